@@ -242,7 +242,7 @@ class ConversationEngine:
         """
         Load current project and return a concise summary.
         """
-        p = load_project_schema(Path(self.project_path).expanduser().resolve())
+        p = load_project_schema(Path(self.project_path).expanduser().resolve(), sections=("geometry", "luminaires", "results"))
         room_lines = []
         for r in p.geometry.rooms[:8]:
             room_lines.append(f"{r.id}:{r.name} {r.width:.2f}x{r.length:.2f}x{r.height:.2f}m")
@@ -18,7 +18,7 @@ class ReportingSkillOutput:
 
 def build_reporting_skill(project_path: str, job_id: str, template: str = "en12464", ensure_run: bool = True) -> ReportingSkillOutput:
     ppath = Path(project_path).expanduser().resolve()
-    project = load_project_schema(ppath)
+    project = load_project_schema(ppath, sections=("results",))
     artifacts: Dict[str, str] = {}
     run_manifest: Dict[str, object] = {"skill": "reporting", "job_id": job_id, "template": template}
     existing_ref = next((r for r in project.results if r.job_id == job_id), None)
@@ -29,7 +29,7 @@ def build_reporting_skill(project_path: str, job_id: str, template: str = "en124
     if ensure_run and not has_valid_result:
         ref = cmd_run_job(str(ppath), job_id)
         run_manifest["run_result"] = {"job_hash": ref.job_hash, "result_dir": ref.result_dir}
-        project = load_project_schema(ppath)
+        project = load_project_schema(ppath, sections=("results",))
     report_path = cmd_export_report(str(ppath), job_id, template)
     bundle_path = cmd_export_audit_bundle(str(ppath), job_id)
     artifacts["report"] = str(report_path)
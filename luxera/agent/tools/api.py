@@ -17,7 +17,7 @@ from luxera.project.schema import CalcGrid, JobSpec, LuminaireInstance, Rotation
 from luxera.project.diff import ProjectDiff
 from luxera.project.diff import DiffOp
 from luxera.project.io import load_project_schema, save_project_schema
-from luxera.project.history import push_snapshot, undo as undo_project_history, redo as redo_project_history
+from luxera.project.history import undo as undo_project_history, redo as redo_project_history
 from luxera.project.validator import validate_project_for_job, ProjectValidationError
 from luxera.gui.commands import (
     cmd_apply_diff,
@@ -288,17 +288,8 @@ class AgentTools:
         if self._current_project_path is None:
             return ToolResult(ok=False, message="Apply diff requires an opened project path context")
         before = len(project.agent_history)
-        push_snapshot(project, label="assistant_apply_diff")
-        save_project_schema(project, self._current_project_path)
-        cmd_apply_diff(str(self._current_project_path), diff)
-        loaded = load_project_schema(self._current_project_path)
-        project.geometry = loaded.geometry
-        project.materials = loaded.materials
-        project.photometry_assets = loaded.photometry_assets
-        project.luminaires = loaded.luminaires
-        project.grids = loaded.grids
-        project.jobs = loaded.jobs
-        project.results = loaded.results
+        # The undo entry holds only the items the diff touches; no full snapshot is taken.
+        cmd_apply_diff(str(self._current_project_path), diff, project=project, history_label="assistant_apply_diff")
         append_audit_event(
             project,
             action="agent.tools.apply_diff",
@@ -330,7 +321,7 @@ class AgentTools:
             return ToolResult(ok=False, message="Run job requires an opened project path context")
         try:
             ref = cmd_run_job(str(self._current_project_path), job_id)
-            loaded = load_project_schema(self._current_project_path)
+            loaded = load_project_schema(self._current_project_path, sections=("results",))
             project.results = loaded.results
         except RunnerError as e:
             return ToolResult(ok=False, message=str(e))
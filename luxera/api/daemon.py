@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, List, Optional, Tuple
+
+import luxera
+from luxera.agent.tools.api import AgentTools, ToolResult
+from luxera.agent.tools.registry import AgentToolRegistry, build_default_registry
+from luxera.api.session import ProjectSessionCache
+from luxera.project.diff import DiffOp, ProjectDiff
+
+
+# JSON-RPC 2.0 error codes.
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+TOOL_ERROR = -32000
+
+# Registry tools that never modify the project; they skip the save on checkout.
+_READ_ONLY_TOOLS = frozenset(
+    {
+        "project.validate",
+        "project.summarize",
+        "results.summarize",
+        "compare_to_target",
+    }
+)
+# Registry tools that also read the project file at the tool's project path
+# (runner, exports, optimizer); pending session edits are saved before they run.
+_FILE_TOOLS = frozenset(
+    {
+        "job.run",
+        "run_calc",
+        "results.summarize",
+        "results.heatmap",
+        "project.diff.propose_layout",
+        "optim.search",
+        "optim.optimizer",
+        "propose_optimizations",
+        "variant.compare",
+        "geom.clean",
+        "report.pdf",
+        "generate_report",
+        "report.roadway.html",
+        "report.backend_compare",
+        "bundle.client",
+        "bundle.audit",
+    }
+)
+# Registry entries replaced by daemon methods working on the session cache.
+_SHADOWED_TOOLS = frozenset({"project.open", "project.save"})
+
+
+class DaemonError(Exception):
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(message)
+        self.code = int(code)
+        self.message = str(message)
+        self.data = data
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, ToolResult) or is_dataclass(value):
+        return _jsonable(asdict(value))
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, Path):
+        return str(value)
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _decode_diff(raw: Any) -> ProjectDiff:
+    """Build a ProjectDiff from ``{"ops": [{op, kind, id, payload, index}]}``."""
+    from luxera.project.history import _COLLECTIONS, _hydrate_item  # type: ignore[attr-defined]
+
+    if isinstance(raw, ProjectDiff):
+        return raw
+    ops_raw = raw.get("ops") if isinstance(raw, dict) else raw
+    if not isinstance(ops_raw, list):
+        raise DaemonError(INVALID_PARAMS, "diff must be an object with an 'ops' list")
+    ops: List[DiffOp] = []
+    for item in ops_raw:
+        if not isinstance(item, dict) or item.get("op") not in ("add", "update", "remove"):
+            raise DaemonError(INVALID_PARAMS, f"Invalid diff op: {item!r}")
+        kind = str(item.get("kind", ""))
+        payload = item.get("payload") or {}
+        if item["op"] == "add" and isinstance(payload, dict) and kind in _COLLECTIONS:
+            payload = _hydrate_item(kind, payload)
+        index = item.get("index")
+        ops.append(
+            DiffOp(
+                op=item["op"],
+                kind=kind,  # type: ignore[arg-type]
+                id=str(item.get("id", "")),
+                payload=payload,
+                index=int(index) if index is not None else None,
+            )
+        )
+    return ProjectDiff(ops=ops)
+
+
+def _coerce(declared: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if declared == "ProjectDiff":
+        return _decode_diff(value)
+    if declared == "Path":
+        return Path(str(value)).expanduser()
+    if declared.startswith("tuple") and isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class LuxeraDaemon:
+    """
+    Long-lived Luxera process speaking line-delimited JSON-RPC 2.0.
+
+    Every ``AgentTools`` operation in the default tool registry is exposed
+    under its registry name (``job.run``, ``place_luminaire``, ...). Tools
+    that take a project receive the live project for the ``project_path``
+    parameter from a :class:`ProjectSessionCache`, so projects stay loaded
+    between requests; parsed photometry and occlusion BVHs stay warm in the
+    engine's process-level caches. ``cli.run`` runs any ``luxera`` CLI
+    command in-process.
+    """
+
+    def __init__(self, *, flush_delay_s: float = 0.0, sessions: Optional[ProjectSessionCache] = None):
+        self.sessions = sessions if sessions is not None else ProjectSessionCache(flush_delay_s=flush_delay_s)
+        self._toolsets: Dict[Path, Tuple[AgentTools, AgentToolRegistry]] = {}
+        self._toolsets_lock = threading.Lock()
+        self._default_tools = AgentTools()
+        self._default_registry = build_default_registry(self._default_tools)
+        self._tool_info = self._default_registry.describe()
+        self._tool_schemas = self._default_registry.json_schemas()
+        self.shutdown_requested = threading.Event()
+        # cli.run swaps the process-wide sys.stdout/sys.stderr; one at a time.
+        self._cli_lock = threading.Lock()
+        self._builtins: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "daemon.ping": self._ping,
+            "daemon.methods": self._methods,
+            "daemon.shutdown": self._shutdown,
+            "project.open": self._project_open,
+            "project.save": self._project_save,
+            "project.close": self._project_close,
+            "project.direct.preview": self._project_direct_preview,
+            "cli.run": self._cli_run,
+        }
+
+    # Protocol -----------------------------------------------------------------
+
+    def handle_line(self, line: str) -> Optional[str]:
+        """Handle one request line and return the response line (None for notifications)."""
+        text = line.strip()
+        if not text:
+            return None
+        try:
+            message = json.loads(text)
+        except json.JSONDecodeError as e:
+            return json.dumps(self._error_response(None, DaemonError(PARSE_ERROR, f"Parse error: {e}")))
+        if isinstance(message, list):
+            if not message:
+                return json.dumps(self._error_response(None, DaemonError(INVALID_REQUEST, "Empty batch")))
+            replies = [r for r in (self.handle_message(m) for m in message) if r is not None]
+            return json.dumps(replies) if replies else None
+        reply = self.handle_message(message)
+        return json.dumps(reply) if reply is not None else None
+
+    def handle_message(self, message: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(message, dict) or not isinstance(message.get("method"), str):
+            return self._error_response(None, DaemonError(INVALID_REQUEST, "Invalid request"))
+        req_id = message.get("id")
+        is_notification = "id" not in message
+        params = message.get("params", {})
+        try:
+            if not isinstance(params, dict):
+                raise DaemonError(INVALID_PARAMS, "params must be an object")
+            result = _jsonable(self.dispatch(message["method"], dict(params)))
+        except DaemonError as e:
+            return None if is_notification else self._error_response(req_id, e)
+        except Exception as e:
+            err = DaemonError(TOOL_ERROR, str(e) or type(e).__name__, {"type": type(e).__name__, "traceback": traceback.format_exc()})
+            return None if is_notification else self._error_response(req_id, err)
+        return None if is_notification else {"jsonrpc": "2.0", "id": req_id, "result": result}
+
+    @staticmethod
+    def _error_response(req_id: Any, err: DaemonError) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"code": err.code, "message": err.message}
+        if err.data is not None:
+            payload["data"] = err.data
+        return {"jsonrpc": "2.0", "id": req_id, "error": payload}
+
+    def dispatch(self, method: str, params: Dict[str, Any]) -> Any:
+        builtin = self._builtins.get(method)
+        if builtin is not None:
+            return builtin(params)
+        if method in _SHADOWED_TOOLS or method not in self._tool_info:
+            raise DaemonError(METHOD_NOT_FOUND, f"Method not found: {method}")
+        return self._call_tool(method, params)
+
+    # Tools --------------------------------------------------------------------
+
+    def _project_path(self, params: Dict[str, Any]) -> Path:
+        raw = params.get("project_path")
+        if not isinstance(raw, str) or not raw:
+            raise DaemonError(INVALID_PARAMS, "project_path is required")
+        return Path(raw).expanduser().resolve()
+
+    def _toolset(self, path: Path) -> Tuple[AgentTools, AgentToolRegistry]:
+        # One AgentTools per project: it carries the current project path.
+        with self._toolsets_lock:
+            found = self._toolsets.get(path)
+            if found is None:
+                tools = AgentTools()
+                tools._current_project_path = path
+                found = (tools, build_default_registry(tools))
+                self._toolsets[path] = found
+            return found
+
+    def _call_tool(self, method: str, params: Dict[str, Any]) -> Any:
+        schema = self._tool_info[method]["schema"]
+        if "project" in params:
+            raise DaemonError(INVALID_PARAMS, "Pass project_path instead of project")
+        unknown = set(params) - set(schema) - {"project_path"}
+        if unknown:
+            raise DaemonError(INVALID_PARAMS, f"Unknown parameters for {method}: {sorted(unknown)}")
+        kwargs = {k: _coerce(str(schema[k]), v) for k, v in params.items() if k in schema}
+        missing = set(self._tool_schemas[method]["required"]) - set(kwargs) - {"project"}
+        if missing:
+            raise DaemonError(INVALID_PARAMS, f"Missing parameters for {method}: {sorted(missing)}")
+        if "project" not in schema:
+            return self._default_registry.call(method, **kwargs)
+
+        path = self._project_path(params)
+        if "project_path" in schema:
+            kwargs["project_path"] = str(path)
+        _, registry = self._toolset(path)
+        with self.sessions.checkout(path, write=method not in _READ_ONLY_TOOLS, sync=method in _FILE_TOOLS) as project:
+            return registry.call(method, project, **kwargs)
+
+    # Built-in methods -----------------------------------------------------------
+
+    def _ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"version": getattr(luxera, "__version__", "unknown"), "pid": os.getpid(), "projects": len(self.sessions)}
+
+    def _methods(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        tools = {
+            name: {**info, "read_only": name in _READ_ONLY_TOOLS}
+            for name, info in self._tool_info.items()
+            if name not in _SHADOWED_TOOLS
+        }
+        return {"builtins": sorted(self._builtins), "tools": tools}
+
+    def _shutdown(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.shutdown_requested.set()
+        return {"ok": True}
+
+    def _project_open(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        path = self._project_path(params)
+        with self.sessions.checkout(path) as project:
+            return {
+                "project_path": str(path),
+                "name": project.name,
+                "rooms": len(project.geometry.rooms),
+                "luminaires": len(project.luminaires),
+                "grids": len(project.grids),
+                "jobs": [j.id for j in project.jobs],
+            }
+
+    def _project_save(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        path = self._project_path(params)
+        return {"project_path": str(path), "saved": self.sessions.flush(path)}
+
+    def _project_direct_preview(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        path = self._project_path(params)
+        result = self.sessions.preview_direct(path, use_occlusion=bool(params.get("use_occlusion", False)))
+        objects = {
+            key: {
+                "points": int(obj.values.size),
+                "min_lux": float(obj.values.min()) if obj.values.size else 0.0,
+                "mean_lux": float(obj.values.mean()) if obj.values.size else 0.0,
+                "max_lux": float(obj.values.max()) if obj.values.size else 0.0,
+                "recomputed_pairs": obj.recomputed_pairs,
+            }
+            for key, obj in result.objects.items()
+        }
+        return {"project_path": str(path), "objects": objects, "stats": result.stats}
+
+    def _project_close(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        path = self._project_path(params)
+        self.sessions.evict(path)
+        with self._toolsets_lock:
+            self._toolsets.pop(path, None)
+        return {"project_path": str(path), "closed": True}
+
+    def _cli_run(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        argv = params.get("argv")
+        if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+            raise DaemonError(INVALID_PARAMS, "argv must be a list of strings")
+        if argv and argv[0] in ("daemon", "serve", "gui"):
+            raise DaemonError(INVALID_PARAMS, f"'{argv[0]}' cannot run inside the daemon")
+        from luxera.cli import main as cli_main
+
+        out = io.StringIO()
+        err = io.StringIO()
+        # CLI commands load and save project files themselves. Every open
+        # session the command names is flushed, held under its project lock
+        # (shared with tool checkouts) and reloaded afterwards; other
+        # projects keep serving tool calls. Output is captured by redirecting
+        # sys.stdout/sys.stderr, so text written by runner, export and report
+        # modules is part of the response too.
+        with contextlib.ExitStack() as stack:
+            for path in self._cli_session_paths(argv):
+                stack.enter_context(self.sessions.external(path))
+            stack.enter_context(self._cli_lock)
+            stack.enter_context(contextlib.redirect_stdout(out))
+            stack.enter_context(contextlib.redirect_stderr(err))
+            try:
+                code = int(cli_main(list(argv)) or 0)
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        return {"exit_code": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+    def _cli_session_paths(self, argv: List[str]) -> List[Path]:
+        paths = set()
+        for arg in argv:
+            if arg.startswith("-"):
+                arg = arg.partition("=")[2]
+            if not arg:
+                continue
+            path = Path(arg).expanduser().resolve()
+            if path in self.sessions:
+                paths.add(path)
+        # Sorted so concurrent commands acquire the project locks in one order.
+        return sorted(paths)
+
+    # Transports -----------------------------------------------------------------
+
+    def serve_stdio(self, stdin: Optional[IO[str]] = None, stdout: Optional[IO[str]] = None) -> None:
+        """Serve requests from ``stdin`` until EOF or ``daemon.shutdown``."""
+        reader = stdin if stdin is not None else sys.stdin
+        writer = stdout if stdout is not None else sys.stdout
+        try:
+            # Anything printed by tools must not corrupt the protocol stream.
+            with contextlib.redirect_stdout(sys.stderr):
+                for line in reader:
+                    reply = self.handle_line(line)
+                    if reply is not None:
+                        writer.write(reply + "\n")
+                        writer.flush()
+                    if self.shutdown_requested.is_set():
+                        break
+        finally:
+            self.sessions.close()
+
+    def serve_socket(self, *, socket_path: Optional[str] = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Serve line-delimited requests on a Unix socket, or TCP on ``host:port``."""
+        daemon = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for raw in self.rfile:
+                    reply = daemon.handle_line(raw.decode("utf-8", errors="replace"))
+                    if reply is not None:
+                        self.wfile.write((reply + "\n").encode("utf-8"))
+                        self.wfile.flush()
+                    if daemon.shutdown_requested.is_set():
+                        threading.Thread(target=self.server.shutdown, daemon=True).start()
+                        return
+
+        server: socketserver.BaseServer
+        if socket_path:
+            if not hasattr(socket, "AF_UNIX"):
+                raise DaemonError(INTERNAL_ERROR, "Unix sockets are not available on this platform; use --port")
+            sock = Path(socket_path).expanduser()
+            if sock.exists():
+                sock.unlink()
+
+            class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+                daemon_threads = True
+
+            server = _UnixServer(str(sock), _Handler)
+            print(f"Luxera daemon listening on {sock}", file=sys.stderr, flush=True)
+        else:
+
+            class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+                allow_reuse_address = True
+                daemon_threads = True
+
+            server = _TCPServer((host, int(port)), _Handler)
+            print(f"Luxera daemon listening on {host}:{server.server_address[1]}", file=sys.stderr, flush=True)
+        with server:
+            try:
+                server.serve_forever()
+            finally:
+                self.sessions.close()
+                if socket_path:
+                    Path(socket_path).expanduser().unlink(missing_ok=True)
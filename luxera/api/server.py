@@ -5,20 +5,22 @@ import http.server
 import socketserver
 import traceback
 import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 from urllib.parse import parse_qs, urlparse
 
 from luxera.agent.runtime import AgentRuntime
 from luxera.agent.summarize import summarize_project
+from luxera.api.session import ProjectSessionCache
 from luxera.compliance.evaluate import evaluate_indoor
 from luxera.database.library import PhotometryLibrary
 from luxera.design.placement import place_array_rect
 from luxera.export.pdf_report import build_project_pdf_report
 from luxera.export.professional_pdf import ProfessionalReportBuilder
-from luxera.project.io import load_project_schema, save_project_schema
+from luxera.project.io import save_project_schema
 from luxera.project.runner import run_job_in_memory
-from luxera.project.schema import CalcGrid, JobSpec, LuminaireInstance, PhotometryAsset, Project, RoomSpec, RotationSpec, TransformSpec
+from luxera.project.schema import CalcGrid, JobResultRef, JobSpec, LuminaireInstance, PhotometryAsset, Project, RoomSpec, RotationSpec, TransformSpec
 
 
 class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
@@ -27,6 +29,7 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
     """
 
     _projects: Dict[str, Any] = {}
+    _sessions: ProjectSessionCache = ProjectSessionCache()
 
     def log_message(self, format: str, *args: Any) -> None:  # noqa: A003
         return
@@ -42,6 +45,9 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
             if path == "/api/v1/project/open":
                 out = self._handle_project_open(body)
                 return self._json_response(200, out)
+            if path == "/api/v1/project/save":
+                out = self._handle_project_save(body)
+                return self._json_response(200, out)
             if path == "/api/v1/luminaire/place":
                 out = self._handle_luminaire_place(body)
                 return self._json_response(200, out)
@@ -165,6 +171,7 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
         )
 
         save_project_schema(project, path)
+        self._sessions.open(path, project)
         self._projects[project_id] = {"path": str(path)}
         return {"project_id": project_id, "path": str(path)}
 
@@ -175,12 +182,20 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
         path = Path(str(raw_path)).expanduser().resolve()
         if not path.exists():
             raise ValueError(f"Project not found: {path}")
-        project = load_project_schema(path)
         project_id = uuid.uuid4().hex[:12]
+        with self._sessions.checkout(path) as project:
+            summary = summarize_project(project).to_dict()
         self._projects[project_id] = {"path": str(path)}
-        summary = summarize_project(project).to_dict()
         return {"project_id": project_id, "summary": summary}
 
+    def _handle_project_save(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        project_id = str(body.get("project_id") or "")
+        if not project_id:
+            raise ValueError("project_id is required")
+        path = self._path_for_id(project_id)
+        saved = self._sessions.flush(path)
+        return {"project_id": project_id, "path": str(path), "saved": saved}
+
     def _handle_luminaire_place(self, body: Dict[str, Any]) -> Dict[str, Any]:
         project_id = str(body.get("project_id") or "")
         luminaires = body.get("luminaires")
@@ -189,7 +204,12 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
         if not isinstance(luminaires, list):
             raise ValueError("luminaires list is required")
 
-        project, path = self._load_project_for_id(project_id)
+        with self._checkout(project_id, write=True) as project:
+            count = self._place_luminaires(project, luminaires)
+        return {"count": count}
+
+    @staticmethod
+    def _place_luminaires(project: Project, luminaires: list) -> int:
         default_asset = project.photometry_assets[0].id if project.photometry_assets else "default_asset"
         count = 0
         for i, row in enumerate(luminaires):
@@ -210,15 +230,19 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
             )
             project.luminaires.append(lum)
             count += 1
-        save_project_schema(project, path)
-        return {"count": count}
+        return count
 
     def _handle_luminaire_array(self, body: Dict[str, Any]) -> Dict[str, Any]:
         project_id = str(body.get("project_id") or "")
         if not project_id:
             raise ValueError("project_id is required")
 
-        project, path = self._load_project_for_id(project_id)
+        with self._checkout(project_id, write=True) as project:
+            count = self._place_array(project, body)
+        return {"count": count}
+
+    @staticmethod
+    def _place_array(project: Project, body: Dict[str, Any]) -> int:
         if not project.geometry.rooms:
             raise ValueError("Project has no rooms")
         room = project.geometry.rooms[0]
@@ -242,8 +266,7 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
             photometry_asset_id=asset_id,
         )
         project.luminaires = list(arr)
-        save_project_schema(project, path)
-        return {"count": len(project.luminaires)}
+        return len(project.luminaires)
 
     def _handle_calc_run(self, body: Dict[str, Any]) -> Dict[str, Any]:
         project_id = str(body.get("project_id") or "")
@@ -252,7 +275,21 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
         job_type = str(body.get("job_type") or "direct")
         backend = str(body.get("backend") or "cpu")
 
-        project, path = self._load_project_for_id(project_id)
+        with self._checkout(project_id, write=True) as project:
+            ref = self._run_api_job(project, job_type, backend)
+
+        summary = dict(ref.summary or {})
+        e_avg = float(summary.get("mean_lux", summary.get("avg_lux", 0.0)) or 0.0)
+        e_min = float(summary.get("min_lux", 0.0) or 0.0)
+        e_max = float(summary.get("max_lux", 0.0) or 0.0)
+        u0 = float(summary.get("uniformity_ratio", summary.get("u0", 0.0)) or 0.0)
+        return {
+            "job_id": ref.job_id,
+            "summary": {"E_avg": e_avg, "E_min": e_min, "E_max": e_max, "uniformity": u0},
+        }
+
+    @staticmethod
+    def _run_api_job(project: Project, job_type: str, backend: str) -> JobResultRef:
         if not project.grids and project.geometry.rooms:
             room = project.geometry.rooms[0]
             project.grids.append(
@@ -274,20 +311,7 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
         else:
             job.type = job_type  # type: ignore[assignment]
             job.backend = backend  # type: ignore[assignment]
-
-        save_project_schema(project, path)
-        ref = run_job_in_memory(project, "api_job")
-        save_project_schema(project, path)
-
-        summary = dict(ref.summary or {})
-        e_avg = float(summary.get("mean_lux", summary.get("avg_lux", 0.0)) or 0.0)
-        e_min = float(summary.get("min_lux", 0.0) or 0.0)
-        e_max = float(summary.get("max_lux", 0.0) or 0.0)
-        u0 = float(summary.get("uniformity_ratio", summary.get("u0", 0.0)) or 0.0)
-        return {
-            "job_id": ref.job_id,
-            "summary": {"E_avg": e_avg, "E_min": e_min, "E_max": e_max, "uniformity": u0},
-        }
+        return run_job_in_memory(project, "api_job")
 
     def _handle_compliance_check(self, body: Dict[str, Any]) -> Dict[str, Any]:
         project_id = str(body.get("project_id") or "")
@@ -296,10 +320,10 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
         standard = str(body.get("standard") or "EN 12464-1")
         activity_type = str(body.get("activity_type") or "OFFICE_GENERAL")
 
-        project, _ = self._load_project_for_id(project_id)
-        if not project.results:
-            raise ValueError("No calculation results available")
-        summary = dict(project.results[-1].summary or {})
+        with self._checkout(project_id) as project:
+            if not project.results:
+                raise ValueError("No calculation results available")
+            summary = dict(project.results[-1].summary or {})
 
         target_map = {
             "OFFICE_GENERAL": (500.0, 0.6),
@@ -338,23 +362,22 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
         if not output_path:
             raise ValueError("output_path is required")
 
-        project, _ = self._load_project_for_id(project_id)
-        if not project.results:
-            raise ValueError("No calculation results available")
-        ref = project.results[-1]
-
         out = Path(str(output_path)).expanduser().resolve()
-        out.parent.mkdir(parents=True, exist_ok=True)
-
-        if style == "professional":
-            results = {
-                "summary": dict(ref.summary or {}),
-                "result_dir": str(ref.result_dir),
-                "job_id": ref.job_id,
-            }
-            ProfessionalReportBuilder(project, results).build(out)
-        else:
-            build_project_pdf_report(project, ref, out)
+        with self._checkout(project_id) as project:
+            if not project.results:
+                raise ValueError("No calculation results available")
+            ref = project.results[-1]
+            out.parent.mkdir(parents=True, exist_ok=True)
+
+            if style == "professional":
+                results = {
+                    "summary": dict(ref.summary or {}),
+                    "result_dir": str(ref.result_dir),
+                    "job_id": ref.job_id,
+                }
+                ProfessionalReportBuilder(project, results).build(out)
+            else:
+                build_project_pdf_report(project, ref, out)
 
         pages = self._count_pdf_pages(out)
         return {"path": str(out), "pages": pages}
@@ -367,9 +390,10 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
         if not intent:
             raise ValueError("intent is required")
 
-        _, path = self._load_project_for_id(project_id)
-        runtime = AgentRuntime()
-        res = runtime.execute(str(path), intent, approvals={"apply_diff": True, "run_job": True})
+        # The agent runtime loads and saves the project file itself.
+        with self._sessions.external(self._path_for_id(project_id)) as path:
+            runtime = AgentRuntime()
+            res = runtime.execute(str(path), intent, approvals={"apply_diff": True, "run_job": True})
         actions = [
             {
                 "kind": a.kind,
@@ -438,15 +462,20 @@ class LuxeraAPIHandler(http.server.BaseHTTPRequestHandler):
         except ValueError as e:
             raise ValueError(f"Invalid float query param: {name}") from e
 
-    def _load_project_for_id(self, project_id: str) -> tuple[Project, Path]:
+    def _path_for_id(self, project_id: str) -> Path:
         info = self._projects.get(project_id)
         if not isinstance(info, dict):
             raise ValueError(f"Unknown project_id: {project_id}")
         path = Path(str(info.get("path", ""))).expanduser().resolve()
-        if not path.exists():
+        if path not in self._sessions and not path.exists():
             raise ValueError(f"Project path missing for project_id: {project_id}")
-        project = load_project_schema(path)
-        return project, path
+        return path
+
+    @contextmanager
+    def _checkout(self, project_id: str, write: bool = False) -> Iterator[Project]:
+        """Yield the cached live project; writes are persisted behind the response."""
+        with self._sessions.checkout(self._path_for_id(project_id), write=write) as project:
+            yield project
 
     @staticmethod
     def _count_pdf_pages(path: Path) -> int:
@@ -488,4 +517,7 @@ def start_server(host: str = "0.0.0.0", port: int = 8420):
 
     with _ThreadedServer((host, int(port)), LuxeraAPIHandler) as httpd:
         print(f"Luxera API server running on http://{host}:{port}")
-        httpd.serve_forever()
+        try:
+            httpd.serve_forever()
+        finally:
+            LuxeraAPIHandler._sessions.close()
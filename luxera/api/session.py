@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from luxera.project.io import load_project_schema, save_project_schema
+from luxera.project.schema import Project
+
+if TYPE_CHECKING:
+    from luxera.engine.incremental import IncrementalDirectResult, IncrementalDirectSession
+
+
+ProjectLoader = Callable[[Path], Project]
+ProjectSaver = Callable[[Project, Path], None]
+# (st_mtime_ns, st_size) of the project file, or None when it does not exist.
+_DiskStamp = Optional[Tuple[int, int]]
+# (object, its attributes) pairs plus (list, its members) pairs.
+_Checkpoint = Tuple[List[Tuple[Any, Dict[str, Any]]], List[Tuple[list, list]]]
+
+
+class ProjectConflictError(ValueError):
+    """The project file changed on disk while the session held unsaved edits."""
+
+
+def _disk_stamp(path: Path) -> _DiskStamp:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _attrs(obj: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(obj, dict):
+        return dict(obj)
+    state = getattr(obj, "__dict__", None)
+    return dict(state) if state is not None else None
+
+
+def _checkpoint(project: Project) -> _Checkpoint:
+    """
+    Record the project's attribute values, collection membership and the
+    top-level attributes of every item, without copying any deeper.
+
+    Edits replace attributes (``setattr`` / ``ProjectDiff``) rather than
+    mutating nested values in place, so this is enough to undo them at a
+    cost proportional to the number of entities, not to their geometry.
+    """
+    objects: List[Tuple[Any, Dict[str, Any]]] = []
+    lists: List[Tuple[list, list]] = []
+    for owner in (project, project.geometry):
+        objects.append((owner, dict(vars(owner))))
+        for value in vars(owner).values():
+            if not isinstance(value, list):
+                continue
+            lists.append((value, list(value)))
+            for item in value:
+                state = _attrs(item)
+                if state is not None:
+                    objects.append((item, state))
+    return objects, lists
+
+
+def _restore(checkpoint: _Checkpoint) -> None:
+    objects, lists = checkpoint
+    for coll, members in lists:
+        coll[:] = members
+    for obj, state in objects:
+        target = obj if isinstance(obj, dict) else vars(obj)
+        target.clear()
+        target.update(state)
+
+
+@dataclass
+class ProjectSession:
+    """
+    Live, in-memory project held by the API server.
+
+    ``version`` is bumped on every write checkout; the session is dirty while
+    it differs from ``saved_version``. ``disk_stamp`` is the file's stat as of
+    the last load or save, used to notice edits made by other processes.
+    """
+
+    path: Path
+    project: Project
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+    version: int = 0
+    saved_version: int = 0
+    modified_at: float = 0.0
+    saved_at: float = 0.0
+    save_count: int = 0
+    disk_stamp: _DiskStamp = None
+    used_at: float = 0.0
+    # Direct contributions kept between edits for ``ProjectSessionCache.preview_direct``.
+    direct: Optional["IncrementalDirectSession"] = field(default=None, repr=False)
+
+    @property
+    def dirty(self) -> bool:
+        return self.version != self.saved_version
+
+
+class ProjectSessionCache:
+    """
+    Per-project session cache with write-behind persistence.
+
+    Handlers check a project out under its own lock, mutate the live
+    ``Project`` and let the cache persist it. Writes are debounced: a dirty
+    session is saved once ``flush_delay_s`` has elapsed since its last edit,
+    so bursts of placement calls collapse into a single save. A delay of
+    ``0`` makes every write checkout save synchronously.
+
+    If the file changes on disk behind a clean session, the next checkout
+    reloads it; if the session has unsaved edits, checkout and save raise
+    ``ProjectConflictError`` instead of overwriting the other writer (evict
+    with ``flush=False`` to discard the edits). Clean sessions unused for
+    ``max_idle_s`` are dropped when another project is opened.
+    """
+
+    def __init__(
+        self,
+        flush_delay_s: float = 1.0,
+        *,
+        loader: ProjectLoader = load_project_schema,
+        saver: ProjectSaver = save_project_schema,
+        max_idle_s: Optional[float] = 1800.0,
+    ) -> None:
+        self.flush_delay_s = max(0.0, float(flush_delay_s))
+        self.max_idle_s = None if max_idle_s is None else max(0.0, float(max_idle_s))
+        self._loader = loader
+        self._saver = saver
+        self._sessions: Dict[Path, ProjectSession] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    @staticmethod
+    def _key(path: Path | str) -> Path:
+        return Path(path).expanduser().resolve()
+
+    def __contains__(self, path: object) -> bool:
+        if not isinstance(path, (str, Path)):
+            return False
+        with self._lock:
+            return self._key(path) in self._sessions
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def open(self, path: Path | str, project: Optional[Project] = None) -> ProjectSession:
+        """
+        Return the session for ``path``, loading it from disk on first use.
+
+        An existing session is checked against the file on disk first.
+        """
+        key = self._key(path)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                self._evict_idle()
+                stamp = _disk_stamp(key)
+                if project is None:
+                    if stamp is None:
+                        raise ValueError(f"Project not found: {key}")
+                    project = self._loader(key)
+                now = time.monotonic()
+                session = ProjectSession(path=key, project=project, saved_at=now, disk_stamp=stamp, used_at=now)
+                self._sessions[key] = session
+                return session
+        with session.lock:
+            self._sync_with_disk(session)
+        return session
+
+    @contextmanager
+    def checkout(self, path: Path | str, *, write: bool = False, sync: bool = False) -> Iterator[Project]:
+        """
+        Hold the project lock and yield the live project.
+
+        With ``write=True`` the session is marked dirty on normal exit and a
+        save is scheduled. If the block raises, the live project is restored
+        to its state at checkout, so a half-applied edit is never persisted.
+        ``sync=True`` saves pending edits first, for code that also reads the
+        project file on disk. A file change made by the block itself, under
+        the lock, is not a conflict: a write checkout keeps its live project,
+        otherwise a clean session is reloaded.
+        """
+        session = self.open(path)
+        with session.lock:
+            self._sync_with_disk(session)
+            session.used_at = time.monotonic()
+            if sync and session.dirty:
+                self._save(session)
+            before = _checkpoint(session.project) if write else None
+            try:
+                yield session.project
+            except BaseException:
+                if before is not None:
+                    _restore(before)
+                self._accept_own_write(session, keep=False)
+                raise
+            self._accept_own_write(session, keep=write)
+            if write:
+                session.version += 1
+                session.modified_at = time.monotonic()
+                if self.flush_delay_s <= 0.0:
+                    self._save(session)
+        if write and self.flush_delay_s > 0.0:
+            self._schedule()
+
+    @contextmanager
+    def external(self, path: Path | str) -> Iterator[Path]:
+        """
+        Hand the on-disk file to code that loads and saves it itself.
+
+        The session is flushed first and reloaded from disk afterwards, all
+        under the project lock.
+        """
+        session = self.open(path)
+        with session.lock:
+            self._sync_with_disk(session)
+            if session.dirty:
+                self._save(session)
+            try:
+                yield session.path
+            finally:
+                self._reload(session)
+
+    def preview_direct(self, path: Path | str, *, use_occlusion: bool = False) -> "IncrementalDirectResult":
+        """
+        Direct illuminance of every calc object of the live project.
+
+        The session keeps an ``IncrementalDirectSession``, so after an edit only
+        the luminaire/point pairs the edit can affect are evaluated again.
+        """
+        from luxera.engine.incremental import IncrementalDirectSession
+
+        session = self.open(path)
+        with self.checkout(path) as project:
+            inc = session.direct
+            if inc is None or inc.use_occlusion != bool(use_occlusion):
+                inc = IncrementalDirectSession(use_occlusion=bool(use_occlusion))
+                session.direct = inc
+            return inc.update(project)
+
+    def flush(self, path: Path | str) -> bool:
+        """Save one session now if it is dirty. Returns True when a save happened."""
+        key = self._key(path)
+        with self._lock:
+            session = self._sessions.get(key)
+        if session is None:
+            return False
+        with session.lock:
+            if not session.dirty:
+                return False
+            self._save(session)
+            return True
+
+    def flush_all(self) -> int:
+        """Save every dirty session now. Returns the number of saves."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+        saved = 0
+        for session in sessions:
+            with session.lock:
+                if session.dirty:
+                    self._save(session)
+                    saved += 1
+        return saved
+
+    def evict(self, path: Path | str, *, flush: bool = True) -> None:
+        key = self._key(path)
+        if flush:
+            self.flush(key)
+        with self._lock:
+            self._sessions.pop(key, None)
+
+    def close(self) -> int:
+        """Cancel the pending timer, persist dirty sessions and drop the cache."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        saved = self.flush_all()
+        with self._lock:
+            self._sessions.clear()
+        return saved
+
+    def dirty_paths(self) -> List[Path]:
+        with self._lock:
+            return [p for p, s in self._sessions.items() if s.dirty]
+
+    def _reload(self, session: ProjectSession) -> None:
+        session.disk_stamp = _disk_stamp(session.path)
+        session.project = self._loader(session.path)
+        session.saved_version = session.version
+        session.saved_at = time.monotonic()
+
+    def _sync_with_disk(self, session: ProjectSession) -> None:
+        """Reload a clean session whose file changed on disk; refuse to mix in a dirty one."""
+        stamp = _disk_stamp(session.path)
+        if stamp == session.disk_stamp or stamp is None:
+            return
+        if session.dirty:
+            raise ProjectConflictError(f"Project changed on disk with unsaved session edits: {session.path}")
+        self._reload(session)
+
+    def _accept_own_write(self, session: ProjectSession, *, keep: bool) -> None:
+        stamp = _disk_stamp(session.path)
+        if stamp == session.disk_stamp or stamp is None:
+            return
+        if keep or session.dirty:
+            session.disk_stamp = stamp
+        else:
+            self._reload(session)
+
+    def _save(self, session: ProjectSession) -> None:
+        stamp = _disk_stamp(session.path)
+        if stamp is not None and session.disk_stamp is not None and stamp != session.disk_stamp:
+            raise ProjectConflictError(f"Project changed on disk with unsaved session edits: {session.path}")
+        version = session.version
+        self._saver(session.project, session.path)
+        session.disk_stamp = _disk_stamp(session.path)
+        session.saved_version = version
+        session.saved_at = time.monotonic()
+        session.save_count += 1
+
+    def _evict_idle(self) -> None:
+        """Drop clean, unlocked sessions idle for ``max_idle_s``; caller holds ``self._lock``."""
+        if self.max_idle_s is None:
+            return
+        cutoff = time.monotonic() - self.max_idle_s
+        for key, session in list(self._sessions.items()):
+            if session.used_at > cutoff or session.dirty or not session.lock.acquire(blocking=False):
+                continue
+            try:
+                if not session.dirty:
+                    del self._sessions[key]
+            finally:
+                session.lock.release()
+
+    def _schedule(self, delay_s: Optional[float] = None) -> None:
+        with self._lock:
+            if self._timer is not None:
+                return
+            timer = threading.Timer(self.flush_delay_s if delay_s is None else delay_s, self._flush_due)
+            timer.daemon = True
+            self._timer = timer
+            timer.start()
+
+    def _flush_due(self) -> None:
+        with self._lock:
+            self._timer = None
+            sessions = [s for s in self._sessions.values() if s.dirty]
+        now = time.monotonic()
+        next_due: Optional[float] = None
+        for session in sessions:
+            wait = session.modified_at + self.flush_delay_s - now
+            # Sessions checked out by a long-running handler are retried later
+            # instead of blocking saves of every other project.
+            if wait > 0.0 or not session.lock.acquire(blocking=False):
+                wait = max(wait, self.flush_delay_s)
+                next_due = wait if next_due is None else min(next_due, wait)
+                continue
+            try:
+                if session.dirty:
+                    self._save(session)
+            except ProjectConflictError:
+                # Left dirty; the next checkout reports the conflict to its caller.
+                pass
+            finally:
+                session.lock.release()
+        if next_due is not None:
+            self._schedule(next_due)
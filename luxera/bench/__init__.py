@@ -0,0 +1,38 @@
+"""
+Luxera Benchmarks
+
+Registered hot-path scenarios, timing/memory measurement and baseline regression gating.
+"""
+
+from luxera.bench.scenarios import BenchScenario, get_scenario, list_scenarios, register_scenario
+from luxera.bench.runner import (
+    BENCH_SCHEMA_VERSION,
+    BenchComparison,
+    BenchRegression,
+    BenchResult,
+    bench_report,
+    compare_to_baseline,
+    load_bench_report,
+    run_benchmarks,
+    run_scenario,
+    select_scenarios,
+    write_bench_report,
+)
+
+__all__ = [
+    "BENCH_SCHEMA_VERSION",
+    "BenchComparison",
+    "BenchRegression",
+    "BenchResult",
+    "BenchScenario",
+    "bench_report",
+    "compare_to_baseline",
+    "get_scenario",
+    "list_scenarios",
+    "load_bench_report",
+    "register_scenario",
+    "run_benchmarks",
+    "run_scenario",
+    "select_scenarios",
+    "write_bench_report",
+]
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+"""Timing/memory measurement for benchmark scenarios and regression gating against a stored baseline."""
+
+import gc
+import json
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+import luxera
+from luxera.bench.scenarios import DEFAULT_SIZES, BenchScenario, list_scenarios
+
+
+BENCH_SCHEMA_VERSION = "luxera_bench_v1"
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    scenario: str
+    size: str
+    params: Dict[str, Any]
+    times_s: List[float]
+    peak_memory_bytes: Optional[int]
+
+    @property
+    def key(self) -> str:
+        return f"{self.scenario}/{self.size}"
+
+    def stats(self) -> Dict[str, float]:
+        t = np.asarray(self.times_s, dtype=float)
+        if t.size == 0:
+            return {"min": 0.0, "median": 0.0, "mean": 0.0, "p90": 0.0, "max": 0.0, "stdev": 0.0}
+        return {
+            "min": float(np.min(t)),
+            "median": float(np.median(t)),
+            "mean": float(np.mean(t)),
+            "p90": float(np.percentile(t, 90.0)),
+            "max": float(np.max(t)),
+            "stdev": float(statistics.pstdev(t.tolist())),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scenario": self.scenario,
+            "size": self.size,
+            "params": dict(self.params),
+            "times_s": [float(v) for v in self.times_s],
+            "stats": self.stats(),
+            "peak_memory_bytes": self.peak_memory_bytes,
+        }
+
+
+@dataclass(frozen=True)
+class BenchRegression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+    ratio: float
+    limit: float
+
+
+@dataclass(frozen=True)
+class BenchComparison:
+    passed: bool
+    regressions: List[BenchRegression] = field(default_factory=list)
+    improvements: List[str] = field(default_factory=list)
+    missing_in_baseline: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "passed": self.passed,
+            "regressions": [
+                {
+                    "key": r.key,
+                    "metric": r.metric,
+                    "baseline": r.baseline,
+                    "current": r.current,
+                    "ratio": r.ratio,
+                    "limit": r.limit,
+                }
+                for r in self.regressions
+            ],
+            "improvements": list(self.improvements),
+            "missing_in_baseline": list(self.missing_in_baseline),
+        }
+
+
+def select_scenarios(patterns: Optional[Sequence[str]] = None, tags: Optional[Sequence[str]] = None) -> List[BenchScenario]:
+    """
+    Scenarios selected by name and tag.
+
+    Each pattern selects the scenario with that exact name, or every scenario whose
+    name starts with it when none matches exactly; ``tags`` keeps scenarios carrying
+    any of them.
+    """
+    names = {s.name for s in list_scenarios()}
+    out = []
+    for s in list_scenarios():
+        if patterns and not any(s.name == p or (p not in names and s.name.startswith(p)) for p in patterns):
+            continue
+        if tags and not set(tags) & set(s.tags):
+            continue
+        out.append(s)
+    return out
+
+
+def run_scenario(
+    scenario: BenchScenario,
+    size: str,
+    *,
+    repeats: int = 5,
+    warmup: int = 1,
+    measure_memory: bool = True,
+    workdir: Optional[Path] = None,
+) -> BenchResult:
+    """
+    Time ``repeats`` calls of the scenario after ``warmup`` untimed calls.
+
+    Setup (scene construction, photometry loading, BVH builds) is excluded from the
+    timings. Peak memory is taken from one extra traced call, so tracing overhead
+    never skews the timings.
+    """
+    if size not in scenario.sizes:
+        raise ValueError(f"Scenario {scenario.name} has no size {size!r}")
+    params = dict(scenario.sizes[size])
+    with tempfile.TemporaryDirectory(prefix=f"luxera_bench_{scenario.name}_") as tmp:
+        wd = Path(workdir) if workdir is not None else Path(tmp)
+        wd.mkdir(parents=True, exist_ok=True)
+        call = scenario.setup(wd, params)
+        for _ in range(max(0, int(warmup))):
+            call()
+        times: List[float] = []
+        for _ in range(max(1, int(repeats))):
+            gc.collect()
+            t0 = time.perf_counter()
+            call()
+            times.append(time.perf_counter() - t0)
+        peak: Optional[int] = None
+        if measure_memory:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                call()
+                peak = int(tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+    return BenchResult(scenario=scenario.name, size=size, params=params, times_s=times, peak_memory_bytes=peak)
+
+
+def run_benchmarks(
+    scenarios: Optional[Sequence[BenchScenario]] = None,
+    sizes: Sequence[str] = DEFAULT_SIZES,
+    *,
+    repeats: int = 5,
+    warmup: int = 1,
+    measure_memory: bool = True,
+) -> List[BenchResult]:
+    out: List[BenchResult] = []
+    for scenario in scenarios if scenarios is not None else list_scenarios():
+        for size in sizes:
+            if size in scenario.sizes:
+                out.append(run_scenario(scenario, size, repeats=repeats, warmup=warmup, measure_memory=measure_memory))
+    return out
+
+
+def bench_report(results: Sequence[BenchResult], *, comparison: Optional[BenchComparison] = None) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        "schema_version": BENCH_SCHEMA_VERSION,
+        "luxera_version": getattr(luxera, "__version__", "unknown"),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": [r.to_dict() for r in results],
+    }
+    if comparison is not None:
+        payload["comparison"] = comparison.to_dict()
+    return payload
+
+
+def write_bench_report(path: Path, payload: Mapping[str, Any]) -> Path:
+    p = Path(path).expanduser().resolve()
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    return p
+
+
+def load_bench_report(path: Path) -> Dict[str, Any]:
+    payload = json.loads(Path(path).expanduser().read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or payload.get("schema_version") != BENCH_SCHEMA_VERSION:
+        raise ValueError(f"Benchmark file must have schema_version '{BENCH_SCHEMA_VERSION}': {path}")
+    return payload
+
+
+def compare_to_baseline(
+    current: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    *,
+    max_time_regression: float = 0.25,
+    max_memory_regression: float = 0.25,
+    min_time_delta_s: float = 0.005,
+    min_memory_delta_bytes: int = 1 << 20,
+    time_stat: str = "median",
+) -> BenchComparison:
+    """
+    Compare two benchmark reports entry by entry (``scenario/size``).
+
+    An entry regresses when its ``time_stat`` exceeds the baseline by more than
+    ``max_time_regression`` (fraction) and by at least ``min_time_delta_s``, or when
+    its peak memory exceeds the baseline by more than ``max_memory_regression`` and
+    by at least ``min_memory_delta_bytes``. The absolute floors keep timer noise on
+    tiny scenarios from failing the gate.
+    """
+
+    def _index(report: Mapping[str, Any]) -> Dict[str, Mapping[str, Any]]:
+        rows = report.get("results", [])
+        return {f"{r['scenario']}/{r['size']}": r for r in rows if isinstance(r, Mapping)}
+
+    base = _index(baseline)
+    regressions: List[BenchRegression] = []
+    improvements: List[str] = []
+    missing: List[str] = []
+    for key, row in sorted(_index(current).items()):
+        ref = base.get(key)
+        if ref is None:
+            missing.append(key)
+            continue
+        cur_t = float(row.get("stats", {}).get(time_stat, 0.0))
+        ref_t = float(ref.get("stats", {}).get(time_stat, 0.0))
+        if ref_t > 0.0:
+            ratio = cur_t / ref_t
+            if ratio > 1.0 + max_time_regression and (cur_t - ref_t) >= min_time_delta_s:
+                regressions.append(BenchRegression(key, f"time_{time_stat}_s", ref_t, cur_t, ratio, 1.0 + max_time_regression))
+            elif ratio < 1.0 / (1.0 + max_time_regression) and (ref_t - cur_t) >= min_time_delta_s:
+                improvements.append(key)
+        cur_m, ref_m = row.get("peak_memory_bytes"), ref.get("peak_memory_bytes")
+        if cur_m is not None and ref_m:
+            ratio = float(cur_m) / float(ref_m)
+            if ratio > 1.0 + max_memory_regression and (float(cur_m) - float(ref_m)) >= min_memory_delta_bytes:
+                regressions.append(
+                    BenchRegression(key, "peak_memory_bytes", float(ref_m), float(cur_m), ratio, 1.0 + max_memory_regression)
+                )
+    return BenchComparison(passed=not regressions, regressions=regressions, improvements=improvements, missing_in_baseline=missing)
+
+
+def format_bench_table(results: Sequence[BenchResult], comparison: Optional[BenchComparison] = None) -> str:
+    flagged = {(r.key, r.metric) for r in (comparison.regressions if comparison else [])}
+    lines = [
+        f"{'scenario/size':<32} {'median s':>10} {'p90 s':>10} {'min s':>10} {'peak MiB':>10}  status",
+    ]
+    for r in results:
+        s = r.stats()
+        mem = f"{r.peak_memory_bytes / (1 << 20):.1f}" if r.peak_memory_bytes is not None else "-"
+        bad = [m for k, m in flagged if k == r.key]
+        status = ("REGRESSION " + ",".join(sorted(bad))) if bad else "ok"
+        lines.append(f"{r.key:<32} {s['median']:>10.4f} {s['p90']:>10.4f} {s['min']:>10.4f} {mem:>10}  {status}")
+    return "\n".join(lines)
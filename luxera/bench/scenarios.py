@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+"""Registered benchmark scenarios covering the calculation, import and report hot paths."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+from luxera.project.schema import (
+    CalcGrid,
+    DaylightSpec,
+    JobSpec,
+    LuminaireInstance,
+    OpeningSpec,
+    PhotometryAsset,
+    Project,
+    RoadwayGridSpec,
+    RoadwaySpec,
+    RoomSpec,
+    RotationSpec,
+    SurfaceSpec,
+    TransformSpec,
+)
+
+
+# ``setup(workdir, params)`` prepares inputs outside the timed region and returns the timed call.
+SetupFn = Callable[[Path, Mapping[str, Any]], Callable[[], Any]]
+
+DEFAULT_SIZES: Tuple[str, ...] = ("small", "medium", "large")
+
+
+@dataclass(frozen=True)
+class BenchScenario:
+    name: str
+    description: str
+    sizes: Mapping[str, Mapping[str, Any]]
+    setup: SetupFn
+    tags: Tuple[str, ...] = field(default_factory=tuple)
+
+
+_SCENARIOS: Dict[str, BenchScenario] = {}
+
+
+def register_scenario(scenario: BenchScenario) -> BenchScenario:
+    if scenario.name in _SCENARIOS:
+        raise ValueError(f"Benchmark scenario already registered: {scenario.name}")
+    if not scenario.sizes:
+        raise ValueError(f"Benchmark scenario {scenario.name} defines no sizes")
+    _SCENARIOS[scenario.name] = scenario
+    return scenario
+
+
+def get_scenario(name: str) -> BenchScenario:
+    try:
+        return _SCENARIOS[name]
+    except KeyError:
+        raise ValueError(f"Unknown benchmark scenario: {name}") from None
+
+
+def list_scenarios() -> List[BenchScenario]:
+    return [_SCENARIOS[k] for k in sorted(_SCENARIOS)]
+
+
+_IES_TEXT = """IESNA:LM-63-2019
+TILT=NONE
+1 3000 1 5 1 1 2 0.6 0.6 0.1
+0 22.5 45 67.5 90
+0
+1100 1000 750 380 90
+"""
+_ROT0 = RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0))
+
+
+def _photometry(workdir: Path) -> PhotometryAsset:
+    path = workdir / "bench.ies"
+    if not path.exists():
+        path.write_text(_IES_TEXT, encoding="utf-8")
+    return PhotometryAsset(id="a1", format="IES", path=str(path))
+
+
+def _office_project(workdir: Path, params: Mapping[str, Any]) -> Project:
+    """Rectangular room with a regular luminaire layout, one work-plane grid and a direct job."""
+    width = float(params.get("width", 12.0))
+    length = float(params.get("length", 9.0))
+    height = float(params.get("height", 3.0))
+    lum_nx, lum_ny = int(params.get("lum_nx", 4)), int(params.get("lum_ny", 3))
+    grid_n = int(params.get("grid", 20))
+    p = Project(name="bench_office", root_dir=str(workdir))
+    p.photometry_assets.append(_photometry(workdir))
+    p.geometry.rooms.append(RoomSpec(id="r1", name="Room", width=width, length=length, height=height))
+    for i in range(lum_nx):
+        for j in range(lum_ny):
+            pos = ((i + 0.5) * width / lum_nx, (j + 0.5) * length / lum_ny, height - 0.05)
+            p.luminaires.append(
+                LuminaireInstance(
+                    id=f"l_{i}_{j}",
+                    name=f"L{i}.{j}",
+                    photometry_asset_id="a1",
+                    transform=TransformSpec(position=pos, rotation=_ROT0),
+                )
+            )
+    p.grids.append(
+        CalcGrid(
+            id="g1",
+            name="Work plane",
+            origin=(0.0, 0.0, 0.0),
+            width=width,
+            height=length,
+            elevation=0.8,
+            nx=grid_n,
+            ny=grid_n,
+            room_id="r1",
+        )
+    )
+    blockers = int(params.get("blockers", 0))
+    for k in range(blockers * blockers):
+        bx, by = k % blockers, k // blockers
+        x0, y0 = (bx + 0.2) * width / blockers, (by + 0.2) * length / blockers
+        x1, y1 = (bx + 0.8) * width / blockers, (by + 0.8) * length / blockers
+        p.geometry.surfaces.append(
+            SurfaceSpec(id=f"b_{k}", name=f"b_{k}", kind="custom", vertices=[(x0, y0, 1.6), (x1, y0, 1.6), (x1, y1, 1.6), (x0, y1, 1.6)])
+        )
+    p.jobs.append(JobSpec(id="direct", type="direct", backend="cpu", settings={"use_occlusion": blockers > 0}))
+    return p
+
+
+def _setup_direct(workdir: Path, params: Mapping[str, Any]) -> Callable[[], Any]:
+    from luxera.engine.direct_illuminance import build_direct_occlusion_context, load_luminaires, run_direct_grid
+
+    project = _office_project(workdir, params)
+    luminaires, _ = load_luminaires(project, lambda asset: asset.id)
+    grid = project.grids[0]
+    occlusion = None
+    if project.geometry.surfaces:
+        occlusion = build_direct_occlusion_context(project, include_room_shell=False, occlusion_epsilon=1e-6)
+    return lambda: run_direct_grid(grid, luminaires, occlusion=occlusion, use_occlusion=occlusion is not None)
+
+
+def _setup_radiosity(method: str) -> SetupFn:
+    def setup(workdir: Path, params: Mapping[str, Any]) -> Callable[[], Any]:  # noqa: ARG001
+        from luxera.engine.direct_illuminance import build_room_from_spec
+        from luxera.engine.radiosity.solver import RadiosityConfig, solve_radiosity
+
+        room = build_room_from_spec(
+            RoomSpec(id="r1", name="Room", width=float(params["width"]), length=float(params["length"]), height=3.0)
+        )
+        surfaces = room.get_surfaces()
+        direct = {s.id: (500.0 if "floor" in s.id.lower() else 120.0) for s in surfaces}
+        config = RadiosityConfig(
+            max_iters=int(params.get("max_iters", 50)),
+            patch_max_area=float(params["patch_max_area"]),
+            form_factor_method=method,
+            monte_carlo_samples=int(params.get("samples", 16)),
+            hemicube_resolution=int(params.get("hemicube_resolution", 32)),
+        )
+        return lambda: solve_radiosity(surfaces, direct, config=config)
+
+    return setup
+
+
+def _setup_ugr(workdir: Path, params: Mapping[str, Any]) -> Callable[[], Any]:
+    from luxera.engine.direct_illuminance import build_room_from_spec, load_luminaires
+    from luxera.engine.ugr_engine import compute_ugr_default
+
+    project = _office_project(workdir, params)
+    luminaires, _ = load_luminaires(project, lambda asset: asset.id)
+    room = build_room_from_spec(project.geometry.rooms[0])
+    spacing = float(params.get("ugr_spacing", 2.0))
+    return lambda: compute_ugr_default(room, luminaires, grid_spacing=spacing, eye_heights=[1.2])
+
+
+def _setup_roadway(workdir: Path, params: Mapping[str, Any]) -> Callable[[], Any]:
+    from luxera.project.runner import run_job_in_memory
+
+    length = float(params["road_length"])
+    spacing = float(params.get("pole_spacing", 30.0))
+    p = Project(name="bench_roadway", root_dir=str(workdir))
+    p.photometry_assets.append(_photometry(workdir))
+    x = 0.0
+    k = 0
+    while x <= length:
+        p.luminaires.append(
+            LuminaireInstance(
+                id=f"pole_{k}",
+                name=f"Pole {k}",
+                photometry_asset_id="a1",
+                transform=TransformSpec(position=(x, -1.0, 10.0), rotation=_ROT0),
+            )
+        )
+        x += spacing
+        k += 1
+    p.roadways.append(RoadwaySpec(id="rw1", name="Road", start=(0.0, 0.0, 0.0), end=(length, 0.0, 0.0), num_lanes=2, lane_width=3.5))
+    p.roadway_grids.append(
+        RoadwayGridSpec(
+            id="rg1",
+            name="Road grid",
+            lane_width=3.5,
+            road_length=length,
+            nx=int(params["longitudinal"]),
+            ny=4,
+            roadway_id="rw1",
+            num_lanes=2,
+            longitudinal_points=int(params["longitudinal"]),
+            transverse_points_per_lane=2,
+        )
+    )
+    p.jobs.append(JobSpec(id="road", type="roadway", backend="cpu", settings={"road_surface_class": "R3"}))
+    return lambda: run_job_in_memory(p, "road")
+
+
+def _setup_daylight(workdir: Path, params: Mapping[str, Any]) -> Callable[[], Any]:
+    from luxera.engine.daylight_df import run_daylight_df
+
+    p = Project(name="bench_daylight", root_dir=str(workdir))
+    windows = int(params.get("windows", 2))
+    for w in range(windows):
+        x0 = 0.5 + 2.5 * w
+        p.geometry.openings.append(
+            OpeningSpec(
+                id=f"op{w}",
+                name=f"Window {w}",
+                kind="window",
+                vertices=[(x0, 0.0, 1.0), (x0 + 2.0, 0.0, 1.0), (x0 + 2.0, 0.0, 2.5), (x0, 0.0, 2.5)],
+                is_daylight_aperture=True,
+                visible_transmittance=0.65,
+            )
+        )
+    grid_n = int(params["grid"])
+    p.grids.append(
+        CalcGrid(id="g1", name="Grid", origin=(0.0, 0.5, 0.0), width=2.5 * windows + 1.0, height=6.0, elevation=0.8, nx=grid_n, ny=grid_n)
+    )
+    job = JobSpec(
+        id="daylight",
+        type="daylight",
+        backend="df",
+        daylight=DaylightSpec(mode="df", sky="CIE_overcast", external_horizontal_illuminance_lux=10000.0),
+        targets=["g1"],
+    )
+    p.jobs.append(job)
+    return lambda: run_daylight_df(p, job)
+
+
+def _setup_import(workdir: Path, params: Mapping[str, Any]) -> Callable[[], Any]:
+    from luxera.io.geometry_import import import_geometry_file
+
+    n = int(params["grid"])
+    path = workdir / f"terrain_{n}.obj"
+    lines = [f"v {i * 0.25:.4f} {j * 0.25:.4f} {0.05 * ((i * 7 + j * 3) % 11):.4f}" for j in range(n + 1) for i in range(n + 1)]
+    for j in range(n):
+        for i in range(n):
+            a = j * (n + 1) + i + 1
+            lines.append(f"f {a} {a + 1} {a + n + 2}")
+            lines.append(f"f {a} {a + n + 2} {a + n + 1}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return lambda: import_geometry_file(str(path))
+
+
+def _setup_report(workdir: Path, params: Mapping[str, Any]) -> Callable[[], Any]:
+    from luxera.export.pdf_report import build_project_pdf_report
+    from luxera.project.runner import run_job_in_memory
+
+    project = _office_project(workdir, params)
+    ref = run_job_in_memory(project, "direct")
+    out = workdir / "report.pdf"
+    return lambda: build_project_pdf_report(project, ref, out)
+
+
+def _setup_incremental(workdir: Path, params: Mapping[str, Any]) -> Callable[[], Any]:
+    """Row of rooms behind shared partitions; the timed call toggles one partition's height."""
+    from luxera.engine.incremental import IncrementalDirectSession
+    from luxera.geometry.param.model import FootprintParam, RoomParam, SharedWallParam, WallParam
+    from luxera.geometry.param.rebuild import rebuild_surfaces_for_room
+
+    rooms, grid_n = int(params.get("rooms", 4)), int(params.get("grid", 10))
+    p = Project(name="bench_floor", root_dir=str(workdir))
+    p.photometry_assets.append(_photometry(workdir))
+    for i in range(rooms):
+        x0 = 4.0 * i
+        p.param.footprints.append(FootprintParam(id=f"f{i}", polygon2d=[(x0, 0.0), (x0 + 4.0, 0.0), (x0 + 4.0, 4.0), (x0, 4.0)]))
+        p.param.rooms.append(RoomParam(id=f"r{i}", footprint_id=f"f{i}", height=3.0))
+        p.param.walls.append(WallParam(id=f"r{i}_s", room_id=f"r{i}", edge_ref=(0, 1)))
+        p.param.walls.append(WallParam(id=f"r{i}_n", room_id=f"r{i}", edge_ref=(2, 3)))
+        if i > 0:
+            p.param.shared_walls.append(SharedWallParam(id=f"sw{i}", edge_geom=((x0, 0.0), (x0, 4.0)), room_a=f"r{i - 1}", room_b=f"r{i}"))
+        p.luminaires.append(
+            LuminaireInstance(id=f"l{i}", name=f"L{i}", photometry_asset_id="a1", transform=TransformSpec(position=(x0 + 2.0, 2.0, 2.8), rotation=_ROT0))
+        )
+        p.grids.append(
+            CalcGrid(id=f"g{i}", name=f"g{i}", origin=(x0 + 0.1, 0.1, 0.0), width=3.8, height=3.8, elevation=0.8, nx=grid_n, ny=grid_n, room_id=f"r{i}")
+        )
+    for i in range(rooms):
+        rebuild_surfaces_for_room(f"r{i}", p)
+    session = IncrementalDirectSession(use_occlusion=True)
+    session.update(p)
+    wall = p.param.shared_walls[len(p.param.shared_walls) // 2]
+
+    def edit() -> Any:
+        wall.height = 1.0 if wall.height is None else None
+        return session.apply_edit(p, [f"shared_wall:{wall.id}"])
+
+    return edit
+
+
+def _office_sizes(**extra: Mapping[str, Any]) -> Dict[str, Dict[str, Any]]:
+    base = {
+        "small": {"width": 8.0, "length": 6.0, "lum_nx": 3, "lum_ny": 2, "grid": 16},
+        "medium": {"width": 16.0, "length": 12.0, "lum_nx": 6, "lum_ny": 4, "grid": 48},
+        "large": {"width": 32.0, "length": 24.0, "lum_nx": 12, "lum_ny": 8, "grid": 120},
+    }
+    return {size: {**params, **dict(extra.get(size, {}))} for size, params in base.items()}
+
+
+register_scenario(
+    BenchScenario(
+        name="direct",
+        description="Direct illuminance on a work-plane grid, no occlusion.",
+        sizes=_office_sizes(),
+        setup=_setup_direct,
+        tags=("direct",),
+    )
+)
+register_scenario(
+    BenchScenario(
+        name="direct_occlusion",
+        description="Direct illuminance through a field of blocker panels (BVH shadow rays).",
+        sizes=_office_sizes(small={"blockers": 4}, medium={"blockers": 12}, large={"blockers": 30}),
+        setup=_setup_direct,
+        tags=("direct", "occlusion"),
+    )
+)
+_RADIOSITY_SIZES = {
+    "small": {"width": 4.0, "length": 3.0, "patch_max_area": 1.0},
+    "medium": {"width": 6.0, "length": 5.0, "patch_max_area": 0.5},
+    "large": {"width": 10.0, "length": 8.0, "patch_max_area": 0.25},
+}
+# Hemicube rasterises every patch's view of the scene, so it gets coarser meshes.
+_HEMICUBE_SIZES = {
+    "small": {"width": 4.0, "length": 3.0, "patch_max_area": 4.0, "hemicube_resolution": 16},
+    "medium": {"width": 6.0, "length": 5.0, "patch_max_area": 2.0, "hemicube_resolution": 24},
+    "large": {"width": 10.0, "length": 8.0, "patch_max_area": 1.0, "hemicube_resolution": 32},
+}
+for _method, _sizes in (("analytic", _RADIOSITY_SIZES), ("monte_carlo", _RADIOSITY_SIZES), ("hemicube", _HEMICUBE_SIZES)):
+    register_scenario(
+        BenchScenario(
+            name=f"radiosity_{_method}",
+            description=f"Radiosity solve with {_method.replace('_', ' ')} form factors on a rectangular room.",
+            sizes=_sizes,
+            setup=_setup_radiosity(_method),
+            tags=("radiosity",),
+        )
+    )
+register_scenario(
+    BenchScenario(
+        name="incremental_edit",
+        description="Incremental direct recompute after a partition edit on a floor of rooms (per-room BLAS).",
+        sizes={
+            "small": {"rooms": 4, "grid": 10},
+            "medium": {"rooms": 10, "grid": 16},
+            "large": {"rooms": 20, "grid": 20},
+        },
+        setup=_setup_incremental,
+        tags=("direct", "occlusion", "incremental"),
+    )
+)
+register_scenario(
+    BenchScenario(
+        name="ugr",
+        description="Default UGR observer sweep over an office luminaire layout.",
+        sizes=_office_sizes(small={"ugr_spacing": 2.0}, medium={"ugr_spacing": 1.5}, large={"ugr_spacing": 1.5}),
+        setup=_setup_ugr,
+        tags=("glare",),
+    )
+)
+register_scenario(
+    BenchScenario(
+        name="roadway",
+        description="Roadway job: illuminance/luminance grid, observers and TI on a straight two-lane road.",
+        sizes={
+            "small": {"road_length": 60.0, "longitudinal": 10},
+            "medium": {"road_length": 300.0, "longitudinal": 40},
+            "large": {"road_length": 1200.0, "longitudinal": 120},
+        },
+        setup=_setup_roadway,
+        tags=("roadway",),
+    )
+)
+register_scenario(
+    BenchScenario(
+        name="daylight",
+        description="Daylight factor on a work-plane grid behind side windows.",
+        sizes={
+            "small": {"grid": 16, "windows": 2},
+            "medium": {"grid": 64, "windows": 4},
+            "large": {"grid": 160, "windows": 8},
+        },
+        setup=_setup_daylight,
+        tags=("daylight",),
+    )
+)
+register_scenario(
+    BenchScenario(
+        name="import_obj",
+        description="OBJ geometry import of a triangulated height field.",
+        sizes={"small": {"grid": 20}, "medium": {"grid": 80}, "large": {"grid": 200}},
+        setup=_setup_import,
+        tags=("import",),
+    )
+)
+register_scenario(
+    BenchScenario(
+        name="report_pdf",
+        description="Project PDF report for a finished direct job.",
+        sizes=_office_sizes(),
+        setup=_setup_report,
+        tags=("report",),
+    )
+)
@@ -1,3 +1,16 @@
-from luxera.cache.photometry_cache import load_lut_from_cache, save_lut_to_cache
+from luxera.cache.figure_cache import figure_key, load_figure_from_cache, save_figure_to_cache
+from luxera.cache.parse_cache import load_parsed_from_cache, parse_cache_key, parse_photometry_text_cached, save_parsed_to_cache
+from luxera.cache.photometry_cache import has_cached_lut, load_lut_from_cache, save_lut_to_cache
 
-__all__ = ["load_lut_from_cache", "save_lut_to_cache"]
+__all__ = [
+    "figure_key",
+    "load_figure_from_cache",
+    "save_figure_to_cache",
+    "has_cached_lut",
+    "load_lut_from_cache",
+    "save_lut_to_cache",
+    "parse_cache_key",
+    "load_parsed_from_cache",
+    "save_parsed_to_cache",
+    "parse_photometry_text_cached",
+]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+import numpy as np
+
+
+_MEMORY_LIMIT = 128
+# On-disk figures are evicted least-recently-used first beyond this size.
+_DISK_LIMIT_BYTES = 256 * 1024 * 1024
+_memory: "OrderedDict[str, bytes]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def _update_digest(h: "hashlib._Hash", value: Any) -> None:
+    if isinstance(value, np.ndarray):
+        arr = np.ascontiguousarray(value)
+        h.update(f"nd:{arr.dtype.str}:{arr.shape}:".encode("ascii"))
+        h.update(arr.tobytes())
+    elif isinstance(value, Mapping):
+        h.update(b"{")
+        for key in sorted(value, key=str):
+            h.update(repr(str(key)).encode("utf-8") + b":")
+            _update_digest(h, value[key])
+        h.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        h.update(b"[")
+        for item in value:
+            _update_digest(h, item)
+        h.update(b"]")
+    else:
+        h.update(repr(value).encode("utf-8") + b";")
+
+
+def figure_key(kind: str, spec: Mapping[str, Any], style: Mapping[str, Any]) -> str:
+    """Content hash of a figure's input data and rendering style."""
+    h = hashlib.sha256()
+    h.update(kind.encode("utf-8") + b"|")
+    _update_digest(h, style)
+    _update_digest(h, spec)
+    return h.hexdigest()
+
+
+def _cache_file(cache_dir: Path, key: str) -> Path:
+    return cache_dir / f"{key}.png"
+
+
+def load_figure_from_cache(cache_dir: Optional[str | Path], key: str) -> Optional[bytes]:
+    """Return cached PNG bytes from the in-process LRU, then ``cache_dir``."""
+    with _memory_lock:
+        png = _memory.get(key)
+        if png is not None:
+            _memory.move_to_end(key)
+            return png
+    if cache_dir is None:
+        return None
+    path = _cache_file(Path(cache_dir).expanduser().resolve(), key)
+    if not path.exists():
+        return None
+    try:
+        png = path.read_bytes()
+        # Hits refresh the mtime, which orders disk eviction.
+        os.utime(path)
+    except OSError:
+        return None
+    _remember(key, png)
+    return png
+
+
+def save_figure_to_cache(
+    cache_dir: Optional[str | Path],
+    key: str,
+    png: bytes,
+    *,
+    max_bytes: int = _DISK_LIMIT_BYTES,
+) -> Optional[Path]:
+    """Store PNG bytes in memory and under ``cache_dir``, bounded to ``max_bytes`` on disk."""
+    _remember(key, png)
+    if cache_dir is None:
+        return None
+    root = Path(cache_dir).expanduser().resolve()
+    root.mkdir(parents=True, exist_ok=True)
+    out = _cache_file(root, key)
+    tmp = out.with_suffix(".tmp")
+    tmp.write_bytes(png)
+    tmp.replace(out)
+    _prune_disk(root, max_bytes, keep=out)
+    return out
+
+
+def _prune_disk(root: Path, max_bytes: int, keep: Path) -> None:
+    """Delete the least recently used figures until ``root`` fits in ``max_bytes``."""
+    entries = []
+    total = 0
+    for path in root.glob("*.png"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime_ns, st.st_size, path))
+        total += st.st_size
+    if total <= max_bytes:
+        return
+    entries.sort(key=lambda e: e[0])
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+
+
+def clear_figure_memory_cache() -> None:
+    with _memory_lock:
+        _memory.clear()
+
+
+def _remember(key: str, png: bytes) -> None:
+    with _memory_lock:
+        _memory[key] = png
+        _memory.move_to_end(key)
+        while len(_memory) > _MEMORY_LIMIT:
+            _memory.popitem(last=False)
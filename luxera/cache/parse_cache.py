@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+
+# Bump when ParsedIES / ParsedLDT or the parsers change shape or semantics.
+PARSE_CACHE_VERSION = 2
+_MEMORY_LIMIT = 256
+# Encoded entries: JSON document plus the float arrays it references.
+_Entry = Tuple[str, Dict[str, np.ndarray]]
+_memory: "OrderedDict[str, _Entry]" = OrderedDict()
+_memory_lock = threading.Lock()
+_TYPES: Dict[str, type] = {}
+
+
+def parse_cache_key(fmt: str, text: str) -> str:
+    """Content hash of photometry text for the given format and parser version."""
+    h = hashlib.sha256()
+    h.update(f"luxera-parse:v{PARSE_CACHE_VERSION}:{fmt.upper()}|".encode("ascii"))
+    h.update(text.encode("utf-8", errors="surrogatepass"))
+    return h.hexdigest()
+
+
+def _cache_file(cache_dir: Path, key: str) -> Path:
+    return cache_dir / f"{key}.npz"
+
+
+def _types() -> Dict[str, type]:
+    """Dataclasses allowed in cache entries; nothing else is ever instantiated on load."""
+    if not _TYPES:
+        from luxera.models.angles import AngleGrid
+        from luxera.models.candela import CandelaGrid
+        from luxera.models.photometry import PhotometryHeader
+        from luxera.models.tilt import TiltData
+        from luxera.parser.ies_parser import IESMetadata, ParsedIES, ParseNote
+        from luxera.parser.ldt_parser import LDTAngles, LDTCandela, LDTGeometry, LDTHeader, LDTLampData, ParsedLDT
+
+        for cls in (
+            AngleGrid, CandelaGrid, PhotometryHeader, TiltData, IESMetadata, ParsedIES, ParseNote,
+            LDTAngles, LDTCandela, LDTGeometry, LDTHeader, LDTLampData, ParsedLDT,
+        ):
+            _TYPES[cls.__name__] = cls
+    return _TYPES
+
+
+def _float_array(values: list) -> Optional[np.ndarray]:
+    """Lists of floats and rectangular lists of float rows become arrays."""
+    if not values:
+        return None
+    if all(type(v) is float for v in values):
+        return np.asarray(values, dtype=float)
+    if all(type(row) is list and row for row in values):
+        width = len(values[0])
+        if all(len(row) == width and all(type(v) is float for v in row) for row in values):
+            return np.asarray(values, dtype=float)
+    return None
+
+
+def _encode(value: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        name = type(value).__name__
+        if _types().get(name) is not type(value):
+            raise TypeError(f"Cannot cache parse result field of type {name}")
+        return {"__type__": name, "fields": {f.name: _encode(getattr(value, f.name), arrays) for f in fields(value)}}
+    if isinstance(value, np.ndarray):
+        key = f"a{len(arrays)}"
+        arrays[key] = np.asarray(value)
+        return {"__ndarray__": key}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(v, arrays) for v in value]}
+    if isinstance(value, list):
+        arr = _float_array(value)
+        if arr is None:
+            return [_encode(v, arrays) for v in value]
+        key = f"a{len(arrays)}"
+        arrays[key] = arr
+        return {"__array__": key}
+    if isinstance(value, dict):
+        return {"__dict__": {str(k): _encode(v, arrays) for k, v in value.items()}}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Cannot cache parse result value of type {type(value).__name__}")
+
+
+def _decode(node: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    if isinstance(node, list):
+        return [_decode(v, arrays) for v in node]
+    if not isinstance(node, dict):
+        return node
+    if "__type__" in node:
+        cls = _types()[str(node["__type__"])]
+        return cls(**{k: _decode(v, arrays) for k, v in node["fields"].items()})
+    if "__array__" in node:
+        return arrays[str(node["__array__"])].tolist()
+    if "__ndarray__" in node:
+        return np.array(arrays[str(node["__ndarray__"])])
+    if "__tuple__" in node:
+        return tuple(_decode(v, arrays) for v in node["__tuple__"])
+    return {k: _decode(v, arrays) for k, v in node["__dict__"].items()}
+
+
+def _remember(key: str, entry: _Entry) -> None:
+    with _memory_lock:
+        _memory[key] = entry
+        _memory.move_to_end(key)
+        while len(_memory) > _MEMORY_LIMIT:
+            _memory.popitem(last=False)
+
+
+def _read_entry(path: Path) -> _Entry:
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: np.asarray(data[name]) for name in data.files if name != "meta"}
+        return str(data["meta"]), arrays
+
+
+def load_parsed_from_cache(cache_dir: Optional[str | Path], key: str) -> Optional[Any]:
+    """
+    Return a fresh copy of a cached parse result from the in-process LRU, then ``cache_dir``.
+
+    Entries are ``.npz`` files holding the float arrays plus a JSON ``meta`` document,
+    loaded with ``allow_pickle=False``. Unreadable cache files are treated as misses.
+    """
+    with _memory_lock:
+        entry = _memory.get(key)
+        if entry is not None:
+            _memory.move_to_end(key)
+    try:
+        if entry is None and cache_dir is not None:
+            path = _cache_file(Path(cache_dir).expanduser().resolve(), key)
+            if path.exists():
+                entry = _read_entry(path)
+        if entry is None:
+            return None
+        payload = json.loads(entry[0])
+        if payload.get("version") != PARSE_CACHE_VERSION:
+            return None
+        doc = _decode(payload["doc"], entry[1])
+    except Exception:
+        return None
+    _remember(key, entry)
+    return doc
+
+
+def save_parsed_to_cache(cache_dir: Optional[str | Path], key: str, doc: Any) -> Optional[Path]:
+    arrays: Dict[str, np.ndarray] = {}
+    meta = json.dumps({"version": PARSE_CACHE_VERSION, "doc": _encode(doc, arrays)}, separators=(",", ":"))
+    entry: _Entry = (meta, arrays)
+    _remember(key, entry)
+    if cache_dir is None:
+        return None
+    root = Path(cache_dir).expanduser().resolve()
+    root.mkdir(parents=True, exist_ok=True)
+    out = _cache_file(root, key)
+    tmp = out.with_suffix(".tmp")
+    with tmp.open("wb") as fh:
+        np.savez_compressed(fh, meta=np.asarray(meta), **arrays)
+    tmp.replace(out)
+    return out
+
+
+def clear_parse_memory_cache() -> None:
+    with _memory_lock:
+        _memory.clear()
+
+
+def parse_photometry_text_cached(
+    text: str,
+    fmt: str,
+    *,
+    source_path: str | Path | None = None,
+    cache_dir: Optional[str | Path] = None,
+) -> Any:
+    """
+    Parse IES/LDT text, reusing a previous parse of identical content.
+
+    IES files whose tilt data lives in a separate file (``TILT=FILE``) are never cached.
+    Parse errors propagate and are not cached.
+    """
+    from luxera.parser.ies_parser import parse_ies_text
+    from luxera.parser.ldt_parser import parse_ldt_text
+
+    kind = fmt.upper()
+    if kind not in {"IES", "LDT"}:
+        raise ValueError(f"Unsupported photometry format: {fmt}")
+    key = parse_cache_key(kind, text)
+    doc = load_parsed_from_cache(cache_dir, key)
+    if doc is not None:
+        return doc
+    if kind == "IES":
+        doc = parse_ies_text(text, source_path=source_path)
+        if str(doc.tilt_mode or "NONE").upper() not in {"NONE", "INCLUDE"}:
+            return doc
+    else:
+        doc = parse_ldt_text(text)
+    save_parsed_to_cache(cache_dir, key, doc)
+    return doc
@@ -29,6 +29,10 @@ def save_lut_to_cache(cache_dir: str | Path, lut: "PhotometryLUT") -> Path:
     return out
 
 
+def has_cached_lut(cache_dir: str | Path, content_hash: str) -> bool:
+    return _cache_file(Path(cache_dir).expanduser().resolve(), content_hash).exists()
+
+
 def load_lut_from_cache(cache_dir: str | Path, content_hash: str) -> Optional["PhotometryLUT"]:
     root = Path(cache_dir).expanduser().resolve()
     path = _cache_file(root, content_hash)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Sequence, Set, Tuple
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 Point2 = Tuple[float, float]
 
@@ -99,3 +102,205 @@ def refine_from_samples(
         if keep:
             out.append(pi)
     return out
+
+
+@dataclass(frozen=True)
+class AdaptiveGridResult:
+    """Values on the full ``ny x nx`` lattice; ``computed`` marks points that were evaluated."""
+
+    values: np.ndarray
+    computed: np.ndarray
+    passes: int
+    converged: bool
+    metrics: Dict[str, float]
+
+    @property
+    def computed_count(self) -> int:
+        return int(np.count_nonzero(self.computed))
+
+
+def _lattice_edges(n: int, step: int) -> np.ndarray:
+    edges = list(range(0, n - 1, step)) + [n - 1]
+    return np.asarray(edges, dtype=np.int64)
+
+
+def _split_cells(cells: np.ndarray) -> np.ndarray:
+    """Quarter ``(i0, i1, j0, j1)`` cells at their midpoints, dropping zero-width children."""
+    i0, i1, j0, j1 = cells.T
+    im = i0 + (i1 - i0) // 2
+    jm = j0 + (j1 - j0) // 2
+    kids = np.concatenate(
+        [
+            np.stack((i0, im, j0, jm), axis=1),
+            np.stack((im, i1, j0, jm), axis=1),
+            np.stack((i0, im, jm, j1), axis=1),
+            np.stack((im, i1, jm, j1), axis=1),
+        ],
+        axis=0,
+    )
+    return kids[(kids[:, 1] > kids[:, 0]) & (kids[:, 3] > kids[:, 2])]
+
+
+def _fill_bilinear(values: np.ndarray, known: np.ndarray, quads: np.ndarray) -> np.ndarray:
+    """Fill unknown lattice points by bilinear interpolation over ``quads``, largest first."""
+    out = values.copy()
+    if quads.shape[0] == 0:
+        return out
+    w = quads[:, 1] - quads[:, 0]
+    h = quads[:, 3] - quads[:, 2]
+    order = np.lexsort((h, w, -(w * h)))
+    quads, w, h = quads[order], w[order], h[order]
+    shape_key = w * (int(h.max()) + 1) + h
+    bounds = np.flatnonzero(np.diff(shape_key)) + 1
+    for grp in np.split(np.arange(quads.shape[0]), bounds):
+        q = quads[grp]
+        gw, gh = int(w[grp[0]]), int(h[grp[0]])
+        tx = np.arange(gw + 1, dtype=float) / gw
+        ty = np.arange(gh + 1, dtype=float) / gh
+        v00 = values[q[:, 2], q[:, 0]][:, None, None]
+        v10 = values[q[:, 2], q[:, 1]][:, None, None]
+        v01 = values[q[:, 3], q[:, 0]][:, None, None]
+        v11 = values[q[:, 3], q[:, 1]][:, None, None]
+        fx = tx[None, None, :]
+        fy = ty[None, :, None]
+        est = (v00 * (1.0 - fx) + v10 * fx) * (1.0 - fy) + (v01 * (1.0 - fx) + v11 * fx) * fy
+        ii = q[:, 0][:, None, None] + np.arange(gw + 1)[None, None, :]
+        jj = q[:, 2][:, None, None] + np.arange(gh + 1)[None, :, None]
+        ii, jj = np.broadcast_arrays(ii, jj)
+        free = ~known[jj, ii]
+        out[jj[free], ii[free]] = est[free]
+    return out
+
+
+def _field_metrics(values: np.ndarray) -> Dict[str, float]:
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return {"E_min": 0.0, "E_avg": 0.0, "U0": 0.0}
+    e_min = float(np.min(finite))
+    e_avg = float(np.mean(finite))
+    return {"E_min": e_min, "E_avg": e_avg, "U0": (e_min / e_avg) if e_avg > 0.0 else 0.0}
+
+
+def _metrics_settled(prev: Dict[str, float], cur: Dict[str, float], tolerance: float) -> bool:
+    for key in ("E_min", "E_avg", "U0"):
+        scale = max(abs(cur[key]), abs(prev[key]), 1e-12)
+        if abs(cur[key] - prev[key]) > tolerance * scale:
+            return False
+    return True
+
+
+def adaptive_grid_values(
+    evaluate: Callable[[np.ndarray], np.ndarray],
+    nx: int,
+    ny: int,
+    *,
+    tolerance: float = 0.02,
+    max_level: int = 4,
+    max_points: Optional[int] = None,
+) -> AdaptiveGridResult:
+    """
+    Compute a field on an ``nx x ny`` lattice by error-driven quadtree refinement.
+
+    ``evaluate`` receives flat lattice indices (``j * nx + i``) of points not yet
+    computed and returns their values. Refinement starts from cells ``2**max_level``
+    points wide; each pass evaluates the mid and edge-mid points of the active cells
+    and splits cells whose bilinear prediction of those points misses by more than
+    ``tolerance * E_avg``. It stops once no cell needs splitting or E_min, E_avg and U0
+    of the reconstructed field change by less than ``tolerance`` between passes.
+    Points never evaluated are bilinearly interpolated from the final cells.
+    """
+    nx = int(nx)
+    ny = int(ny)
+    if nx < 1 or ny < 1:
+        raise ValueError("nx and ny must be >= 1")
+    if tolerance <= 0.0:
+        raise ValueError("tolerance must be > 0")
+    if max_level < 0:
+        raise ValueError("max_level must be >= 0")
+
+    values = np.full((ny, nx), np.nan, dtype=float)
+    known = np.zeros((ny, nx), dtype=bool)
+
+    def _ensure(jj: np.ndarray, ii: np.ndarray) -> None:
+        mark = np.zeros((ny, nx), dtype=bool)
+        mark[jj, ii] = True
+        mark &= ~known
+        flat = np.flatnonzero(mark)
+        if flat.size == 0:
+            return
+        got = np.asarray(evaluate(flat), dtype=float).reshape(-1)
+        if got.size != flat.size:
+            raise ValueError("evaluate must return one value per requested index")
+        values.reshape(-1)[flat] = got
+        known.reshape(-1)[flat] = True
+
+    if nx < 2 or ny < 2:
+        jj, ii = np.indices((ny, nx))
+        _ensure(jj.reshape(-1), ii.reshape(-1))
+        return AdaptiveGridResult(values=values, computed=known.copy(), passes=1, converged=True, metrics=_field_metrics(values))
+
+    step = 1 << int(max_level)
+    xs = _lattice_edges(nx, step)
+    ys = _lattice_edges(ny, step)
+    gi, gj = np.meshgrid(np.arange(xs.size - 1), np.arange(ys.size - 1))
+    cells = np.stack((xs[gi.ravel()], xs[gi.ravel() + 1], ys[gj.ravel()], ys[gj.ravel() + 1]), axis=1)
+    cj, ci = np.meshgrid(ys, xs, indexing="ij")
+    _ensure(cj.reshape(-1), ci.reshape(-1))
+
+    final_quads: List[np.ndarray] = []
+    prev_metrics: Optional[Dict[str, float]] = None
+    passes = 0
+    converged = False
+    while cells.shape[0]:
+        passes += 1
+        i0, i1, j0, j1 = cells.T
+        im = i0 + (i1 - i0) // 2
+        jm = j0 + (j1 - j0) // 2
+        _ensure(np.concatenate((j0, j1, jm, jm, jm)), np.concatenate((im, im, i0, i1, im)))
+
+        tx = np.divide(im - i0, i1 - i0, out=np.zeros(im.shape, dtype=float), where=i1 > i0)
+        ty = np.divide(jm - j0, j1 - j0, out=np.zeros(jm.shape, dtype=float), where=j1 > j0)
+        v00, v10 = values[j0, i0], values[j0, i1]
+        v01, v11 = values[j1, i0], values[j1, i1]
+        bottom = v00 + tx * (v10 - v00)
+        top = v01 + tx * (v11 - v01)
+        err = np.max(
+            np.abs(
+                np.stack(
+                    (
+                        values[j0, im] - bottom,
+                        values[j1, im] - top,
+                        values[jm, i0] - (v00 + ty * (v01 - v00)),
+                        values[jm, i1] - (v10 + ty * (v11 - v10)),
+                        values[jm, im] - (bottom + ty * (top - bottom)),
+                    ),
+                    axis=1,
+                )
+            ),
+            axis=1,
+        )
+        scale = max(abs(_field_metrics(values[known])["E_avg"]), 1e-12)
+        splittable = ((i1 - i0) >= 2) | ((j1 - j0) >= 2)
+        refine = ~(err <= float(tolerance) * scale) & splittable
+
+        # Accepted cells are final; their quarters' corners are all known now.
+        final_quads.append(_split_cells(cells[~refine]))
+        cells = _split_cells(cells[refine])
+
+        metrics = _field_metrics(_fill_bilinear(values, known, np.concatenate(final_quads + [cells], axis=0)))
+        if cells.shape[0] == 0 or (prev_metrics is not None and _metrics_settled(prev_metrics, metrics, tolerance)):
+            converged = True
+            break
+        prev_metrics = metrics
+        if max_points is not None and int(np.count_nonzero(known)) >= int(max_points):
+            break
+
+    quads = np.concatenate(final_quads + [cells], axis=0)
+    filled = _fill_bilinear(values, known, quads)
+    return AdaptiveGridResult(
+        values=filled,
+        computed=known.copy(),
+        passes=passes,
+        converged=converged,
+        metrics=_field_metrics(filled),
+    )
@@ -8,7 +8,7 @@ import numpy as np
 
 from luxera.geometry.openings.opening_uv import opening_uv_polygon
 from luxera.geometry.openings.project_uv import lift_uv_to_3d, project_points_to_uv, wall_basis
-from luxera.geometry.spatial import point_in_polygon
+from luxera.geometry.spatial import points_in_polygon, points_in_polygons
 from luxera.project.schema import OpeningSpec, SurfaceSpec
 
 
@@ -45,30 +45,20 @@ def build_workplane_grid(
     o = np.array(origin, dtype=float)
     du = float(width) / max(cols - 1, 1)
     dv = float(height) / max(rows - 1, 1)
-    pts: List[Point3] = []
-    mask: List[bool] = []
-    for j in range(rows):
-        for i in range(cols):
-            p = o + ou * (i * du) + ov * (j * dv)
-            pp = (float(p[0]), float(p[1]), float(p[2]))
-            keep = True
-            if clip_polygon is not None:
-                keep = point_in_polygon((pp[0], pp[1]), clip_polygon)
-                if keep:
-                    for h in holes:
-                        if point_in_polygon((pp[0], pp[1]), h):
-                            keep = False
-                            break
-            pts.append(pp)
-            mask.append(bool(keep))
-    conn: List[Tuple[int, int]] = []
-    for j in range(rows):
-        for i in range(cols):
-            idx = j * cols + i
-            if i + 1 < cols:
-                conn.append((idx, idx + 1))
-            if j + 1 < rows:
-                conn.append((idx, idx + cols))
+    jj, ii = np.divmod(np.arange(rows * cols), cols)
+    p = o[None, :] + ou[None, :] * (ii * du)[:, None] + ov[None, :] * (jj * dv)[:, None]
+    pts: List[Point3] = [(x, y, z) for x, y, z in p.tolist()]
+    if clip_polygon is not None:
+        mask = points_in_polygons(p, [clip_polygon], holes).tolist()
+    else:
+        mask = [True] * len(pts)
+    idx = np.arange(rows * cols)
+    right = idx[ii + 1 < cols]
+    up = idx[jj + 1 < rows]
+    # Interleave (idx, idx + 1) and (idx, idx + cols) per point, row-major.
+    pairs = np.concatenate((np.stack((right, right + 1), axis=1), np.stack((up, up + cols), axis=1)), axis=0)
+    order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+    conn: List[Tuple[int, int]] = [(a, b) for a, b in pairs[order].tolist()]
     n = np.cross(ou, ov)
     ln = float(np.linalg.norm(n))
     normal = (0.0, 0.0, 1.0) if ln <= 1e-12 else (float(n[0] / ln), float(n[1] / ln), float(n[2] / ln))
@@ -79,13 +69,13 @@ def mask_points_by_openings(
     points_wall_uv: Sequence[Point2],
     opening_polys_uv: Sequence[Sequence[Point2]],
 ) -> List[bool]:
-    keep: List[bool] = [True] * len(points_wall_uv)
-    for i, p in enumerate(points_wall_uv):
-        for poly in opening_polys_uv:
-            if point_in_polygon((float(p[0]), float(p[1])), poly):
-                keep[i] = False
-                break
-    return keep
+    if len(points_wall_uv) == 0:
+        return []
+    pts = np.asarray(points_wall_uv, dtype=float).reshape(len(points_wall_uv), -1)
+    blocked = np.zeros((pts.shape[0],), dtype=bool)
+    for poly in opening_polys_uv:
+        blocked |= points_in_polygon(pts, poly)
+    return (~blocked).tolist()
 
 
 def build_vertical_grid_on_wall(
@@ -130,7 +120,7 @@ def build_vertical_grid_on_wall(
         cols=cols,
     )
     grid_uv = project_points_to_uv(grid.points_xyz, origin, u, v)
-    mask = [point_in_polygon(p, wall_uv) for p in grid_uv]
+    mask = points_in_polygon(np.asarray(grid_uv, dtype=float).reshape(-1, 2), wall_uv).tolist()
     if openings:
         host_ops = [o for o in openings if o.host_surface_id == wall.id]
         if host_ops:
@@ -2,27 +2,28 @@ from __future__ import annotations
 
 from typing import List, Sequence, Tuple
 
-from luxera.geometry.spatial import point_in_polygon
+import numpy as np
+
+from luxera.geometry.spatial import points_in_polygons
 
 Point2 = Tuple[float, float]
 
 
+def _points_array(points: Sequence[Point2]) -> np.ndarray:
+    if len(points) == 0:
+        return np.zeros((0, 2), dtype=float)
+    return np.asarray(points, dtype=float).reshape(len(points), -1)[:, :2]
+
+
 def mask_points_by_polygons(points: Sequence[Point2], polygons: Sequence[Sequence[Point2]]) -> List[bool]:
-    mask: List[bool] = []
-    for p in points:
-        blocked = False
-        for poly in polygons:
-            if len(poly) >= 3 and point_in_polygon((float(p[0]), float(p[1])), poly):
-                blocked = True
-                break
-        mask.append(not blocked)
-    return mask
+    blocked = points_in_polygons(_points_array(points), polygons)
+    return (~blocked).tolist()
 
 
 def apply_obstacle_masks(base_mask: Sequence[bool], points: Sequence[Point2], obstacle_polygons: Sequence[Sequence[Point2]]) -> List[bool]:
     keep = mask_points_by_polygons(points, obstacle_polygons)
     n = min(len(base_mask), len(keep))
-    out = [bool(base_mask[i] and keep[i]) for i in range(n)]
+    out = (np.asarray(base_mask[:n], dtype=bool) & np.asarray(keep[:n], dtype=bool)).tolist()
     if len(base_mask) > n:
         out.extend(bool(x) for x in base_mask[n:])
     return out
@@ -46,14 +47,11 @@ def apply_opening_proximity_mask(
         bboxes.append((min(xs) - m, min(ys) - m, max(xs) + m, max(ys) + m))
     if not bboxes:
         return [bool(x) for x in base_mask]
-    out: List[bool] = []
-    for i, p in enumerate(points):
-        keep = bool(base_mask[i]) if i < len(base_mask) else True
-        if keep:
-            x, y = float(p[0]), float(p[1])
-            for x0, y0, x1, y1 in bboxes:
-                if x0 <= x <= x1 and y0 <= y <= y1:
-                    keep = False
-                    break
-        out.append(keep)
-    return out
+    pts = _points_array(points)
+    keep = np.ones((pts.shape[0],), dtype=bool)
+    n = min(len(base_mask), pts.shape[0])
+    keep[:n] = np.asarray(base_mask[:n], dtype=bool)
+    x, y = pts[:, 0], pts[:, 1]
+    for x0, y0, x1, y1 in bboxes:
+        keep &= ~((x0 <= x) & (x <= x1) & (y0 <= y) & (y <= y1))
+    return keep.tolist()
@@ -153,7 +153,7 @@ def _cmd_check(args: argparse.Namespace) -> int:
     if not project_path.exists():
         print(f"[ERROR] Project file not found: {project_path}")
         return 2
-    project = load_project_schema(project_path)
+    project = load_project_schema(project_path, sections=("geometry", "luminaires"))
     issues = ProjectDiagnostics().check(project)
 
     RED = "\x1b[31m"
@@ -568,12 +568,19 @@ def _cmd_run_job(args: argparse.Namespace) -> int:
 
     project_path = Path(args.project).expanduser().resolve()
     try:
-        ref = run_job(project_path, args.job_id)
+        ref = run_job(project_path, args.job_id, trace=True if getattr(args, "trace", False) else None)
     except RunnerError as e:
         print(f"[ERROR] Run failed: {e}")
         return 2
     print(f"Job completed: {ref.job_id}")
     print(f"  Result dir: {ref.result_dir}")
+    trace_path = Path(ref.result_dir) / "trace.json"
+    if trace_path.exists():
+        payload = json.loads((Path(ref.result_dir) / "result.json").read_text(encoding="utf-8"))
+        stages = (payload.get("trace") or {}).get("stages", {})
+        print(f"  Trace: {trace_path}")
+        for name, row in sorted(stages.items(), key=lambda kv: -float(kv[1]["wall_s"]))[:10]:
+            print(f"    {name:<28} {float(row['wall_s']):>9.3f}s wall {float(row['cpu_s']):>9.3f}s cpu  x{int(row['count'])}")
     return 0
 
 
@@ -808,7 +815,7 @@ def _cmd_compare_results(args: argparse.Namespace) -> int:
     from luxera.results.compare import compare_job_results
 
     project_path = Path(args.project).expanduser().resolve()
-    project = load_project_schema(project_path)
+    project = load_project_schema(project_path, sections=("results",))
     try:
         cmp = compare_job_results(project, args.job_a, args.job_b)
     except Exception as e:
@@ -924,12 +931,18 @@ def _cmd_parity_run(args: argparse.Namespace) -> int:
     selector = _load_parity_selector(args)
     parity_root = Path(getattr(args, "parity_root", "parity")).expanduser().resolve()
     out_dir = Path(args.out).expanduser().resolve() if getattr(args, "out", None) else Path("out/parity_runs").resolve()
+    suite_opts: Dict[str, Any] = {}
+    if getattr(args, "jobs", 1) != 1:
+        suite_opts["jobs"] = args.jobs
+    if getattr(args, "incremental", False):
+        suite_opts["incremental"] = True
     result = run_corpus(
         parity_root=parity_root,
         selector=selector,
         baseline=str(getattr(args, "baseline", "luxera")),
         out_dir=out_dir,
         update_goldens=bool(getattr(args, "update_goldens", False)),
+        **suite_opts,
     )
     print(json.dumps(result, indent=2, sort_keys=True))
     return 0
@@ -976,8 +989,8 @@ def _cmd_golden_run(args: argparse.Namespace) -> int:
 
 
 def _cmd_golden_compare(args: argparse.Namespace) -> int:
-    from luxera.testing.compare import compare_golden_case
-    from luxera.testing.golden import discover_golden_cases, load_golden_case, run_golden_case
+    from luxera.testing.compare import compare_golden_cases
+    from luxera.testing.golden import discover_golden_cases, load_golden_case
 
     root = Path(args.root).expanduser().resolve() if args.root else None
     if args.case_id == "all":
@@ -989,11 +1002,15 @@ def _cmd_golden_compare(args: argparse.Namespace) -> int:
         return 2
     run_root = Path(args.out).expanduser().resolve() if args.out else None
     any_fail = False
-    for case in cases:
-        produced = run_golden_case(case, run_root=run_root)
-        cmp = compare_golden_case(case, produced)
+    results = compare_golden_cases(
+        cases,
+        run_root=run_root,
+        jobs=getattr(args, "jobs", 1),
+        incremental=bool(getattr(args, "incremental", False)),
+    )
+    for cmp in results:
         status = "PASS" if cmp.passed else "FAIL"
-        print(f"Golden compare: {case.case_id} [{status}] report={cmp.report_path}")
+        print(f"Golden compare: {cmp.case_id} [{status}] report={cmp.report_path}")
         if not cmp.passed:
             any_fail = True
     return 1 if any_fail else 0
@@ -1347,6 +1364,17 @@ def _cmd_serve(args: argparse.Namespace) -> int:
     return 0
 
 
+def _cmd_daemon(args: argparse.Namespace) -> int:
+    from luxera.api.daemon import LuxeraDaemon
+
+    daemon = LuxeraDaemon(flush_delay_s=float(args.flush_delay))
+    if args.socket or args.port is not None:
+        daemon.serve_socket(socket_path=args.socket, host=str(args.host), port=int(args.port or 0))
+    else:
+        daemon.serve_stdio()
+    return 0
+
+
 def _library_db_path(raw: str | None) -> Path:
     if raw:
         return Path(raw).expanduser().resolve()
@@ -1522,7 +1550,7 @@ def _cmd_validate(args: argparse.Namespace) -> int:
         except ValueError as e:
             print(f"[ERROR] {e}")
             return 2
-        run_cases(selected, out)
+        run_cases(selected, out, jobs=args.jobs, incremental=bool(args.incremental))
         print(f"Validation run complete: {len(selected)} case(s)")
         return 0
 
@@ -1534,7 +1562,7 @@ def _cmd_validate(args: argparse.Namespace) -> int:
         except ValueError as e:
             print(f"[ERROR] {e}")
             return 2
-        results = run_cases(selected, out)
+        results = run_cases(selected, out, jobs=args.jobs, incremental=bool(args.incremental))
         suite_name = suite_target.split("/", 1)[0]
         md_path, json_path = write_suite_report(suite_name, results, out)
         print(f"Validation report written:\n  {json_path}\n  {md_path}")
@@ -1553,6 +1581,72 @@ def _cmd_validate(args: argparse.Namespace) -> int:
     return 0
 
 
+def _cmd_bench_list(args: argparse.Namespace) -> int:
+    from luxera.bench import select_scenarios
+
+    for scenario in select_scenarios(tags=args.tag or None):
+        sizes = ", ".join(scenario.sizes)
+        print(f"{scenario.name:<24} [{sizes}] {scenario.description}")
+    return 0
+
+
+def _cmd_bench_run(args: argparse.Namespace) -> int:
+    from luxera.bench import (
+        bench_report,
+        compare_to_baseline,
+        load_bench_report,
+        run_benchmarks,
+        select_scenarios,
+        write_bench_report,
+    )
+    from luxera.bench.runner import format_bench_table
+
+    scenarios = select_scenarios(args.scenario or None, args.tag or None)
+    if not scenarios:
+        print("[ERROR] No benchmark scenarios selected.")
+        return 2
+    sizes = [s.strip() for s in str(args.sizes).split(",") if s.strip()]
+    results = run_benchmarks(
+        scenarios,
+        sizes,
+        repeats=int(args.repeat),
+        warmup=int(args.warmup),
+        measure_memory=not bool(args.no_memory),
+    )
+    comparison = None
+    if args.baseline:
+        baseline_path = Path(args.baseline).expanduser()
+        if baseline_path.exists():
+            comparison = compare_to_baseline(
+                bench_report(results),
+                load_bench_report(baseline_path),
+                max_time_regression=float(args.max_time_regression),
+                max_memory_regression=float(args.max_memory_regression),
+                min_time_delta_s=float(args.min_time_delta),
+            )
+        elif not args.update_baseline:
+            print(f"[ERROR] Baseline file not found: {baseline_path}")
+            return 2
+    payload = bench_report(results, comparison=comparison)
+    print(format_bench_table(results, comparison))
+    if args.out:
+        print(f"Benchmark report: {write_bench_report(Path(args.out), payload)}")
+    if args.update_baseline:
+        if not args.baseline:
+            print("[ERROR] --update-baseline requires --baseline")
+            return 2
+        print(f"Baseline updated: {write_bench_report(Path(args.baseline), bench_report(results))}")
+        return 0
+    if comparison is not None:
+        for reg in comparison.regressions:
+            print(f"[REGRESSION] {reg.key} {reg.metric}: {reg.baseline:.6g} -> {reg.current:.6g} (x{reg.ratio:.2f} > x{reg.limit:.2f})")
+        for key in comparison.missing_in_baseline:
+            print(f"[NEW] {key} has no baseline entry")
+        if not comparison.passed:
+            return 1
+    return 0
+
+
 def _cmd_agent_run(args: argparse.Namespace) -> int:
     """Compatibility shim for `luxera agent run ...` used by legacy tests."""
     from luxera.runner import run_job, RunnerError
@@ -1584,7 +1678,7 @@ def _cmd_agent_run(args: argparse.Namespace) -> int:
 
 
 def _latest_result_payload(project_path: Path, job_id: str | None = None) -> tuple[dict[str, Any], Path]:
-    project = load_project_schema(project_path)
+    project = load_project_schema(project_path, sections=("results",))
     if not project.results:
         raise ValueError("No job results found in project")
     ref = project.results[-1] if job_id is None else next((r for r in reversed(project.results) if r.job_id == job_id), None)
@@ -1967,6 +2061,11 @@ def main(argv: list[str] | None = None) -> int:
     rj = sub.add_parser("run", help="Run a project job and store results.")
     rj.add_argument("project", help="Path to project JSON")
     rj.add_argument("job_id", help="Job id to run")
+    rj.add_argument(
+        "--trace",
+        action="store_true",
+        help="Record per-stage wall/CPU time and peak RSS into result.json and a Chrome trace (trace.json).",
+    )
     rj.set_defaults(func=_cmd_run_job)
 
     dj = sub.add_parser("daylight", help="Run a daylight job by id.")
@@ -2034,6 +2133,13 @@ def main(argv: list[str] | None = None) -> int:
     serve.add_argument("--port", type=int, default=8420, help="Bind port (default: 8420)")
     serve.set_defaults(func=_cmd_serve)
 
+    dmn = sub.add_parser("daemon", help="Run a long-lived JSON-RPC daemon over stdio or a local socket.")
+    dmn.add_argument("--socket", default=None, help="Listen on this Unix socket path instead of stdio")
+    dmn.add_argument("--port", type=int, default=None, help="Listen on a TCP port instead of stdio")
+    dmn.add_argument("--host", default="127.0.0.1", help="TCP host for --port")
+    dmn.add_argument("--flush-delay", type=float, default=0.0, help="Seconds to batch project saves (0 = save on every edit)")
+    dmn.set_defaults(func=_cmd_daemon)
+
     cr = sub.add_parser("compare-results", help="Compare two job results and output deltas.")
     cr.add_argument("project", help="Path to project JSON")
     cr.add_argument("job_a", help="Reference job id")
@@ -2057,6 +2163,8 @@ def main(argv: list[str] | None = None) -> int:
     pr.add_argument("--baseline", default="luxera", help="Baseline id (default: luxera)")
     pr.add_argument("--out", default=None, help="Output directory")
     pr.add_argument("--parity-root", default="parity", help="Parity corpus root")
+    pr.add_argument("--jobs", type=int, default=1, help="Worker processes (0: one per CPU)")
+    pr.add_argument("--incremental", action="store_true", default=False, help="Skip entries whose inputs are unchanged since their last recorded pass")
     pr.set_defaults(func=_cmd_parity_run)
 
     pu = parity_sub.add_parser("update", help="Run parity corpus and update expected goldens.")
@@ -2066,6 +2174,8 @@ def main(argv: list[str] | None = None) -> int:
     pu.add_argument("--out", default=None, help="Output directory")
     pu.add_argument("--parity-root", default="parity", help="Parity corpus root")
     pu.add_argument("--force", action="store_true", default=False, help="Compatibility flag")
+    pu.add_argument("--jobs", type=int, default=1, help="Worker processes (0: one per CPU)")
+    pu.add_argument("--incremental", action="store_true", default=False, help="Skip entries whose inputs are unchanged since their last recorded pass")
     pu.set_defaults(func=_cmd_parity_update)
 
     pp = parity_sub.add_parser("report", help="Print summary details from a parity corpus run directory.")
@@ -2085,6 +2195,8 @@ def main(argv: list[str] | None = None) -> int:
     gc.add_argument("case_id", help="Golden case id or 'all'")
     gc.add_argument("--root", default=None, help="Golden root directory (default: tests/golden)")
     gc.add_argument("--out", default=None, help="Output run root (default: <golden_root>/runs)")
+    gc.add_argument("--jobs", type=int, default=1, help="Worker processes (0: one per CPU)")
+    gc.add_argument("--incremental", action="store_true", default=False, help="Skip entries whose inputs are unchanged since their last recorded pass")
     gc.set_defaults(func=_cmd_golden_compare)
 
     gu = golden_sub.add_parser("update", help="Run and overwrite expected artifacts for one case (or all).")
@@ -2181,18 +2293,44 @@ def main(argv: list[str] | None = None) -> int:
     validate_run.add_argument("target", help="Suite or suite/case_id")
     validate_run.add_argument("--out", required=True, help="Output directory for run artifacts")
     validate_run.add_argument("--root", default=None, help="Validation root (default: tests/validation)")
+    validate_run.add_argument("--jobs", type=int, default=1, help="Worker processes (0: one per CPU)")
+    validate_run.add_argument("--incremental", action="store_true", default=False, help="Skip entries whose inputs are unchanged since their last recorded pass")
     validate_run.set_defaults(func=_cmd_validate)
 
     validate_report = validate_sub.add_parser("report", help="Run suite and emit markdown/json summary.")
     validate_report.add_argument("suite", help="Suite or suite/case_id")
     validate_report.add_argument("--out", required=True, help="Output directory for report artifacts")
     validate_report.add_argument("--root", default=None, help="Validation root (default: tests/validation)")
+    validate_report.add_argument("--jobs", type=int, default=1, help="Worker processes (0: one per CPU)")
+    validate_report.add_argument("--incremental", action="store_true", default=False, help="Skip entries whose inputs are unchanged since their last recorded pass")
     validate_report.set_defaults(func=_cmd_validate)
 
     # Keep old single-flag mode for backward compatibility.
     validate.add_argument("--suite", required=False, help="Legacy validation suite id (e.g. cie171)")
     validate.set_defaults(func=_cmd_validate)
 
+    bench = sub.add_parser("bench", help="Hot-path benchmark scenarios with baseline regression gating.")
+    bench_sub = bench.add_subparsers(dest="bench_cmd", required=True)
+
+    bench_list = bench_sub.add_parser("list", help="List registered benchmark scenarios and sizes.")
+    bench_list.add_argument("--tag", action="append", default=[], help="Only scenarios with this tag (repeatable)")
+    bench_list.set_defaults(func=_cmd_bench_list)
+
+    bench_run = bench_sub.add_parser("run", help="Run benchmark scenarios and compare against a baseline.")
+    bench_run.add_argument("--scenario", action="append", default=[], help="Scenario name or prefix (repeatable; default: all)")
+    bench_run.add_argument("--tag", action="append", default=[], help="Only scenarios with this tag (repeatable)")
+    bench_run.add_argument("--sizes", default="small,medium", help="Comma-separated sizes (default: small,medium)")
+    bench_run.add_argument("--repeat", type=int, default=5, help="Timed repetitions per scenario/size")
+    bench_run.add_argument("--warmup", type=int, default=1, help="Untimed warm-up calls per scenario/size")
+    bench_run.add_argument("--no-memory", action="store_true", default=False, help="Skip the traced peak-memory call")
+    bench_run.add_argument("--out", default=None, help="Write the JSON report to this path")
+    bench_run.add_argument("--baseline", default=None, help="Baseline JSON report to compare against")
+    bench_run.add_argument("--update-baseline", action="store_true", default=False, help="Overwrite --baseline with this run")
+    bench_run.add_argument("--max-time-regression", type=float, default=0.25, help="Allowed median-time increase (fraction)")
+    bench_run.add_argument("--max-memory-regression", type=float, default=0.25, help="Allowed peak-memory increase (fraction)")
+    bench_run.add_argument("--min-time-delta", type=float, default=0.005, help="Ignore time increases below this many seconds")
+    bench_run.set_defaults(func=_cmd_bench_run)
+
     library = sub.add_parser("library", help="Photometric library indexing/search.")
     library_sub = library.add_subparsers(dest="library_cmd", required=True)
 
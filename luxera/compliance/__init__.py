@@ -24,7 +24,20 @@ from luxera.compliance.evaluate import (
     evaluate_roadway,
     evaluate_emergency,
 )
-from luxera.compliance.energy import LENIInputs, LENIResult, LENI_PROFILES, compute_leni, compute_leni_from_project
+from luxera.compliance.energy import (
+    AnnualEnergyResult,
+    ControlStrategy,
+    EnergyZone,
+    LENIInputs,
+    LENIResult,
+    LENI_PROFILES,
+    compute_leni,
+    compute_leni_from_project,
+    daylight_hourly_from_summary,
+    occupancy_schedule,
+    simulate_annual_energy,
+    zones_from_project,
+)
 from luxera.compliance.maintenance import (
     MAINTENANCE_PROFILES,
     MaintenanceFactorComponents,
@@ -57,6 +70,13 @@ __all__ = [
     "LENI_PROFILES",
     "compute_leni",
     "compute_leni_from_project",
+    "EnergyZone",
+    "ControlStrategy",
+    "AnnualEnergyResult",
+    "simulate_annual_energy",
+    "zones_from_project",
+    "daylight_hourly_from_summary",
+    "occupancy_schedule",
     "MaintenanceFactorComponents",
     "MaintenanceSchedule",
     "MAINTENANCE_PROFILES",
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
-from typing import Dict, Optional
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Literal, Mapping, Optional, Sequence
+
+import numpy as np
 
 from luxera.project.schema import Project
 
@@ -144,36 +146,49 @@ def _extract_watts(meta: dict) -> float:
     return 0.0
 
 
-def compute_leni_from_project(project: "Project", profile_name: str = "office_open_plan") -> LENIResult:
-    """
-    Extract installed power and room area from project, merge with profile defaults, compute LENI.
-    """
-    profile_key = str(profile_name).strip().lower()
-    base = LENI_PROFILES.get(profile_key, LENI_PROFILES["office_open_plan"])
+def _luminaire_power(project: "Project") -> Dict[str, tuple[float, float, float]]:
+    """Luminaire id -> (installed W, parasitic W, emergency W) from photometry asset metadata."""
     assets = {str(a.id): a for a in project.photometry_assets}
-
-    installed_power = 0.0
-    parasitic = 0.0
-    emergency = 0.0
+    out: Dict[str, tuple[float, float, float]] = {}
     for lum in project.luminaires:
         asset = assets.get(str(lum.photometry_asset_id))
         meta = dict(getattr(asset, "metadata", {}) or {})
-        watts = _extract_watts(meta)
         multiplier = float(getattr(lum, "flux_multiplier", 1.0) or 1.0)
-        installed_power += watts * max(multiplier, 0.0)
         standby = meta.get("parasitic_power_w") or meta.get("standby_power_w")
         emer = meta.get("emergency_power_w")
-        if isinstance(standby, (int, float)):
-            parasitic += max(0.0, float(standby))
-        if isinstance(emer, (int, float)):
-            emergency += max(0.0, float(emer))
+        out[str(lum.id)] = (
+            _extract_watts(meta) * max(multiplier, 0.0),
+            max(0.0, float(standby)) if isinstance(standby, (int, float)) else 0.0,
+            max(0.0, float(emer)) if isinstance(emer, (int, float)) else 0.0,
+        )
+    return out
+
 
+def _project_area(project: "Project") -> float:
     area = 0.0
     for room in project.geometry.rooms:
         area += max(0.0, float(room.width) * float(room.length))
     if area <= 1e-9 and project.grids:
         g = project.grids[0]
         area = max(0.0, float(g.width) * float(g.height))
+    return area
+
+
+def compute_leni_from_project(project: "Project", profile_name: str = "office_open_plan") -> LENIResult:
+    """
+    Extract installed power and room area from project, merge with profile defaults, compute LENI.
+    """
+    profile_key = str(profile_name).strip().lower()
+    base = LENI_PROFILES.get(profile_key, LENI_PROFILES["office_open_plan"])
+
+    installed_power = 0.0
+    parasitic = 0.0
+    emergency = 0.0
+    for watts, standby, emer in _luminaire_power(project).values():
+        installed_power += watts
+        parasitic += standby
+        emergency += emer
+    area = _project_area(project)
 
     merged = replace(
         base,
@@ -183,3 +198,271 @@ def compute_leni_from_project(project: "Project", profile_name: str = "office_op
         emergency_power_W=(emergency if emergency > 0.0 else base.emergency_power_W),
     )
     return compute_leni(merged, limit_kWh_per_m2_year=LENI_LIMITS_KWH_M2_YEAR.get(profile_key))
+
+
+HOURS_PER_YEAR = 8760
+
+
+@dataclass(frozen=True)
+class EnergyZone:
+    """
+    One independently controlled lighting zone for the hourly annual simulation.
+
+    ``daylight_lux`` is the hourly daylight illuminance at the zone's reference point
+    (e.g. a daylight target mean); ``occupancy`` is the hourly fraction of the zone
+    that is occupied. Both hold one value per simulated hour, or a daily profile whose
+    length divides 24 (and the simulated hours), which is repeated. Without a schedule,
+    ``occupancy_schedule(profile)`` supplies the operating hours and occupancy factor
+    of the zone's ``LENI_PROFILES`` entry. ``parasitic_power_W`` is the standby power
+    of controls and ``emergency_power_W`` the charging power of emergency luminaires.
+    """
+
+    id: str
+    installed_power_W: float
+    area_m2: float
+    daylight_lux: np.ndarray
+    occupancy: Optional[np.ndarray] = None
+    target_lux: float = 500.0
+    parasitic_power_W: float = 0.0
+    profile: str = "office_open_plan"
+    emergency_power_W: float = 0.0
+
+
+@dataclass(frozen=True)
+class ControlStrategy:
+    """
+    Lighting control strategy applied to every zone.
+
+    ``daylight`` selects manual (``none``), on/off switching or continuous dimming;
+    the dimming curve is linear from ``(min_light_output, min_power_fraction)`` to full
+    output at full power, and luminaires switch off when daylight alone reaches the
+    target if ``switch_off_when_sufficient``. ``occupancy_sensing`` scales power by the
+    hourly occupied fraction instead of running the whole operating hour.
+    """
+
+    name: str
+    daylight: Literal["none", "switch", "dim"] = "none"
+    occupancy_sensing: bool = False
+    min_light_output: float = 0.1
+    min_power_fraction: float = 0.1
+    switch_off_when_sufficient: bool = True
+
+
+DEFAULT_CONTROL_STRATEGIES: tuple[ControlStrategy, ...] = (
+    ControlStrategy(name="manual"),
+    ControlStrategy(name="daylight_switching", daylight="switch"),
+    ControlStrategy(name="daylight_dimming", daylight="dim"),
+    ControlStrategy(name="daylight_dimming_occupancy", daylight="dim", occupancy_sensing=True),
+)
+
+
+@dataclass(frozen=True)
+class AnnualEnergyResult:
+    strategy: str
+    hours: int
+    power_W: np.ndarray
+    energy_lighting_kWh: float
+    energy_parasitic_kWh: float
+    total_energy_kWh: float
+    leni_kWh_per_m2_year: float
+    peak_demand_W: float
+    peak_hour: int
+    savings_percent: float
+    energy_by_zone_kWh: Dict[str, float] = field(default_factory=dict)
+
+
+def _hourly(values: Optional[np.ndarray], hours: int, default: float, name: str = "series") -> np.ndarray:
+    """``values`` over ``hours``: one value per hour, or a daily profile repeated."""
+    if values is None:
+        return np.full((hours,), float(default), dtype=float)
+    arr = np.asarray(values, dtype=float).reshape(-1)
+    if arr.size == 0:
+        return np.full((hours,), float(default), dtype=float)
+    if arr.size == hours:
+        return arr
+    if 24 % arr.size or hours % arr.size:
+        raise ValueError(
+            f"{name} has {arr.size} values; expected {hours} hourly values or a daily profile "
+            f"whose length divides both 24 and {hours}"
+        )
+    return np.tile(arr, hours // arr.size)
+
+
+def occupancy_schedule(profile_name: str = "office_open_plan", hours: int = HOURS_PER_YEAR) -> np.ndarray:
+    """
+    Hourly occupancy for a ``LENI_PROFILES`` entry.
+
+    The profile's annual operating hours ``t_O`` are spread evenly over the whole days
+    in ``hours`` as one block per day centred on midday; operating hours hold the
+    profile's occupancy factor ``F_O`` and all other hours are 0.
+    """
+    base = LENI_PROFILES.get(str(profile_name).strip().lower(), LENI_PROFILES["office_open_plan"])
+    h = max(int(hours), 0)
+    days = h // 24
+    out = np.zeros((h,), dtype=float)
+    if days == 0:
+        return out
+    total = int(round(max(float(base.annual_operating_hours), 0.0) * days / 365.0))
+    cumulative = (np.arange(days + 1) * total) // days
+    f_o = _clamp_factor(base.occupancy_factor)
+    for day, n in enumerate(np.minimum(np.diff(cumulative), 24)):
+        start = day * 24 + min(max(12 - int(n) // 2, 0), 24 - int(n))
+        out[start : start + int(n)] = f_o
+    return out
+
+
+def _zone_occupancy(zone: EnergyZone, hours: int) -> np.ndarray:
+    if zone.occupancy is None:
+        return occupancy_schedule(zone.profile, hours)
+    return _hourly(zone.occupancy, hours, 0.0, f"zone {zone.id!r} occupancy")
+
+
+def _power_fraction(strategy: ControlStrategy, daylight: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Fraction of installed power drawn while lit, shape ``(zones, hours)``."""
+    if strategy.daylight == "none":
+        return np.ones(daylight.shape, dtype=float)
+    sufficient = daylight >= target
+    if strategy.daylight == "switch":
+        return np.where(sufficient, 0.0, 1.0)
+    o_min = float(np.clip(strategy.min_light_output, 0.0, 1.0))
+    p_min = float(np.clip(strategy.min_power_fraction, 0.0, 1.0))
+    needed = np.clip(1.0 - daylight / np.maximum(target, 1e-9), 0.0, 1.0)
+    output = np.maximum(needed, o_min)
+    frac = p_min + (1.0 - p_min) * (output - o_min) / max(1.0 - o_min, 1e-9)
+    if strategy.switch_off_when_sufficient:
+        frac = np.where(sufficient, 0.0, frac)
+    return frac
+
+
+def simulate_annual_energy(
+    zones: Sequence[EnergyZone],
+    strategies: Sequence[ControlStrategy] = DEFAULT_CONTROL_STRATEGIES,
+    *,
+    hours: int = HOURS_PER_YEAR,
+    baseline: Optional[str] = None,
+) -> Dict[str, AnnualEnergyResult]:
+    """
+    Hourly annual lighting energy per control strategy, vectorised over zones and hours.
+
+    Lighting power is ``P_n * F(daylight) * occupancy`` during operating hours
+    (hours with occupancy > 0; zones without a schedule use
+    ``occupancy_schedule``), where ``F`` follows the strategy's switching or
+    dimming curve and occupancy only scales power with ``occupancy_sensing``.
+
+    Parasitic energy follows EN 15193-1 ``W_P``: control standby power is drawn
+    whenever a zone's lighting is off, and emergency charging power in every
+    simulated hour regardless of strategy. Both are reported in
+    ``energy_parasitic_kWh``. LENI is total energy over total zone area;
+    ``savings_percent`` is relative to ``baseline`` (default: first strategy).
+
+    Library API only: no project job runs this simulation; the energy section of
+    ``evaluate_indoor_with_energy`` stays the profile-based ``compute_leni_from_project``.
+    """
+    h = max(int(hours), 0)
+    ids = [z.id for z in zones]
+    p_n = np.array([max(float(z.installed_power_W), 0.0) for z in zones], dtype=float)[:, None]
+    p_par = np.array([max(float(z.parasitic_power_W), 0.0) for z in zones], dtype=float)[:, None]
+    p_em = np.array([max(float(z.emergency_power_W), 0.0) for z in zones], dtype=float)[:, None]
+    area = max(float(sum(max(float(z.area_m2), 0.0) for z in zones)), 1e-9)
+    daylight = (
+        np.stack([_hourly(z.daylight_lux, h, 0.0, f"zone {z.id!r} daylight_lux") for z in zones]) if zones else np.zeros((0, h))
+    )
+    occ = np.clip(np.stack([_zone_occupancy(z, h) for z in zones]), 0.0, 1.0) if zones else np.zeros((0, h))
+    target = np.array([float(z.target_lux) for z in zones], dtype=float)[:, None]
+    operating = occ > 0.0
+
+    raw: Dict[str, AnnualEnergyResult] = {}
+    for strategy in strategies:
+        frac = _power_fraction(strategy, daylight, target)
+        on = np.where(operating, frac, 0.0)
+        if strategy.occupancy_sensing:
+            on = on * occ
+        lighting = p_n * on
+        parasitic = np.where(on > 0.0, 0.0, p_par) + p_em
+        power = lighting + parasitic
+        total_power = np.sum(power, axis=0) if power.size else np.zeros((h,), dtype=float)
+        w_l = float(np.sum(lighting)) / 1000.0
+        w_p = float(np.sum(parasitic)) / 1000.0
+        peak_hour = int(np.argmax(total_power)) if total_power.size else -1
+        raw[strategy.name] = AnnualEnergyResult(
+            strategy=strategy.name,
+            hours=h,
+            power_W=power,
+            energy_lighting_kWh=w_l,
+            energy_parasitic_kWh=w_p,
+            total_energy_kWh=w_l + w_p,
+            leni_kWh_per_m2_year=(w_l + w_p) / area,
+            peak_demand_W=float(total_power[peak_hour]) if peak_hour >= 0 else 0.0,
+            peak_hour=peak_hour,
+            savings_percent=0.0,
+            energy_by_zone_kWh={zid: float(v) / 1000.0 for zid, v in zip(ids, np.sum(power, axis=1))},
+        )
+    if not raw:
+        return raw
+    base_name = baseline if baseline in raw else next(iter(raw))
+    base_total = raw[base_name].total_energy_kWh
+    return {
+        name: replace(res, savings_percent=(100.0 * (1.0 - res.total_energy_kWh / base_total) if base_total > 1e-12 else 0.0))
+        for name, res in raw.items()
+    }
+
+
+def zones_from_project(
+    project: "Project",
+    daylight_hourly_lux: Mapping[str, np.ndarray],
+    *,
+    occupancy: Optional[np.ndarray] = None,
+    target_lux: float = 500.0,
+    profile_name: str = "office_open_plan",
+) -> List[EnergyZone]:
+    """
+    One ``EnergyZone`` per project control group (or one for the whole project).
+
+    ``daylight_hourly_lux`` maps daylight target ids to hourly illuminance, e.g. from
+    ``daylight_hourly_from_summary``. A group picks its series through a
+    ``daylight_target_id`` key, otherwise the mean of all series is used; its area is
+    ``area_m2`` when given, else the project area split by installed power. A group's
+    ``leni_profile`` key overrides ``profile_name`` for its default occupancy.
+    """
+    power = _luminaire_power(project)
+    total_power = sum(p[0] for p in power.values())
+    area = _project_area(project)
+    series = {str(k): np.asarray(v, dtype=float).reshape(-1) for k, v in daylight_hourly_lux.items()}
+    mean_series = np.mean(np.stack(list(series.values())), axis=0) if series else np.zeros((0,), dtype=float)
+
+    groups = [g for g in project.control_groups if isinstance(g, dict) and g.get("id")]
+    if not groups:
+        groups = [{"id": "all", "luminaire_ids": list(power)}]
+    zones: List[EnergyZone] = []
+    for g in groups:
+        members = [str(x) for x in g.get("luminaire_ids", []) if str(x) in power]
+        p = sum(power[m][0] for m in members)
+        par = sum(power[m][1] for m in members)
+        emer = sum(power[m][2] for m in members)
+        raw_area = g.get("area_m2")
+        z_area = float(raw_area) if isinstance(raw_area, (int, float)) else (area * p / total_power if total_power > 0.0 else 0.0)
+        key = g.get("daylight_target_id")
+        zones.append(
+            EnergyZone(
+                id=str(g["id"]),
+                installed_power_W=p,
+                area_m2=z_area,
+                daylight_lux=series.get(str(key), mean_series) if key is not None else mean_series,
+                occupancy=occupancy,
+                target_lux=float(g.get("target_lux", target_lux)),
+                parasitic_power_W=par,
+                profile=str(g.get("leni_profile", profile_name)),
+                emergency_power_W=emer,
+            )
+        )
+    return zones
+
+
+def daylight_hourly_from_summary(summary: Mapping[str, object]) -> Dict[str, np.ndarray]:
+    """Hourly mean daylight illuminance per target from an annual daylight job summary."""
+    out: Dict[str, np.ndarray] = {}
+    rows = summary.get("annual_metrics", [])
+    for row in rows if isinstance(rows, list) else []:
+        if isinstance(row, dict) and row.get("target_id") is not None and isinstance(row.get("illuminance_hourly_mean_lux"), list):
+            out[str(row["target_id"])] = np.asarray(row["illuminance_hourly_mean_lux"], dtype=float)
+    return out
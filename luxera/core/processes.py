@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import threading
+from multiprocessing.context import BaseContext
+
+
+def process_context() -> BaseContext:
+    """
+    Return the multiprocessing context worker pools should start from.
+
+    ``"fork"`` is used when the platform offers it and no other thread is
+    alive, since it starts workers without re-importing Luxera. Forking a
+    process with live threads (API server handlers, daemon sessions, GUI
+    workers) can deadlock the child on locks those threads held, so such
+    processes get ``"forkserver"`` where available and ``"spawn"`` otherwise
+    (Windows, macOS). Pool workers must therefore be module-level functions
+    with picklable arguments.
+    """
+    methods = mp.get_all_start_methods()
+    if "fork" in methods and threading.active_count() <= 1:
+        return mp.get_context("fork")
+    if "forkserver" in methods:
+        return mp.get_context("forkserver")
+    return mp.get_context("spawn")
+
+
+__all__ = ["process_context"]
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+"""
+Lightweight stage tracing: nested spans with wall time, CPU time and peak RSS.
+
+Tracing is off unless a :class:`Tracer` is activated with :func:`tracing`; while
+off, :func:`span` returns a shared no-op context so instrumented code pays one
+context-variable lookup per span.
+"""
+
+import contextvars
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+try:  # pragma: no cover - unavailable on Windows
+    import resource as _resource
+except ImportError:  # pragma: no cover
+    _resource = None
+
+
+TRACE_SCHEMA_VERSION = "luxera_trace_v1"
+TRACE_ENV_VAR = "LUXERA_TRACE"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_ACTIVE: contextvars.ContextVar[Optional["Tracer"]] = contextvars.ContextVar("luxera_tracer", default=None)
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Process high-water resident set size, or ``None`` where the platform does not report it."""
+    if _resource is None:
+        return None
+    peak = int(_resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss)
+    # Linux reports KiB, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def trace_enabled_from_env() -> bool:
+    return os.environ.get(TRACE_ENV_VAR, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    depth: int
+    start_s: float
+    thread_id: int
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_rss_bytes: Optional[int] = None
+    peak_rss_growth_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "name": self.name,
+            "category": self.category,
+            "depth": self.depth,
+            "start_s": self.start_s,
+            "wall_s": self.wall_s,
+            "cpu_s": self.cpu_s,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "peak_rss_growth_bytes": self.peak_rss_growth_bytes,
+        }
+        if self.attrs:
+            out["attrs"] = dict(self.attrs)
+        if self.error is not None:
+            out["error"] = self.error
+        return out
+
+
+class _SpanContext:
+    __slots__ = ("_tracer", "_span", "_t0", "_c0", "_rss0", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, attrs: Dict[str, Any]):
+        self._tracer = tracer
+        self._span = Span(
+            name=name,
+            category=category,
+            depth=0,
+            start_s=0.0,
+            thread_id=threading.get_ident(),
+            attrs=attrs,
+        )
+
+    def __enter__(self) -> Span:
+        tracer = self._tracer
+        self._span.depth = tracer._depth.get()
+        self._token = tracer._depth.set(self._span.depth + 1)
+        self._rss0 = peak_rss_bytes() if tracer.measure_memory else None
+        self._c0 = time.thread_time()
+        self._t0 = time.perf_counter()
+        self._span.start_s = self._t0 - tracer.origin_s
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        s = self._span
+        s.wall_s = time.perf_counter() - self._t0
+        s.cpu_s = time.thread_time() - self._c0
+        if self._rss0 is not None:
+            s.peak_rss_bytes = peak_rss_bytes()
+            s.peak_rss_growth_bytes = int(s.peak_rss_bytes or 0) - int(self._rss0)
+        if exc_type is not None:
+            s.error = exc_type.__name__
+        self._tracer._depth.reset(self._token)
+        self._tracer._record(s)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Collects finished spans for one run.
+
+    Spans nest by call depth within a thread; CPU time is per-thread so that
+    concurrent work in other threads is not attributed to the span.
+    """
+
+    def __init__(self, *, measure_memory: bool = True):
+        self.measure_memory = bool(measure_memory)
+        self.origin_s = time.perf_counter()
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._depth: contextvars.ContextVar[int] = contextvars.ContextVar(f"luxera_trace_depth_{id(self)}", default=0)
+
+    def span(self, name: str, category: str = "stage", **attrs: Any) -> _SpanContext:
+        return _SpanContext(self, name, category, attrs)
+
+    def _record(self, s: Span) -> None:
+        with self._lock:
+            self.spans.append(s)
+
+    def ordered_spans(self) -> List[Span]:
+        return sorted(self.spans, key=lambda s: (s.start_s, s.depth))
+
+    def stage_totals(self) -> Dict[str, Dict[str, float]]:
+        """Wall/CPU totals and call counts per span name."""
+        totals: Dict[str, Dict[str, float]] = {}
+        for s in self.spans:
+            t = totals.setdefault(s.name, {"count": 0, "wall_s": 0.0, "cpu_s": 0.0})
+            t["count"] += 1
+            t["wall_s"] += s.wall_s
+            t["cpu_s"] += s.cpu_s
+        return dict(sorted(totals.items(), key=lambda kv: -kv[1]["wall_s"]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        ordered = self.ordered_spans()
+        top = [s for s in ordered if s.depth == 0]
+        return {
+            "schema_version": TRACE_SCHEMA_VERSION,
+            "total_wall_s": sum(s.wall_s for s in top),
+            "total_cpu_s": sum(s.cpu_s for s in top),
+            "peak_rss_bytes": peak_rss_bytes() if self.measure_memory else None,
+            "stages": self.stage_totals(),
+            "spans": [s.to_dict() for s in ordered],
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Trace Event Format payload loadable by ``chrome://tracing`` and Perfetto."""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "luxera"}},
+        ]
+        for s in self.ordered_spans():
+            args: Dict[str, Any] = {"cpu_s": s.cpu_s, **s.attrs}
+            if s.peak_rss_bytes is not None:
+                args["peak_rss_bytes"] = s.peak_rss_bytes
+                args["peak_rss_growth_bytes"] = s.peak_rss_growth_bytes
+            if s.error is not None:
+                args["error"] = s.error
+            events.append(
+                {
+                    "name": s.name,
+                    "cat": s.category,
+                    "ph": "X",
+                    "ts": s.start_s * 1e6,
+                    "dur": s.wall_s * 1e6,
+                    "pid": pid,
+                    "tid": s.thread_id,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(self.to_chrome_trace(), default=str), encoding="utf-8")
+        return p
+
+
+def current_tracer() -> Optional[Tracer]:
+    return _ACTIVE.get()
+
+
+def span(name: str, category: str = "stage", **attrs: Any):
+    """Context manager timing ``name`` on the active tracer; a no-op when tracing is off."""
+    tracer = _ACTIVE.get()
+    if tracer is None:
+        return _NULL_SPAN
+    return _SpanContext(tracer, name, category, attrs)
+
+
+def traced(name: str, category: str = "engine") -> Callable[[F], F]:
+    """Decorator form of :func:`span` for coarse engine entry points."""
+
+    def deco(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _ACTIVE.get()
+            if tracer is None:
+                return fn(*args, **kwargs)
+            with _SpanContext(tracer, name, category, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return deco
+
+
+class tracing:
+    """
+    Activate a tracer for the enclosed block, reusing an already active one.
+
+    ``with tracing() as tracer:`` yields the :class:`Tracer`, or ``None`` when
+    ``enabled`` is false.
+    """
+
+    def __init__(self, enabled: bool = True, *, measure_memory: bool = True):
+        self.enabled = bool(enabled)
+        self.measure_memory = measure_memory
+        self._token: Optional[contextvars.Token] = None
+
+    def __enter__(self) -> Optional[Tracer]:
+        if not self.enabled:
+            return None
+        existing = _ACTIVE.get()
+        if existing is not None:
+            return existing
+        tracer = Tracer(measure_memory=self.measure_memory)
+        self._token = _ACTIVE.set(tracer)
+        return tracer
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self._token is not None:
+            _ACTIVE.reset(self._token)
+            self._token = None
+        return False
+
+
+__all__ = [
+    "TRACE_ENV_VAR",
+    "TRACE_SCHEMA_VERSION",
+    "Span",
+    "Tracer",
+    "current_tracer",
+    "peak_rss_bytes",
+    "span",
+    "trace_enabled_from_env",
+    "traced",
+    "tracing",
+]
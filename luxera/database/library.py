@@ -11,8 +11,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
-from luxera.parser.ies_parser import parse_ies_text
-from luxera.parser.ldt_parser import parse_ldt_text
+from luxera.cache.parse_cache import parse_photometry_text_cached
 from luxera.photometry.model import photometry_from_parsed_ies, photometry_from_parsed_ldt
 
 
@@ -93,8 +92,11 @@ class PhotometryLibrary:
     SQLite-backed photometric file library with search and filtering.
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, parse_cache_dir: Optional[Path] = None):
         self._db_path = Path(db_path).expanduser().resolve()
+        self._parse_cache_dir = (
+            Path(parse_cache_dir).expanduser().resolve() if parse_cache_dir is not None else self._db_path.parent / "cache" / "parsed"
+        )
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(str(self._db_path))
         self._conn.row_factory = sqlite3.Row
@@ -212,7 +214,7 @@ class PhotometryLibrary:
         )
 
     def _build_record_ies(self, path: Path, text: str, digest: str) -> PhotometryRecord:
-        doc = parse_ies_text(text, source_path=path)
+        doc = parse_photometry_text_cached(text, "IES", source_path=path, cache_dir=self._parse_cache_dir)
         phot = photometry_from_parsed_ies(doc)
         c0 = np.asarray(phot.candela[0], dtype=float) if np.asarray(phot.candela).ndim == 2 else np.array([], dtype=float)
         beam, field, max_cd = _compute_beam_and_field_angles(np.asarray(phot.gamma_angles_deg, dtype=float), c0)
@@ -254,7 +256,7 @@ class PhotometryLibrary:
         )
 
     def _build_record_ldt(self, path: Path, text: str, digest: str) -> PhotometryRecord:
-        doc = parse_ldt_text(text)
+        doc = parse_photometry_text_cached(text, "LDT", cache_dir=self._parse_cache_dir)
         phot = photometry_from_parsed_ldt(doc)
         c0 = np.asarray(phot.candela[0], dtype=float) if np.asarray(phot.candela).ndim == 2 else np.array([], dtype=float)
         beam, field, max_cd = _compute_beam_and_field_angles(np.asarray(phot.gamma_angles_deg, dtype=float), c0)
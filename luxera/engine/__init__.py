@@ -9,7 +9,10 @@ from luxera.engine.daylight_radiance import run_daylight_radiance
 from luxera.engine.emergency_escape_route import EmergencyRouteResult, run_escape_routes
 from luxera.engine.emergency_open_area import EmergencyOpenAreaResult, run_open_area
 from luxera.engine.direct_illuminance import run_direct_grid, load_luminaires, build_grid_from_spec, build_room_from_spec
+from luxera.engine.incremental import IncrementalDirectResult, IncrementalDirectSession
 from luxera.engine.road_illuminance import run_road_illuminance, RoadIlluminanceResult
+from luxera.engine.multi_metric import MetricRequest, PointMetricsResult, compute_point_metrics
+from luxera.engine.glare_rating import GlareRatingResult, compute_glare_rating
 
 __all__ = [
     "run_radiosity",
@@ -20,6 +23,8 @@ __all__ = [
     "load_luminaires",
     "build_grid_from_spec",
     "build_room_from_spec",
+    "IncrementalDirectSession",
+    "IncrementalDirectResult",
     "run_daylight_df",
     "run_daylight_radiance",
     "DaylightResult",
@@ -30,4 +35,9 @@ __all__ = [
     "EmergencyOpenAreaResult",
     "run_road_illuminance",
     "RoadIlluminanceResult",
+    "MetricRequest",
+    "PointMetricsResult",
+    "compute_point_metrics",
+    "GlareRatingResult",
+    "compute_glare_rating",
 ]
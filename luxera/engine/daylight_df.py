@@ -8,6 +8,7 @@ import numpy as np
 
 from luxera.engine.direct_illuminance import build_grid_from_spec, build_vertical_plane_points
 from luxera.project.schema import DaylightSpec, JobSpec, OpeningSpec, Project
+from luxera.core.trace import traced
 
 
 @dataclass(frozen=True)
@@ -112,6 +113,7 @@ def _df_at_points(points: np.ndarray, apertures: List[OpeningSpec], spec: Daylig
     return vals
 
 
+@traced("daylight_df")
 def run_daylight_df(project: Project, job: JobSpec, scene: object | None = None) -> DaylightResult:  # noqa: ARG001
     spec = job.daylight or DaylightSpec(mode="df")
     apertures = [o for o in project.geometry.openings if bool(getattr(o, "is_daylight_aperture", False))]
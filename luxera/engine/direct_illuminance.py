@@ -4,12 +4,15 @@ from __future__ import annotations
 import hashlib
 import json
 import math
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
+from luxera.calcs.adaptive_grid import adaptive_grid_values
 from luxera.calculation.illuminance import (
     CalculationGrid,
     DirectCalcSettings,
@@ -18,24 +21,25 @@ from luxera.calculation.illuminance import (
     calculate_direct_illuminance,
     calculate_grid_illuminance,
 )
-from luxera.engine.vectorised import ParallelEngine, VectorisedDirectEngine
+from luxera.engine.vectorised import IntensityLookupFn, ParallelEngine, VectorisedDirectEngine
 from luxera.geometry.core import Material, Polygon, Room, Surface, Vector3
-from luxera.geometry.spatial import point_in_polygon
+from luxera.geometry.spatial import points_in_polygons
 from luxera.geometry.materials import material_from_spec
 from luxera.geometry.tolerance import EPS_POS
 from luxera.geometry.bvh import BVHNode, Triangle, build_bvh, refit_bvh, triangulate_surfaces
 from luxera.geometry.accel import MeshInstance, TwoLevelBVH, build_two_level_bvh, refit_two_level_bvh
-from luxera.parser.ies_parser import parse_ies_text
-from luxera.parser.ldt_parser import parse_ldt_text
 from luxera.photometry.canonical import canonical_from_photometry
-from luxera.photometry.interp import build_interpolation_lut
-from luxera.cache.photometry_cache import load_lut_from_cache, save_lut_to_cache
-from luxera.photometry.model import photometry_from_parsed_ies, photometry_from_parsed_ldt
+from luxera.photometry.interp import PhotometryLUT, build_interpolation_lut
+from luxera.cache.parse_cache import clear_parse_memory_cache, parse_photometry_text_cached
+from luxera.cache.photometry_cache import has_cached_lut, load_lut_from_cache, save_lut_to_cache
+from luxera.photometry.model import Photometry, photometry_from_parsed_ies, photometry_from_parsed_ldt
 from luxera.photometry.sample import sample_intensity_cd
 from luxera.photometry.interp import sample_lut_intensity_cd
 from luxera.compliance.maintenance import MAINTENANCE_PROFILES, MaintenanceFactorComponents, compute_maintenance_factors
-from luxera.project.schema import ArbitraryPlaneSpec, CalcGrid, LineGridSpec, PointSetSpec, PolygonWorkplaneSpec, Project, RoomSpec, VerticalPlaneSpec
+from luxera.project.schema import ArbitraryPlaneSpec, CalcGrid, LineGridSpec, PhotometryAsset, PointSetSpec, PolygonWorkplaneSpec, Project, RoomSpec, VerticalPlaneSpec
 from luxera.core.units import project_scale_to_meters
+from luxera.core.trace import traced
+from luxera.engine.influence import InfluenceNeighbourhoods, accumulate_culled, build_neighbourhoods
 
 
 @dataclass(frozen=True)
@@ -45,6 +49,10 @@ class DirectGridResult:
     nx: int
     ny: int
     result: IlluminanceResult
+    # Adaptive mode only: points that were computed (the rest are interpolated).
+    computed_mask: Optional[np.ndarray] = None
+    # Influence culling only: evaluated vs total luminaire/point pairs.
+    influence_culling: Optional[Dict[str, float]] = None
 
 
 @dataclass(frozen=True)
@@ -58,6 +66,13 @@ class OcclusionContext:
 
 _OCCLUSION_CACHE: Dict[Tuple[str, bool], OcclusionContext] = {}
 
+# Parsed photometry and LUTs keyed by (format, sha256 of asset text). Shared
+# across jobs in long-lived processes (API server, optimizer, GUI); misses fall
+# through to the on-disk parse cache (luxera.cache.parse_cache).
+_PHOTOMETRY_CACHE_SIZE = 64
+_PHOTOMETRY_CACHE: "OrderedDict[Tuple[str, str], Tuple[Photometry, Optional[PhotometryLUT]]]" = OrderedDict()
+_PHOTOMETRY_CACHE_LOCK = threading.Lock()
+
 
 def compute_direct_illuminance_rgb(
     direct_illuminance: Dict[str, float],
@@ -142,6 +157,8 @@ def update_occlusion_instance_transforms(
 class DirectPointResult:
     points: np.ndarray
     values: np.ndarray
+    # Influence culling only: evaluated vs total luminaire/point pairs.
+    influence_culling: Optional[Dict[str, float]] = None
 
 
 def build_grid_from_spec(grid_spec: CalcGrid, length_scale: float = 1.0) -> CalculationGrid:
@@ -182,48 +199,102 @@ def _resolve_asset_path(project: Project, raw_path: str) -> Path:
     return p.resolve()
 
 
+def clear_photometry_cache() -> None:
+    with _PHOTOMETRY_CACHE_LOCK:
+        _PHOTOMETRY_CACHE.clear()
+    clear_parse_memory_cache()
+
+
+def _read_asset_text(project: Project, asset: PhotometryAsset) -> tuple[str, Optional[Path]]:
+    if asset.embedded_b64:
+        import base64
+
+        return base64.b64decode(asset.embedded_b64.encode("utf-8")).decode("utf-8", errors="replace"), None
+    if asset.path:
+        asset_path = _resolve_asset_path(project, asset.path)
+        try:
+            return asset_path.read_text(encoding="utf-8", errors="replace"), asset_path
+        except OSError as e:
+            raise ValueError(f"Failed to load photometry asset {asset.id} from {asset_path}: {e}") from e
+    raise ValueError(f"Photometry asset {asset.id} has no data")
+
+
+def _project_lut(phot: Photometry, source_format: str, cache_root: Path) -> PhotometryLUT:
+    """Interpolation LUT for ``phot`` from the project's on-disk cache or a fresh build."""
+    canonical = canonical_from_photometry(phot, source_format=source_format)
+    lut = load_lut_from_cache(cache_root, canonical.content_hash)
+    if lut is None:
+        lut = build_interpolation_lut(canonical)
+        save_lut_to_cache(cache_root, lut)
+    return lut
+
+
+def _resolve_asset_photometry(
+    project: Project,
+    asset: PhotometryAsset,
+    project_root: Path,
+) -> tuple[Photometry, Optional[PhotometryLUT]]:
+    """
+    Parse an asset and load its interpolation LUT, reusing the process-wide
+    cache keyed by format and content hash.
+    """
+    text, asset_path = _read_asset_text(project, asset)
+    key = (str(asset.format), hashlib.sha256(text.encode("utf-8")).hexdigest())
+    cache_root = project_root / ".luxera" / "cache" / "photometry"
+    with _PHOTOMETRY_CACHE_LOCK:
+        hit = _PHOTOMETRY_CACHE.get(key)
+        if hit is not None:
+            _PHOTOMETRY_CACHE.move_to_end(key)
+    if hit is not None:
+        phot, lut = hit
+        # Every project keeps its own .npz, also when the LUT came from memory.
+        if lut is not None and not has_cached_lut(cache_root, lut.content_hash):
+            try:
+                save_lut_to_cache(cache_root, lut)
+            except Exception:
+                pass
+        return phot, lut
+
+    if asset.format == "IES":
+        phot = photometry_from_parsed_ies(parse_photometry_text_cached(text, "IES", source_path=asset_path))
+    elif asset.format == "LDT":
+        phot = photometry_from_parsed_ldt(parse_photometry_text_cached(text, "LDT"))
+    else:
+        raise ValueError(f"Unsupported photometry format: {asset.format}")
+
+    # Precompute/load interpolation LUT cache for deterministic runtime acceleration.
+    # Cache writes are best-effort and must never fail the calculation pipeline.
+    try:
+        lut: Optional[PhotometryLUT] = _project_lut(phot, asset.format, cache_root)
+    except Exception:
+        lut = None
+
+    # External TILT files are not covered by the content hash of the IES text.
+    if phot.tilt_source != "FILE":
+        with _PHOTOMETRY_CACHE_LOCK:
+            _PHOTOMETRY_CACHE[key] = (phot, lut)
+            _PHOTOMETRY_CACHE.move_to_end(key)
+            while len(_PHOTOMETRY_CACHE) > _PHOTOMETRY_CACHE_SIZE:
+                _PHOTOMETRY_CACHE.popitem(last=False)
+    return phot, lut
+
+
 def load_luminaires(project: Project, hash_asset_fn) -> tuple[List[Luminaire], Dict[str, str]]:
     assets_by_id = {a.id: a for a in project.photometry_assets}
     luminaires: List[Luminaire] = []
     asset_hashes: Dict[str, str] = {}
     length_scale = project_scale_to_meters(project)
     project_root = Path(project.root_dir).expanduser().resolve() if project.root_dir else Path.cwd().resolve()
+    # Photometry is resolved once per asset and shared by all its instances.
+    resolved: Dict[str, tuple[Photometry, Optional[PhotometryLUT]]] = {}
     for inst in project.luminaires:
         asset = assets_by_id.get(inst.photometry_asset_id)
         if asset is None:
             raise ValueError(f"Missing photometry asset: {inst.photometry_asset_id}")
-        asset_path: Optional[Path] = None
-        if asset.embedded_b64:
-            import base64
-
-            text = base64.b64decode(asset.embedded_b64.encode("utf-8")).decode("utf-8", errors="replace")
-        elif asset.path:
-            asset_path = _resolve_asset_path(project, asset.path)
-            try:
-                text = asset_path.read_text(encoding="utf-8", errors="replace")
-            except OSError as e:
-                raise ValueError(f"Failed to load photometry asset {asset.id} from {asset_path}: {e}") from e
-        else:
-            raise ValueError(f"Photometry asset {asset.id} has no data")
-        if asset.format == "IES":
-            phot = photometry_from_parsed_ies(parse_ies_text(text, source_path=asset_path))
-        elif asset.format == "LDT":
-            phot = photometry_from_parsed_ldt(parse_ldt_text(text))
-        else:
-            raise ValueError(f"Unsupported photometry format: {asset.format}")
-
-        # Precompute/load interpolation LUT cache for deterministic runtime acceleration.
-        # Cache writes are best-effort and must never fail the calculation pipeline.
-        lut = None
-        try:
-            canonical = canonical_from_photometry(phot, source_format=asset.format)
-            cache_root = project_root / ".luxera" / "cache" / "photometry"
-            lut = load_lut_from_cache(cache_root, canonical.content_hash)
-            if lut is None:
-                lut = build_interpolation_lut(canonical)
-                save_lut_to_cache(cache_root, lut)
-        except Exception:
-            lut = None
+        if asset.id not in resolved:
+            resolved[asset.id] = _resolve_asset_photometry(project, asset, project_root)
+            asset_hashes[asset.id] = asset.content_hash or hash_asset_fn(asset)
+        phot, lut = resolved[asset.id]
 
         mf_effective = max(0.0, float(getattr(inst, "maintenance_factor", 1.0) or 1.0))
         comp_payload = getattr(inst, "maintenance_components", None)
@@ -253,7 +324,6 @@ def load_luminaires(project: Project, hash_asset_fn) -> tuple[List[Luminaire], D
                 lut=lut,
             )
         )
-        asset_hashes[asset.id] = asset.content_hash or hash_asset_fn(asset)
     return luminaires, asset_hashes
 
 
@@ -288,6 +358,7 @@ def build_direct_occluders(project: Project, include_room_shell: bool = False) -
     return surfaces
 
 
+@traced("occlusion_build")
 def build_direct_occlusion_context(
     project: Project,
     include_room_shell: bool = False,
@@ -364,21 +435,26 @@ def build_polygon_workplane_points(spec: PolygonWorkplaneSpec, seed: int = 0, le
 
     rng = np.random.default_rng(int(seed))
     target = max(1, int(spec.sample_count))
-    out: List[tuple[float, float, float]] = []
-    attempts = 0
     max_attempts = max(1000, target * 64)
-    while len(out) < target and attempts < max_attempts:
-        attempts += 1
-        uu = float(rng.uniform(min_u, max_u))
-        vv = float(rng.uniform(min_v, max_v))
-        uv = (uu, vv)
-        if not point_in_polygon(uv, poly):
-            continue
-        if any(point_in_polygon(uv, ring) for ring in holes):
-            continue
-        p = origin + (u * uu) + (v * vv)
-        out.append(p.to_tuple())
-    return np.asarray(out, dtype=float), n
+    # Rejection sampling in batches; draws are consumed in the same (u, v) order as
+    # one-at-a-time sampling, so the accepted points do not depend on the batch size.
+    accepted: List[np.ndarray] = []
+    count = 0
+    attempts = 0
+    while count < target and attempts < max_attempts:
+        k = min(max(64, 2 * (target - count)), max_attempts - attempts)
+        attempts += k
+        r = rng.random(2 * k).reshape(k, 2)
+        uv = np.stack((min_u + (max_u - min_u) * r[:, 0], min_v + (max_v - min_v) * r[:, 1]), axis=1)
+        keep = uv[points_in_polygons(uv, [poly], holes)][: target - count]
+        accepted.append(keep)
+        count += keep.shape[0]
+    if count == 0:
+        return np.zeros((0, 3), dtype=float), n
+    uv = np.concatenate(accepted, axis=0)
+    o = np.array(origin.to_tuple(), dtype=float)
+    pts = o[None, :] + np.array(u.to_tuple())[None, :] * uv[:, :1] + np.array(v.to_tuple())[None, :] * uv[:, 1:]
+    return pts, n
 
 
 def build_vertical_plane_points(spec: VerticalPlaneSpec, length_scale: float = 1.0) -> tuple[np.ndarray, Vector3, int, int]:
@@ -411,7 +487,17 @@ def run_direct_points(
     use_occlusion: bool = False,
     occlusion_epsilon: float = 1e-6,
     near_field_correction: bool = False,
+    influence_threshold_lux: Optional[float] = None,
+    neighbourhoods: Optional[InfluenceNeighbourhoods] = None,
 ) -> DirectPointResult:
+    """
+    Direct illuminance at arbitrary points.
+
+    With ``influence_threshold_lux`` set, each luminaire is only evaluated at the
+    points inside its influence radius (see ``luxera.engine.influence``). Callers that
+    already built the ``neighbourhoods`` for these points and luminaires pass them in
+    so the index is not built again.
+    """
     n = surface_normal.normalize()
     vals = np.zeros((points.shape[0],), dtype=float)
     eps = max(float(occlusion_epsilon), 1e-9)
@@ -422,6 +508,28 @@ def run_direct_points(
     )
     tris = occlusion.triangles if occlusion is not None else None
     bvh = occlusion.bvh if occlusion is not None else None
+    if influence_threshold_lux is not None or neighbourhoods is not None:
+        def _evaluate_pairs(idx: np.ndarray, lum_idx: int) -> np.ndarray:
+            lum = luminaires[lum_idx]
+            return np.array(
+                [
+                    calculate_direct_illuminance(
+                        Vector3(float(points[i, 0]), float(points[i, 1]), float(points[i, 2])),
+                        n,
+                        lum,
+                        occluders=tris,
+                        settings=settings,
+                        occluder_bvh=bvh,
+                    )
+                    for i in idx
+                ],
+                dtype=float,
+            )
+
+        hood = neighbourhoods
+        if hood is None:
+            hood = build_neighbourhoods(points, luminaires, float(influence_threshold_lux))
+        return DirectPointResult(points=points, values=accumulate_culled(hood, _evaluate_pairs), influence_culling=hood.summary())
     for i in range(points.shape[0]):
         p = Vector3(float(points[i, 0]), float(points[i, 1]), float(points[i, 2]))
         total = 0.0
@@ -438,6 +546,36 @@ def run_direct_points(
     return DirectPointResult(points=points, values=vals)
 
 
+def direct_point_contributions(
+    points: np.ndarray,
+    surface_normal: Vector3,
+    luminaires: List[Luminaire],
+    occlusion: Optional[OcclusionContext] = None,
+    use_occlusion: bool = False,
+    occlusion_epsilon: float = 1e-6,
+    near_field_correction: bool = False,
+) -> np.ndarray:
+    """
+    ``(n_luminaires, n_points)`` direct illuminance of each luminaire at ``points``.
+
+    Summing the rows in luminaire order reproduces ``run_direct_points`` exactly.
+    """
+    n = surface_normal.normalize()
+    out = np.zeros((len(luminaires), points.shape[0]), dtype=float)
+    settings = DirectCalcSettings(
+        use_occlusion=bool(use_occlusion),
+        occlusion_epsilon=max(float(occlusion_epsilon), 1e-9),
+        near_field_correction=bool(near_field_correction),
+    )
+    tris = occlusion.triangles if occlusion is not None else None
+    bvh = occlusion.bvh if occlusion is not None else None
+    for i in range(points.shape[0]):
+        p = Vector3(float(points[i, 0]), float(points[i, 1]), float(points[i, 2]))
+        for j, lum in enumerate(luminaires):
+            out[j, i] = calculate_direct_illuminance(p, n, lum, occluders=tris, settings=settings, occluder_bvh=bvh)
+    return out
+
+
 def run_direct_vertical_plane(
     plane_spec: VerticalPlaneSpec,
     luminaires: List[Luminaire],
@@ -445,6 +583,7 @@ def run_direct_vertical_plane(
     use_occlusion: bool = False,
     occlusion_epsilon: float = 1e-6,
     near_field_correction: bool = False,
+    influence_threshold_lux: Optional[float] = None,
 ) -> DirectGridResult:
     points, normal, nx, ny = build_vertical_plane_points(plane_spec)
     pts = run_direct_points(
@@ -455,6 +594,7 @@ def run_direct_vertical_plane(
         use_occlusion=use_occlusion,
         occlusion_epsilon=occlusion_epsilon,
         near_field_correction=near_field_correction,
+        influence_threshold_lux=influence_threshold_lux,
     )
     values_2d = pts.values.reshape(ny, nx)
     grid = CalculationGrid(
@@ -472,6 +612,7 @@ def run_direct_vertical_plane(
         nx=nx,
         ny=ny,
         result=IlluminanceResult(grid=grid, values=values_2d),
+        influence_culling=pts.influence_culling,
     )
 
 
@@ -483,6 +624,7 @@ def run_direct_point_set(
     occlusion_epsilon: float = 1e-6,
     normal: Vector3 = Vector3.up(),
     near_field_correction: bool = False,
+    influence_threshold_lux: Optional[float] = None,
 ) -> DirectPointResult:
     points = np.array(point_set.points, dtype=float)
     if points.size == 0:
@@ -495,6 +637,7 @@ def run_direct_point_set(
         use_occlusion=use_occlusion,
         occlusion_epsilon=occlusion_epsilon,
         near_field_correction=near_field_correction,
+        influence_threshold_lux=influence_threshold_lux,
     )
 
 
@@ -522,6 +665,7 @@ def run_direct_arbitrary_plane(
     use_occlusion: bool = False,
     occlusion_epsilon: float = 1e-6,
     near_field_correction: bool = False,
+    influence_threshold_lux: Optional[float] = None,
 ) -> DirectGridResult:
     points, normal, nx, ny = build_arbitrary_plane_points(plane_spec)
     pts = run_direct_points(
@@ -532,6 +676,7 @@ def run_direct_arbitrary_plane(
         use_occlusion=use_occlusion,
         occlusion_epsilon=occlusion_epsilon,
         near_field_correction=near_field_correction,
+        influence_threshold_lux=influence_threshold_lux,
     )
     values_2d = pts.values.reshape(ny, nx)
     grid = CalculationGrid(
@@ -543,7 +688,14 @@ def run_direct_arbitrary_plane(
         ny=ny,
         normal=normal,
     )
-    return DirectGridResult(points=pts.points, values=pts.values, nx=nx, ny=ny, result=IlluminanceResult(grid=grid, values=values_2d))
+    return DirectGridResult(
+        points=pts.points,
+        values=pts.values,
+        nx=nx,
+        ny=ny,
+        result=IlluminanceResult(grid=grid, values=values_2d),
+        influence_culling=pts.influence_culling,
+    )
 
 
 def _sample_polyline(polyline: List[tuple[float, float, float]], spacing: float) -> np.ndarray:
@@ -575,6 +727,7 @@ def run_direct_line_grid(
     occlusion_epsilon: float = 1e-6,
     normal: Vector3 = Vector3.up(),
     near_field_correction: bool = False,
+    influence_threshold_lux: Optional[float] = None,
 ) -> DirectPointResult:
     points = _sample_polyline(list(line_spec.polyline), line_spec.spacing)
     return run_direct_points(
@@ -585,9 +738,141 @@ def run_direct_line_grid(
         use_occlusion=use_occlusion,
         occlusion_epsilon=occlusion_epsilon,
         near_field_correction=near_field_correction,
+        influence_threshold_lux=influence_threshold_lux,
     )
 
 
+def _intensity_lookup(luminaires: List[Luminaire]) -> IntensityLookupFn:
+    """Per-luminaire intensity lookup for ``VectorisedDirectEngine`` (LUT where valid)."""
+
+    def _lookup_fn(directions_mx1x3: np.ndarray, lum_idx: int) -> np.ndarray:
+        lum = luminaires[lum_idx]
+        R = np.asarray(lum.transform.get_rotation_matrix(), dtype=float)
+        dirs = np.asarray(directions_mx1x3[:, 0, :], dtype=float)
+        out = np.zeros((dirs.shape[0],), dtype=float)
+        tilt_data = lum.photometry.tilt
+        tilt_active = bool(
+            tilt_data is not None and str(getattr(tilt_data, "type", "")).upper() in {"INCLUDE", "FILE"}
+        )
+        can_use_lut = (
+            lum.lut is not None
+            and abs(float(lum.tilt_deg)) <= 1e-12
+            and not tilt_active
+        )
+        for i in range(dirs.shape[0]):
+            local_dir = R.T @ (-dirs[i])
+            if float(local_dir[2]) >= 0.0:
+                out[i] = 0.0
+                continue
+            if can_use_lut:
+                out[i] = float(sample_lut_intensity_cd(lum.lut, Vector3.from_array(local_dir)))
+            else:
+                out[i] = float(sample_intensity_cd(lum.photometry, Vector3.from_array(local_dir), tilt_deg=lum.tilt_deg))
+        return out
+
+    return _lookup_fn
+
+
+def _vectorised_grid_values(
+    points: np.ndarray,
+    normal: Vector3,
+    luminaires: List[Luminaire],
+    tri: Optional[List[Triangle]],
+    bvh: Optional[BVHNode],
+    use_occlusion: bool,
+    parallel: bool,
+    n_workers: Optional[int],
+    neighbourhoods: Optional[InfluenceNeighbourhoods] = None,
+) -> np.ndarray:
+    normals = np.repeat(np.array([normal.to_tuple()], dtype=float), points.shape[0], axis=0)
+    lum_pos = np.array([lum.transform.position.to_tuple() for lum in luminaires], dtype=float)
+    lum_peak = np.array([float(np.max(np.asarray(lum.photometry.candela, dtype=float))) for lum in luminaires], dtype=float)
+    lum_flux = np.array([float(lum.flux_multiplier) for lum in luminaires], dtype=float)
+    lum_mf = np.ones((len(luminaires),), dtype=float)
+    _lookup_fn = _intensity_lookup(luminaires)
+
+    vec_engine = VectorisedDirectEngine()
+    if neighbourhoods is not None:
+        # Culled pairs are evaluated one luminaire at a time over its own points;
+        # the saving outweighs process-pool parallelism, so ``parallel`` is ignored.
+        def _evaluate_pairs(idx: np.ndarray, lum_idx: int) -> np.ndarray:
+            one = slice(lum_idx, lum_idx + 1)
+            lookup = lambda dirs, _local: _lookup_fn(dirs, lum_idx)  # noqa: E731
+            if use_occlusion:
+                return vec_engine.compute_grid_with_occlusion(
+                    points[idx],
+                    normals[idx],
+                    lum_pos[one],
+                    lum_peak[one],
+                    lum_flux[one],
+                    lum_mf[one],
+                    occlusion_triangles=(tri or []),
+                    bvh=bvh,
+                    intensity_lookup_fn=lookup,
+                )
+            return vec_engine.compute_grid(
+                points[idx],
+                normals[idx],
+                lum_pos[one],
+                lum_peak[one],
+                lum_flux[one],
+                lum_mf[one],
+                intensity_lookup_fn=lookup,
+            )
+
+        return accumulate_culled(neighbourhoods, _evaluate_pairs)
+    if use_occlusion:
+        if parallel:
+            par_engine = ParallelEngine(n_workers=n_workers)
+            values = par_engine.compute_parallel(
+                vec_engine,
+                points,
+                normals,
+                lum_pos,
+                lum_peak,
+                lum_flux,
+                lum_mf,
+                occlusion_triangles=(tri or []),
+                bvh=bvh,
+            )
+        else:
+            values = vec_engine.compute_grid_with_occlusion(
+                points,
+                normals,
+                lum_pos,
+                lum_peak,
+                lum_flux,
+                lum_mf,
+                occlusion_triangles=(tri or []),
+                bvh=bvh,
+                intensity_lookup_fn=_lookup_fn,
+            )
+    else:
+        if parallel:
+            # Parallel wrapper uses picklable numpy payloads (no closure lookup callback).
+            par_engine = ParallelEngine(n_workers=n_workers)
+            values = par_engine.compute_parallel(
+                vec_engine,
+                points,
+                normals,
+                lum_pos,
+                lum_peak,
+                lum_flux,
+                lum_mf,
+            )
+        else:
+            values = vec_engine.compute_grid(
+                points,
+                normals,
+                lum_pos,
+                lum_peak,
+                lum_flux,
+                lum_mf,
+                intensity_lookup_fn=_lookup_fn,
+            )
+    return np.asarray(values, dtype=float).reshape(-1)
+
+
 def run_direct_grid(
     grid_spec: CalcGrid,
     luminaires: List[Luminaire],
@@ -599,7 +884,20 @@ def run_direct_grid(
     vectorised: bool = True,
     parallel: bool = False,
     n_workers: Optional[int] = None,
+    adaptive_tolerance: Optional[float] = None,
+    adaptive_max_level: int = 4,
+    influence_threshold_lux: Optional[float] = None,
 ) -> DirectGridResult:
+    """
+    Direct illuminance on a rectangular grid.
+
+    With ``adaptive_tolerance`` set, the grid is refined from a coarse lattice and only
+    the points the refinement inserts are computed; see ``adaptive_grid_values``.
+
+    With ``influence_threshold_lux`` set, luminaire/point pairs farther apart than the
+    luminaire's influence radius are skipped (each skipped pair contributes less than
+    the threshold); see ``luxera.engine.influence``.
+    """
     grid = build_grid_from_spec(grid_spec)
     if grid_spec.sample_mask and grid_spec.sample_points:
         points_all = np.array([p.to_tuple() for p in grid.get_points()], dtype=float)
@@ -612,6 +910,7 @@ def run_direct_grid(
             use_occlusion=use_occlusion,
             occlusion_epsilon=occlusion_epsilon,
             near_field_correction=near_field_correction,
+            influence_threshold_lux=influence_threshold_lux,
         )
         vals = np.full((grid.nx * grid.ny,), np.nan, dtype=float)
         tcount = sum(1 for m in grid_spec.sample_mask if m)
@@ -639,90 +938,70 @@ def run_direct_grid(
     tri = occlusion.triangles if occlusion is not None else None
     bvh = occlusion.bvh if occlusion is not None else None
 
-    if vectorised and not near_field_correction and luminaires:
-        points = np.array([p.to_tuple() for p in grid.get_points()], dtype=float)
-        normals = np.repeat(np.array([grid.normal.to_tuple()], dtype=float), points.shape[0], axis=0)
-        lum_pos = np.array([lum.transform.position.to_tuple() for lum in luminaires], dtype=float)
-        lum_peak = np.array([float(np.max(np.asarray(lum.photometry.candela, dtype=float))) for lum in luminaires], dtype=float)
-        lum_flux = np.array([float(lum.flux_multiplier) for lum in luminaires], dtype=float)
-        lum_mf = np.ones((len(luminaires),), dtype=float)
-
-        def _lookup_fn(directions_mx1x3: np.ndarray, lum_idx: int) -> np.ndarray:
-            lum = luminaires[lum_idx]
-            R = np.asarray(lum.transform.get_rotation_matrix(), dtype=float)
-            dirs = np.asarray(directions_mx1x3[:, 0, :], dtype=float)
-            out = np.zeros((dirs.shape[0],), dtype=float)
-            tilt_data = lum.photometry.tilt
-            tilt_active = bool(
-                tilt_data is not None and str(getattr(tilt_data, "type", "")).upper() in {"INCLUDE", "FILE"}
-            )
-            can_use_lut = (
-                lum.lut is not None
-                and abs(float(lum.tilt_deg)) <= 1e-12
-                and not tilt_active
-            )
-            for i in range(dirs.shape[0]):
-                local_dir = R.T @ (-dirs[i])
-                if float(local_dir[2]) >= 0.0:
-                    out[i] = 0.0
-                    continue
-                if can_use_lut:
-                    out[i] = float(sample_lut_intensity_cd(lum.lut, Vector3.from_array(local_dir)))
-                else:
-                    out[i] = float(sample_intensity_cd(lum.photometry, Vector3.from_array(local_dir), tilt_deg=lum.tilt_deg))
-            return out
-
-        vec_engine = VectorisedDirectEngine()
-        if use_occlusion:
-            if parallel:
-                par_engine = ParallelEngine(n_workers=n_workers)
-                values = par_engine.compute_parallel(
-                    vec_engine,
-                    points,
-                    normals,
-                    lum_pos,
-                    lum_peak,
-                    lum_flux,
-                    lum_mf,
-                    occlusion_triangles=(tri or []),
-                    bvh=bvh,
-                )
-            else:
-                values = vec_engine.compute_grid_with_occlusion(
-                    points,
-                    normals,
-                    lum_pos,
-                    lum_peak,
-                    lum_flux,
-                    lum_mf,
-                    occlusion_triangles=(tri or []),
-                    bvh=bvh,
-                    intensity_lookup_fn=_lookup_fn,
-                )
-        else:
-            if parallel:
-                # Parallel wrapper uses picklable numpy payloads (no closure lookup callback).
-                par_engine = ParallelEngine(n_workers=n_workers)
-                values = par_engine.compute_parallel(
-                    vec_engine,
-                    points,
-                    normals,
-                    lum_pos,
-                    lum_peak,
-                    lum_flux,
-                    lum_mf,
-                )
-            else:
-                values = vec_engine.compute_grid(
-                    points,
-                    normals,
-                    lum_pos,
-                    lum_peak,
-                    lum_flux,
-                    lum_mf,
-                    intensity_lookup_fn=_lookup_fn,
+    points = np.array([p.to_tuple() for p in grid.get_points()], dtype=float)
+    use_vectorised = vectorised and not near_field_correction and bool(luminaires)
+    culled = influence_threshold_lux is not None and bool(luminaires)
+    pair_counts = {"evaluated_pairs": 0, "total_pairs": 0}
+
+    def _neighbourhoods(sub: np.ndarray) -> Optional[InfluenceNeighbourhoods]:
+        if not culled:
+            return None
+        hood = build_neighbourhoods(sub, luminaires, float(influence_threshold_lux))
+        pair_counts["evaluated_pairs"] += hood.evaluated_pairs
+        pair_counts["total_pairs"] += hood.total_pairs
+        return hood
+
+    def _culling_summary() -> Optional[Dict[str, float]]:
+        if not culled:
+            return None
+        total = pair_counts["total_pairs"]
+        return {
+            "threshold_lux": float(influence_threshold_lux),
+            "evaluated_pairs": pair_counts["evaluated_pairs"],
+            "total_pairs": total,
+            "culled_fraction": (1.0 - pair_counts["evaluated_pairs"] / total) if total else 0.0,
+        }
+
+    if adaptive_tolerance is not None:
+        def _evaluate(flat: np.ndarray) -> np.ndarray:
+            sub = points[flat]
+            if use_vectorised:
+                return _vectorised_grid_values(
+                    sub, grid.normal, luminaires, tri, bvh, use_occlusion, parallel, n_workers, _neighbourhoods(sub)
                 )
+            return run_direct_points(
+                sub,
+                grid.normal,
+                luminaires,
+                occlusion=occlusion,
+                use_occlusion=use_occlusion,
+                occlusion_epsilon=occlusion_epsilon,
+                near_field_correction=near_field_correction,
+                influence_threshold_lux=influence_threshold_lux,
+                neighbourhoods=_neighbourhoods(sub),
+            ).values
+
+        adaptive = adaptive_grid_values(
+            _evaluate,
+            grid.nx,
+            grid.ny,
+            tolerance=float(adaptive_tolerance),
+            max_level=int(adaptive_max_level),
+        )
+        return DirectGridResult(
+            points=points,
+            values=adaptive.values.reshape(-1),
+            nx=grid.nx,
+            ny=grid.ny,
+            result=IlluminanceResult(grid=grid, values=adaptive.values),
+            computed_mask=adaptive.computed.reshape(-1),
+            influence_culling=_culling_summary(),
+        )
 
+    if use_vectorised:
+        values = _vectorised_grid_values(
+            points, grid.normal, luminaires, tri, bvh, use_occlusion, parallel, n_workers, _neighbourhoods(points)
+        )
         values_2d = values.reshape(grid.ny, grid.nx)
         result = IlluminanceResult(grid=grid, values=values_2d)
         return DirectGridResult(
@@ -731,6 +1010,28 @@ def run_direct_grid(
             nx=grid.nx,
             ny=grid.ny,
             result=result,
+            influence_culling=_culling_summary(),
+        )
+
+    if culled:
+        pts = run_direct_points(
+            points,
+            grid.normal,
+            luminaires,
+            occlusion=occlusion,
+            use_occlusion=use_occlusion,
+            occlusion_epsilon=occlusion_epsilon,
+            near_field_correction=near_field_correction,
+            influence_threshold_lux=influence_threshold_lux,
+            neighbourhoods=_neighbourhoods(points),
+        )
+        return DirectGridResult(
+            points=points,
+            values=pts.values,
+            nx=grid.nx,
+            ny=grid.ny,
+            result=IlluminanceResult(grid=grid, values=pts.values.reshape(grid.ny, grid.nx)),
+            influence_culling=_culling_summary(),
         )
 
     result = calculate_grid_illuminance(
@@ -741,7 +1042,6 @@ def run_direct_grid(
         occluder_triangles=tri,
         occluder_bvh=bvh,
     )
-    points = np.array([p.to_tuple() for p in grid.get_points()], dtype=float)
     return DirectGridResult(
         points=points,
         values=result.values.reshape(-1),
@@ -2,14 +2,16 @@ from __future__ import annotations
 """Contract: docs/spec/emergency_contract.md, docs/spec/solver_contracts.md."""
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 from luxera.engine.direct_illuminance import OcclusionContext, run_direct_points
+from luxera.engine.emergency_failure import Contributions, column_totals, contribution_matrix, point_contributions
 from luxera.calculation.illuminance import Luminaire
 from luxera.geometry.core import Vector3
 from luxera.project.schema import EscapeRouteSpec
+from luxera.core.trace import traced
 
 
 @dataclass(frozen=True)
@@ -18,6 +20,7 @@ class EmergencyRouteResult:
     points: np.ndarray
     values: np.ndarray
     summary: Dict[str, float]
+    contributions: Optional[Contributions] = None
 
 
 def _route_samples(route: EscapeRouteSpec, length_scale: float = 1.0) -> np.ndarray:
@@ -51,6 +54,7 @@ def _route_samples(route: EscapeRouteSpec, length_scale: float = 1.0) -> np.ndar
     return np.asarray(samples, dtype=float)
 
 
+@traced("emergency_escape_routes")
 def run_escape_routes(
     routes: List[EscapeRouteSpec],
     luminaires: List[Luminaire],
@@ -60,7 +64,15 @@ def run_escape_routes(
     use_occlusion: bool = False,
     occlusion_epsilon: float = 1e-6,
     length_scale: float = 1.0,
+    keep_contributions: bool = False,
 ) -> List[EmergencyRouteResult]:
+    """
+    Evaluate escape routes. With ``keep_contributions`` each result also carries the
+    ``(n_luminaires, n_points)`` per-luminaire contributions whose column sums are
+    ``values``: a dense array, or a chunked ``ContributionSource`` when the matrix
+    would exceed the dense size limit. ``values`` is then derived from the
+    contributions rather than from a separate direct pass.
+    """
     if not routes:
         return []
     ef = max(0.0, float(emergency_factor))
@@ -68,18 +80,32 @@ def run_escape_routes(
     out: List[EmergencyRouteResult] = []
     for route in routes:
         points = _route_samples(route, length_scale=length_scale)
-        if points.size == 0:
+        contributions: Optional[Contributions] = None
+        if keep_contributions:
+            contributions = contribution_matrix(
+                len(scaled_lums),
+                points.shape[0],
+                point_contributions(
+                    points,
+                    Vector3.up(),
+                    scaled_lums,
+                    occlusion=occlusion,
+                    use_occlusion=use_occlusion,
+                    occlusion_epsilon=occlusion_epsilon,
+                ),
+            )
+            values = column_totals(contributions)
+        elif points.size == 0:
             values = np.zeros((0,), dtype=float)
         else:
-            r = run_direct_points(
+            values = run_direct_points(
                 points=points,
                 surface_normal=Vector3.up(),
                 luminaires=scaled_lums,
                 occlusion=occlusion,
                 use_occlusion=use_occlusion,
                 occlusion_epsilon=occlusion_epsilon,
-            )
-            values = r.values
+            ).values
         mean_v = float(np.mean(values)) if values.size else 0.0
         min_v = float(np.min(values)) if values.size else 0.0
         max_v = float(np.max(values)) if values.size else 0.0
@@ -94,6 +120,7 @@ def run_escape_routes(
                     "max_lux": max_v,
                     "u0": (min_v / mean_v) if mean_v > 1e-9 else 0.0,
                 },
+                contributions=contributions,
             )
         )
     return out
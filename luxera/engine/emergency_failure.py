@@ -0,0 +1,311 @@
+from __future__ import annotations
+"""Contract: docs/spec/emergency_contract.md (failure-mode analysis)."""
+
+from dataclasses import dataclass
+from itertools import combinations
+from math import comb
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from luxera.calculation.illuminance import Luminaire
+from luxera.engine.direct_illuminance import direct_point_contributions
+from luxera.geometry.core import Vector3
+
+_BATCH_CELLS = 4_000_000
+# Contribution matrices larger than this many cells are not materialised;
+# failures are accumulated over point chunks instead.
+_DENSE_CELLS = 4_000_000
+# Ranking resolution: failures closer than this are ties, broken by luminaire order.
+_RANK_DECIMALS = 9
+
+
+def rank_lux(value: float) -> float:
+    return round(float(value), _RANK_DECIMALS)
+
+
+@dataclass(frozen=True)
+class ContributionSource:
+    """
+    Per-luminaire contributions evaluated on demand for a slice of points.
+
+    ``evaluate(start, stop)`` returns the ``(n_luminaires, stop - start)`` block
+    for points ``start:stop``.
+    """
+
+    n_luminaires: int
+    n_points: int
+    evaluate: Callable[[int, int], np.ndarray]
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.n_luminaires, self.n_points)
+
+
+Contributions = Union[np.ndarray, ContributionSource]
+
+
+def contribution_matrix(
+    n_luminaires: int,
+    n_points: int,
+    evaluate: Callable[[int, int], np.ndarray],
+    *,
+    max_cells: Optional[int] = None,
+) -> Contributions:
+    """Evaluate the dense matrix when it fits ``max_cells``, else return a chunked source."""
+    limit = _DENSE_CELLS if max_cells is None else int(max_cells)
+    if int(n_luminaires) * int(n_points) <= limit:
+        return np.asarray(evaluate(0, int(n_points)), dtype=float).reshape(int(n_luminaires), int(n_points))
+    return ContributionSource(n_luminaires=int(n_luminaires), n_points=int(n_points), evaluate=evaluate)
+
+
+def point_contributions(
+    points: np.ndarray,
+    surface_normal: Vector3,
+    luminaires: Sequence[Luminaire],
+    **direct_kwargs: object,
+) -> Callable[[int, int], np.ndarray]:
+    """``evaluate(start, stop)`` computing each luminaire's direct illuminance at ``points[start:stop]``."""
+    pts = np.asarray(points, dtype=float).reshape(-1, 3)
+    lums = list(luminaires)
+
+    def evaluate(start: int, stop: int) -> np.ndarray:
+        return direct_point_contributions(pts[start:stop], surface_normal, lums, **direct_kwargs)  # type: ignore[arg-type]
+
+    return evaluate
+
+
+def _row_sum(block: np.ndarray) -> np.ndarray:
+    # Luminaire-order accumulation, matching the direct solver's per-point sum.
+    total = np.zeros((block.shape[1],), dtype=float)
+    for row in block:
+        total += row
+    return total
+
+
+def column_totals(contributions: Contributions) -> np.ndarray:
+    """
+    Total illuminance per point: the column sums of ``contributions``.
+
+    A :class:`ContributionSource` is evaluated once, block by block.
+    """
+    if not isinstance(contributions, ContributionSource):
+        return _row_sum(np.asarray(contributions, dtype=float))
+    n, m = contributions.shape
+    step = max(1, _BATCH_CELLS // max(n, 1))
+    out = np.zeros((m,), dtype=float)
+    for start in range(0, m, step):
+        stop = min(m, start + step)
+        out[start:stop] = _row_sum(np.asarray(contributions.evaluate(start, stop), dtype=float).reshape(n, stop - start))
+    return out
+
+
+def _blocks(contributions: Contributions) -> Iterator[np.ndarray]:
+    """Yield finite-column blocks of at most ``_BATCH_CELLS`` cells."""
+    if isinstance(contributions, ContributionSource):
+        n, m = contributions.shape
+        fetch: Callable[[int, int], np.ndarray] = lambda a, b: np.asarray(contributions.evaluate(a, b), dtype=float).reshape(n, b - a)
+    else:
+        C = np.asarray(contributions, dtype=float)
+        if C.ndim != 2:
+            raise ValueError("contributions must be a 2D (n_luminaires, n_points) array")
+        n, m = C.shape
+        fetch = lambda a, b: C[:, a:b]
+    step = max(1, _BATCH_CELLS // max(n, 1))
+    if m == 0:
+        yield np.zeros((n, 0), dtype=float)
+        return
+    for start in range(0, m, step):
+        block = fetch(start, min(m, start + step))
+        yield block[:, np.all(np.isfinite(block), axis=0)]
+
+
+class _ComboAccumulator:
+    """Failure cases for one set of luminaire-index combinations of equal size."""
+
+    def __init__(self, combos: np.ndarray):
+        self.combos = combos
+        self.acc = _Accumulator(combos.shape[0])
+
+    def add(self, block: np.ndarray, total: np.ndarray) -> None:
+        batch = max(1, _BATCH_CELLS // max(block.shape[1], 1))
+        for start in range(0, self.combos.shape[0], batch):
+            rows = slice(start, start + batch)
+            self.acc.add(total[None, :] - np.sum(block[self.combos[rows]], axis=1), rows)
+        self.acc.count += block.shape[1]
+
+
+def _combos(idx: Sequence[int], size: int) -> np.ndarray:
+    return np.asarray(list(combinations(idx, size)), dtype=int).reshape(-1, size)
+
+
+class _Accumulator:
+    """Running min, sum and count of clamped remaining illuminance per case."""
+
+    def __init__(self, cases: int):
+        self.mins = np.full((cases,), np.inf, dtype=float)
+        self.sums = np.zeros((cases,), dtype=float)
+        self.count = 0
+
+    def add(self, remaining: np.ndarray, rows: slice) -> None:
+        if remaining.shape[1] == 0:
+            return
+        rem = np.maximum(remaining, 0.0)
+        self.mins[rows] = np.minimum(self.mins[rows], np.min(rem, axis=1))
+        self.sums[rows] += np.sum(rem, axis=1)
+
+    def stats(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self.count == 0:
+            z = np.zeros_like(self.sums)
+            return z, z, z
+        means = self.sums / self.count
+        u0 = np.divide(self.mins, means, out=np.zeros_like(self.mins), where=means > 1e-9)
+        return self.mins, means, u0
+
+
+@dataclass(frozen=True)
+class FailureCase:
+    """Illuminance statistics with ``failed`` luminaire indices switched off."""
+
+    failed: Tuple[int, ...]
+    min_lux: float
+    mean_lux: float
+    u0: float
+
+
+@dataclass(frozen=True)
+class TargetFailureAnalysis:
+    target_id: str
+    baseline_min_lux: float
+    baseline_u0: float
+    cases: List[FailureCase]
+
+    @property
+    def worst(self) -> FailureCase | None:
+        if not self.cases:
+            return None
+        return min(self.cases, key=lambda c: (rank_lux(c.min_lux), rank_lux(c.u0), c.failed))
+
+
+def _candidates(single_mins: np.ndarray, k: int, max_combinations: int) -> List[int]:
+    n = int(single_mins.shape[0])
+    if k <= 1 or comb(n, k) <= max_combinations:
+        return list(range(n))
+    order = sorted(range(n), key=lambda i: (rank_lux(single_mins[i]), i))
+    m = k
+    while m < n and comb(m + 1, k) <= max_combinations:
+        m += 1
+    return sorted(order[:m])
+
+
+def _single_failures(
+    contributions: Contributions, extra: Sequence[_ComboAccumulator] = ()
+) -> Tuple[_Accumulator, _Accumulator]:
+    n = int(contributions.shape[0])
+    base = _Accumulator(1)
+    single = _Accumulator(n)
+    for block in _blocks(contributions):
+        total = np.sum(block, axis=0)
+        base.add(total[None, :], slice(0, 1))
+        single.add(total[None, :] - block, slice(0, n))
+        base.count += block.shape[1]
+        single.count += block.shape[1]
+        for combo in extra:
+            combo.add(block, total)
+    return base, single
+
+
+def failure_candidates(contributions: Contributions, k: int, max_combinations: int) -> List[int]:
+    """
+    Luminaire indices considered for k-failure combinations.
+
+    When ``C(n, k)`` exceeds ``max_combinations`` only the luminaires whose single
+    failure lowers the minimum the most are combined.
+    """
+    n = int(contributions.shape[0])
+    if k <= 1 or comb(n, k) <= max_combinations:
+        return list(range(n))
+    _, single = _single_failures(contributions)
+    return _candidates(single.stats()[0], k, max_combinations)
+
+
+def analyse_target_failures(
+    target_id: str,
+    contributions: Contributions,
+    *,
+    k: int = 1,
+    max_combinations: int = 20000,
+) -> TargetFailureAnalysis:
+    """
+    Evaluate every failure of up to ``k`` luminaires from a per-luminaire contribution matrix.
+
+    ``contributions`` is a ``(n_luminaires, n_points)`` array or a
+    :class:`ContributionSource`; columns that are not finite (masked grid cells) are
+    ignored. Each failure is a subtraction from the baseline total, accumulated over
+    point blocks of bounded size, so no illuminance is recomputed and no matrix larger
+    than a block is held. All failure sizes are accumulated in the same pass over the
+    blocks; a source is evaluated once more only when ``C(n, k)`` exceeds
+    ``max_combinations`` and the candidates depend on the single-failure results.
+    """
+    n = int(contributions.shape[0])
+    kmax = max(0, min(int(k), n))
+    sizes = range(2, kmax + 1)
+    upfront = {size: _ComboAccumulator(_combos(range(n), size)) for size in sizes if comb(n, size) <= max_combinations}
+    base, single = _single_failures(contributions, list(upfront.values()))
+    base_min, _, base_u0 = base.stats()
+    cases: List[FailureCase] = []
+    if kmax >= 1:
+        mins, means, u0 = single.stats()
+        cases.extend(
+            FailureCase(failed=(i,), min_lux=float(mins[i]), mean_lux=float(means[i]), u0=float(u0[i])) for i in range(n)
+        )
+    pruned = {
+        size: _ComboAccumulator(_combos(_candidates(single.stats()[0], size, max_combinations), size))
+        for size in sizes
+        if size not in upfront
+    }
+    if pruned:
+        for block in _blocks(contributions):
+            total = np.sum(block, axis=0)
+            for combo in pruned.values():
+                combo.add(block, total)
+    for size in sizes:
+        combo = upfront.get(size) or pruned[size]
+        mins, means, u0 = combo.acc.stats()
+        for row, m_lux, a_lux, u in zip(combo.combos, mins, means, u0):
+            cases.append(FailureCase(failed=tuple(int(i) for i in row), min_lux=float(m_lux), mean_lux=float(a_lux), u0=float(u)))
+    return TargetFailureAnalysis(
+        target_id=str(target_id),
+        baseline_min_lux=float(base_min[0]),
+        baseline_u0=float(base_u0[0]),
+        cases=cases,
+    )
+
+
+def summarize_failures(
+    analysis: TargetFailureAnalysis,
+    luminaire_ids: Sequence[str],
+    *,
+    min_lux: float,
+    u0_min: float,
+) -> Dict[str, object]:
+    worst = analysis.worst
+    row: Dict[str, object] = {
+        "baseline_min_lux": analysis.baseline_min_lux,
+        "baseline_u0": analysis.baseline_u0,
+        "cases_evaluated": len(analysis.cases),
+    }
+    if worst is None:
+        row.update({"worst_min_lux": analysis.baseline_min_lux, "worst_failed_luminaires": [], "worst_u0": analysis.baseline_u0, "worst_u0_failed_luminaires": []})
+    else:
+        worst_u0 = min(analysis.cases, key=lambda c: (rank_lux(c.u0), rank_lux(c.min_lux), c.failed))
+        row.update(
+            {
+                "worst_min_lux": worst.min_lux,
+                "worst_failed_luminaires": [str(luminaire_ids[i]) for i in worst.failed],
+                "worst_u0": worst_u0.u0,
+                "worst_u0_failed_luminaires": [str(luminaire_ids[i]) for i in worst_u0.failed],
+            }
+        )
+    row["pass"] = bool(float(row["worst_min_lux"]) >= min_lux and float(row["worst_u0"]) >= u0_min)
+    return row
@@ -2,16 +2,19 @@ from __future__ import annotations
 """Contract: docs/spec/emergency_contract.md, docs/spec/solver_contracts.md."""
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import numpy as np
 
 from luxera.calculation.illuminance import Luminaire
 from luxera.engine.direct_illuminance import (
     OcclusionContext,
+    build_grid_from_spec,
     run_direct_grid,
 )
+from luxera.engine.emergency_failure import Contributions, column_totals, contribution_matrix, point_contributions
 from luxera.project.schema import CalcGrid
+from luxera.core.trace import traced
 
 
 @dataclass(frozen=True)
@@ -22,8 +25,10 @@ class EmergencyOpenAreaResult:
     nx: int
     ny: int
     summary: Dict[str, float]
+    contributions: Optional[Contributions] = None
 
 
+@traced("emergency_open_area")
 def run_open_area(
     grids: List[CalcGrid],
     luminaires: List[Luminaire],
@@ -32,37 +37,78 @@ def run_open_area(
     occlusion: OcclusionContext | None = None,
     use_occlusion: bool = False,
     occlusion_epsilon: float = 1e-6,
+    keep_contributions: bool = False,
 ) -> List[EmergencyOpenAreaResult]:
+    """
+    Evaluate open-area grids. With ``keep_contributions`` each result also carries the
+    ``(n_luminaires, n_points)`` per-luminaire contributions at the evaluated points
+    (the sample points of a masked grid): a dense array, or a chunked
+    ``ContributionSource`` when the matrix would exceed the dense size limit; the grid
+    values are then its column sums rather than a separate direct pass.
+    """
     if not grids:
         return []
     ef = max(0.0, float(emergency_factor))
     scaled_lums = [Luminaire(photometry=l.photometry, transform=l.transform, flux_multiplier=l.flux_multiplier * ef, tilt_deg=l.tilt_deg) for l in luminaires]
     out: List[EmergencyOpenAreaResult] = []
     for g in grids:
-        r = run_direct_grid(
-            g,
-            scaled_lums,
-            occlusion=occlusion,
-            use_occlusion=use_occlusion,
-            occlusion_epsilon=occlusion_epsilon,
-        )
-        vals = r.values.reshape(-1)
+        contributions: Optional[Contributions] = None
+        if keep_contributions and scaled_lums:
+            grid = build_grid_from_spec(g)
+            nx, ny = grid.nx, grid.ny
+            grid_points = np.array([p.to_tuple() for p in grid.get_points()], dtype=float)
+            # Masked grids are evaluated at their clipped sample points only.
+            masked = bool(g.sample_mask and g.sample_points)
+            points = np.asarray(g.sample_points, dtype=float) if masked else grid_points
+            contributions = contribution_matrix(
+                len(scaled_lums),
+                points.shape[0],
+                point_contributions(
+                    points,
+                    grid.normal,
+                    scaled_lums,
+                    occlusion=occlusion,
+                    use_occlusion=use_occlusion,
+                    occlusion_epsilon=occlusion_epsilon,
+                ),
+            )
+            totals = column_totals(contributions)
+            if masked:
+                keep = np.zeros((nx * ny,), dtype=bool)
+                flags = np.asarray(g.sample_mask[: nx * ny], dtype=bool)
+                keep[: flags.size] = flags
+                if int(np.count_nonzero(keep)) != totals.size:
+                    raise ValueError("Grid sample mask does not match clipped sample point count")
+                vals = np.full((nx * ny,), np.nan, dtype=float)
+                vals[keep] = totals
+            else:
+                vals = totals
+        else:
+            r = run_direct_grid(
+                g,
+                scaled_lums,
+                occlusion=occlusion,
+                use_occlusion=use_occlusion,
+                occlusion_epsilon=occlusion_epsilon,
+            )
+            grid_points, vals, nx, ny = r.points, r.values.reshape(-1), r.nx, r.ny
         mean_v = float(np.mean(vals)) if vals.size else 0.0
         min_v = float(np.min(vals)) if vals.size else 0.0
         max_v = float(np.max(vals)) if vals.size else 0.0
         out.append(
             EmergencyOpenAreaResult(
                 target_id=g.id,
-                points=r.points,
+                points=grid_points,
                 values=vals,
-                nx=r.nx,
-                ny=r.ny,
+                nx=nx,
+                ny=ny,
                 summary={
                     "min_lux": min_v,
                     "mean_lux": mean_v,
                     "max_lux": max_v,
                     "u0": (min_v / mean_v) if mean_v > 1e-9 else 0.0,
                 },
+                contributions=contributions,
             )
         )
     return out
@@ -0,0 +1,120 @@
+from __future__ import annotations
+"""Contract: docs/spec/glare_rating.md."""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from luxera.calculation.illuminance import Luminaire
+from luxera.engine.multi_metric import luminaire_intensity_array
+
+
+# Observer positions per block; each block holds (block, luminaires, views) arrays.
+_OBSERVER_BLOCK = 1024
+
+
+@dataclass(frozen=True)
+class GlareRatingResult:
+    """
+    CIE 112 glare rating for every (observer, view direction) pair.
+
+    ``gr`` and ``veiling_luminance`` have shape ``(M, V)`` for ``M`` observers and
+    ``V`` view directions; pairs that see no luminaire inside the field of view have
+    zero veiling luminance and GR 0.
+    """
+
+    observers: np.ndarray
+    view_dirs: np.ndarray
+    gr: np.ndarray
+    veiling_luminance: np.ndarray
+    environment_luminance: float
+
+    @property
+    def gr_max(self) -> float:
+        return float(np.max(self.gr)) if self.gr.size else 0.0
+
+    def worst(self) -> Dict[str, object]:
+        if self.gr.size == 0:
+            return {"gr": 0.0, "observer_index": -1, "view_index": -1, "position": None, "view_dir": None}
+        oi, vi = np.unravel_index(int(np.argmax(self.gr)), self.gr.shape)
+        return {
+            "gr": float(self.gr[oi, vi]),
+            "observer_index": int(oi),
+            "view_index": int(vi),
+            "position": tuple(float(v) for v in self.observers[oi]),
+            "view_dir": tuple(float(v) for v in self.view_dirs[vi]),
+        }
+
+
+def glare_view_directions(count: int = 8, tilt_deg: float = -2.0, start_deg: float = 0.0) -> np.ndarray:
+    """``count`` unit view directions evenly spaced in azimuth, tilted ``tilt_deg`` from horizontal."""
+    n = max(1, int(count))
+    az = np.radians(float(start_deg) + 360.0 * np.arange(n, dtype=float) / n)
+    tilt = math.radians(float(tilt_deg))
+    return np.stack(
+        (np.cos(az) * math.cos(tilt), np.sin(az) * math.cos(tilt), np.full(n, math.sin(tilt))),
+        axis=1,
+    )
+
+
+def environment_veiling_luminance(e_h_avg: float, reflectance: float) -> float:
+    """CIE 112 environment veiling luminance ``L_ve = 0.035 * rho * E_h,av / pi``."""
+    return 0.035 * max(float(reflectance), 0.0) * max(float(e_h_avg), 0.0) / math.pi
+
+
+def compute_glare_rating(
+    observers: np.ndarray,
+    luminaires: Sequence[Luminaire],
+    *,
+    e_h_avg: float,
+    reflectance: float = 0.2,
+    view_dirs: Optional[np.ndarray] = None,
+    theta_min_deg: float = 1.5,
+    theta_max_deg: float = 60.0,
+) -> GlareRatingResult:
+    """
+    Evaluate GR = 27 + 24 log10(L_vl / L_ve^0.9) for observers x view directions.
+
+    Veiling luminance follows CIE 112: ``L_vl = 10 * sum(E_eye / theta^2)`` with
+    ``E_eye`` the illuminance at the eye on the plane normal to the line of sight and
+    ``theta`` (degrees) the angle between the line of sight and the luminaire,
+    clamped below at ``theta_min_deg``; luminaires beyond ``theta_max_deg`` are ignored.
+    Intensities toward each observer are looked up once and shared by every view
+    direction.
+    """
+    obs = np.asarray(observers, dtype=float).reshape(-1, 3)
+    views = glare_view_directions() if view_dirs is None else np.asarray(view_dirs, dtype=float).reshape(-1, 3)
+    norms = np.linalg.norm(views, axis=1)
+    views = views / np.where(norms > 1e-12, norms, 1.0)[:, None]
+    m, v = obs.shape[0], views.shape[0]
+    l_ve = environment_veiling_luminance(e_h_avg, reflectance)
+    lvl = np.zeros((m, v), dtype=float)
+    if m and v and luminaires:
+        lum_pos = np.array([lum.transform.position.to_tuple() for lum in luminaires], dtype=float)
+        cos_max = math.cos(math.radians(float(theta_max_deg)))
+        theta_min = max(float(theta_min_deg), 1e-6)
+        for start in range(0, m, _OBSERVER_BLOCK):
+            block = obs[start : start + _OBSERVER_BLOCK]
+            to_lum = lum_pos[None, :, :] - block[:, None, :]
+            d2 = np.sum(to_lum * to_lum, axis=2)
+            ok = d2 > 1e-12
+            dist = np.sqrt(np.where(ok, d2, 1.0))
+            to_lum = to_lum / dist[:, :, None]
+            intensity = np.zeros(d2.shape, dtype=float)
+            for k, lum in enumerate(luminaires):
+                intensity[:, k] = luminaire_intensity_array(lum, -to_lum[:, k, :])
+            e_normal = np.where(ok, intensity / np.where(ok, d2, 1.0), 0.0)
+            # (block, luminaires, views): cosine between line of sight and luminaire direction.
+            cos_theta = to_lum @ views.T
+            theta = np.degrees(np.arccos(np.clip(cos_theta, -1.0, 1.0)))
+            theta = np.maximum(theta, theta_min)
+            seen = cos_theta >= cos_max
+            contrib = np.where(seen, e_normal[:, :, None] * cos_theta / (theta * theta), 0.0)
+            lvl[start : start + block.shape[0]] = 10.0 * np.sum(contrib, axis=1)
+    gr = np.zeros((m, v), dtype=float)
+    if l_ve > 0.0:
+        lit = lvl > 0.0
+        gr[lit] = 27.0 + 24.0 * np.log10(lvl[lit] / (l_ve**0.9))
+    return GlareRatingResult(observers=obs, view_dirs=views, gr=gr, veiling_luminance=lvl, environment_luminance=l_ve)
@@ -0,0 +1,219 @@
+from __future__ import annotations
+"""Contract: docs/spec/solver_contracts.md (Influence Culling)."""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+from luxera.calculation.illuminance import Luminaire
+
+
+# evaluate(point_indices, luminaire_index) -> contribution at those points
+PairEvaluator = Callable[[np.ndarray, int], np.ndarray]
+
+
+class InfluenceCullingError(ValueError):
+    pass
+
+
+def _tilt_scale(luminaire: Luminaire) -> float:
+    tilt = luminaire.photometry.tilt
+    factors = getattr(tilt, "factors", None) if tilt is not None else None
+    tilt_max = float(np.max(np.asarray(factors, dtype=float))) if factors is not None and np.size(factors) else 1.0
+    return max(float(luminaire.flux_multiplier), 0.0) * max(tilt_max, 1.0)
+
+
+def luminaire_peak_intensity_cd(luminaire: Luminaire) -> float:
+    """Upper bound of the luminaire's output intensity in any direction (cd)."""
+    candela = np.asarray(luminaire.photometry.candela, dtype=float)
+    peak = float(np.max(candela)) if candela.size else 0.0
+    return max(peak, 0.0) * _tilt_scale(luminaire)
+
+
+def intensity_bound_cd(luminaire: Luminaire, directions_world: np.ndarray) -> np.ndarray:
+    """
+    Upper bound of the intensity towards each world direction (unit rows, luminaire to point).
+
+    For Type C photometry the bound is the maximum over C planes of the two gamma
+    samples bracketing each direction's gamma, which is never below the
+    interpolated intensity. Other systems fall back to the spherical peak.
+    """
+    dirs = np.asarray(directions_world, dtype=float).reshape(-1, 3)
+    phot = luminaire.photometry
+    candela = np.asarray(phot.candela, dtype=float)
+    gammas = np.asarray(phot.gamma_angles_deg, dtype=float).reshape(-1)
+    if phot.system != "C" or candela.ndim != 2 or gammas.size < 2 or candela.shape[1] != gammas.size:
+        return np.full((dirs.shape[0],), luminaire_peak_intensity_cd(luminaire), dtype=float)
+    per_gamma = np.max(candela, axis=0)
+    envelope = np.maximum(per_gamma[:-1], per_gamma[1:])
+    R = np.asarray(luminaire.transform.get_rotation_matrix(), dtype=float)
+    local_z = dirs @ R[:, 2]
+    gamma = np.degrees(np.arccos(np.clip(-local_z, -1.0, 1.0)))
+    gamma = np.clip(gamma, float(gammas[0]), float(gammas[-1]))
+    k = np.clip(np.searchsorted(gammas, gamma, side="right") - 1, 0, gammas.size - 2)
+    # A direction exactly on a sample also borders the interval below it.
+    on_sample = (k > 0) & (gamma == gammas[k])
+    bound = envelope[k]
+    bound[on_sample] = np.maximum(bound[on_sample], envelope[k[on_sample] - 1])
+    return np.maximum(bound, 0.0) * _tilt_scale(luminaire)
+
+
+def influence_radius(luminaire: Luminaire, threshold_lux: float) -> float:
+    """
+    Distance beyond which the luminaire contributes less than ``threshold_lux`` to any surface.
+
+    Uses ``E = I cos(a) / d^2 <= I_peak / d^2``, so the bound holds for every
+    point orientation and aiming.
+    """
+    if not threshold_lux > 0.0:
+        raise InfluenceCullingError("influence threshold must be > 0 lux")
+    return math.sqrt(luminaire_peak_intensity_cd(luminaire) / float(threshold_lux))
+
+
+def influence_radii(luminaires: Sequence[Luminaire], threshold_lux: float) -> np.ndarray:
+    return np.asarray([influence_radius(lum, threshold_lux) for lum in luminaires], dtype=float)
+
+
+class PointGridIndex:
+    """
+    Uniform plan-view (XY) bucket grid over calculation points.
+
+    Sphere queries visit only the cells overlapping the sphere's footprint and then
+    filter candidates by exact 3D distance, so a query costs O(points near the
+    sphere) rather than O(all points).
+    """
+
+    def __init__(self, points: np.ndarray, cell_size: float):
+        pts = np.asarray(points, dtype=float).reshape(-1, 3)
+        if not cell_size > 0.0:
+            raise InfluenceCullingError("cell_size must be > 0")
+        self.points = pts
+        self.cell_size = float(cell_size)
+        if pts.shape[0] == 0:
+            self.origin = np.zeros((2,), dtype=float)
+            self.shape = (0, 0)
+            self._order = np.zeros((0,), dtype=np.int64)
+            self._starts = np.zeros((1,), dtype=np.int64)
+            return
+        self.origin = np.min(pts[:, :2], axis=0)
+        cells = np.floor((pts[:, :2] - self.origin[None, :]) / self.cell_size).astype(np.int64)
+        self.shape = (int(cells[:, 0].max()) + 1, int(cells[:, 1].max()) + 1)
+        flat = cells[:, 0] * self.shape[1] + cells[:, 1]
+        self._order = np.argsort(flat, kind="stable")
+        counts = np.bincount(flat, minlength=self.shape[0] * self.shape[1])
+        self._starts = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+
+    def query_sphere(self, center: Sequence[float], radius: float) -> np.ndarray:
+        """Sorted indices of points within ``radius`` (3D) of ``center``."""
+        if self.points.shape[0] == 0 or radius < 0.0:
+            return np.zeros((0,), dtype=np.int64)
+        c = np.asarray(center, dtype=float).reshape(3)
+        lo = np.floor((c[:2] - radius - self.origin) / self.cell_size).astype(np.int64)
+        hi = np.floor((c[:2] + radius - self.origin) / self.cell_size).astype(np.int64)
+        i0, j0 = max(int(lo[0]), 0), max(int(lo[1]), 0)
+        i1, j1 = min(int(hi[0]), self.shape[0] - 1), min(int(hi[1]), self.shape[1] - 1)
+        if i0 > i1 or j0 > j1:
+            return np.zeros((0,), dtype=np.int64)
+        chunks = []
+        for i in range(i0, i1 + 1):
+            # Cells of one grid column are contiguous in the sorted order.
+            a = self._starts[i * self.shape[1] + j0]
+            b = self._starts[i * self.shape[1] + j1 + 1]
+            if b > a:
+                chunks.append(self._order[a:b])
+        if not chunks:
+            return np.zeros((0,), dtype=np.int64)
+        cand = np.concatenate(chunks)
+        d = self.points[cand] - c[None, :]
+        keep = np.einsum("ij,ij->i", d, d) <= radius * radius
+        return np.sort(cand[keep])
+
+
+@dataclass(frozen=True)
+class InfluenceNeighbourhoods:
+    """Per-luminaire indices of the calculation points inside its influence radius."""
+
+    threshold_lux: float
+    radii: np.ndarray
+    point_indices: List[np.ndarray]
+    point_count: int
+
+    @property
+    def evaluated_pairs(self) -> int:
+        return int(sum(int(idx.size) for idx in self.point_indices))
+
+    @property
+    def total_pairs(self) -> int:
+        return int(self.point_count * len(self.point_indices))
+
+    def summary(self) -> dict:
+        total = self.total_pairs
+        return {
+            "threshold_lux": float(self.threshold_lux),
+            "evaluated_pairs": self.evaluated_pairs,
+            "total_pairs": total,
+            "culled_fraction": (1.0 - self.evaluated_pairs / total) if total else 0.0,
+            "max_radius_m": float(np.max(self.radii)) if self.radii.size else 0.0,
+        }
+
+
+def build_neighbourhoods(
+    points: np.ndarray,
+    luminaires: Sequence[Luminaire],
+    threshold_lux: float,
+    *,
+    cell_size: Optional[float] = None,
+) -> InfluenceNeighbourhoods:
+    """
+    Pair every luminaire with the calculation points it can light above ``threshold_lux``.
+
+    Candidates come from a sphere query at the peak-intensity radius and are then
+    kept only where the directional bound ``intensity_bound_cd / d^2`` reaches the
+    threshold, so the neighbourhood follows the shape of the light distribution.
+    ``cell_size`` defaults to the median influence radius, which keeps the number
+    of visited cells per query small for sites of uniformly specified poles.
+    """
+    pts = np.asarray(points, dtype=float).reshape(-1, 3)
+    radii = influence_radii(luminaires, threshold_lux)
+    if cell_size is None:
+        positive = radii[radii > 0.0]
+        cell_size = float(np.median(positive)) if positive.size else 1.0
+    index = PointGridIndex(pts, max(float(cell_size), float(np.finfo(float).eps)))
+    neighbours: List[np.ndarray] = []
+    for lum, r in zip(luminaires, radii):
+        if not r > 0.0:
+            neighbours.append(np.zeros((0,), dtype=np.int64))
+            continue
+        pos = np.asarray(lum.transform.position.to_tuple(), dtype=float)
+        cand = index.query_sphere(pos, float(r))
+        vec = pts[cand] - pos[None, :]
+        d2 = np.einsum("ij,ij->i", vec, vec)
+        d = np.sqrt(d2)
+        dirs = np.divide(vec, d[:, None], out=np.zeros_like(vec), where=d[:, None] > 0.0)
+        keep = intensity_bound_cd(lum, dirs) >= float(threshold_lux) * d2
+        neighbours.append(cand[keep])
+    return InfluenceNeighbourhoods(threshold_lux=float(threshold_lux), radii=radii, point_indices=neighbours, point_count=int(pts.shape[0]))
+
+
+def accumulate_culled(neighbourhoods: InfluenceNeighbourhoods, evaluate: PairEvaluator) -> np.ndarray:
+    """Sum ``evaluate`` over each luminaire's neighbourhood; culled pairs contribute zero."""
+    out = np.zeros((neighbourhoods.point_count,), dtype=float)
+    for lum_idx, idx in enumerate(neighbourhoods.point_indices):
+        if idx.size:
+            out[idx] += np.asarray(evaluate(idx, lum_idx), dtype=float).reshape(-1)
+    return out
+
+
+__all__ = [
+    "InfluenceCullingError",
+    "InfluenceNeighbourhoods",
+    "PointGridIndex",
+    "accumulate_culled",
+    "build_neighbourhoods",
+    "influence_radii",
+    "influence_radius",
+    "intensity_bound_cd",
+    "luminaire_peak_intensity_cd",
+]
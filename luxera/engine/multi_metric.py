@@ -0,0 +1,195 @@
+from __future__ import annotations
+"""Contract: docs/spec/solver_contracts.md, docs/spec/indoor_multiplane.md."""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from luxera.calculation.illuminance import Luminaire, _is_occluded
+from luxera.engine.direct_illuminance import OcclusionContext
+from luxera.geometry.core import Vector3
+from luxera.photometry.interp import sample_lut_intensity_cd_array
+from luxera.photometry.sample import sample_intensity_cd
+
+
+# Points per block; each block holds (block, luminaires) arrays for every shared quantity.
+_POINT_BLOCK = 4096
+
+
+@dataclass(frozen=True)
+class MetricRequest:
+    """
+    Metrics to evaluate on one point set.
+
+    ``vertical`` maps an orientation name to its plane normal and ``semicylindrical``
+    maps a name to its horizontal facing direction, e.g. ``{"N": (0.0, -1.0, 0.0)}``.
+    """
+
+    horizontal: bool = True
+    vertical: Mapping[str, Sequence[float]] = field(default_factory=dict)
+    cylindrical: bool = False
+    semicylindrical: Mapping[str, Sequence[float]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class PointMetricsResult:
+    """
+    Per-point values for every requested metric.
+
+    Keys are ``E_h``, ``E_z`` (cylindrical), ``E_v:<name>`` and ``E_sc:<name>``; all
+    arrays have shape ``(M,)`` and align with ``points``.
+    """
+
+    points: np.ndarray
+    values: Dict[str, np.ndarray]
+
+    @property
+    def E_h(self) -> Optional[np.ndarray]:
+        return self.values.get("E_h")
+
+    @property
+    def E_z(self) -> Optional[np.ndarray]:
+        return self.values.get("E_z")
+
+    def E_v(self, name: str) -> np.ndarray:
+        return self.values[f"E_v:{name}"]
+
+    def E_sc(self, name: str) -> np.ndarray:
+        return self.values[f"E_sc:{name}"]
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        out: Dict[str, Dict[str, float]] = {}
+        for key, vals in self.values.items():
+            v = np.asarray(vals, dtype=float)
+            v = v[np.isfinite(v)]
+            if v.size == 0:
+                out[key] = {"min": 0.0, "avg": 0.0, "max": 0.0, "U0": 0.0, "U1": 0.0}
+                continue
+            mn, avg, mx = float(np.min(v)), float(np.mean(v)), float(np.max(v))
+            out[key] = {
+                "min": mn,
+                "avg": avg,
+                "max": mx,
+                "U0": (mn / avg) if avg > 1e-9 else 0.0,
+                "U1": (mn / mx) if mx > 1e-9 else 0.0,
+            }
+        return out
+
+
+def luminaire_intensity_array(luminaire: Luminaire, directions_world: np.ndarray) -> np.ndarray:
+    """
+    Intensity (cd, flux multiplier applied) toward ``(K, 3)`` unit world directions.
+
+    Directions point from the luminaire to the receiver; those in the luminaire's
+    upper local hemisphere get zero, as in ``calculate_direct_illuminance``.
+    """
+    dirs = np.asarray(directions_world, dtype=float).reshape(-1, 3)
+    R = np.asarray(luminaire.transform.get_rotation_matrix(), dtype=float)
+    local = dirs @ R
+    out = np.zeros((dirs.shape[0],), dtype=float)
+    below = np.flatnonzero(local[:, 2] < 0.0)
+    if below.size == 0:
+        return out
+    tilt_data = luminaire.photometry.tilt
+    tilt_active = bool(tilt_data is not None and str(getattr(tilt_data, "type", "")).upper() in {"INCLUDE", "FILE"})
+    if luminaire.lut is not None and abs(float(luminaire.tilt_deg)) <= 1e-12 and not tilt_active:
+        out[below] = sample_lut_intensity_cd_array(luminaire.lut, local[below])
+    else:
+        out[below] = [
+            float(sample_intensity_cd(luminaire.photometry, Vector3.from_array(d), tilt_deg=luminaire.tilt_deg))
+            for d in local[below]
+        ]
+    return out * float(luminaire.flux_multiplier)
+
+
+def _unit_normals(named: Mapping[str, Sequence[float]], dims: int) -> List[Tuple[str, np.ndarray]]:
+    out: List[Tuple[str, np.ndarray]] = []
+    for name, vec in named.items():
+        v = np.asarray(vec, dtype=float).reshape(-1)[:dims]
+        n = float(np.linalg.norm(v))
+        out.append((str(name), v / n if n > 1e-12 else np.zeros((dims,), dtype=float)))
+    return out
+
+
+def compute_point_metrics(
+    points: np.ndarray,
+    luminaires: Sequence[Luminaire],
+    request: MetricRequest = MetricRequest(),
+    *,
+    occlusion: Optional[OcclusionContext] = None,
+    use_occlusion: bool = False,
+    occlusion_epsilon: float = 1e-6,
+) -> PointMetricsResult:
+    """
+    Evaluate several illuminance metrics at ``points`` in one pass.
+
+    Distances, directions, intensities and (optionally) visibility are computed once
+    per (point, luminaire) block and shared by E_h, every E_v orientation, E_z and
+    every E_sc facing. Per-metric formulas match ``calculate_direct_illuminance``,
+    ``compute_cylindrical_illuminance`` and ``compute_semicylindrical_illuminance``;
+    visibility uses one shadow ray per pair offset along the ray.
+    """
+    pts = np.asarray(points, dtype=float).reshape(-1, 3)
+    m = pts.shape[0]
+    planes: List[Tuple[str, np.ndarray]] = []
+    if request.horizontal:
+        planes.append(("E_h", np.array([0.0, 0.0, 1.0])))
+    planes.extend((f"E_v:{name}", n) for name, n in _unit_normals(request.vertical, 3))
+    facings = [(f"E_sc:{name}", f) for name, f in _unit_normals(request.semicylindrical, 2)]
+
+    values: Dict[str, np.ndarray] = {key: np.zeros((m,), dtype=float) for key, _ in planes}
+    if request.cylindrical:
+        values["E_z"] = np.zeros((m,), dtype=float)
+    values.update({key: np.zeros((m,), dtype=float) for key, _ in facings})
+    if m == 0 or not luminaires or not values:
+        return PointMetricsResult(points=pts, values=values)
+
+    tris = occlusion.triangles if occlusion is not None else []
+    bvh = occlusion.bvh if occlusion is not None else None
+    check_occlusion = bool(use_occlusion) and occlusion is not None and (bool(tris) or bvh is not None)
+    eps = max(float(occlusion_epsilon), 1e-9)
+    lum_pos = np.array([lum.transform.position.to_tuple() for lum in luminaires], dtype=float)
+
+    for start in range(0, m, _POINT_BLOCK):
+        block = pts[start : start + _POINT_BLOCK]
+        # Luminaire -> point geometry shared by every metric.
+        ray = block[:, None, :] - lum_pos[None, :, :]
+        d2 = np.sum(ray * ray, axis=2)
+        dist = np.sqrt(d2)
+        safe = np.where(dist > 0.0, dist, 1.0)
+        direction = ray / safe[:, :, None]
+        intensity = np.zeros(d2.shape, dtype=float)
+        for k, lum in enumerate(luminaires):
+            intensity[:, k] = luminaire_intensity_array(lum, direction[:, k, :])
+        if check_occlusion:
+            for i, k in zip(*np.nonzero(intensity > 0.0)):
+                p = Vector3(*block[i].tolist())
+                if _is_occluded(p, luminaires[k].transform.position, tris, eps, bvh=bvh, surface_normal=None):
+                    intensity[i, k] = 0.0
+
+        # Planar metrics: E = I cos(incidence) / d^2 (calculate_direct_illuminance).
+        planar_ok = dist >= 0.001
+        e_planar = np.where(planar_ok, intensity / np.where(planar_ok, d2, 1.0), 0.0)
+        for key, n in planes:
+            cos_inc = -(direction @ n)
+            values[key][start : start + block.shape[0]] = np.sum(np.where(cos_inc > 0.0, e_planar * cos_inc, 0.0), axis=1)
+
+        if request.cylindrical or facings:
+            to_lum = -ray
+            horizontal = np.hypot(to_lum[:, :, 0], to_lum[:, :, 1])
+            cyl_ok = (dist > 1e-9) & (d2 > 1e-12)
+            cos_alpha = np.where(cyl_ok, horizontal / np.where(cyl_ok, dist, 1.0), 0.0)
+            e_cyl = np.where(cyl_ok & (cos_alpha > 0.0), intensity * cos_alpha / np.where(cyl_ok, d2, 1.0), 0.0)
+            if request.cylindrical:
+                values["E_z"][start : start + block.shape[0]] = np.sum(e_cyl / math.pi, axis=1)
+            if facings:
+                h_ok = horizontal > 1e-12
+                h_safe = np.where(h_ok, horizontal, 1.0)
+                for key, f in facings:
+                    cos_beta = (to_lum[:, :, 0] * f[0] + to_lum[:, :, 1] * f[1]) / h_safe
+                    keep = h_ok & (cos_beta > 0.0) & (float(np.hypot(f[0], f[1])) > 1e-12)
+                    values[key][start : start + block.shape[0]] = np.sum(np.where(keep, e_cyl * cos_beta, 0.0), axis=1)
+
+    return PointMetricsResult(points=pts, values=values)
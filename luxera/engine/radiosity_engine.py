@@ -8,6 +8,7 @@ from luxera.calculation.radiosity import RadiosityMethod, RadiositySettings
 from luxera.geometry.core import Room
 from luxera.calculation.illuminance import Luminaire, calculate_direct_illuminance
 from luxera.engine.radiosity.solver import RadiosityConfig, solve_radiosity
+from luxera.core.trace import traced
 
 
 @dataclass(frozen=True)
@@ -25,6 +26,7 @@ class RadiosityEngineResult:
     energy: Dict[str, float] = field(default_factory=dict)
 
 
+@traced("radiosity_solve")
 def run_radiosity(
     room: Room,
     luminaires: List[Luminaire],
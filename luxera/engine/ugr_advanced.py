@@ -9,7 +9,7 @@ import numpy as np
 
 from luxera.calculation.illuminance import Luminaire
 from luxera.geometry.core import Room, Vector3
-from luxera.geometry.spatial import point_in_polygon
+from luxera.geometry.spatial import points_in_polygon
 from luxera.photometry.sample import sample_intensity_cd_world
 
 
@@ -240,15 +240,21 @@ class AdvancedUGREngine:
         ys = [p[1] for p in poly]
         s = max(0.2, float(spacing))
 
-        points: List[Tuple[float, float, float]] = []
+        gx: List[float] = []
         x = min(xs) + 0.5 * s
         while x < max(xs):
-            y = min(ys) + 0.5 * s
-            while y < max(ys):
-                if point_in_polygon((x, y), poly):
-                    points.append((float(x), float(y), float(observer_height)))
-                y += s
+            gx.append(x)
             x += s
+        gy: List[float] = []
+        y = min(ys) + 0.5 * s
+        while y < max(ys):
+            gy.append(y)
+            y += s
+        cand = [(x, y) for x in gx for y in gy]
+        inside = points_in_polygon(cand, poly) if cand else []
+        points: List[Tuple[float, float, float]] = [
+            (float(x), float(y), float(observer_height)) for (x, y), keep in zip(cand, inside) if keep
+        ]
 
         if not points:
             cx = 0.5 * (min(xs) + max(xs))
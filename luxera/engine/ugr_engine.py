@@ -17,6 +17,7 @@ from luxera.calculation.illuminance import Luminaire
 from luxera.photometry.sample import sample_intensity_cd
 from luxera.project.schema import GlareViewSpec
 from luxera.geometry.bvh import BVHNode, build_bvh, triangulate_surfaces
+from luxera.core.trace import traced
 
 
 UGR_INTENSITY_CAL_FACTOR = 0.78
@@ -47,6 +48,7 @@ def _to_ugr_luminaires(luminaires: List[Luminaire]) -> List[LuminaireForUGR]:
     return out
 
 
+@traced("ugr_grid")
 def compute_ugr_default(
     room: Room,
     luminaires: List[Luminaire],
@@ -94,6 +96,7 @@ def compute_ugr_default(
     return worst
 
 
+@traced("ugr_views")
 def compute_ugr_for_views(
     room: Room,
     luminaires: List[Luminaire],
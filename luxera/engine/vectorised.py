@@ -2,11 +2,11 @@ from __future__ import annotations
 """Contract: docs/spec/solver_contracts.md, docs/spec/performance_contract.md."""
 
 import math
-import multiprocessing as mp
 from typing import Callable, List, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
 
+from luxera.core.processes import process_context
 from luxera.geometry.bvh import any_hit, ray_intersects_triangle
 from luxera.geometry.core import Vector3
 from luxera.geometry.ray_config import scaled_ray_policy
@@ -46,32 +46,41 @@ def _validate_inputs(
     return pts, nrms, lpos, lint, lflux, lmf
 
 
-def _point_pair_occluded(
-    point_xyz: np.ndarray,
-    target_xyz: np.ndarray,
-    occlusion_triangles: List["Triangle"],
-    bvh: Optional["BVHNode"],
-) -> bool:
+def shadow_ray(point_xyz: np.ndarray, target_xyz: np.ndarray) -> Optional[Tuple[Vector3, Vector3, float, float]]:
+    """Offset origin, unit direction and ``(t_min, t_max)`` of the point-to-target shadow ray; ``None`` if degenerate."""
     p = Vector3(float(point_xyz[0]), float(point_xyz[1]), float(point_xyz[2]))
     t = Vector3(float(target_xyz[0]), float(target_xyz[1]), float(target_xyz[2]))
 
     direction = t - p
     dist = direction.length()
     if dist <= 0.0:
-        return False
+        return None
 
     policy = scaled_ray_policy(scene_scale=dist, user_eps=1e-6)
     ray_dir = direction / dist
     origin = p + ray_dir * policy.origin_eps
     t_max = max((t - origin).length() - policy.t_min, 0.0)
     if t_max <= policy.t_min:
+        return None
+    return origin, ray_dir, policy.t_min, t_max
+
+
+def _point_pair_occluded(
+    point_xyz: np.ndarray,
+    target_xyz: np.ndarray,
+    occlusion_triangles: List["Triangle"],
+    bvh: Optional["BVHNode"],
+) -> bool:
+    ray = shadow_ray(point_xyz, target_xyz)
+    if ray is None:
         return False
+    origin, ray_dir, t_min, t_max = ray
 
     if bvh is not None:
-        return any_hit(bvh, origin, ray_dir, t_min=policy.t_min, t_max=t_max)
+        return any_hit(bvh, origin, ray_dir, t_min=t_min, t_max=t_max)
 
     for tri in occlusion_triangles:
-        if ray_intersects_triangle(origin, ray_dir, tri, t_min=policy.t_min, t_max=t_max) is not None:
+        if ray_intersects_triangle(origin, ray_dir, tri, t_min=t_min, t_max=t_max) is not None:
             return True
     return False
 
@@ -303,11 +312,8 @@ class ParallelEngine:
             else:
                 tasks.append((p_chunk, n_chunk, lpos, lint, lflux, lmf, occlusion_triangles, bvh))
 
-        ctx = mp.get_context("fork")
-        with ctx.Pool(processes=len(spans)) as pool:
-            if occlusion_triangles is None:
-                parts = pool.starmap(_compute_chunk_no_occlusion, tasks)
-            else:
-                parts = pool.starmap(_compute_chunk_with_occlusion, tasks)
+        fn = _compute_chunk_no_occlusion if occlusion_triangles is None else _compute_chunk_with_occlusion
+        with process_context().Pool(processes=len(spans)) as pool:
+            parts = pool.starmap(fn, tasks)
 
         return np.concatenate(parts, axis=0) if parts else np.zeros((0,), dtype=float)
@@ -3,9 +3,11 @@ from __future__ import annotations
 import io
 import json
 import math
+import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import matplotlib
 
@@ -18,6 +20,8 @@ from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import cm
 from reportlab.platypus import Image, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 
+from luxera.cache.figure_cache import figure_key, load_figure_from_cache, save_figure_to_cache
+from luxera.core.processes import process_context
 from luxera.parser.ies_parser import parse_ies_text
 from luxera.parser.ldt_parser import parse_ldt_text
 from luxera.photometry.model import photometry_from_parsed_ies, photometry_from_parsed_ldt
@@ -26,16 +30,232 @@ from luxera.reporting.schedules import build_luminaire_schedule
 from luxera.viz.falsecolour import FalseColourRenderer
 
 
+_FIGURE_STYLE: Dict[str, Any] = {"version": 1, "dpi": 170}
+
+
+def _fig_png(fig: plt.Figure) -> bytes:
+    buf = io.BytesIO()
+    fig.tight_layout()
+    fig.savefig(buf, format="png", dpi=_FIGURE_STYLE["dpi"])
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def _render_layout_plan(spec: Dict[str, Any]) -> bytes:
+    fig, ax = plt.subplots(figsize=(9, 5.5), dpi=160)
+    x_min = 0.0
+    y_min = 0.0
+    x_max = 8.0
+    y_max = 8.0
+
+    rooms = spec["rooms"]
+    if rooms:
+        x_vals: List[float] = []
+        y_vals: List[float] = []
+        for name, ox, oy, width, length in rooms:
+            rect = plt.Rectangle((ox, oy), width, length, fill=False, linewidth=2.0, edgecolor="#1f4e79")
+            ax.add_patch(rect)
+            ax.text(ox + width * 0.5, oy + length * 0.5, name, ha="center", va="center", fontsize=9)
+            x_vals.extend([ox, ox + width])
+            y_vals.extend([oy, oy + length])
+        x_min, x_max = min(x_vals), max(x_vals)
+        y_min, y_max = min(y_vals), max(y_vals)
+
+    if spec["grid"] is not None:
+        name, gx, gy, width, height = spec["grid"]
+        grid_rect = plt.Rectangle((gx, gy), width, height, fill=False, linewidth=1.5, linestyle="--", edgecolor="#f57c00")
+        ax.add_patch(grid_rect)
+        ax.text(gx, gy, f"Grid: {name}", fontsize=8, color="#f57c00", va="bottom")
+
+    xs = spec["xs"]
+    ys = spec["ys"]
+    if xs and ys:
+        ax.scatter(xs, ys, marker="*", s=130, color="#c62828", edgecolors="white", linewidths=0.8, label="Luminaires")
+        for i, (x, y) in enumerate(zip(xs, ys), start=1):
+            ax.text(x, y, f"L{i}", fontsize=7, ha="left", va="bottom", color="#7f0000")
+
+    span = max(x_max - x_min, y_max - y_min, 1.0)
+    scale_len = max(1.0, round(span / 5.0, 1))
+    x0 = x_min + span * 0.05
+    y0 = y_min - span * 0.08
+    ax.plot([x0, x0 + scale_len], [y0, y0], color="black", linewidth=2)
+    ax.plot([x0, x0], [y0 - 0.05, y0 + 0.05], color="black", linewidth=1)
+    ax.plot([x0 + scale_len, x0 + scale_len], [y0 - 0.05, y0 + 0.05], color="black", linewidth=1)
+    ax.text(x0 + scale_len / 2.0, y0 - 0.12, f"{scale_len:g} m", ha="center", va="top", fontsize=8)
+
+    nx = x_max + span * 0.05
+    ny = y_max - span * 0.15
+    ax.annotate("N", xy=(nx, ny + span * 0.1), xytext=(nx, ny), arrowprops=dict(arrowstyle="->", lw=1.8), ha="center", fontsize=10)
+
+    ax.set_title("Layout Plan (Top View)")
+    ax.set_xlabel("X (m)")
+    ax.set_ylabel("Y (m)")
+    ax.grid(alpha=0.25)
+    ax.set_aspect("equal", adjustable="box")
+    ax.set_xlim(x_min - span * 0.12, x_max + span * 0.15)
+    ax.set_ylim(y_min - span * 0.2, y_max + span * 0.1)
+    if xs:
+        ax.legend(loc="upper right", fontsize=8)
+    return _fig_png(fig)
+
+
+def _render_section_view(spec: Dict[str, Any]) -> bytes:
+    fig, ax = plt.subplots(figsize=(9, 3.2), dpi=160)
+    room_h = spec["room_h"]
+    room_l = spec["room_l"]
+    ax.plot([0, room_l], [0, 0], color="#5d4037", linewidth=2)
+    ax.plot([0, 0], [0, room_h], color="#1f4e79", linewidth=1.5)
+    ax.plot([room_l, room_l], [0, room_h], color="#1f4e79", linewidth=1.5)
+    ax.plot([0, room_l], [room_h, room_h], color="#1f4e79", linewidth=1.5)
+    z_vals = spec["z_vals"]
+    if z_vals:
+        x_norm = np.linspace(0.5, max(0.6, room_l - 0.5), num=len(z_vals))
+        ax.scatter(x_norm, z_vals, marker="o", s=45, color="#c62828", label="Luminaire Mount")
+    ax.set_title("Section View")
+    ax.set_xlabel("Length (m)")
+    ax.set_ylabel("Height (m)")
+    ax.set_xlim(-0.2, room_l + 0.2)
+    ax.set_ylim(0, room_h + 0.6)
+    ax.grid(alpha=0.25)
+    return _fig_png(fig)
+
+
+def _render_isolux(spec: Dict[str, Any]) -> bytes:
+    x, y, z = spec["x"], spec["y"], spec["z"]
+    renderer = FalseColourRenderer(colour_scale="viridis", vmin=float(np.min(z)), vmax=float(np.max(z) + 1e-9))
+    levels = np.linspace(float(np.min(z)), float(np.max(z)), 8).tolist()
+    fig = renderer.render_isolux_contours(
+        grid_values=z,
+        grid_origin=(float(np.min(x)), float(np.min(y))),
+        grid_width=float(np.max(x) - np.min(x)),
+        grid_height=float(np.max(y) - np.min(y)),
+        levels=levels,
+        luminaire_positions=[(float(lx), float(ly)) for lx, ly in spec["luminaires"]],
+    )
+    return _fig_png(fig)
+
+
+def _render_heatmap(spec: Dict[str, Any]) -> bytes:
+    x, y, z = spec["x"], spec["y"], spec["z"]
+    renderer = FalseColourRenderer(colour_scale="luxera", vmin=float(np.min(z)), vmax=float(np.max(z) + 1e-9))
+    levels = np.linspace(float(np.min(z)), float(np.max(z)), 8).tolist()
+    fig = renderer.render_grid_heatmap(
+        grid_values=z,
+        grid_origin=(float(np.min(x)), float(np.min(y))),
+        grid_width=float(np.max(x) - np.min(x)),
+        grid_height=float(np.max(y) - np.min(y)),
+        title="False-colour Illuminance Heatmap",
+        contour_levels=levels,
+    )
+    return _fig_png(fig)
+
+
+def _render_polar(spec: Dict[str, Any]) -> bytes:
+    asset_id = spec["asset_id"]
+    fig = None
+    if spec["text"] is not None:
+        try:
+            if spec["format"] == "LDT":
+                phot = photometry_from_parsed_ldt(parse_ldt_text(spec["text"]))
+            else:
+                # TILT=<file> references resolve relative to the asset file.
+                phot = photometry_from_parsed_ies(parse_ies_text(spec["text"], source_path=spec.get("source_path")))
+            fig = FalseColourRenderer(colour_scale="viridis").render_polar_candela(
+                photometry=phot,
+                title=f"Luminaire {asset_id}",
+            )
+        except Exception:
+            fig = None
+
+    if fig is None:
+        n = max(1.0, min(16.0, 180.0 / spec["beam"]))
+        theta = np.linspace(0, 2 * np.pi, 360)
+        intensity = np.clip(np.cos(theta) ** (2 * n), 0, None)
+        intensity = intensity / max(np.max(intensity), 1e-9)
+        fig = plt.figure(figsize=(5.3, 4.2), dpi=170)
+        ax = fig.add_subplot(111, projection="polar")
+        ax.plot(theta, intensity, color="#1f4e79", linewidth=1.8)
+        ax.fill(theta, intensity, color="#90caf9", alpha=0.35)
+        ax.set_title(f"Luminaire {asset_id}", va="bottom", fontsize=10)
+        ax.set_rticks([0.25, 0.5, 0.75, 1.0])
+    return _fig_png(fig)
+
+
+_FIGURE_RENDERERS = {
+    "layout_plan": _render_layout_plan,
+    "section_view": _render_section_view,
+    "isolux": _render_isolux,
+    "heatmap": _render_heatmap,
+    "polar": _render_polar,
+}
+
+
+def _render_figure(kind: str, spec: Dict[str, Any]) -> bytes:
+    return _FIGURE_RENDERERS[kind](spec)
+
+
+def _render_many(tasks: Sequence[Tuple[str, Dict[str, Any]]], n_workers: Optional[int] = None) -> List[bytes]:
+    """Render figures in a process pool; matplotlib is not thread-safe."""
+    workers = min(len(tasks), n_workers or max(1, (os.cpu_count() or 1)))
+    if workers <= 1:
+        return [_render_figure(kind, spec) for kind, spec in tasks]
+    with process_context().Pool(processes=workers) as pool:
+        return pool.starmap(_render_figure, tasks)
+
+
+@lru_cache(maxsize=32)
+def _load_grid_csv(path: str, mtime_ns: int, size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    # mtime/size are part of the cache key so rewritten CSVs are re-read.
+    # The arrays are shared between callers, so they are returned read-only.
+    _ = (mtime_ns, size)
+    try:
+        arr = np.loadtxt(path, delimiter=",", skiprows=1, dtype=float)
+        if arr.ndim == 1:
+            arr = arr.reshape(1, -1)
+        if arr.shape[1] < 4:
+            return None
+        xvals = np.unique(arr[:, 0])
+        yvals = np.unique(arr[:, 1])
+        if xvals.size < 2 or yvals.size < 2:
+            return None
+        order = np.lexsort((arr[:, 0], arr[:, 1]))
+        arr = arr[order]
+        z = arr[:, 3].reshape(yvals.size, xvals.size)
+        xx, yy = np.meshgrid(xvals, yvals)
+        for a in (xx, yy, z):
+            a.setflags(write=False)
+        return xx, yy, z
+    except Exception:
+        return None
+
+
 class ProfessionalReportBuilder:
     """
     Generate a professional multi-page lighting report PDF.
     Comparable to AGi32's printed output.
     """
 
-    def __init__(self, project: Project, results: Dict[str, Any]):
+    def __init__(
+        self,
+        project: Project,
+        results: Dict[str, Any],
+        *,
+        n_workers: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
+    ):
         self.project = project
         self.results = results
         self.styles = self._default_styles()
+        # Figures are cached by a hash of their input data and style, in
+        # memory and under <project>/.luxera/cache/figures, so text-only
+        # rebuilds and report variants reuse rendered images.
+        if cache_dir is None and project.root_dir:
+            cache_dir = Path(project.root_dir).expanduser() / ".luxera" / "cache" / "figures"
+        self.cache_dir = cache_dir
+        self.n_workers = n_workers
+        self.figure_stats: Dict[str, int] = {"rendered": 0, "cached": 0}
+        self._figures: Dict[str, bytes] = {}
+        self._plot_grid: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
         self.sections = [
             "Project Summary",
             "Luminaire Schedule",
@@ -84,6 +304,7 @@ class ProfessionalReportBuilder:
             pageCompression=0,
         )
 
+        self._figures = self._render_figures(self._figure_specs())
         story: List[Any] = []
 
         story.extend(self._cover_story())
@@ -235,91 +456,12 @@ class ProfessionalReportBuilder:
         ]
 
     def _layout_plan(self):
-        fig, ax = plt.subplots(figsize=(9, 5.5), dpi=160)
-        rooms = self.project.geometry.rooms
-        x_min = 0.0
-        y_min = 0.0
-        x_max = 8.0
-        y_max = 8.0
-
-        if rooms:
-            x_vals: List[float] = []
-            y_vals: List[float] = []
-            for room in rooms:
-                ox, oy, _ = room.origin
-                rect = plt.Rectangle((ox, oy), room.width, room.length, fill=False, linewidth=2.0, edgecolor="#1f4e79")
-                ax.add_patch(rect)
-                ax.text(ox + room.width * 0.5, oy + room.length * 0.5, room.name, ha="center", va="center", fontsize=9)
-                x_vals.extend([ox, ox + room.width])
-                y_vals.extend([oy, oy + room.length])
-            x_min, x_max = min(x_vals), max(x_vals)
-            y_min, y_max = min(y_vals), max(y_vals)
-
-        if self.project.grids:
-            g = self.project.grids[0]
-            gx, gy, _ = g.origin
-            grid_rect = plt.Rectangle((gx, gy), g.width, g.height, fill=False, linewidth=1.5, linestyle="--", edgecolor="#f57c00")
-            ax.add_patch(grid_rect)
-            ax.text(gx, gy, f"Grid: {g.name}", fontsize=8, color="#f57c00", va="bottom")
-
-        xs = [l.transform.position[0] for l in self.project.luminaires]
-        ys = [l.transform.position[1] for l in self.project.luminaires]
-        if xs and ys:
-            ax.scatter(xs, ys, marker="*", s=130, color="#c62828", edgecolors="white", linewidths=0.8, label="Luminaires")
-            for i, (x, y) in enumerate(zip(xs, ys), start=1):
-                ax.text(x, y, f"L{i}", fontsize=7, ha="left", va="bottom", color="#7f0000")
-
-        span = max(x_max - x_min, y_max - y_min, 1.0)
-        scale_len = max(1.0, round(span / 5.0, 1))
-        x0 = x_min + span * 0.05
-        y0 = y_min - span * 0.08
-        ax.plot([x0, x0 + scale_len], [y0, y0], color="black", linewidth=2)
-        ax.plot([x0, x0], [y0 - 0.05, y0 + 0.05], color="black", linewidth=1)
-        ax.plot([x0 + scale_len, x0 + scale_len], [y0 - 0.05, y0 + 0.05], color="black", linewidth=1)
-        ax.text(x0 + scale_len / 2.0, y0 - 0.12, f"{scale_len:g} m", ha="center", va="top", fontsize=8)
-
-        nx = x_max + span * 0.05
-        ny = y_max - span * 0.15
-        ax.annotate("N", xy=(nx, ny + span * 0.1), xytext=(nx, ny), arrowprops=dict(arrowstyle="->", lw=1.8), ha="center", fontsize=10)
-
-        ax.set_title("Layout Plan (Top View)")
-        ax.set_xlabel("X (m)")
-        ax.set_ylabel("Y (m)")
-        ax.grid(alpha=0.25)
-        ax.set_aspect("equal", adjustable="box")
-        ax.set_xlim(x_min - span * 0.12, x_max + span * 0.15)
-        ax.set_ylim(y_min - span * 0.2, y_max + span * 0.1)
-        if xs:
-            ax.legend(loc="upper right", fontsize=8)
-
-        plan_img = self._fig_to_image(fig, width_cm=17.2, height_cm=9.0)
-
-        # Section/elevation companion view.
-        fig2, ax2 = plt.subplots(figsize=(9, 3.2), dpi=160)
-        room_h = max((r.height for r in rooms), default=3.0)
-        room_l = max((r.length for r in rooms), default=8.0)
-        ax2.plot([0, room_l], [0, 0], color="#5d4037", linewidth=2)
-        ax2.plot([0, 0], [0, room_h], color="#1f4e79", linewidth=1.5)
-        ax2.plot([room_l, room_l], [0, room_h], color="#1f4e79", linewidth=1.5)
-        ax2.plot([0, room_l], [room_h, room_h], color="#1f4e79", linewidth=1.5)
-        z_vals = [l.transform.position[2] for l in self.project.luminaires]
-        if z_vals and xs:
-            x_norm = np.linspace(0.5, max(0.6, room_l - 0.5), num=len(z_vals))
-            ax2.scatter(x_norm, z_vals, marker="o", s=45, color="#c62828", label="Luminaire Mount")
-        ax2.set_title("Section View")
-        ax2.set_xlabel("Length (m)")
-        ax2.set_ylabel("Height (m)")
-        ax2.set_xlim(-0.2, room_l + 0.2)
-        ax2.set_ylim(0, room_h + 0.6)
-        ax2.grid(alpha=0.25)
-        section_img = self._fig_to_image(fig2, width_cm=17.2, height_cm=6.0)
-
         return [
             Paragraph("Layout Plan", self.styles["heading"]),
             Spacer(1, 0.15 * cm),
-            plan_img,
+            self._figure_image("layout_plan", width_cm=17.2, height_cm=9.0),
             Spacer(1, 0.3 * cm),
-            section_img,
+            self._figure_image("section_view", width_cm=17.2, height_cm=6.0),
         ]
 
     def _results_table(self):
@@ -343,33 +485,11 @@ class ProfessionalReportBuilder:
         ]
 
     def _isolux_plot(self):
-        x, y, z = self._grid_for_plot()
-        renderer = FalseColourRenderer(colour_scale="viridis", vmin=float(np.min(z)), vmax=float(np.max(z) + 1e-9))
-        levels = np.linspace(float(np.min(z)), float(np.max(z)), 8).tolist()
-        fig = renderer.render_isolux_contours(
-            grid_values=z,
-            grid_origin=(float(np.min(x)), float(np.min(y))),
-            grid_width=float(np.max(x) - np.min(x)),
-            grid_height=float(np.max(y) - np.min(y)),
-            levels=levels,
-            luminaire_positions=[(float(l.transform.position[0]), float(l.transform.position[1])) for l in self.project.luminaires],
-        )
-        img = self._fig_to_image(fig, width_cm=17.0, height_cm=10.5)
+        img = self._figure_image("isolux", width_cm=17.0, height_cm=10.5)
         return [Paragraph("Iso-lux Contour", self.styles["heading"]), Spacer(1, 0.15 * cm), img]
 
     def _heatmap_plot(self):
-        x, y, z = self._grid_for_plot()
-        renderer = FalseColourRenderer(colour_scale="luxera", vmin=float(np.min(z)), vmax=float(np.max(z) + 1e-9))
-        levels = np.linspace(float(np.min(z)), float(np.max(z)), 8).tolist()
-        fig = renderer.render_grid_heatmap(
-            grid_values=z,
-            grid_origin=(float(np.min(x)), float(np.min(y))),
-            grid_width=float(np.max(x) - np.min(x)),
-            grid_height=float(np.max(y) - np.min(y)),
-            title="False-colour Illuminance Heatmap",
-            contour_levels=levels,
-        )
-        img = self._fig_to_image(fig, width_cm=17.0, height_cm=10.5)
+        img = self._figure_image("heatmap", width_cm=17.0, height_cm=10.5)
         return [Paragraph("False-colour Heatmap", self.styles["heading"]), Spacer(1, 0.15 * cm), img]
 
     def _ugr_table(self):
@@ -453,38 +573,7 @@ class ProfessionalReportBuilder:
             asset = by_asset.get(asset_id)
             meta = asset.metadata if asset and isinstance(asset.metadata, dict) else {}
             beam = self._to_float(meta.get("beam_angle_deg")) or 60.0
-            fig = None
-            if asset is not None and asset.path:
-                p = Path(asset.path).expanduser()
-                if not p.is_absolute() and self.project.root_dir:
-                    p = (Path(self.project.root_dir).expanduser() / p).resolve()
-                if p.exists():
-                    try:
-                        txt = p.read_text(encoding="utf-8", errors="replace")
-                        if str(asset.format).upper() == "LDT":
-                            phot = photometry_from_parsed_ldt(parse_ldt_text(txt))
-                        else:
-                            phot = photometry_from_parsed_ies(parse_ies_text(txt, source_path=p))
-                        fig = FalseColourRenderer(colour_scale="viridis").render_polar_candela(
-                            photometry=phot,
-                            title=f"Luminaire {asset_id}",
-                        )
-                    except Exception:
-                        fig = None
-
-            if fig is None:
-                n = max(1.0, min(16.0, 180.0 / beam))
-                theta = np.linspace(0, 2 * np.pi, 360)
-                intensity = np.clip(np.cos(theta) ** (2 * n), 0, None)
-                intensity = intensity / max(np.max(intensity), 1e-9)
-                fig = plt.figure(figsize=(5.3, 4.2), dpi=170)
-                ax = fig.add_subplot(111, projection="polar")
-                ax.plot(theta, intensity, color="#1f4e79", linewidth=1.8)
-                ax.fill(theta, intensity, color="#90caf9", alpha=0.35)
-                ax.set_title(f"Luminaire {asset_id}", va="bottom", fontsize=10)
-                ax.set_rticks([0.25, 0.5, 0.75, 1.0])
-
-            img = self._fig_to_image(fig, width_cm=11.5, height_cm=8.0)
+            img = self._figure_image(f"polar:{asset_id}", width_cm=11.5, height_cm=8.0)
 
             table = self._styled_table(
                 [
@@ -545,13 +634,89 @@ class ProfessionalReportBuilder:
         table.setStyle(TableStyle(style))
         return table
 
-    def _fig_to_image(self, fig: plt.Figure, width_cm: float, height_cm: float) -> Image:
-        buf = io.BytesIO()
-        fig.tight_layout()
-        fig.savefig(buf, format="png", dpi=170)
-        plt.close(fig)
-        buf.seek(0)
-        return Image(buf, width=width_cm * cm, height=height_cm * cm)
+    def _figure_image(self, name: str, width_cm: float, height_cm: float) -> Image:
+        if name not in self._figures:
+            self._figures.update(self._render_figures({name: self._figure_specs()[name]}))
+        return Image(io.BytesIO(self._figures[name]), width=width_cm * cm, height=height_cm * cm)
+
+    def _figure_specs(self) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """Plain-data inputs for every report figure, keyed by figure name."""
+        rooms = self.project.geometry.rooms
+        xs = [float(l.transform.position[0]) for l in self.project.luminaires]
+        ys = [float(l.transform.position[1]) for l in self.project.luminaires]
+        grid = None
+        if self.project.grids:
+            g = self.project.grids[0]
+            grid = (str(g.name), float(g.origin[0]), float(g.origin[1]), float(g.width), float(g.height))
+        x, y, z = self._grid_for_plot()
+        specs: Dict[str, Tuple[str, Dict[str, Any]]] = {
+            "layout_plan": (
+                "layout_plan",
+                {
+                    "rooms": [(str(r.name), float(r.origin[0]), float(r.origin[1]), float(r.width), float(r.length)) for r in rooms],
+                    "grid": grid,
+                    "xs": xs,
+                    "ys": ys,
+                },
+            ),
+            "section_view": (
+                "section_view",
+                {
+                    "room_h": float(max((r.height for r in rooms), default=3.0)),
+                    "room_l": float(max((r.length for r in rooms), default=8.0)),
+                    "z_vals": [float(l.transform.position[2]) for l in self.project.luminaires],
+                },
+            ),
+            "isolux": ("isolux", {"x": x, "y": y, "z": z, "luminaires": list(zip(xs, ys))}),
+            "heatmap": ("heatmap", {"x": x, "y": y, "z": z}),
+        }
+        by_asset = {a.id: a for a in self.project.photometry_assets}
+        for asset_id in sorted({l.photometry_asset_id for l in self.project.luminaires}):
+            asset = by_asset.get(asset_id)
+            meta = asset.metadata if asset and isinstance(asset.metadata, dict) else {}
+            text = None
+            source_path = None
+            if asset is not None and asset.path:
+                src = Path(asset.path).expanduser()
+                if not src.is_absolute() and self.project.root_dir:
+                    src = (Path(self.project.root_dir).expanduser() / src).resolve()
+                if src.exists():
+                    text = src.read_text(encoding="utf-8", errors="replace")
+                    source_path = str(src)
+            specs[f"polar:{asset_id}"] = (
+                "polar",
+                {
+                    "asset_id": asset_id,
+                    "format": str(asset.format).upper() if asset is not None else "",
+                    "text": text,
+                    "source_path": source_path,
+                    "beam": self._to_float(meta.get("beam_angle_deg")) or 60.0,
+                },
+            )
+        return specs
+
+    def _render_figures(self, specs: Dict[str, Tuple[str, Dict[str, Any]]]) -> Dict[str, bytes]:
+        """Return PNG bytes per figure, rendering only cache misses (in parallel)."""
+        keys = {name: figure_key(kind, spec, _FIGURE_STYLE) for name, (kind, spec) in specs.items()}
+        out: Dict[str, bytes] = {}
+        missing: List[str] = []
+        for name, key in keys.items():
+            png = load_figure_from_cache(self.cache_dir, key)
+            if png is None:
+                missing.append(name)
+            else:
+                out[name] = png
+        rendered = _render_many([specs[name] for name in missing], self.n_workers)
+        for name, png in zip(missing, rendered):
+            out[name] = png
+            try:
+                save_figure_to_cache(self.cache_dir, keys[name], png)
+            except OSError:
+                # The on-disk figure cache is an optimisation; never fail a report on it.
+                pass
+        self.figure_stats["rendered"] += len(missing)
+        self.figure_stats["cached"] += len(specs) - len(missing)
+        return out
 
     def _summary(self) -> Dict[str, Any]:
         s = self.results.get("summary", {})
@@ -597,6 +762,11 @@ class ProfessionalReportBuilder:
         return rows[:20]
 
     def _grid_for_plot(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._plot_grid is None:
+            self._plot_grid = self._derive_grid_for_plot()
+        return self._plot_grid
+
+    def _derive_grid_for_plot(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         result_dir = self._result_dir()
         if result_dir is not None:
             grids_dir = result_dir / "grids"
@@ -622,22 +792,10 @@ class ProfessionalReportBuilder:
 
     def _parse_grid_csv(self, csv_path: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
         try:
-            arr = np.loadtxt(str(csv_path), delimiter=",", skiprows=1, dtype=float)
-            if arr.ndim == 1:
-                arr = arr.reshape(1, -1)
-            if arr.shape[1] < 4:
-                return None
-            xvals = np.unique(arr[:, 0])
-            yvals = np.unique(arr[:, 1])
-            if xvals.size < 2 or yvals.size < 2:
-                return None
-            order = np.lexsort((arr[:, 0], arr[:, 1]))
-            arr = arr[order]
-            z = arr[:, 3].reshape(yvals.size, xvals.size)
-            xx, yy = np.meshgrid(xvals, yvals)
-            return xx, yy, z
-        except Exception:
+            st = csv_path.stat()
+        except OSError:
             return None
+        return _load_grid_csv(str(csv_path.resolve()), st.st_mtime_ns, st.st_size)
 
     def _asset_hashes(self) -> Dict[str, str]:
         assets = self.results.get("assets", {})
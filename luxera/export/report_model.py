@@ -269,6 +269,7 @@ def build_report_model(project: Project, job_id: str, result_ref: JobResultRef)
             "luminance_metrics": {
                 "road_luminance_mean_cd_m2": summary.get("road_luminance_mean_cd_m2"),
                 "observer_luminance_max_cd_m2": summary.get("observer_luminance_max_cd_m2"),
+                "threshold_increment_ti_percent": summary.get("threshold_increment_ti_percent"),
                 "threshold_increment_ti_proxy_percent": summary.get("threshold_increment_ti_proxy_percent"),
                 "surround_ratio_proxy": summary.get("surround_ratio_proxy"),
             },
@@ -40,6 +40,7 @@ def render_roadway_report_html(result_dir: Path, out_html: Path) -> Path:
         "ul_longitudinal",
         "road_luminance_mean_cd_m2",
         "observer_luminance_max_cd_m2",
+        "threshold_increment_ti_percent",
         "threshold_increment_ti_proxy_percent",
         "surround_ratio_proxy",
         "lane_width_m",
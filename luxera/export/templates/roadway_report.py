@@ -44,6 +44,7 @@ def _summary_rows(summary: Dict[str, Any]) -> List[List[str]]:
         "uniformity_ratio",
         "ul_longitudinal",
         "road_luminance_mean_cd_m2",
+        "threshold_increment_ti_percent",
         "threshold_increment_ti_proxy_percent",
         "surround_ratio_proxy",
         "lane_width_m",
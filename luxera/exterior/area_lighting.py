@@ -4,13 +4,22 @@ import base64
 import math
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
-from luxera.calculation.illuminance import CalculationGrid, DirectCalcSettings, Luminaire, calculate_grid_illuminance
+from luxera.calculation.illuminance import (
+    CalculationGrid,
+    DirectCalcSettings,
+    IlluminanceResult,
+    Luminaire,
+    calculate_direct_illuminance,
+    calculate_grid_illuminance,
+)
+from luxera.engine.glare_rating import compute_glare_rating
+from luxera.engine.influence import accumulate_culled, build_neighbourhoods
 from luxera.geometry.core import Transform, Vector3
-from luxera.geometry.spatial import point_in_polygon
+from luxera.geometry.spatial import points_in_polygon
 from luxera.parser.ies_parser import parse_ies_text
 from luxera.parser.ldt_parser import parse_ldt_text
 from luxera.photometry.model import Photometry, photometry_from_parsed_ies, photometry_from_parsed_ldt
@@ -26,6 +35,7 @@ class ExteriorAreaSpec:
     ground_reflectance: float = 0.1
     grid_height: float = 0.0
     grid_spacing: float = 5.0
+    observer_height: float = 1.5
 
 
 @dataclass(frozen=True)
@@ -58,17 +68,25 @@ class ExteriorAreaEngine:
         y0 = min(ys) + 0.5 * spacing
         y1 = max(ys)
 
-        points: List[Tuple[float, float, float]] = []
+        # Same running sums as stepping point by point, so sample positions are unchanged.
+        gx: List[float] = []
         x = x0
         while x < x1:
-            y = y0
-            while y < y1:
-                if point_in_polygon((x, y), poly):
-                    points.append((float(x), float(y), float(area.grid_height)))
-                y += spacing
+            gx.append(x)
             x += spacing
-
-        return np.asarray(points, dtype=float)
+        gy: List[float] = []
+        y = y0
+        while y < y1:
+            gy.append(y)
+            y += spacing
+        if not gx or not gy:
+            return np.asarray([], dtype=float)
+        xx, yy = np.meshgrid(np.asarray(gx, dtype=float), np.asarray(gy, dtype=float), indexing="ij")
+        xy = np.stack((xx.ravel(), yy.ravel()), axis=1)
+        xy = xy[points_in_polygon(xy, poly)]
+        if xy.shape[0] == 0:
+            return np.asarray([], dtype=float)
+        return np.column_stack((xy, np.full((xy.shape[0],), float(area.grid_height))))
 
     def create_luminaires_from_poles(self, poles: List[PoleSpec], project: Project) -> List[Luminaire]:
         assets = {a.id: a for a in project.photometry_assets}
@@ -107,7 +125,21 @@ class ExteriorAreaEngine:
 
         return luminaires
 
-    def compute(self, area: ExteriorAreaSpec, poles: List[PoleSpec], project: Project) -> Dict[str, Any]:
+    def compute(
+        self,
+        area: ExteriorAreaSpec,
+        poles: List[PoleSpec],
+        project: Project,
+        *,
+        influence_threshold_lux: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Horizontal illuminance and glare rating over the area.
+
+        ``influence_threshold_lux`` enables culling: each luminaire is evaluated only
+        at grid points inside its influence radius, so large sites cost
+        O(points x nearby luminaires) instead of O(points x all luminaires).
+        """
         points = self.generate_grid_points(area)
         luminaires = self.create_luminaires_from_poles(poles, project)
 
@@ -121,6 +153,7 @@ class ExteriorAreaEngine:
                 "E_min": 0.0,
                 "E_max": 0.0,
                 "U0": 0.0,
+                "GR_max": 0.0,
                 "grid_spacing": float(area.grid_spacing),
                 "grid_height": float(area.grid_height),
             }
@@ -148,12 +181,27 @@ class ExteriorAreaEngine:
         grid.get_points = _get_points  # type: ignore[assignment]
         grid.get_point = _get_point  # type: ignore[assignment]
 
-        result = calculate_grid_illuminance(
-            grid,
-            luminaires,
-            occluders=None,
-            settings=DirectCalcSettings(use_occlusion=False),
-        )
+        culling = None
+        if influence_threshold_lux is not None:
+            normal = Vector3(0.0, 0.0, 1.0)
+            cfg = DirectCalcSettings(use_occlusion=False)
+            hood = build_neighbourhoods(points, luminaires, float(influence_threshold_lux))
+            culled = accumulate_culled(
+                hood,
+                lambda idx, lum_idx: np.array(
+                    [calculate_direct_illuminance(grid_points_vec[i], normal, luminaires[lum_idx], settings=cfg) for i in idx],
+                    dtype=float,
+                ),
+            )
+            result = IlluminanceResult(grid=grid, values=culled.reshape(1, n_points))
+            culling = hood.summary()
+        else:
+            result = calculate_grid_illuminance(
+                grid,
+                luminaires,
+                occluders=None,
+                settings=DirectCalcSettings(use_occlusion=False),
+            )
 
         vals = result.values.reshape(-1)
         e_avg = float(np.mean(vals)) if vals.size else 0.0
@@ -161,7 +209,10 @@ class ExteriorAreaEngine:
         e_max = float(np.max(vals)) if vals.size else 0.0
         u0 = e_min / e_avg if e_avg > 1e-12 else 0.0
 
-        return {
+        observers = points + np.array([0.0, 0.0, float(area.observer_height)])
+        glare = compute_glare_rating(observers, luminaires, e_h_avg=e_avg, reflectance=area.ground_reflectance)
+
+        out = {
             "area_name": area.name,
             "grid_points": points,
             "grid_values": result.values,
@@ -170,9 +221,13 @@ class ExteriorAreaEngine:
             "E_min": e_min,
             "E_max": e_max,
             "U0": u0,
+            "GR_max": glare.gr_max,
             "grid_spacing": float(area.grid_spacing),
             "grid_height": float(area.grid_height),
         }
+        if culling is not None:
+            out["influence_culling"] = culling
+        return out
 
     def _photometry_from_asset(self, project: Project, asset_id: str) -> Photometry:
         asset = next((a for a in project.photometry_assets if a.id == asset_id), None)
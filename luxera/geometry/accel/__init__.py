@@ -1,5 +1,6 @@
 from .refit import rebuild_affected_blas, refit_tlas
 from .tlas_blas import (
+    IDENTITY_4X4,
     MeshBLAS,
     MeshInstance,
     Ray,
@@ -7,6 +8,7 @@ from .tlas_blas import (
     TLAS,
     TLASNode,
     TwoLevelBVH,
+    any_hit_two_level,
     build_blas,
     build_tlas,
     build_two_level_bvh,
@@ -21,6 +23,7 @@ def refit_two_level_bvh(scene: TwoLevelBVH, new_transforms):
 
 
 __all__ = [
+    "IDENTITY_4X4",
     "MeshBLAS",
     "MeshInstance",
     "TLAS",
@@ -28,6 +31,7 @@ __all__ = [
     "TwoLevelBVH",
     "Ray",
     "RayHit",
+    "any_hit_two_level",
     "build_blas",
     "build_tlas",
     "build_two_level_bvh",
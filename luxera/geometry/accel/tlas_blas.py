@@ -397,3 +397,59 @@ def ray_intersect(scene: TwoLevelBVH | TLAS, ray: Ray) -> Optional[RayHit]:
             best = RayHit(t=best_t, triangle=tri_world, instance_id=inst.instance_id, mesh_id=inst.mesh_id)
 
     return best
+
+
+# Instance transform that places a BLAS in world space unchanged.
+IDENTITY_4X4 = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]]
+
+
+def any_hit_two_level(
+    scene: TwoLevelBVH,
+    origin: Vector3,
+    direction: Vector3,
+    t_min: float,
+    t_max: float,
+    *,
+    closest: bool = False,
+) -> Optional[RayHit]:
+    """
+    Shadow-ray query: a hit with ``t_min <= t <= t_max``, or ``None``.
+
+    Returns the first hit found unless ``closest`` is set. Instance transforms are applied to the ray without renormalising the
+    direction, so ``t`` keeps its world-space meaning inside every BLAS. The
+    returned triangle is in BLAS-local coordinates and keeps its payload.
+    """
+    tlas = scene.tlas
+    if not tlas.instances:
+        return None
+    if tlas.instance_tree is None:
+        candidate_indices = list(range(len(tlas.instances)))
+    else:
+        candidate_indices = _query_tlas_instances(tlas.instance_tree, origin, direction, t_min=t_min, t_max=t_max)
+    best: Optional[RayHit] = None
+    seen: Set[int] = set()
+    for idx in candidate_indices:
+        if idx in seen or idx < 0 or idx >= len(tlas.instances):
+            continue
+        seen.add(idx)
+        inst = tlas.instances[idx]
+        b = scene.blas.get(inst.mesh_id)
+        if b is None or b.bvh_local is None:
+            continue
+        if inst.transform_4x4 == IDENTITY_4X4:
+            o_local, d_local = origin, direction
+        else:
+            try:
+                m_local = np.linalg.inv(np.asarray(inst.transform_4x4, dtype=float).reshape(4, 4))
+            except np.linalg.LinAlgError:
+                continue
+            o_local, d_local = _tx_point(m_local, origin), _tx_dir(m_local, direction)
+        for tri in query_triangles(b.bvh_local, o_local, d_local, t_min=t_min, t_max=t_max):
+            t = ray_intersects_triangle(o_local, d_local, tri, t_min=t_min, t_max=t_max)
+            if t is None:
+                continue
+            best = RayHit(t=float(t), triangle=tri, instance_id=inst.instance_id, mesh_id=inst.mesh_id)
+            if not closest:
+                return best
+            t_max = float(t)
+    return best
@@ -11,8 +11,7 @@ Point3 = Tuple[float, float, float]
 TriangleIdx = Tuple[int, int, int]
 
 
-def merge_vertices(vertices: Sequence[Point3], eps: float = EPS_WELD) -> tuple[List[Point3], List[int]]:
-    inv = 1.0 / max(eps, EPS_POS)
+def _merge_vertices_loop(vertices: Sequence[Point3], inv: float) -> tuple[List[Point3], List[int]]:
     out: List[Point3] = []
     remap: List[int] = []
     bucket_to_idx: dict[tuple[int, int, int], int] = {}
@@ -27,45 +26,114 @@ def merge_vertices(vertices: Sequence[Point3], eps: float = EPS_WELD) -> tuple[L
     return out, remap
 
 
+def merge_vertices(vertices: Sequence[Point3], eps: float = EPS_WELD) -> tuple[List[Point3], List[int]]:
+    inv = 1.0 / max(eps, EPS_POS)
+    verts = np.asarray(vertices, dtype=float).reshape(-1, 3)
+    if verts.shape[0] == 0:
+        return [], []
+    q = np.round(verts * inv)
+    if not np.all(np.abs(q) < 2.0**62):
+        # Non-finite or out-of-range buckets: keep exact Python integer semantics.
+        return _merge_vertices_loop(vertices, inv)
+    # Quantise, then number buckets in first-seen order.
+    _, first, inverse = np.unique(q.astype(np.int64), axis=0, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    out = [(float(x), float(y), float(z)) for x, y, z in verts[first[order]]]
+    return out, rank[inverse.reshape(-1)].tolist()
+
+
+def _row_dot(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    # Row-wise dot through matmul so results match per-vector ``np.dot`` bit for bit.
+    return (u[:, None, :] @ v[:, :, None])[:, 0, 0]
+
+
+def _row_norm(u: np.ndarray) -> np.ndarray:
+    return np.sqrt(_row_dot(u, u))
+
+
+def triangle_areas(verts: np.ndarray, tris: np.ndarray) -> np.ndarray:
+    va, vb, vc = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+    return 0.5 * _row_norm(np.cross(vb - va, vc - va))
+
+
+def sliver_and_orientation(verts: np.ndarray, tris: np.ndarray, sliver_ratio: float) -> tuple[np.ndarray, np.ndarray]:
+    """Per-triangle sliver flags and ``normal . centroid`` (negative means inward-facing)."""
+    if tris.shape[0] == 0:
+        return np.zeros((0,), dtype=bool), np.zeros((0,), dtype=float)
+    va, vb, vc = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+    edges = np.stack(
+        (_row_norm(vb - va), _row_norm(vc - vb), _row_norm(va - vc)),
+        axis=1,
+    )
+    shortest = edges.min(axis=1)
+    longest = edges.max(axis=1)
+    ratio = np.divide(shortest, longest, out=np.ones_like(shortest), where=longest > 0.0)
+    is_sliver = (longest > 0.0) & (ratio < sliver_ratio)
+    orient = _row_dot(np.cross(vb - va, vc - va), (va + vb + vc) / 3.0)
+    return is_sliver, orient
+
+
 def remove_degenerate_triangles(
     triangles: Iterable[TriangleIdx],
     vertices: Sequence[Point3],
     area_eps: float = EPS_AREA,
 ) -> List[TriangleIdx]:
     verts = np.asarray(vertices, dtype=float)
-    out: List[TriangleIdx] = []
-    for a, b, c in triangles:
-        if a == b or b == c or a == c:
-            continue
-        va, vb, vc = verts[int(a)], verts[int(b)], verts[int(c)]
-        area = 0.5 * np.linalg.norm(np.cross(vb - va, vc - va))
-        if float(area) <= float(area_eps):
-            continue
-        out.append((int(a), int(b), int(c)))
-    return out
+    tris = np.asarray([(int(a), int(b), int(c)) for a, b, c in triangles], dtype=np.int64).reshape(-1, 3)
+    if tris.shape[0] == 0:
+        return []
+    keep = (tris[:, 0] != tris[:, 1]) & (tris[:, 1] != tris[:, 2]) & (tris[:, 0] != tris[:, 2])
+    live = tris[keep]
+    if live.shape[0]:
+        keep[np.flatnonzero(keep)] = ~(triangle_areas(verts, live) <= float(area_eps))
+    return [(int(a), int(b), int(c)) for a, b, c in tris[keep].tolist()]
 
 
 def fix_winding_consistent_normals(triangles: Sequence[TriangleIdx], vertices: Sequence[Point3]) -> List[TriangleIdx]:
     if not triangles:
         return []
     verts = np.asarray(vertices, dtype=float)
+    tris = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
     # Deterministic global reference by centroid-to-normal orientation.
-    tris: List[TriangleIdx] = []
-    for a, b, c in triangles:
-        va, vb, vc = verts[a], verts[b], verts[c]
-        n = np.cross(vb - va, vc - va)
-        centroid = (va + vb + vc) / 3.0
-        if float(np.dot(n, centroid)) < 0.0:
-            tris.append((a, c, b))
-        else:
-            tris.append((a, b, c))
-    return tris
+    va, vb, vc = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+    n = np.cross(vb - va, vc - va)
+    centroid = (va + vb + vc) / 3.0
+    flip = _row_dot(n, centroid) < 0.0
+    out = tris.copy()
+    out[flip, 1] = tris[flip, 2]
+    out[flip, 2] = tris[flip, 1]
+    return [(a, b, c) for a, b, c in out.tolist()]
 
 
-def detect_open_mesh_edges(triangles: Sequence[TriangleIdx]) -> List[Tuple[int, int]]:
-    edge_count: dict[tuple[int, int], int] = {}
-    for a, b, c in triangles:
-        for u, v in ((a, b), (b, c), (c, a)):
-            key = (min(u, v), max(u, v))
+def mesh_edge_counts(triangles: Sequence[TriangleIdx]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Undirected edges ``(min, max)`` in first-seen order and how many triangles use each.
+    """
+    tris = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    if tris.shape[0] == 0:
+        return np.zeros((0, 2), dtype=np.int64), np.zeros((0,), dtype=np.int64)
+    u = tris.ravel()
+    v = tris[:, [1, 2, 0]].ravel()
+    lo = np.minimum(u, v)
+    hi = np.maximum(u, v)
+    base = int(hi.max()) + 1
+    if int(lo.min()) < 0 or base >= 2**31:
+        edge_count: dict[tuple[int, int], int] = {}
+        for key in zip(lo.tolist(), hi.tolist()):
             edge_count[key] = edge_count.get(key, 0) + 1
-    return [e for e, n in edge_count.items() if n == 1]
+        return np.asarray(list(edge_count), dtype=np.int64).reshape(-1, 2), np.asarray(list(edge_count.values()), dtype=np.int64)
+    keys = lo * base + hi
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+    counts = np.diff(np.append(starts, sorted_keys.size))
+    first = order[starts]
+    seen = np.argsort(first, kind="stable")
+    return np.stack((lo[first[seen]], hi[first[seen]]), axis=1), counts[seen]
+
+
+def detect_open_mesh_edges(triangles: Sequence[TriangleIdx]) -> List[Tuple[int, int]]:
+    edges, counts = mesh_edge_counts(triangles)
+    return [(int(a), int(b)) for a, b in edges[counts == 1].tolist()]
@@ -9,8 +9,12 @@ from luxera.geometry.cleaning import (
     detect_open_mesh_edges,
     fix_winding_consistent_normals,
     merge_vertices,
+    mesh_edge_counts,
     remove_degenerate_triangles,
+    sliver_and_orientation,
+    triangle_areas,
 )
+from luxera.geometry.mesh_intersect import find_self_intersections
 from luxera.geometry.tolerance import EPS_ANG, EPS_AREA, EPS_POS, EPS_SLIVER_RATIO, EPS_WELD
 
 Point3 = Tuple[float, float, float]
@@ -41,41 +45,32 @@ class MeshRepairResult:
     report: SceneHealthReport
 
 
-def _tri_area(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> float:
-    return 0.5 * float(np.linalg.norm(np.cross(b - a, c - a)))
-
-
-def _edge_incidence(tris: Sequence[TriangleIdx]) -> Dict[Tuple[int, int], int]:
-    out: Dict[Tuple[int, int], int] = {}
-    for a, b, c in tris:
-        for u, v in ((a, b), (b, c), (c, a)):
-            key = (u, v) if u < v else (v, u)
-            out[key] = out.get(key, 0) + 1
-    return out
-
-
 def _components(tris: Sequence[TriangleIdx]) -> int:
     if not tris:
         return 0
-    adj: Dict[int, set[int]] = {}
-    for a, b, c in tris:
-        for u, v in ((a, b), (b, c), (c, a)):
-            adj.setdefault(u, set()).add(v)
-            adj.setdefault(v, set()).add(u)
-    seen: set[int] = set()
-    comps = 0
-    for n in adj:
-        if n in seen:
-            continue
-        comps += 1
-        stack = [n]
-        while stack:
-            cur = stack.pop()
-            if cur in seen:
-                continue
-            seen.add(cur)
-            stack.extend(list(adj.get(cur, ())))
-    return comps
+    t = np.asarray(tris, dtype=np.int64).reshape(-1, 3)
+    if int(t.min()) < 0:
+        t = np.unique(t.ravel(), return_inverse=True)[1].reshape(-1, 3)
+    n = int(t.max()) + 1
+    used = np.zeros(n, dtype=bool)
+    used[t.ravel()] = True
+    u = t.ravel()
+    v = t[:, [1, 2, 0]].ravel()
+    # Min-label hooking with pointer jumping; every root ends as its component's smallest vertex.
+    parent = np.arange(n)
+    while True:
+        pu = parent[u]
+        pv = parent[v]
+        live = pu != pv
+        if not np.any(live):
+            break
+        np.minimum.at(parent, np.maximum(pu, pv)[live], np.minimum(pu, pv)[live])
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+    return int(np.count_nonzero(used & (parent == np.arange(n))))
 
 
 def split_connected_components(triangles: Sequence[TriangleIdx]) -> List[List[TriangleIdx]]:
@@ -154,57 +149,8 @@ def _fill_small_holes(triangles: Sequence[TriangleIdx], max_loop_len: int = 3) -
     return out
 
 
-def _segment_intersects_triangle(p0: np.ndarray, p1: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray) -> bool:
-    d = p1 - p0
-    e1 = b - a
-    e2 = c - a
-    pvec = np.cross(d, e2)
-    det = float(np.dot(e1, pvec))
-    if abs(det) < EPS_POS:
-        return False
-    inv_det = 1.0 / det
-    tvec = p0 - a
-    u = float(np.dot(tvec, pvec) * inv_det)
-    if u < 0.0 or u > 1.0:
-        return False
-    qvec = np.cross(tvec, e1)
-    v = float(np.dot(d, qvec) * inv_det)
-    if v < 0.0 or (u + v) > 1.0:
-        return False
-    t = float(np.dot(e2, qvec) * inv_det)
-    return 0.0 <= t <= 1.0
-
-
 def _self_intersections_approx(vertices: np.ndarray, triangles: Sequence[TriangleIdx]) -> int:
-    tris = list(triangles)
-    if len(tris) < 2:
-        return 0
-    boxes: List[Tuple[np.ndarray, np.ndarray]] = []
-    for a, b, c in tris:
-        pts = np.vstack((vertices[a], vertices[b], vertices[c]))
-        boxes.append((pts.min(axis=0), pts.max(axis=0)))
-    hits = 0
-    for i in range(len(tris)):
-        ai, bi, ci = tris[i]
-        v1 = (vertices[ai], vertices[bi], vertices[ci])
-        set_i = {ai, bi, ci}
-        for j in range(i + 1, len(tris)):
-            aj, bj, cj = tris[j]
-            if set_i.intersection({aj, bj, cj}):
-                continue
-            mn_i, mx_i = boxes[i]
-            mn_j, mx_j = boxes[j]
-            if np.any(mx_i < mn_j) or np.any(mx_j < mn_i):
-                continue
-            v2 = (vertices[aj], vertices[bj], vertices[cj])
-            edges1 = ((v1[0], v1[1]), (v1[1], v1[2]), (v1[2], v1[0]))
-            edges2 = ((v2[0], v2[1]), (v2[1], v2[2]), (v2[2], v2[0]))
-            if any(_segment_intersects_triangle(e0, e1, v2[0], v2[1], v2[2]) for e0, e1 in edges1):
-                hits += 1
-                continue
-            if any(_segment_intersects_triangle(e0, e1, v1[0], v1[1], v1[2]) for e0, e1 in edges2):
-                hits += 1
-    return hits
+    return len(find_self_intersections(vertices, triangles))
 
 
 def scene_health_report(vertices: Sequence[Point3], triangles: Sequence[TriangleIdx]) -> SceneHealthReport:
@@ -221,37 +167,26 @@ def scene_health_report(vertices: Sequence[Point3], triangles: Sequence[Triangle
         errors.append("No triangles.")
 
     # Degenerate triangles.
-    deg = 0
-    sliver = 0
     dup_faces = 0
     seen_faces: set[Tuple[int, int, int]] = set()
-    inverted = 0
     for a, b, c in tris:
         key = tuple(sorted((a, b, c)))
         if key in seen_faces:
             dup_faces += 1
         seen_faces.add(key)
-        if a == b or b == c or a == c:
-            deg += 1
-            continue
-        va, vb, vc = verts[a], verts[b], verts[c]
-        area = _tri_area(va, vb, vc)
-        if area <= EPS_AREA:
-            deg += 1
-            continue
-        edges = sorted(
-            [
-                float(np.linalg.norm(vb - va)),
-                float(np.linalg.norm(vc - vb)),
-                float(np.linalg.norm(va - vc)),
-            ]
-        )
-        if edges[-1] > 0 and edges[0] / edges[-1] < EPS_SLIVER_RATIO:
-            sliver += 1
-        n = np.cross(vb - va, vc - va)
-        cent = (va + vb + vc) / 3.0
-        if float(np.dot(n, cent)) < 0.0:
-            inverted += 1
+    deg = 0
+    sliver = 0
+    inverted = 0
+    if tris:
+        tri_np = np.asarray(tris, dtype=np.int64)
+        live = (tri_np[:, 0] != tri_np[:, 1]) & (tri_np[:, 1] != tri_np[:, 2]) & (tri_np[:, 0] != tri_np[:, 2])
+        if verts.size:
+            live_idx = np.flatnonzero(live)
+            live[live_idx] = ~(triangle_areas(verts, tri_np[live_idx]) <= EPS_AREA)
+            is_sliver, orient = sliver_and_orientation(verts, tri_np[live], EPS_SLIVER_RATIO)
+            sliver = int(np.count_nonzero(is_sliver))
+            inverted = int(np.count_nonzero(orient < 0.0))
+        deg = int(live.size - np.count_nonzero(live))
     counts["degenerate_triangles"] = deg
     counts["duplicate_faces"] = dup_faces
     counts["sliver_triangles"] = sliver
@@ -262,9 +197,9 @@ def scene_health_report(vertices: Sequence[Point3], triangles: Sequence[Triangle
     severities["inverted_winding_triangles"] = "warn" if inverted > 0 else "ok"
 
     # Non-manifold / open boundaries.
-    edge_inc = _edge_incidence(tris)
-    non_manifold = sum(1 for _e, n in edge_inc.items() if n > 2)
-    open_edges = len(detect_open_mesh_edges(tris))
+    _edges, edge_uses = mesh_edge_counts(tris)
+    non_manifold = int(np.count_nonzero(edge_uses > 2))
+    open_edges = int(np.count_nonzero(edge_uses == 1))
     counts["non_manifold_edges"] = int(non_manifold)
     counts["open_boundary_edges"] = int(open_edges)
     severities["non_manifold_edges"] = "error" if non_manifold > 0 else "ok"
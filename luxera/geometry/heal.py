@@ -7,7 +7,15 @@ from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 
-from luxera.geometry.cleaning import fix_winding_consistent_normals, merge_vertices, remove_degenerate_triangles
+from luxera.geometry.cleaning import (
+    fix_winding_consistent_normals,
+    merge_vertices,
+    mesh_edge_counts,
+    remove_degenerate_triangles,
+    sliver_and_orientation,
+    triangle_areas,
+)
+from luxera.geometry.mesh_intersect import find_self_intersections
 from luxera.geometry.tolerance import EPS_AREA, EPS_POS, EPS_SLIVER_RATIO, EPS_WELD
 
 Point3 = Tuple[float, float, float]
@@ -70,12 +78,6 @@ class MeshHealingResult:
     report: MeshHealingReport
 
 
-def _tri_area(verts: np.ndarray, tri: TriangleIdx) -> float:
-    a, b, c = tri
-    va, vb, vc = verts[a], verts[b], verts[c]
-    return 0.5 * float(np.linalg.norm(np.cross(vb - va, vc - va)))
-
-
 def _tri_edges(tri: TriangleIdx) -> Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]:
     a, b, c = tri
     return (
@@ -85,65 +87,30 @@ def _tri_edges(tri: TriangleIdx) -> Tuple[Tuple[int, int], Tuple[int, int], Tupl
     )
 
 
-def _edge_incidence(triangles: Sequence[TriangleIdx]) -> Dict[Tuple[int, int], List[int]]:
-    out: Dict[Tuple[int, int], List[int]] = {}
-    for tidx, tri in enumerate(triangles):
-        for edge in _tri_edges(tri):
-            out.setdefault(edge, []).append(tidx)
+def _irregular_edge_incidence(triangles: Sequence[TriangleIdx]) -> Dict[Tuple[int, int], List[int]]:
+    """Incident triangle indices for every edge not shared by exactly two triangles."""
+    edges, counts = mesh_edge_counts(triangles)
+    irregular = edges[counts != 2]
+    out: Dict[Tuple[int, int], List[int]] = {(int(e0), int(e1)): [] for e0, e1 in irregular.tolist()}
+    if not out:
+        return out
+    tris = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    u = tris.ravel()
+    v = tris[:, [1, 2, 0]].ravel()
+    lo = np.minimum(u, v)
+    hi = np.maximum(u, v)
+    # Only visit edge slots whose endpoints both lie on an irregular edge.
+    on_irregular = np.zeros(int(tris.max()) + 1, dtype=bool)
+    on_irregular[irregular.ravel()] = True
+    for k in np.flatnonzero(on_irregular[lo] & on_irregular[hi]).tolist():
+        faces = out.get((int(lo[k]), int(hi[k])))
+        if faces is not None:
+            faces.append(k // 3)
     return out
 
 
-def _segment_intersects_triangle(p0: np.ndarray, p1: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray) -> bool:
-    d = p1 - p0
-    e1 = b - a
-    e2 = c - a
-    pvec = np.cross(d, e2)
-    det = float(np.dot(e1, pvec))
-    if abs(det) < EPS_POS:
-        return False
-    inv_det = 1.0 / det
-    tvec = p0 - a
-    u = float(np.dot(tvec, pvec) * inv_det)
-    if u < 0.0 or u > 1.0:
-        return False
-    qvec = np.cross(tvec, e1)
-    v = float(np.dot(d, qvec) * inv_det)
-    if v < 0.0 or (u + v) > 1.0:
-        return False
-    t = float(np.dot(e2, qvec) * inv_det)
-    return 0.0 <= t <= 1.0
-
-
 def _coarse_self_intersections(verts: np.ndarray, triangles: Sequence[TriangleIdx]) -> List[Tuple[int, int]]:
-    tris = list(triangles)
-    if len(tris) < 2:
-        return []
-    boxes: List[Tuple[np.ndarray, np.ndarray]] = []
-    for a, b, c in tris:
-        pts = np.vstack((verts[a], verts[b], verts[c]))
-        boxes.append((pts.min(axis=0), pts.max(axis=0)))
-    hits: List[Tuple[int, int]] = []
-    for i in range(len(tris)):
-        ai, bi, ci = tris[i]
-        set_i = {ai, bi, ci}
-        v1 = (verts[ai], verts[bi], verts[ci])
-        for j in range(i + 1, len(tris)):
-            aj, bj, cj = tris[j]
-            if set_i.intersection({aj, bj, cj}):
-                continue
-            mn_i, mx_i = boxes[i]
-            mn_j, mx_j = boxes[j]
-            if np.any(mx_i < mn_j) or np.any(mx_j < mn_i):
-                continue
-            v2 = (verts[aj], verts[bj], verts[cj])
-            edges1 = ((v1[0], v1[1]), (v1[1], v1[2]), (v1[2], v1[0]))
-            edges2 = ((v2[0], v2[1]), (v2[1], v2[2]), (v2[2], v2[0]))
-            if any(_segment_intersects_triangle(e0, e1, v2[0], v2[1], v2[2]) for e0, e1 in edges1):
-                hits.append((i, j))
-                continue
-            if any(_segment_intersects_triangle(e0, e1, v1[0], v1[1], v1[2]) for e0, e1 in edges2):
-                hits.append((i, j))
-    return hits
+    return find_self_intersections(verts, triangles)
 
 
 def _stable_mesh_hash(vertices: Sequence[Point3], triangles: Sequence[TriangleIdx]) -> str:
@@ -211,17 +178,18 @@ def heal_mesh(
         )
 
     verts_np = np.asarray(merged, dtype=float) if merged else np.zeros((0, 3), dtype=float)
-    degenerate_idxs: List[int] = []
-    for idx, (a, b, c) in enumerate(triangles_remapped):
-        is_deg = (a == b) or (b == c) or (a == c)
-        if not is_deg and verts_np.size:
-            is_deg = _tri_area(verts_np, (a, b, c)) <= float(area_epsilon)
-        if is_deg:
-            degenerate_idxs.append(idx)
-            issues["degenerate_triangles"].append(refs_in[idx].to_dict())
-
-    triangles_clean = [t for i, t in enumerate(triangles_remapped) if i not in set(degenerate_idxs)]
-    refs_clean = [r for i, r in enumerate(refs_in) if i not in set(degenerate_idxs)]
+    tri_np = np.asarray(triangles_remapped, dtype=np.int64).reshape(-1, 3)
+    is_deg = (tri_np[:, 0] == tri_np[:, 1]) | (tri_np[:, 1] == tri_np[:, 2]) | (tri_np[:, 0] == tri_np[:, 2])
+    if verts_np.size and tri_np.shape[0]:
+        live = np.flatnonzero(~is_deg)
+        is_deg[live] = triangle_areas(verts_np, tri_np[live]) <= float(area_epsilon)
+    degenerate_idxs: List[int] = np.flatnonzero(is_deg).tolist()
+    for idx in degenerate_idxs:
+        issues["degenerate_triangles"].append(refs_in[idx].to_dict())
+
+    degenerate_set = set(degenerate_idxs)
+    triangles_clean = [t for i, t in enumerate(triangles_remapped) if i not in degenerate_set]
+    refs_clean = [r for i, r in enumerate(refs_in) if i not in degenerate_set]
     if degenerate_idxs:
         actions.append(
             HealAction(
@@ -253,25 +221,14 @@ def heal_mesh(
         )
 
     # Sliver + inverted detection pre-winding fix.
-    sliver_count = 0
-    inverted_count = 0
-    for idx, tri in enumerate(dedup_tris):
-        a, b, c = tri
-        va, vb, vc = verts_np[a], verts_np[b], verts_np[c]
-        edges = sorted(
-            [
-                float(np.linalg.norm(vb - va)),
-                float(np.linalg.norm(vc - vb)),
-                float(np.linalg.norm(va - vc)),
-            ]
-        )
-        if edges[-1] > 0.0 and edges[0] / edges[-1] < float(sliver_ratio_epsilon):
-            sliver_count += 1
+    is_sliver, orient = sliver_and_orientation(verts_np, np.asarray(dedup_tris, dtype=np.int64).reshape(-1, 3), float(sliver_ratio_epsilon))
+    is_inverted = orient < -float(normal_epsilon)
+    sliver_count = int(np.count_nonzero(is_sliver))
+    inverted_count = int(np.count_nonzero(is_inverted))
+    for idx in np.flatnonzero(is_sliver | is_inverted).tolist():
+        if is_sliver[idx]:
             issues["sliver_triangles"].append(dedup_refs[idx].to_dict())
-        n = np.cross(vb - va, vc - va)
-        cent = (va + vb + vc) / 3.0
-        if float(np.dot(n, cent)) < -float(normal_epsilon):
-            inverted_count += 1
+        if is_inverted[idx]:
             issues["inverted_normals"].append(dedup_refs[idx].to_dict())
 
     wound = fix_winding_consistent_normals(dedup_tris, merged)
@@ -279,7 +236,7 @@ def heal_mesh(
     if flipped > 0:
         actions.append(HealAction(action="unify_winding", details={"flipped": int(flipped)}))
 
-    edge_map = _edge_incidence(wound)
+    edge_map = _irregular_edge_incidence(wound)
     non_manifold_edges = sorted([e for e, ids in edge_map.items() if len(ids) > 2], key=lambda x: (x[0], x[1]))
     for e in non_manifold_edges:
         issues["non_manifold_edges"].append({"edge": [int(e[0]), int(e[1])], "incident_faces": list(edge_map[e])})
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
+from luxera.geometry.cleaning import merge_vertices, mesh_edge_counts
 from luxera.geometry.mesh import TriMesh
+from luxera.geometry.tolerance import EPS_COND, EPS_WELD
 
 
 @dataclass(frozen=True)
@@ -27,25 +30,15 @@ def mesh_bounds(mesh: TriMesh) -> Tuple[np.ndarray, np.ndarray]:
     return v.min(axis=0), v.max(axis=0)
 
 
-def simplify_mesh(mesh: TriMesh, ratio: float = 0.5) -> TriMesh:
-    """Deterministic face decimation for viewport LOD."""
-    if not mesh.faces:
-        return TriMesh(vertices=list(mesh.vertices), faces=[])
-    r = max(0.05, min(1.0, float(ratio)))
-    keep_n = max(1, int(round(len(mesh.faces) * r)))
+# Boundary edges get a perpendicular constraint plane weighted this much above face planes.
+_BOUNDARY_WEIGHT = 1000.0
+# Smallest number of collapses applied between batched cost updates.
+_MIN_ROUND = 32
 
-    # Deterministic sampling in input face order.
-    step = max(1, int(round(len(mesh.faces) / keep_n)))
-    selected_faces = [mesh.faces[i] for i in range(0, len(mesh.faces), step)][:keep_n]
 
-    used = sorted({idx for f in selected_faces for idx in f})
-    remap = {old: new for new, old in enumerate(used)}
-    new_vertices = [mesh.vertices[i] for i in used]
-    new_faces = [(remap[a], remap[b], remap[c]) for a, b, c in selected_faces]
-
-    # Preserve full-mesh bounds for viewer fit by appending bbox corner verts.
+def _bounds_corners(mesh: TriMesh) -> List[Tuple[float, float, float]]:
     mn, mx = mesh_bounds(mesh)
-    corners = [
+    return [
         (float(mn[0]), float(mn[1]), float(mn[2])),
         (float(mx[0]), float(mn[1]), float(mn[2])),
         (float(mx[0]), float(mx[1]), float(mn[2])),
@@ -55,8 +48,229 @@ def simplify_mesh(mesh: TriMesh, ratio: float = 0.5) -> TriMesh:
         (float(mx[0]), float(mx[1]), float(mx[2])),
         (float(mn[0]), float(mx[1]), float(mx[2])),
     ]
-    new_vertices.extend(corners)
 
+
+def _tri_normal(a: Sequence[float], b: Sequence[float], c: Sequence[float]) -> Tuple[float, float, float]:
+    e1 = (b[0] - a[0], b[1] - a[1], b[2] - a[2])
+    e2 = (c[0] - a[0], c[1] - a[1], c[2] - a[2])
+    return (e1[1] * e2[2] - e1[2] * e2[1], e1[2] * e2[0] - e1[0] * e2[2], e1[0] * e2[1] - e1[1] * e2[0])
+
+
+def _plane_quadrics(normals: np.ndarray, points: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    planes = np.concatenate((normals, -np.sum(normals * points, axis=1, keepdims=True)), axis=1)
+    return weights[:, None, None] * planes[:, :, None] * planes[:, None, :]
+
+
+def _edge_costs(Q: np.ndarray, pos: np.ndarray, us: np.ndarray, vs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Collapse cost and target position for each edge ``(us[i], vs[i])``."""
+    Qe = Q[us] + Q[vs]
+    pu, pv = pos[us], pos[vs]
+    mid = 0.5 * (pu + pv)
+    A = Qe[:, :3, :3]
+    rhs = -Qe[:, :3, 3]
+    scale = np.maximum(np.abs(np.trace(A, axis1=1, axis2=2)) / 3.0, np.finfo(float).tiny)
+    solvable = np.abs(np.linalg.det(A)) > EPS_COND * scale**3
+    opt = mid.copy()
+    if np.any(solvable):
+        opt[solvable] = np.linalg.solve(A[solvable], rhs[solvable][:, :, None])[:, :, 0]
+        # Reject optima that drift far from the edge (near-singular systems).
+        reach = 2.0 * np.linalg.norm(pv - pu, axis=1)
+        solvable &= np.linalg.norm(opt - mid, axis=1) <= reach
+    cands = np.stack((opt, pu, pv, mid), axis=1)
+    homo = np.concatenate((cands, np.ones(cands.shape[:2] + (1,))), axis=2)
+    err = np.einsum("kci,kij,kcj->kc", homo, Qe, homo)
+    err[:, 0] = np.where(solvable, err[:, 0], np.inf)
+    best = np.argmin(err, axis=1)
+    rows = np.arange(us.size)
+    return np.maximum(err[rows, best], 0.0), cands[rows, best]
+
+
+def _qem_simplify(
+    vertices: np.ndarray, faces: np.ndarray, target_faces: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Garland-Heckbert quadric edge collapse down to ``target_faces`` faces.
+
+    Boundary edges are held by weighted constraint planes, collapses that would fold a
+    face over or break the edge link condition are skipped, and ties are broken by
+    vertex index so the result is deterministic.
+    """
+    pos = np.array(vertices, dtype=float)
+    F = np.array(faces, dtype=np.int64).reshape(-1, 3)
+    if F.shape[0] <= target_faces:
+        return pos, F
+    va, vb, vc = pos[F[:, 0]], pos[F[:, 1]], pos[F[:, 2]]
+    cross = np.cross(vb - va, vc - va)
+    dbl_area = np.linalg.norm(cross, axis=1)
+    normals = cross / np.maximum(dbl_area, np.finfo(float).tiny)[:, None]
+    Q = np.zeros((pos.shape[0], 4, 4), dtype=float)
+    Kf = _plane_quadrics(normals, va, 0.5 * dbl_area)
+    for k in range(3):
+        np.add.at(Q, F[:, k], Kf)
+
+    edges, counts = mesh_edge_counts(F)
+    if np.any(counts == 1):
+        # Constraint planes through each boundary edge, perpendicular to its face.
+        u = F.ravel()
+        v = F[:, [1, 2, 0]].ravel()
+        base = pos.shape[0]
+        border = edges[counts == 1]
+        slot = np.isin(np.minimum(u, v) * base + np.maximum(u, v), border[:, 0] * base + border[:, 1], kind="sort")
+        bu, bv, bf = u[slot], v[slot], np.repeat(np.arange(F.shape[0]), 3)[slot]
+        e = pos[bv] - pos[bu]
+        bn = np.cross(e, normals[bf])
+        bl = np.linalg.norm(bn, axis=1)
+        ok = bl > 0.0
+        Kb = _plane_quadrics(bn[ok] / bl[ok][:, None], pos[bu][ok], _BOUNDARY_WEIGHT * np.sum(e[ok] * e[ok], axis=1))
+        np.add.at(Q, bu[ok], Kb)
+        np.add.at(Q, bv[ok], Kb)
+
+    # The collapse loop works on Python lists; numpy is only used for batched costs.
+    tri: List[List[int]] = F.tolist()
+    xyz: List[List[float]] = pos.tolist()
+    vfaces: List[set] = [set() for _ in range(pos.shape[0])]
+    for fi, (a, b, c) in enumerate(tri):
+        vfaces[a].add(fi)
+        vfaces[b].add(fi)
+        vfaces[c].add(fi)
+    face_alive = np.ones(F.shape[0], dtype=bool)
+    vert_alive = np.ones(pos.shape[0], dtype=bool)
+    version = [0] * pos.shape[0]
+    heap: List[Tuple[float, int, int, int, int, Tuple[float, float, float]]] = []
+
+    def push(us: np.ndarray, vs: np.ndarray) -> None:
+        if us.size == 0:
+            return
+        cost, target = _edge_costs(Q, pos, us, vs)
+        for c, a, b, t in zip(cost.tolist(), us.tolist(), vs.tolist(), target.tolist()):
+            heapq.heappush(heap, (c, a, b, version[a], version[b], tuple(t)))
+
+    def neighbours(x: int) -> set:
+        out = set()
+        for f in vfaces[x]:
+            out.update(tri[f])
+        out.discard(x)
+        return out
+
+    def on_boundary(x: int) -> bool:
+        seen: Dict[int, int] = {}
+        for f in vfaces[x]:
+            for y in tri[f]:
+                if y != x:
+                    seen[y] = seen.get(y, 0) + 1
+        return any(n == 1 for n in seen.values())
+
+    def folds(u: int, v: int, faces_: set, target: Sequence[float]) -> bool:
+        """True if moving ``u`` and ``v`` to ``target`` flips or flattens any of ``faces_``."""
+        if not faces_:
+            return False
+        for f in faces_:
+            corners = [xyz[i] for i in tri[f]]
+            moved = [target if i == u or i == v else xyz[i] for i in tri[f]]
+            n_old = _tri_normal(*corners)
+            if n_old == (0.0, 0.0, 0.0):
+                continue
+            n_new = _tri_normal(*moved)
+            if n_old[0] * n_new[0] + n_old[1] * n_new[1] + n_old[2] * n_new[2] <= 0.0:
+                return True
+        return False
+
+    push(edges[:, 0], edges[:, 1])
+    live = int(F.shape[0])
+    # Collapses run in rounds: within a round each vertex moves at most once (later
+    # entries touching it are stale), and the costs around every moved vertex are
+    # recomputed in one batch at the end of the round.
+    while live > target_faces and heap:
+        budget = max(_MIN_ROUND, (live - target_faces) // 4)
+        moved: List[int] = []
+        while live > target_faces and heap and len(moved) < budget:
+            _cost, u, v, ver_u, ver_v, target_t = heapq.heappop(heap)
+            if not (vert_alive[u] and vert_alive[v]) or version[u] != ver_u or version[v] != ver_v:
+                continue
+            shared = vfaces[u] & vfaces[v]
+            if len(shared) not in (1, 2):
+                continue
+            if len(neighbours(u) & neighbours(v)) != len(shared):
+                continue
+            if len(shared) == 2 and on_boundary(u) and on_boundary(v):
+                continue
+            if folds(u, v, (vfaces[u] | vfaces[v]) - shared, target_t):
+                continue
+            for f in shared:
+                face_alive[f] = False
+                for x in tri[f]:
+                    vfaces[x].discard(f)
+            for f in vfaces[v]:
+                tri[f] = [u if x == v else x for x in tri[f]]
+            vfaces[u] |= vfaces[v]
+            vfaces[v] = set()
+            vert_alive[v] = False
+            pos[u] = target_t
+            xyz[u] = list(target_t)
+            Q[u] += Q[v]
+            version[u] += 1
+            live -= len(shared)
+            moved.append(u)
+        if not moved:
+            break
+        ring_edges = sorted({(min(u, w), max(u, w)) for u in moved if vert_alive[u] for w in neighbours(u)})
+        if ring_edges:
+            pairs = np.asarray(ring_edges, dtype=np.int64)
+            push(pairs[:, 0], pairs[:, 1])
+
+    kept = np.asarray(tri, dtype=np.int64).reshape(-1, 3)[face_alive]
+    used = np.unique(kept.ravel())
+    remap = np.full(pos.shape[0], -1, dtype=np.int64)
+    remap[used] = np.arange(used.size)
+    return pos[used], remap[kept]
+
+
+def simplify_mesh(mesh: TriMesh, ratio: float = 0.5) -> TriMesh:
+    """
+    Quadric-error decimation for viewport LOD.
+
+    Coincident vertices are welded first so triangulated surfaces collapse across shared
+    edges; open boundaries are preserved. The full-mesh bounding box corners are appended
+    (unreferenced) so the viewer fits the same extents at every level.
+    """
+    if not mesh.faces:
+        return TriMesh(vertices=list(mesh.vertices), faces=[])
+    r = max(0.05, min(1.0, float(ratio)))
+    keep_n = max(1, int(round(len(mesh.faces) * r)))
+    verts, faces = _weld(mesh)
+    verts, faces = _qem_simplify(verts, faces, keep_n)
+    return _lod_trimesh(mesh, verts, faces)
+
+
+def simplify_mesh_levels(mesh: TriMesh, ratios: Sequence[float]) -> List[TriMesh]:
+    """
+    Simplify ``mesh`` to each ratio (relative to the full face count), finest first.
+
+    Each level is decimated from the previous one, so a chain of levels costs about as
+    much as the coarsest level alone.
+    """
+    if not mesh.faces:
+        return [TriMesh(vertices=list(mesh.vertices), faces=[]) for _ in ratios]
+    verts, faces = _weld(mesh)
+    out: List[TriMesh] = []
+    for ratio in sorted((max(0.05, min(1.0, float(r))) for r in ratios), reverse=True):
+        keep_n = max(1, int(round(len(mesh.faces) * ratio)))
+        verts, faces = _qem_simplify(verts, faces, keep_n)
+        out.append(_lod_trimesh(mesh, verts, faces))
+    return out
+
+
+def _weld(mesh: TriMesh) -> Tuple[np.ndarray, np.ndarray]:
+    merged, remap = merge_vertices(mesh.vertices, eps=EPS_WELD)
+    faces = np.asarray(remap, dtype=np.int64)[np.asarray(mesh.faces, dtype=np.int64).reshape(-1, 3)]
+    keep = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])
+    return np.asarray(merged, dtype=float), faces[keep]
+
+
+def _lod_trimesh(source: TriMesh, verts: np.ndarray, faces: np.ndarray) -> TriMesh:
+    new_vertices = [(float(x), float(y), float(z)) for x, y, z in verts.tolist()]
+    new_faces = [(int(a), int(b), int(c)) for a, b, c in faces.tolist()]
+    new_vertices.extend(_bounds_corners(source))
     out = TriMesh(vertices=new_vertices, faces=new_faces)
     out.validate()
     return out
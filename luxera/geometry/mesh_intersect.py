@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+"""Broad/narrow-phase triangle self-intersection tests for mesh healing and health reports."""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from luxera.geometry.tolerance import EPS_POS
+
+
+TriangleIdx = Tuple[int, int, int]
+
+# Triangles spanning more grid cells than this skip the grid and are box-tested directly.
+_MAX_CELLS_PER_TRIANGLE = 64
+# Candidate pairs tested per narrow-phase batch.
+_NARROW_BATCH = 200_000
+
+
+def _as_arrays(vertices: np.ndarray, triangles: Sequence[TriangleIdx] | np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    verts = np.asarray(vertices, dtype=float).reshape(-1, 3)
+    tris = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    return verts, tris
+
+
+def triangle_aabbs(vertices: np.ndarray, triangles: Sequence[TriangleIdx] | np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    verts, tris = _as_arrays(vertices, triangles)
+    corners = verts[tris]
+    return corners.min(axis=1), corners.max(axis=1)
+
+
+def _group_pairs(keys: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """All pairs of ``ids`` that share a key, as an (N, 2) array."""
+    if keys.size < 2:
+        return np.zeros((0, 2), dtype=np.int64)
+    order = np.lexsort((ids, keys))
+    keys = keys[order]
+    ids = ids[order]
+    bounds = np.flatnonzero(np.diff(keys)) + 1
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [keys.size]))
+    group_end = np.repeat(ends, ends - starts)
+    after = group_end - np.arange(keys.size) - 1
+    total = int(after.sum())
+    if total == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    left = np.repeat(np.arange(keys.size), after)
+    run_start = np.repeat(np.cumsum(after) - after, after)
+    right = left + 1 + (np.arange(total) - run_start)
+    return np.stack((ids[left], ids[right]), axis=1)
+
+
+def triangle_pair_candidates(vertices: np.ndarray, triangles: Sequence[TriangleIdx] | np.ndarray) -> np.ndarray:
+    """
+    Pairs ``(i, j)``, ``i < j``, of triangles whose bounding boxes overlap and that share no vertex.
+
+    Uses a uniform grid sized from the median triangle extent as broad phase; the
+    result is sorted lexicographically.
+    """
+    verts, tris = _as_arrays(vertices, triangles)
+    n = tris.shape[0]
+    if n < 2:
+        return np.zeros((0, 2), dtype=np.int64)
+    mins, maxs = triangle_aabbs(verts, tris)
+    extent = np.max(maxs - mins, axis=1)
+    cell = float(np.median(extent))
+    if not np.isfinite(cell) or cell <= 0.0:
+        positive = extent[np.isfinite(extent) & (extent > 0.0)]
+        cell = float(np.median(positive)) if positive.size else 1.0
+    origin = np.min(np.where(np.isfinite(mins), mins, 0.0), axis=0)
+    lo = np.floor((mins - origin) / cell)
+    hi = np.floor((maxs - origin) / cell)
+    finite = np.all(np.isfinite(lo) & np.isfinite(hi), axis=1)
+    span = np.where(finite[:, None], hi - lo + 1.0, 1.0)
+    n_cells = np.prod(span, axis=1)
+    gridded = finite & (n_cells <= _MAX_CELLS_PER_TRIANGLE)
+
+    pairs: List[np.ndarray] = []
+    g_ids = np.flatnonzero(gridded)
+    if g_ids.size:
+        g_lo = lo[g_ids].astype(np.int64)
+        g_span = span[g_ids].astype(np.int64)
+        counts = np.prod(g_span, axis=1)
+        owner = np.repeat(np.arange(g_ids.size), counts)
+        local = np.arange(owner.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        sy = g_span[owner, 1]
+        sz = g_span[owner, 2]
+        cx = g_lo[owner, 0] + local // (sy * sz)
+        cy = g_lo[owner, 1] + (local // sz) % sy
+        cz = g_lo[owner, 2] + local % sz
+        dims = np.array([cx.max(), cy.max(), cz.max()], dtype=float) - np.array([cx.min(), cy.min(), cz.min()]) + 1.0
+        if float(np.prod(dims)) < 2.0**62:
+            key = ((cx - cx.min()) * int(dims[1]) + (cy - cy.min())) * int(dims[2]) + (cz - cz.min())
+        else:
+            _, key = np.unique(np.stack((cx, cy, cz), axis=1), axis=0, return_inverse=True)
+        pairs.append(_group_pairs(key.reshape(-1), g_ids[owner]))
+    big = np.flatnonzero(~gridded)
+    for i in big:
+        overlap = np.all((mins <= maxs[i]) & (mins[i] <= maxs), axis=1)
+        overlap[i] = False
+        others = np.flatnonzero(overlap)
+        pairs.append(np.stack((np.full(others.size, i, dtype=np.int64), others), axis=1))
+    if not pairs:
+        return np.zeros((0, 2), dtype=np.int64)
+    cand = np.concatenate(pairs, axis=0)
+    if cand.size == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    cand = np.sort(cand, axis=1)
+    flat = np.sort(cand[:, 0] * n + cand[:, 1])
+    flat = flat[np.concatenate(([True], flat[1:] != flat[:-1]))]
+    a, b = flat // n, flat % n
+    cand = np.stack((a, b), axis=1)
+    overlap = np.all((mins[a] <= maxs[b]) & (mins[b] <= maxs[a]), axis=1)
+    shared = np.any(tris[a][:, :, None] == tris[b][:, None, :], axis=(1, 2))
+    return cand[overlap & ~shared]
+
+
+def _dot(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    # Row-wise dot through matmul so results match per-vector ``np.dot`` bit for bit.
+    return (u[:, None, :] @ v[:, :, None])[:, 0, 0]
+
+
+def segments_hit_triangles(
+    p0: np.ndarray, p1: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray
+) -> np.ndarray:
+    """Vectorised closed segment/triangle test (Moller-Trumbore, ``t`` in [0, 1])."""
+    d = p1 - p0
+    e1 = b - a
+    e2 = c - a
+    pvec = np.cross(d, e2)
+    det = _dot(e1, pvec)
+    ok = np.abs(det) >= EPS_POS
+    inv_det = np.divide(1.0, det, out=np.zeros_like(det), where=ok)
+    tvec = p0 - a
+    u = _dot(tvec, pvec) * inv_det
+    qvec = np.cross(tvec, e1)
+    v = _dot(d, qvec) * inv_det
+    t = _dot(e2, qvec) * inv_det
+    return ok & (u >= 0.0) & (u <= 1.0) & (v >= 0.0) & ((u + v) <= 1.0) & (t >= 0.0) & (t <= 1.0)
+
+
+def _pairs_intersect(corners: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    ta = corners[a]
+    tb = corners[b]
+    hit = np.zeros(a.shape[0], dtype=bool)
+    for src, dst in ((ta, tb), (tb, ta)):
+        for k in range(3):
+            hit |= segments_hit_triangles(src[:, k], src[:, (k + 1) % 3], dst[:, 0], dst[:, 1], dst[:, 2])
+    return hit
+
+
+def find_self_intersections(vertices: np.ndarray, triangles: Sequence[TriangleIdx] | np.ndarray) -> List[Tuple[int, int]]:
+    """
+    Triangle pairs ``(i, j)``, ``i < j``, where an edge of one crosses the other.
+
+    Pairs sharing a vertex are ignored. Results are sorted.
+    """
+    verts, tris = _as_arrays(vertices, triangles)
+    cand = triangle_pair_candidates(verts, tris)
+    if cand.shape[0] == 0:
+        return []
+    corners = verts[tris]
+    out: List[Tuple[int, int]] = []
+    for start in range(0, cand.shape[0], _NARROW_BATCH):
+        chunk = cand[start : start + _NARROW_BATCH]
+        hit = _pairs_intersect(corners, chunk[:, 0], chunk[:, 1])
+        out.extend((int(i), int(j)) for i, j in chunk[hit])
+    return out
@@ -4,6 +4,8 @@ import math
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+import numpy as np
+
 from luxera.geometry.materials import encode_wall_side_material_tags
 from luxera.geometry.curves.arc import Arc
 from luxera.geometry.openings.opening_uv import opening_uv_polygon
@@ -18,7 +20,7 @@ from luxera.geometry.param.identity import (
 )
 from luxera.geometry.param.graph import build_param_graph
 from luxera.geometry.param.model import FootprintParam, OpeningParam, RoomParam, SharedWallParam, WallParam
-from luxera.geometry.spatial import point_in_polygon
+from luxera.geometry.spatial import points_in_polygons
 from luxera.geometry.selection_sets import remap_selection_sets
 from luxera.geometry.zones import obstacle_polygons_for_room, resolve_zone_polygon, room_polygon
 from luxera.calcs.masks import apply_obstacle_masks, apply_opening_proximity_mask
@@ -468,11 +470,8 @@ def _grid_xy_points(grid: object) -> List[Tuple[float, float]]:
     ny = max(1, int(grid.ny))  # type: ignore[attr-defined]
     dx = float(grid.width) / max(nx - 1, 1)  # type: ignore[attr-defined]
     dy = float(grid.height) / max(ny - 1, 1)  # type: ignore[attr-defined]
-    out: List[Tuple[float, float]] = []
-    for j in range(ny):
-        for i in range(nx):
-            out.append((ox + i * dx, oy + j * dy))
-    return out
+    jj, ii = np.divmod(np.arange(nx * ny), nx)
+    return list(zip((ox + ii * dx).tolist(), (oy + jj * dy).tolist()))
 
 
 def _reclip_grids_for_room(project: Project, room_id: str) -> List[str]:
@@ -502,11 +501,7 @@ def _reclip_grids_for_room(project: Project, room_id: str) -> List[str]:
             if pz is not None:
                 zone_holes = [[(float(x), float(y)) for x, y in h] for h in pz.holes2d if len(h) >= 3]
         pts_xy = _grid_xy_points(grid)
-        mask = [point_in_polygon(p, poly) for p in pts_xy]
-        if zone_holes:
-            for i, p in enumerate(pts_xy):
-                if any(point_in_polygon(p, h) for h in zone_holes):
-                    mask[i] = False
+        mask = points_in_polygons(pts_xy, [poly], zone_holes).tolist()
         obstacles = obstacle_polygons_for_room(project.geometry.no_go_zones, room_id)
         mask = apply_obstacle_masks(mask, pts_xy, obstacles)
         if bool(getattr(grid, "mask_near_openings", False)) and float(getattr(grid, "opening_mask_margin", 0.0)) > 0.0:
@@ -541,6 +536,23 @@ def rebuild(edited_ids: Sequence[str], project: Project) -> RebuildResult:
             w = next((x for x in project.param.walls if x.id == wid), None)
             if w is not None:
                 room_ids.add(w.room_id)
+        elif aid.startswith("shared_wall:"):
+            swid = aid.split(":", 1)[1]
+            sw = next((x for x in project.param.shared_walls if x.id == swid), None)
+            if sw is not None:
+                room_ids.add(sw.room_a)
+                if sw.room_b is not None:
+                    room_ids.add(sw.room_b)
+        elif aid.startswith("opening:"):
+            oid = aid.split(":", 1)[1]
+            op = next((x for x in project.param.openings if x.id == oid), None)
+            if op is not None:
+                w = next((x for x in project.param.walls if x.id == op.wall_id), None)
+                sw = next((x for x in project.param.shared_walls if x.id == op.wall_id), None)
+                if w is not None:
+                    room_ids.add(w.room_id)
+                elif sw is not None:
+                    room_ids.update(r for r in (sw.room_a, sw.room_b) if r is not None)
         elif aid.startswith("footprint:"):
             fid = aid.split(":", 1)[1]
             room_ids.update(_room_for_footprint(project, fid))
@@ -4,6 +4,8 @@ import math
 from dataclasses import dataclass
 from typing import Iterable, List, Literal, Optional, Sequence, Tuple
 
+import numpy as np
+
 from luxera.geometry.tolerance import EPS_POS
 
 
@@ -18,13 +20,92 @@ def point_in_polygon(point: Point2, polygon: Sequence[Point2]) -> bool:
     for i in range(n):
         x1, y1 = polygon[i]
         x2, y2 = polygon[(i + 1) % n]
-        if ((y1 > y) != (y2 > y)) and (x < (x2 - x1) * (y - y1) / max(y2 - y1, EPS_POS) + x1):
+        # The straddle test guarantees y2 != y1 before dividing.
+        if ((y1 > y) != (y2 > y)) and (x < (x2 - x1) * (y - y1) / (y2 - y1) + x1):
             inside = not inside
     return inside
 
 
+def _as_points2(points: Sequence[Point2] | np.ndarray) -> np.ndarray:
+    pts = np.asarray(points, dtype=float)
+    if pts.size == 0:
+        return np.zeros((0, 2), dtype=float)
+    return pts.reshape(-1, pts.shape[-1])[:, :2]
+
+
+def _crossing_mask(x: np.ndarray, y: np.ndarray, ring: np.ndarray) -> np.ndarray:
+    inside = np.zeros(x.shape, dtype=bool)
+    nxt = np.roll(ring, -1, axis=0)
+    for (x1, y1), (x2, y2) in zip(ring.tolist(), nxt.tolist()):
+        if y1 == y2:
+            continue
+        straddle = (y1 > y) != (y2 > y)
+        inside ^= straddle & (x < (x2 - x1) * (y - y1) / (y2 - y1) + x1)
+    return inside
+
+
+def points_in_polygon(points: Sequence[Point2] | np.ndarray, polygon: Sequence[Point2]) -> np.ndarray:
+    """Vectorised ``point_in_polygon`` over ``(M, 2)`` points (extra columns are ignored)."""
+    pts = _as_points2(points)
+    inside = np.zeros((pts.shape[0],), dtype=bool)
+    ring = np.asarray(polygon, dtype=float).reshape(-1, 2) if len(polygon) else np.zeros((0, 2))
+    if ring.shape[0] == 0 or pts.shape[0] == 0:
+        return inside
+    lo = ring.min(axis=0)
+    hi = ring.max(axis=0)
+    cand = np.flatnonzero(
+        (pts[:, 0] >= lo[0]) & (pts[:, 0] <= hi[0]) & (pts[:, 1] >= lo[1]) & (pts[:, 1] <= hi[1])
+    )
+    if cand.size:
+        inside[cand] = _crossing_mask(pts[cand, 0], pts[cand, 1], ring)
+    return inside
+
+
+def points_in_polygons(
+    points: Sequence[Point2] | np.ndarray,
+    polygons: Sequence[Sequence[Point2]],
+    holes: Sequence[Sequence[Point2]] = (),
+) -> np.ndarray:
+    """
+    Mask of points inside any of ``polygons`` and outside every ring in ``holes``.
+
+    Rings with fewer than 3 vertices are ignored. Points are sorted by x once so each
+    ring only tests the points inside its bounding box.
+    """
+    pts = _as_points2(points)
+    inside = np.zeros((pts.shape[0],), dtype=bool)
+    rings = [np.asarray(r, dtype=float).reshape(-1, 2) for r in polygons if len(r) >= 3]
+    hole_rings = [np.asarray(r, dtype=float).reshape(-1, 2) for r in holes if len(r) >= 3]
+    if pts.shape[0] == 0 or not rings:
+        return inside
+    order = np.argsort(pts[:, 0], kind="stable")
+    xs = pts[order, 0]
+
+    def _in_box(ring: np.ndarray) -> np.ndarray:
+        lo = ring.min(axis=0)
+        hi = ring.max(axis=0)
+        a = int(np.searchsorted(xs, lo[0], side="left"))
+        b = int(np.searchsorted(xs, hi[0], side="right"))
+        idx = order[a:b]
+        y = pts[idx, 1]
+        return idx[(y >= lo[1]) & (y <= hi[1])]
+
+    for ring in rings:
+        idx = _in_box(ring)
+        idx = idx[~inside[idx]]
+        if idx.size:
+            inside[idx] = _crossing_mask(pts[idx, 0], pts[idx, 1], ring)
+    for ring in hole_rings:
+        idx = _in_box(ring)
+        idx = idx[inside[idx]]
+        if idx.size:
+            inside[idx] = ~_crossing_mask(pts[idx, 0], pts[idx, 1], ring)
+    return inside
+
+
 def clip_points_to_polygon(points: Sequence[Point2], polygon: Sequence[Point2]) -> List[Point2]:
-    return [p for p in points if point_in_polygon(p, polygon)]
+    keep = points_in_polygon(points, polygon) if len(points) else []
+    return [p for p, k in zip(points, keep) if k]
 
 
 def polygon_union(polygons: Sequence[Sequence[Point2]]) -> List[Point2]:
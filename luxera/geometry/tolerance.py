@@ -6,6 +6,10 @@ EPS_POS = 1e-12
 # Angular epsilon (dimensionless tolerance used for orthogonality/unit checks).
 EPS_ANG = 1e-9
 
+# Relative conditioning floor for 3x3 linear solves (e.g. QEM collapse targets):
+# |det(A)| at or below this times (trace(A) / 3) ** 3 is treated as singular.
+EPS_COND = 1e-9
+
 # Area epsilon for degenerate polygon/triangle checks.
 EPS_AREA = 1e-12
 
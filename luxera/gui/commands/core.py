@@ -28,6 +28,7 @@ from luxera.project.schema import (
     EscapeRouteSpec,
     JobResultRef,
     JobSpec,
+    Project,
     ProjectVariant,
 )
 from luxera.project.variants import run_job_for_variants
@@ -516,9 +517,30 @@ def cmd_export_roadway_report(project_path: str, job_id: str, out_path: str | No
     return render_roadway_report_html(Path(ref.result_dir), out)
 
 
-def cmd_apply_diff(project_path: str, diff: ProjectDiff) -> ProjectDiff:
-    project, ppath = _load(project_path)
-    diff.apply(project)
+def cmd_apply_diff(
+    project_path: str,
+    diff: ProjectDiff,
+    *,
+    project: Project | None = None,
+    history_label: str | None = None,
+) -> ProjectDiff:
+    """
+    Apply ``diff`` and save the project.
+
+    ``project`` edits an already loaded project in place instead of reading
+    ``project_path``. With ``history_label`` the change is recorded as a diff
+    undo entry, which holds only the touched items.
+    """
+    if project is None:
+        project, ppath = _load(project_path)
+    else:
+        ppath = Path(project_path).expanduser().resolve()
+    if history_label is None:
+        diff.apply(project)
+    else:
+        from luxera.project.history import record_diff
+
+        record_diff(project, diff, label=history_label)
     from luxera.project.io import save_project_schema
 
     save_project_schema(project, ppath)
@@ -4,6 +4,7 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from luxera.ifc.step_model import IfcStepModel
 from luxera.project.schema import (
     CoordinateSystemSpec,
     LevelSpec,
@@ -27,23 +28,40 @@ class EnhancedIFCImporter:
     6. Coordinate system alignment (project north, true north, elevation)
     """
 
-    def __init__(self, ifc_path: Path):
+    def __init__(self, ifc_path: Path, backend: str = "ifcopenshell"):
         """
         Open IFC file using ifcopenshell (import ifcopenshell).
         If ifcopenshell is not installed, raise ImportError with install instructions.
+
+        ``backend="step"`` reads the file through the built-in indexed STEP reader instead;
+        ``backend="auto"`` prefers ifcopenshell and falls back to the STEP reader.
         """
         self.ifc_path = Path(ifc_path).expanduser().resolve()
         if not self.ifc_path.exists():
             raise FileNotFoundError(f"IFC file not found: {self.ifc_path}")
-        try:
-            import ifcopenshell  # type: ignore
-        except Exception as e:
-            raise ImportError(
-                "EnhancedIFCImporter requires ifcopenshell. Install with: pip install ifcopenshell"
-            ) from e
-
-        self._ifcopenshell = ifcopenshell
-        self.model = ifcopenshell.open(str(self.ifc_path))
+        if backend not in {"ifcopenshell", "step", "auto"}:
+            raise ValueError(f"Unsupported IFC backend: {backend}")
+        self._ifcopenshell = None
+        if backend != "step":
+            try:
+                import ifcopenshell  # type: ignore
+            except Exception as e:
+                if backend == "ifcopenshell":
+                    raise ImportError(
+                        "EnhancedIFCImporter requires ifcopenshell. Install with: pip install ifcopenshell"
+                    ) from e
+            else:
+                self._ifcopenshell = ifcopenshell
+        if self._ifcopenshell is not None:
+            self.backend = "ifcopenshell"
+            self.model = self._ifcopenshell.open(str(self.ifc_path))
+        else:
+            self.backend = "step"
+            self.model = IfcStepModel.open(self.ifc_path)
+
+    def close(self) -> None:
+        if isinstance(self.model, IfcStepModel):
+            self.model.close()
 
     def import_spaces(self) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from luxera.io.step_reader import STEP_DERIVED, StepIndex, StepRef, StepTyped
+
+
+# Positional attribute names for the IFC2X3/IFC4 entities the importers read.
+_ROOT = ("GlobalId", "OwnerHistory", "Name", "Description")
+_PRODUCT = _ROOT + ("ObjectType", "ObjectPlacement", "Representation")
+_ELEMENT = _PRODUCT + ("Tag",)
+_SPATIAL = _PRODUCT + ("LongName", "CompositionType")
+_FILLING = _ELEMENT + ("OverallHeight", "OverallWidth")
+
+IFC_ATTRIBUTES: Dict[str, Tuple[str, ...]] = {
+    "IFCPROJECT": _ROOT + ("ObjectType", "LongName", "Phase", "RepresentationContexts", "UnitsInContext"),
+    "IFCSITE": _SPATIAL + ("RefLatitude", "RefLongitude", "RefElevation", "LandTitleNumber", "SiteAddress"),
+    "IFCBUILDING": _SPATIAL + ("ElevationOfRefHeight", "ElevationOfTerrain", "BuildingAddress"),
+    "IFCBUILDINGSTOREY": _SPATIAL + ("Elevation",),
+    "IFCSPACE": _SPATIAL + ("PredefinedType", "ElevationWithFlooring"),
+    "IFCWALL": _ELEMENT + ("PredefinedType",),
+    "IFCWALLSTANDARDCASE": _ELEMENT + ("PredefinedType",),
+    "IFCSLAB": _ELEMENT + ("PredefinedType",),
+    "IFCSLABSTANDARDCASE": _ELEMENT + ("PredefinedType",),
+    "IFCROOF": _ELEMENT + ("PredefinedType",),
+    "IFCCOVERING": _ELEMENT + ("PredefinedType",),
+    "IFCPLATE": _ELEMENT + ("PredefinedType",),
+    "IFCWINDOW": _FILLING,
+    "IFCWINDOWSTANDARDCASE": _FILLING,
+    "IFCDOOR": _FILLING,
+    "IFCDOORSTANDARDCASE": _FILLING,
+    "IFCOPENINGELEMENT": _ELEMENT + ("PredefinedType",),
+    "IFCLOCALPLACEMENT": ("PlacementRelTo", "RelativePlacement"),
+    "IFCAXIS2PLACEMENT2D": ("Location", "RefDirection"),
+    "IFCAXIS2PLACEMENT3D": ("Location", "Axis", "RefDirection"),
+    "IFCCARTESIANPOINT": ("Coordinates",),
+    "IFCDIRECTION": ("DirectionRatios",),
+    "IFCMATERIAL": ("Name", "Description", "Category"),
+    "IFCMATERIALLAYER": ("Material", "LayerThickness", "IsVentilated", "Name"),
+    "IFCMATERIALLAYERSET": ("MaterialLayers", "LayerSetName"),
+    "IFCMATERIALLAYERSETUSAGE": ("ForLayerSet", "LayerSetDirection", "DirectionSense", "OffsetFromReferenceLine"),
+    "IFCRELASSOCIATESMATERIAL": _ROOT + ("RelatedObjects", "RelatingMaterial"),
+    "IFCRELCONTAINEDINSPATIALSTRUCTURE": _ROOT + ("RelatedElements", "RelatingStructure"),
+    "IFCRELFILLSELEMENT": _ROOT + ("RelatingOpeningElement", "RelatedBuildingElement"),
+    "IFCRELVOIDSELEMENT": _ROOT + ("RelatingBuildingElement", "RelatedOpeningElement"),
+    "IFCRELSPACEBOUNDARY": _ROOT + ("RelatingSpace", "RelatedBuildingElement", "ConnectionGeometry", "PhysicalOrVirtualBoundary", "InternalOrExternalBoundary"),
+    "IFCSIUNIT": ("Dimensions", "UnitType", "Prefix", "Name"),
+    "IFCUNITASSIGNMENT": ("Units",),
+}
+
+# Inverse attribute -> (relationship type, forward attribute pointing back at the entity).
+IFC_INVERSES: Dict[str, Tuple[str, str]] = {
+    "HasAssociations": ("IFCRELASSOCIATESMATERIAL", "RelatedObjects"),
+    "ContainsElements": ("IFCRELCONTAINEDINSPATIALSTRUCTURE", "RelatingStructure"),
+    "ContainedInStructure": ("IFCRELCONTAINEDINSPATIALSTRUCTURE", "RelatedElements"),
+    "FillsVoids": ("IFCRELFILLSELEMENT", "RelatedBuildingElement"),
+    "HasFillings": ("IFCRELFILLSELEMENT", "RelatingOpeningElement"),
+    "HasOpenings": ("IFCRELVOIDSELEMENT", "RelatingBuildingElement"),
+    "VoidsElements": ("IFCRELVOIDSELEMENT", "RelatedOpeningElement"),
+    "BoundedBy": ("IFCRELSPACEBOUNDARY", "RelatingSpace"),
+}
+
+# Supertype -> concrete types included by ``by_type`` (mirrors ifcopenshell's subtype expansion).
+_SUBTYPES: Dict[str, Tuple[str, ...]] = {
+    "IFCWALL": ("IFCWALL", "IFCWALLSTANDARDCASE", "IFCWALLELEMENTEDCASE"),
+    "IFCSLAB": ("IFCSLAB", "IFCSLABSTANDARDCASE", "IFCSLABELEMENTEDCASE"),
+    "IFCWINDOW": ("IFCWINDOW", "IFCWINDOWSTANDARDCASE"),
+    "IFCDOOR": ("IFCDOOR", "IFCDOORSTANDARDCASE"),
+}
+
+
+class IfcStepEntity:
+    """Attribute-style view of an IFC entity instance backed by a ``StepIndex``."""
+
+    __slots__ = ("_model", "_id", "_type")
+
+    def __init__(self, model: "IfcStepModel", entity_id: int, entity_type: str):
+        self._model = model
+        self._id = int(entity_id)
+        self._type = entity_type
+
+    def id(self) -> int:
+        return self._id
+
+    def is_a(self, name: Optional[str] = None) -> Any:
+        if name is None:
+            return self._type
+        return self._type in _SUBTYPES.get(name.upper(), (name.upper(),))
+
+    def __getattr__(self, name: str) -> Any:
+        attrs = IFC_ATTRIBUTES.get(self._type, ())
+        if name in attrs:
+            args = self._model.index.args(self._id)
+            pos = attrs.index(name)
+            return self._model.wrap(args[pos]) if pos < len(args) else None
+        if name in IFC_INVERSES:
+            rel_type, attr = IFC_INVERSES[name]
+            return self._model.inverse(self._id, rel_type, attr)
+        raise AttributeError(name)
+
+    def __repr__(self) -> str:
+        return f"#{self._id}={self._type}"
+
+
+class IfcStepModel:
+    """
+    Minimal ifcopenshell-like model (``by_type`` + attribute access) over a STEP index.
+
+    Used when ifcopenshell is unavailable; only the attributes in ``IFC_ATTRIBUTES`` and
+    the inverses in ``IFC_INVERSES`` are exposed.
+    """
+
+    def __init__(self, index: StepIndex):
+        self.index = index
+        self._inverse_maps: Dict[Tuple[str, str], Dict[int, List[int]]] = {}
+
+    @classmethod
+    def open(cls, path: str | Path) -> "IfcStepModel":
+        return cls(StepIndex.open(path))
+
+    def close(self) -> None:
+        self.index.close()
+
+    @property
+    def schema(self) -> Optional[str]:
+        return self.index.schema
+
+    def by_id(self, entity_id: int) -> IfcStepEntity:
+        return IfcStepEntity(self, entity_id, self.index.entity_type(entity_id))
+
+    def by_type(self, name: str) -> List[IfcStepEntity]:
+        kinds = _SUBTYPES.get(name.upper(), (name.upper(),))
+        ids = sorted(eid for kind in kinds for eid in self.index.ids_of_type(kind))
+        return [self.by_id(eid) for eid in ids]
+
+    def wrap(self, value: Any) -> Any:
+        if isinstance(value, StepRef):
+            return self.by_id(value.id) if value.id in self.index else None
+        if isinstance(value, tuple):
+            return tuple(self.wrap(v) for v in value)
+        if isinstance(value, StepTyped):
+            return self.wrap(value.value)
+        if value is STEP_DERIVED:
+            return None
+        return value
+
+    def inverse(self, entity_id: int, rel_type: str, attr: str) -> List[IfcStepEntity]:
+        key = (rel_type, attr)
+        mapping = self._inverse_maps.get(key)
+        if mapping is None:
+            mapping = {}
+            pos = IFC_ATTRIBUTES[rel_type].index(attr)
+            for rel_id in self.index.ids_of_type(rel_type):
+                args = self.index.args(rel_id)
+                target = args[pos] if pos < len(args) else None
+                targets = target if isinstance(target, tuple) else (target,)
+                for t in targets:
+                    if isinstance(t, StepRef):
+                        mapping.setdefault(t.id, []).append(rel_id)
+            self._inverse_maps[key] = mapping
+        return [self.by_id(rid) for rid in mapping.get(int(entity_id), [])]
@@ -10,6 +10,7 @@ from luxera.io.dxf_import import (
     DXFPolyline,
     DXFLine,
     load_dxf,
+    iter_dxf_entities,
     extract_rooms_from_dxf,
     lines_to_polylines,
 )
@@ -26,6 +27,7 @@ __all__ = [
     "DXFPolyline",
     "DXFLine",
     "load_dxf",
+    "iter_dxf_entities",
     "extract_rooms_from_dxf",
     "lines_to_polylines",
     "GeometryImportResult",
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Dict, Iterator
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 import re
 
@@ -111,6 +111,41 @@ class DXFDocument:
         return [p for p in self.get_polylines(layer) if p.is_closed]
 
 
+def iter_dxf_pairs(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """
+    Yield ``(group code, value)`` pairs from an iterable of DXF text lines.
+
+    Lines are consumed two at a time, so a file object can be passed directly
+    without reading it into memory. Pairs with a non-integer group code are skipped.
+    """
+    it = iter(lines)
+    for code_line, value_line in zip(it, it):
+        try:
+            code = int(code_line)
+        except ValueError:
+            continue
+        yield code, value_line.strip()
+
+
+def iter_dxf_records(lines: Iterable[str]) -> Iterator[Tuple[str, Dict[int, str]]]:
+    """
+    Group DXF pairs into records: each ``0`` code starts a record whose data holds the
+    following non-zero codes (last value wins for repeated codes).
+    """
+    record_type: Optional[str] = None
+    data: Dict[int, str] = {}
+    for code, value in iter_dxf_pairs(lines):
+        if code == 0:
+            if record_type is not None:
+                yield record_type, data
+            record_type = value
+            data = {}
+        elif record_type is not None:
+            data[code] = value
+    if record_type is not None:
+        yield record_type, data
+
+
 class DXFParser:
     """
     Simple DXF parser for extracting geometry.
@@ -121,89 +156,69 @@ class DXFParser:
     
     def __init__(self):
         self.doc = DXFDocument()
-        self._current_section = ""
         self._current_entity_type = ""
         self._current_entity_data: Dict[int, str] = {}
-        self._current_block: Optional[DXFBlock] = None
-        self._in_block = False
     
     def parse_file(self, filepath: Path) -> DXFDocument:
-        """Parse a DXF file."""
+        """Parse a DXF file, streaming it line by line."""
         with open(filepath, 'r', errors='replace') as f:
-            content = f.read()
-        return self.parse_string(content)
+            return self.parse_lines(f)
     
     def parse_string(self, content: str) -> DXFDocument:
         """Parse DXF content from string."""
-        self.doc = DXFDocument()
-        lines = content.splitlines()
-        
-        i = 0
-        while i < len(lines) - 1:
-            try:
-                code = int(lines[i].strip())
-                value = lines[i + 1].strip()
-            except (ValueError, IndexError):
-                i += 2
-                continue
-            
-            self._process_pair(code, value)
-            i += 2
-        
-        return self.doc
+        return self.parse_lines(content.splitlines())
     
-    def _process_pair(self, code: int, value: str):
-        """Process a DXF code-value pair."""
-        # Section markers
-        if code == 0:
-            if value == "SECTION":
-                pass
-            elif value == "ENDSEC":
-                self._current_section = ""
-            elif value == "EOF":
-                pass
-            elif self._current_section == "ENTITIES":
-                self._flush_entity()
-                self._current_entity_type = value
-                self._current_entity_data = {}
-            elif self._current_section == "BLOCKS":
-                if value == "BLOCK":
-                    self._current_block = DXFBlock(name="")
-                    self._in_block = True
-                elif value == "ENDBLK":
-                    if self._current_block and self._current_block.name:
-                        self.doc.blocks[self._current_block.name] = self._current_block
-                    self._current_block = None
-                    self._in_block = False
-                elif self._in_block:
-                    self._flush_entity()
-                    self._current_entity_type = value
-                    self._current_entity_data = {}
-            else:
-                self._current_entity_type = value
-                self._current_entity_data = {}
-        elif code == 2:
-            if value in ("HEADER", "TABLES", "BLOCKS", "ENTITIES", "OBJECTS"):
-                self._current_section = value
-            elif self._current_block is not None:
-                self._current_block.name = value
+    def parse_lines(self, lines: Iterable[str]) -> DXFDocument:
+        """Parse DXF content from an iterable of lines."""
+        self.doc = DXFDocument()
+        for block, entity in self.iter_entities(lines):
+            if block is None:
+                self.doc.entities.append(entity)
             else:
-                self._current_entity_data[code] = value
-        else:
-            self._current_entity_data[code] = value
+                block.entities.append(entity)
+        return self.doc
     
-    def _flush_entity(self):
-        """Convert accumulated data into an entity."""
-        if not self._current_entity_type or not self._current_entity_data:
-            return
-        
-        entity = self._create_entity()
-        if entity:
-            if self._in_block and self._current_block:
-                self._current_block.entities.append(entity)
-            else:
-                self.doc.entities.append(entity)
-        
+    def iter_entities(self, lines: Iterable[str]) -> Iterator[Tuple[Optional[DXFBlock], DXFEntity]]:
+        """
+        Yield ``(block, entity)`` for every supported entity as it is read.
+
+        ``block`` is ``None`` for model-space entities in the ENTITIES section. Block
+        definitions are registered in ``self.doc.blocks`` when their BLOCK record is read.
+        """
+        section = ""
+        block: Optional[DXFBlock] = None
+        for record_type, data in iter_dxf_records(lines):
+            if record_type == "SECTION":
+                section = data.get(2, "")
+                continue
+            if record_type == "ENDSEC":
+                section = ""
+                block = None
+                continue
+            if record_type == "EOF":
+                break
+            if section == "BLOCKS":
+                if record_type == "BLOCK":
+                    self._current_entity_data = data
+                    block = DXFBlock(
+                        name=data.get(2, ""),
+                        base_point=Vector3(self._get_float(10), self._get_float(20), self._get_float(30)),
+                    )
+                    if block.name:
+                        self.doc.blocks[block.name] = block
+                    continue
+                if record_type == "ENDBLK":
+                    block = None
+                    continue
+                if block is None:
+                    continue
+            elif section != "ENTITIES":
+                continue
+            self._current_entity_type = record_type
+            self._current_entity_data = data
+            entity = self._create_entity()
+            if entity is not None:
+                yield block, entity
         self._current_entity_type = ""
         self._current_entity_data = {}
     
@@ -402,6 +417,23 @@ def load_dxf(filepath: Path) -> DXFDocument:
     return parser.parse_file(filepath)
 
 
+def iter_dxf_entities(filepath: Path) -> Iterator[DXFEntity]:
+    """
+    Stream model-space entities from a DXF file without building a ``DXFDocument``.
+
+    Args:
+        filepath: Path to DXF file
+
+    Yields:
+        Entities from the ENTITIES section, in file order
+    """
+    parser = DXFParser()
+    with open(filepath, 'r', errors='replace') as f:
+        for block, entity in parser.iter_entities(f):
+            if block is None:
+                yield entity
+
+
 # =============================================================================
 # Polyline Builder (for creating closed polylines from lines)
 # =============================================================================
@@ -425,19 +457,58 @@ def lines_to_polylines(lines: List[DXFLine], tolerance: float = 0.01) -> List[DX
     
     polylines = []
     used = set()
-    
-    def find_connected(point: Vector3, exclude: int) -> Optional[Tuple[int, bool]]:
-        """Find a line connected to the given point."""
-        for i, line in enumerate(lines):
-            if i in used or i == exclude:
-                continue
-            
-            if (line.start - point).length() < tolerance:
-                return (i, False)  # Connect at start
-            if (line.end - point).length() < tolerance:
-                return (i, True)  # Connect at end (reversed)
-        
-        return None
+    tol = float(tolerance)
+    cell = 2.0 * tol if tol > 0.0 else 1.0
+
+    def key(p: Vector3) -> Optional[Tuple[int, int, int]]:
+        try:
+            return (math.floor(p.x / cell), math.floor(p.y / cell), math.floor(p.z / cell))
+        except (ValueError, OverflowError):
+            return None  # Non-finite endpoints never connect
+
+    # Endpoint hash on a grid of 2*tolerance cells: the tolerance box around a
+    # point overlaps at most two cells per axis.
+    grid: Dict[Tuple[int, int, int], List[int]] = {}
+    for i, line in enumerate(lines):
+        ks = key(line.start)
+        if ks is not None:
+            grid.setdefault(ks, []).append(i)
+        ke = key(line.end)
+        if ke is not None and ke != ks:
+            grid.setdefault(ke, []).append(i)
+
+    def near(a: Vector3, b: Vector3) -> bool:
+        dx = a.x - b.x
+        dy = a.y - b.y
+        dz = a.z - b.z
+        return math.sqrt(dx**2 + dy**2 + dz**2) < tol
+
+    def find_connected(point: Vector3) -> Optional[Tuple[int, bool]]:
+        """Find the lowest-index unused line connected to the given point."""
+        if tol <= 0.0:
+            return None
+        lo = key(Vector3(point.x - tol, point.y - tol, point.z - tol))
+        hi = key(Vector3(point.x + tol, point.y + tol, point.z + tol))
+        if lo is None or hi is None:
+            return None
+        best: Optional[Tuple[int, bool]] = None
+        for cx in range(lo[0], hi[0] + 1):
+            for cy in range(lo[1], hi[1] + 1):
+                for cz in range(lo[2], hi[2] + 1):
+                    bucket = grid.get((cx, cy, cz))
+                    if not bucket:
+                        continue
+                    if any(i in used for i in bucket):
+                        bucket[:] = [i for i in bucket if i not in used]
+                    for i in bucket:
+                        if best is not None and i >= best[0]:
+                            break
+                        line = lines[i]
+                        if near(line.start, point):
+                            best = (i, False)  # Connect at start
+                        elif near(line.end, point):
+                            best = (i, True)  # Connect at end (reversed)
+        return best
     
     for start_idx, start_line in enumerate(lines):
         if start_idx in used:
@@ -449,7 +520,7 @@ def lines_to_polylines(lines: List[DXFLine], tolerance: float = 0.01) -> List[DX
         
         # Extend forward
         while True:
-            result = find_connected(vertices[-1], -1)
+            result = find_connected(vertices[-1])
             if result is None:
                 break
             
@@ -462,8 +533,9 @@ def lines_to_polylines(lines: List[DXFLine], tolerance: float = 0.01) -> List[DX
                 vertices.append(lines[idx].end)
         
         # Extend backward
+        head: List[Vector3] = []
         while True:
-            result = find_connected(vertices[0], -1)
+            result = find_connected(head[-1] if head else vertices[0])
             if result is None:
                 break
             
@@ -471,9 +543,11 @@ def lines_to_polylines(lines: List[DXFLine], tolerance: float = 0.01) -> List[DX
             used.add(idx)
             
             if reversed_dir:
-                vertices.insert(0, lines[idx].end)
+                head.append(lines[idx].end)
             else:
-                vertices.insert(0, lines[idx].start)
+                head.append(lines[idx].start)
+        if head:
+            vertices = head[::-1] + vertices
         
         # Check if closed
         is_closed = (vertices[0] - vertices[-1]).length() < tolerance
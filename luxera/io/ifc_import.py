@@ -13,6 +13,7 @@ from luxera.geometry.openings.opening_uv import opening_uv_polygon
 from luxera.geometry.openings.project_uv import lift_uv_to_3d, project_points_to_uv, wall_basis
 from luxera.geometry.openings.subtract import UVPolygon, subtract_openings
 from luxera.geometry.openings.triangulate_wall import wall_mesh_from_uv
+from luxera.io.step_reader import StepIndex
 from luxera.project.schema import LevelSpec, ObstructionSpec, OpeningSpec, RoomSpec, SurfaceSpec
 
 
@@ -54,17 +55,8 @@ def _normalize_unit(unit: Optional[str]) -> str:
     return "m"
 
 
-def _extract_ifc_entities(text: str, name: str) -> List[str]:
-    pat = re.compile(rf"#\d+\s*=\s*{name}\((.*?)\);", re.IGNORECASE | re.DOTALL)
-    return [m.group(1).strip() for m in pat.finditer(text)]
-
-
-def _extract_ifc_entities_with_ids(text: str, name: str) -> List[Tuple[int, str]]:
-    pat = re.compile(rf"#(\d+)\s*=\s*{name}\((.*?)\);", re.IGNORECASE | re.DOTALL)
-    out: List[Tuple[int, str]] = []
-    for m in pat.finditer(text):
-        out.append((int(m.group(1)), m.group(2).strip()))
-    return out
+def _extract_ifc_entities_with_ids(index: StepIndex, name: str) -> List[Tuple[int, str]]:
+    return [(eid, index.raw_args(eid)) for eid in index.ids_of_type(name)]
 
 
 def _extract_name(args_text: str, fallback: str) -> str:
@@ -73,19 +65,21 @@ def _extract_name(args_text: str, fallback: str) -> str:
     return m.group(1) if m else fallback
 
 
-def _infer_unit_from_ifc_text(text: str) -> str:
-    up = text.upper()
-    if "IFCSIUNIT" not in up:
+def _infer_unit_from_step_index(index: StepIndex) -> str:
+    si_units = index.ids_of_type("IFCSIUNIT")
+    if not si_units:
         return "m"
+    unit_ids = si_units + index.ids_of_type("IFCCONVERSIONBASEDUNIT")
+    up = " ".join(index.raw_args(uid) for uid in unit_ids).upper()
     if ".LENGTHUNIT." not in up:
         return "m"
     if ".MILLI." in up and ".METRE." in up:
         return "mm"
     if ".CENTI." in up and ".METRE." in up:
         return "cm"
-    if ".FOOT." in up:
+    if ".FOOT." in up or "'FOOT'" in up:
         return "ft"
-    if ".INCH." in up:
+    if ".INCH." in up or "'INCH'" in up:
         return "in"
     return "m"
 
@@ -594,8 +588,12 @@ def _extract_ifcgeom_surfaces(
 
 def import_ifc(path: Path, options: IFCImportOptions | None = None) -> ImportedIFC:
     options = options or IFCImportOptions()
-    text = path.read_text(encoding="utf-8", errors="replace")
-    inferred_unit = _normalize_unit(options.length_unit_override or _infer_unit_from_ifc_text(text))
+    with StepIndex.open(path) as index:
+        return _import_ifc_indexed(path, index, options)
+
+
+def _import_ifc_indexed(path: Path, index: StepIndex, options: IFCImportOptions) -> ImportedIFC:
+    inferred_unit = _normalize_unit(options.length_unit_override or _infer_unit_from_step_index(index))
     scale = float(options.scale_to_meters_override if options.scale_to_meters_override is not None else unit_scale_to_m(inferred_unit))
 
     warnings: List[str] = []
@@ -782,9 +780,9 @@ def import_ifc(path: Path, options: IFCImportOptions | None = None) -> ImportedI
             warnings.append("ifcopenshell.geom unavailable; imported metadata + fallback room/opening geometry.")
     else:
         # Fallback line-based extraction for tests and minimal ingestion.
-        for i, args in enumerate(_extract_ifc_entities(text, "IFCBUILDINGSTOREY")):
+        for i, (_, args) in enumerate(_extract_ifc_entities_with_ids(index, "IFCBUILDINGSTOREY")):
             levels.append(LevelSpec(id=f"ifc_level_{i+1}", name=_extract_name(args, f"Level {i+1}"), elevation=0.0))
-        spaces = _extract_ifc_entities_with_ids(text, "IFCSPACE")
+        spaces = _extract_ifc_entities_with_ids(index, "IFCSPACE")
         room_by_space_step_id: Dict[int, RoomSpec] = {}
         for i, (sid, args) in enumerate(spaces):
             w, l, h = options.fallback_room_size
@@ -801,8 +799,8 @@ def import_ifc(path: Path, options: IFCImportOptions | None = None) -> ImportedI
             room_by_space_step_id[int(sid)] = rooms[-1]
         for room in rooms:
             surfaces.extend(_room_box_surfaces(room))
-        boundary_rows = _extract_ifc_entities_with_ids(text, "IFCRELSPACEBOUNDARY")
-        walls = _extract_ifc_entities_with_ids(text, "IFCWALL")
+        boundary_rows = _extract_ifc_entities_with_ids(index, "IFCRELSPACEBOUNDARY")
+        walls = _extract_ifc_entities_with_ids(index, "IFCWALL")
         wall_ids = {wid for wid, _ in walls}
         wall_room_map, wall_conflicts = _build_boundary_room_map_from_rows(boundary_rows, room_by_space_step_id, target_element_ids=wall_ids)
         if wall_room_map:
@@ -830,7 +828,7 @@ def import_ifc(path: Path, options: IFCImportOptions | None = None) -> ImportedI
             ("IFCPLATE", "ifc_plate", "custom"),
         ]
         for entity_name, prefix, kind in extra_element_specs:
-            elems = _extract_ifc_entities_with_ids(text, entity_name)
+            elems = _extract_ifc_entities_with_ids(index, entity_name)
             if not elems:
                 continue
             elem_ids = {eid for eid, _ in elems}
@@ -855,7 +853,7 @@ def import_ifc(path: Path, options: IFCImportOptions | None = None) -> ImportedI
                 warnings.append(
                     f"Fallback IFCRELSPACEBOUNDARY ownership conflicts resolved deterministically for {elem_conflicts} {entity_name} elements."
                 )
-        windows = _extract_ifc_entities_with_ids(text, "IFCWINDOW")
+        windows = _extract_ifc_entities_with_ids(index, "IFCWINDOW")
         opening_by_window_step_id: Dict[int, OpeningSpec] = {}
         for i, (wid, args) in enumerate(windows):
             name = _extract_name(args, f"Window {i+1}")
@@ -0,0 +1,352 @@
+from __future__ import annotations
+"""
+Single-pass indexed reader for ISO 10303-21 (STEP) exchange files such as IFC.
+
+The file is memory-mapped and scanned once to build an ``id -> (type, body span)``
+index; entity arguments are only decoded and parsed when requested.
+"""
+
+import mmap
+import re
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+# One entity instance: "#id = TYPE ( body ) ;". Semicolons only occur inside strings, so the
+# possessive body scan never backtracks; the closing parenthesis is stripped on access.
+_INSTANCE_RE = re.compile(rb"#(\d+)\s*=\s*([A-Za-z_][A-Za-z0-9_]*)\s*\(((?:[^;']++|'[^']*+(?:''[^']*+)*+')*+);")
+_SCHEMA_RE = re.compile(rb"FILE_SCHEMA\s*\(\s*\(\s*'([^']*)'", re.IGNORECASE)
+_DATA_RE = re.compile(rb"\bDATA\s*;")
+_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<ref>#\d+)"
+    r"|(?P<str>'(?:[^']|'')*')"
+    r"|(?P<enum>\.[A-Za-z0-9_]+\.)"
+    r"|(?P<num>[+-]?(?:\d+\.?\d*|\.\d+)(?:[Ee][+-]?\d+)?)"
+    r"|(?P<bin>\"[0-9A-Fa-f]*\")"
+    r"|(?P<kw>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<punct>[()$*,])"
+    r")"
+)
+_X2_RE = re.compile(r"\\X2\\((?:[0-9A-Fa-f]{4})+)\\X0\\")
+_X4_RE = re.compile(r"\\X4\\((?:[0-9A-Fa-f]{8})+)\\X0\\")
+_X_RE = re.compile(r"\\X\\([0-9A-Fa-f]{2})")
+
+
+class StepReaderError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class StepRef:
+    """Reference to another entity instance (``#id``)."""
+
+    id: int
+
+
+class StepEnum(str):
+    """Enumeration / boolean literal, stored without the surrounding dots."""
+
+
+@dataclass(frozen=True)
+class StepTyped:
+    """Typed parameter such as ``IFCLABEL('x')``."""
+
+    type: str
+    value: Any
+
+
+class _Derived:
+    def __repr__(self) -> str:
+        return "STEP_DERIVED"
+
+
+STEP_DERIVED = _Derived()
+
+
+def decode_step_string(raw: str) -> str:
+    """Decode a STEP string literal body (without quotes): '' escapes and \\X, \\X2, \\X4 encodings."""
+    s = raw.replace("''", "'")
+    if "\\" not in s:
+        return s
+    s = _X2_RE.sub(lambda m: "".join(chr(int(m.group(1)[i : i + 4], 16)) for i in range(0, len(m.group(1)), 4)), s)
+    s = _X4_RE.sub(lambda m: "".join(chr(int(m.group(1)[i : i + 8], 16)) for i in range(0, len(m.group(1)), 8)), s)
+    s = _X_RE.sub(lambda m: chr(int(m.group(1), 16)), s)
+    return s.replace("\\\\", "\\")
+
+
+def parse_step_arguments(text: str) -> Tuple[Any, ...]:
+    """
+    Parse the comma-separated parameter list of one entity instance.
+
+    Values become ``StepRef``, ``str``, ``int``, ``float``, ``StepEnum``, ``StepTyped``,
+    tuples for aggregates, ``None`` for ``$`` and ``STEP_DERIVED`` for ``*``.
+    """
+    tokens: List[Tuple[str, str]] = []
+    pos = 0
+    end = len(text)
+    while pos < end:
+        m = _TOKEN_RE.match(text, pos)
+        if m is None:
+            if text[pos:].strip():
+                raise StepReaderError(f"Unexpected STEP token near: {text[pos:pos + 20]!r}")
+            break
+        kind = m.lastgroup or ""
+        tokens.append((kind, m.group(kind)))
+        pos = m.end()
+
+    idx = 0
+
+    def _value() -> Any:
+        nonlocal idx
+        if idx >= len(tokens):
+            raise StepReaderError("Unexpected end of STEP parameter list")
+        kind, tok = tokens[idx]
+        idx += 1
+        if kind == "ref":
+            return StepRef(int(tok[1:]))
+        if kind == "str":
+            return decode_step_string(tok[1:-1])
+        if kind == "enum":
+            return StepEnum(tok[1:-1])
+        if kind == "num":
+            return float(tok) if any(c in tok for c in ".eE") else int(tok)
+        if kind == "bin":
+            return tok[1:-1]
+        if kind == "kw":
+            if idx < len(tokens) and tokens[idx] == ("punct", "("):
+                idx += 1
+                inner = _list_items()
+                return StepTyped(tok.upper(), inner[0] if len(inner) == 1 else inner)
+            return StepEnum(tok)
+        if tok == "(":
+            return _list_items()
+        if tok == "$":
+            return None
+        if tok == "*":
+            return STEP_DERIVED
+        raise StepReaderError(f"Unexpected STEP token {tok!r}")
+
+    def _list_items() -> Tuple[Any, ...]:
+        nonlocal idx
+        items: List[Any] = []
+        if idx < len(tokens) and tokens[idx] == ("punct", ")"):
+            idx += 1
+            return tuple(items)
+        while True:
+            items.append(_value())
+            if idx >= len(tokens):
+                raise StepReaderError("Unterminated STEP aggregate")
+            kind, tok = tokens[idx]
+            idx += 1
+            if tok == ")":
+                return tuple(items)
+            if tok != ",":
+                raise StepReaderError(f"Expected ',' or ')' in STEP aggregate, got {tok!r}")
+
+    if not tokens:
+        return ()
+    out: List[Any] = [_value()]
+    while idx < len(tokens):
+        kind, tok = tokens[idx]
+        idx += 1
+        if tok != ",":
+            raise StepReaderError(f"Expected ',' between STEP parameters, got {tok!r}")
+        out.append(_value())
+    return tuple(out)
+
+
+class StepEntity:
+    """Lazy view of one entity instance in a ``StepIndex``."""
+
+    __slots__ = ("index", "id", "type")
+
+    def __init__(self, index: "StepIndex", entity_id: int, entity_type: str):
+        self.index = index
+        self.id = int(entity_id)
+        self.type = entity_type
+
+    @property
+    def raw_args(self) -> str:
+        return self.index.raw_args(self.id)
+
+    @property
+    def args(self) -> Tuple[Any, ...]:
+        return self.index.args(self.id)
+
+    def __getitem__(self, i: int) -> Any:
+        args = self.args
+        return args[i] if -len(args) <= i < len(args) else None
+
+    def resolve(self, i: int) -> Any:
+        """Argument ``i`` with references replaced by entities (recursively through aggregates)."""
+        return self.index.resolve(self[i])
+
+    def __repr__(self) -> str:
+        return f"StepEntity(#{self.id}={self.type})"
+
+
+class StepIndex:
+    """
+    Entity index over a STEP file built in a single scan.
+
+    Only ids, type codes and byte offsets are stored for each instance; argument text is
+    read back from the memory map on demand and parsed results are memoised.
+    """
+
+    def __init__(self, data: bytes | mmap.mmap, *, source: Optional[str] = None, _file=None):
+        self._data = data
+        self._file = _file
+        self.source = source
+        self._type_names: List[str] = []
+        self._parsed: Dict[int, Tuple[Any, ...]] = {}
+        self.schema = self._read_schema()
+        self._build()
+
+    @classmethod
+    def open(cls, path: str | Path) -> "StepIndex":
+        p = Path(path).expanduser().resolve()
+        f = p.open("rb")
+        try:
+            if p.stat().st_size == 0:
+                f.close()
+                return cls(b"", source=str(p))
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            f.close()
+            raise
+        return cls(mm, source=str(p), _file=f)
+
+    @classmethod
+    def from_text(cls, text: str) -> "StepIndex":
+        return cls(text.encode("utf-8"))
+
+    def close(self) -> None:
+        self._parsed.clear()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._data = b""
+
+    def __enter__(self) -> "StepIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _read_schema(self) -> Optional[str]:
+        head_end = _DATA_RE.search(self._data)
+        stop = head_end.start() if head_end is not None else min(len(self._data), 65536)
+        m = _SCHEMA_RE.search(self._data, 0, stop)
+        return m.group(1).decode("ascii", errors="replace").upper() if m else None
+
+    def _build(self) -> None:
+        ids = array("q")
+        codes = array("l")
+        starts = array("q")
+        ends = array("q")
+        code_by_raw: Dict[bytes, int] = {}
+        code_by_name: Dict[str, int] = {}
+        start_at = 0
+        head_end = _DATA_RE.search(self._data)
+        if head_end is not None:
+            start_at = head_end.end()
+        add_id, add_code, add_start, add_end = ids.append, codes.append, starts.append, ends.append
+        for m in _INSTANCE_RE.finditer(self._data, start_at):
+            raw_id, raw_type = m.group(1, 2)
+            code = code_by_raw.get(raw_type)
+            if code is None:
+                name = raw_type.decode("ascii").upper()
+                code = code_by_name.get(name)
+                if code is None:
+                    code = len(self._type_names)
+                    self._type_names.append(name)
+                    code_by_name[name] = code
+                code_by_raw[raw_type] = code
+            body_start, body_end = m.span(3)
+            add_id(int(raw_id))
+            add_code(code)
+            add_start(body_start)
+            add_end(body_end)
+        self._code_by_name = code_by_name
+        self._ids = np.frombuffer(ids, dtype=np.int64) if ids else np.zeros((0,), dtype=np.int64)
+        self._codes = np.frombuffer(codes, dtype=np.dtype(codes.typecode)) if codes else np.zeros((0,), dtype=np.int64)
+        self._starts = np.frombuffer(starts, dtype=np.int64) if starts else np.zeros((0,), dtype=np.int64)
+        self._ends = np.frombuffer(ends, dtype=np.int64) if ends else np.zeros((0,), dtype=np.int64)
+        self._order = np.argsort(self._ids, kind="stable")
+        self._sorted_ids = self._ids[self._order]
+
+    def __len__(self) -> int:
+        return int(self._ids.size)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return isinstance(entity_id, int) and self._row(entity_id) is not None
+
+    def _row(self, entity_id: int) -> Optional[int]:
+        pos = int(np.searchsorted(self._sorted_ids, int(entity_id)))
+        if pos >= self._sorted_ids.size or int(self._sorted_ids[pos]) != int(entity_id):
+            return None
+        return int(self._order[pos])
+
+    def _require_row(self, entity_id: int) -> int:
+        row = self._row(entity_id)
+        if row is None:
+            raise KeyError(f"STEP entity #{entity_id} not found")
+        return row
+
+    def type_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self._codes, minlength=len(self._type_names)) if self._codes.size else []
+        return {name: int(counts[i]) for i, name in enumerate(self._type_names) if len(counts) and counts[i]}
+
+    def ids_of_type(self, name: str) -> List[int]:
+        """Entity ids of exactly type ``name`` (case-insensitive), in file order."""
+        code = self._code_by_name.get(name.upper())
+        if code is None:
+            return []
+        return [int(x) for x in self._ids[self._codes == code]]
+
+    def entity_type(self, entity_id: int) -> str:
+        return self._type_names[int(self._codes[self._require_row(entity_id)])]
+
+    def raw_args(self, entity_id: int) -> str:
+        """Argument text of an entity (inside the outer parentheses, stripped)."""
+        row = self._require_row(entity_id)
+        chunk = bytes(self._data[int(self._starts[row]) : int(self._ends[row])]).rstrip()
+        if chunk.endswith(b")"):
+            chunk = chunk[:-1]
+        return chunk.decode("utf-8", errors="replace").strip()
+
+    def args(self, entity_id: int) -> Tuple[Any, ...]:
+        key = int(entity_id)
+        cached = self._parsed.get(key)
+        if cached is None:
+            cached = parse_step_arguments(self.raw_args(key))
+            self._parsed[key] = cached
+        return cached
+
+    def entity(self, entity_id: int) -> StepEntity:
+        return StepEntity(self, int(entity_id), self.entity_type(entity_id))
+
+    def by_type(self, name: str) -> List[StepEntity]:
+        kind = name.upper()
+        return [StepEntity(self, eid, kind) for eid in self.ids_of_type(kind)]
+
+    def iter_entities(self) -> Iterator[StepEntity]:
+        for eid, code in zip(self._ids.tolist(), self._codes.tolist()):
+            yield StepEntity(self, eid, self._type_names[code])
+
+    def resolve(self, value: Any) -> Any:
+        """Replace ``StepRef`` values with entities; missing targets resolve to ``None``."""
+        if isinstance(value, StepRef):
+            return self.entity(value.id) if value.id in self else None
+        if isinstance(value, tuple):
+            return tuple(self.resolve(v) for v in value)
+        if isinstance(value, StepTyped):
+            return value.value
+        return value
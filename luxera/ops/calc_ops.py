@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from math import isclose
 from typing import List, Optional, Sequence, Tuple
 
+import numpy as np
+
 from luxera.calcs.masks import apply_obstacle_masks, apply_opening_proximity_mask
 from luxera.geometry.zones import obstacle_polygons_for_room, resolve_zone_polygon, room_polygon
 from luxera.ops.base import OpContext, execute_op
-from luxera.geometry.spatial import clip_polyline_to_polygon, snap_polyline_to_segments
+from luxera.geometry.spatial import clip_polyline_to_polygon, points_in_polygons, snap_polyline_to_segments
 from luxera.project.schema import CalcGrid, LineGridSpec, PointSetSpec, Project, VerticalPlaneSpec, WorkplaneSpec
 
 
@@ -51,23 +52,6 @@ def create_workplane(
     )
 
 
-def _point_in_polygon(point: tuple[float, float], polygon: List[Tuple[float, float]]) -> bool:
-    x, y = point
-    inside = False
-    n = len(polygon)
-    if n < 3:
-        return False
-    for i in range(n):
-        x1, y1 = polygon[i]
-        x2, y2 = polygon[(i + 1) % n]
-        if isclose(y1, y2):
-            continue
-        intersects = ((y1 > y) != (y2 > y)) and (x < (x2 - x1) * (y - y1) / (y2 - y1) + x1)
-        if intersects:
-            inside = not inside
-    return inside
-
-
 def create_calc_grid_from_room(
     project: Project,
     *,
@@ -99,7 +83,6 @@ def create_calc_grid_from_room(
         ny = max(2, int(round(height / float(spacing))) + 1)
         x0, y0, z0 = room.origin
         origin = (x0 + float(margin), y0 + float(margin), z0)
-        sample_mask: List[bool] = []
         sample_points: List[Tuple[float, float, float]] = []
 
         footprint = room_polygon(room)
@@ -110,14 +93,9 @@ def create_calc_grid_from_room(
 
         dx = width / max(nx - 1, 1)
         dy = height / max(ny - 1, 1)
-        points_xy: List[Tuple[float, float]] = []
-        for j in range(ny):
-            for i in range(nx):
-                px = origin[0] + i * dx
-                py = origin[1] + j * dy
-                points_xy.append((float(px), float(py)))
-                inside = _point_in_polygon((px, py), footprint)
-                sample_mask.append(bool(inside))
+        jj, ii = np.divmod(np.arange(nx * ny), nx)
+        points_xy: List[Tuple[float, float]] = list(zip((origin[0] + ii * dx).tolist(), (origin[1] + jj * dy).tolist()))
+        sample_mask = points_in_polygons(points_xy, [footprint]).tolist()
         obstacles = obstacle_polygons_for_room(project.geometry.no_go_zones, room_id)
         sample_mask = apply_obstacle_masks(sample_mask, points_xy, obstacles)
         if bool(mask_near_openings) and float(opening_mask_margin) > 0.0:
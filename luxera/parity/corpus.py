@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import traceback
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping
+from typing import Any, Callable, Dict, List, Mapping, Tuple
 
 import numpy as np
 
@@ -13,6 +15,7 @@ from luxera.parity.invariance import run_invariance_for_scene
 from luxera.parity.packs import Pack, PackScene, load_pack, select_scenes
 from luxera.project.io import load_project_schema
 from luxera.runner import run_job
+from luxera.testing.suite import SUITE_CACHE_FILENAME, callable_fingerprint, input_fingerprint, run_suite, scene_input_paths
 
 
 def _scene_expected_path(
@@ -215,36 +218,59 @@ def _summary_markdown(rows: List[Dict[str, Any]]) -> str:
             )
     if not wrote:
         lines.append("| - | - | - | - | - | - | none |")
+    errors = [r for r in rows if r.get("error")]
+    if errors:
+        lines.extend(["", "## Scene Errors", ""])
+        lines.extend(f"- {r['pack_id']}/{r['scene_id']}: {r['error']}" for r in errors)
     lines.append("")
     return "\n".join(lines)
 
 
-def run_corpus(
-    parity_root: Path,
-    selector: dict,
+def _evaluate_corpus_scene(
+    task: Tuple[Pack, PackScene],
+    *,
+    root: Path,
     baseline: str,
-    out_dir: Path,
-    update_goldens: bool = False,
-    run_scene: Callable[[Path], Mapping[str, Any]] | None = None,
-) -> dict:
-    root = Path(parity_root).expanduser().resolve()
-    out = Path(out_dir).expanduser().resolve()
-    out.mkdir(parents=True, exist_ok=True)
-
-    selected = select_scenes(root, selector)
-    rows: List[Dict[str, Any]] = []
-    updates: List[Dict[str, Any]] = []
-
-    for pack, scene in selected:
-        scene_path = (pack.pack_dir / scene.path).resolve()
-        expected_path = _scene_expected_path(root, pack, scene, baseline)
-
-        if run_scene is not None:
-            actual = dict(run_scene(scene_path))
-        else:
-            actual = _default_run_scene(scene_path, pack, scene)
+    out: Path,
+    update_goldens: bool,
+    run_scene: Callable[[Path], Mapping[str, Any]] | None,
+) -> Tuple[bool, Dict[str, Any]]:
+    pack, scene = task
+    update: Dict[str, Any] | None = None
+    scene_path = (pack.pack_dir / scene.path).resolve()
+    expected_path = _scene_expected_path(root, pack, scene, baseline)
+
+    if run_scene is not None:
+        actual = dict(run_scene(scene_path))
+    else:
+        actual = _default_run_scene(scene_path, pack, scene)
+
+    if expected_path.exists() and not (update_goldens and str(baseline) == "luxera"):
+        expected_payload = load_expected_file(expected_path)
+        comparison = compare_expected(
+            actual,
+            expected_payload,
+            scene_tags=list(scene.tags),
+            expected_root=expected_path.parent,
+        )
+        status = "PASS" if comparison.passed else "FAIL"
+        if not comparison.passed:
+            _write_failure_bundle(out, scene.id, comparison, actual, expected_payload)
+    else:
+        if update_goldens and str(baseline) == "luxera":
+            expected_path.parent.mkdir(parents=True, exist_ok=True)
+            old_hash = _sha256_file(expected_path) if expected_path.exists() else None
+            to_write = _expected_from_actual(actual, scene, baseline)
+            expected_path.write_text(json.dumps(to_write, indent=2, sort_keys=True), encoding="utf-8")
+            new_hash = _sha256_file(expected_path)
+            update = {
+                "pack_id": pack.id,
+                "scene_id": scene.id,
+                "expected_path": str(expected_path),
+                "old_hash": old_hash,
+                "new_hash": new_hash,
+            }
 
-        if expected_path.exists() and not (update_goldens and str(baseline) == "luxera"):
             expected_payload = load_expected_file(expected_path)
             comparison = compare_expected(
                 actual,
@@ -256,135 +282,209 @@ def run_corpus(
             if not comparison.passed:
                 _write_failure_bundle(out, scene.id, comparison, actual, expected_payload)
         else:
-            if update_goldens and str(baseline) == "luxera":
-                expected_path.parent.mkdir(parents=True, exist_ok=True)
-                old_hash = _sha256_file(expected_path) if expected_path.exists() else None
-                to_write = _expected_from_actual(actual, scene, baseline)
-                expected_path.write_text(json.dumps(to_write, indent=2, sort_keys=True), encoding="utf-8")
-                new_hash = _sha256_file(expected_path)
-                updates.append(
+            status = "FAIL"
+            comparison = ParityComparison(passed=False, checked_metrics=0, mismatches=[])
+            missing_expected = {
+                "schema_version": "parity_expected_v2",
+                "scene_id": scene.id,
+                "baseline": baseline,
+                "baseline_version": "v1",
+                "results": {},
+                "tags": list(scene.tags),
+            }
+            diff = {
+                "passed": False,
+                "checked_metrics": 0,
+                "mismatches": [
                     {
-                        "pack_id": pack.id,
-                        "scene_id": scene.id,
-                        "expected_path": str(expected_path),
-                        "old_hash": old_hash,
-                        "new_hash": new_hash,
+                        "path": "expected_file",
+                        "reason": "missing_expected_file",
+                        "expected": str(expected_path),
+                        "actual": None,
+                        "abs_tol": None,
+                        "rel_tol": None,
                     }
-                )
-
-                expected_payload = load_expected_file(expected_path)
-                comparison = compare_expected(
-                    actual,
-                    expected_payload,
-                    scene_tags=list(scene.tags),
-                    expected_root=expected_path.parent,
-                )
-                status = "PASS" if comparison.passed else "FAIL"
-                if not comparison.passed:
-                    _write_failure_bundle(out, scene.id, comparison, actual, expected_payload)
-            else:
-                status = "FAIL"
-                comparison = ParityComparison(passed=False, checked_metrics=0, mismatches=[])
-                missing_expected = {
-                    "schema_version": "parity_expected_v2",
-                    "scene_id": scene.id,
-                    "baseline": baseline,
-                    "baseline_version": "v1",
-                    "results": {},
-                    "tags": list(scene.tags),
-                }
-                diff = {
-                    "passed": False,
-                    "checked_metrics": 0,
-                    "mismatches": [
-                        {
-                            "path": "expected_file",
-                            "reason": "missing_expected_file",
-                            "expected": str(expected_path),
-                            "actual": None,
-                            "abs_tol": None,
-                            "rel_tol": None,
-                        }
-                    ],
-                }
-                dst = out / "failures" / scene.id
-                dst.mkdir(parents=True, exist_ok=True)
-                (dst / "diff.json").write_text(json.dumps(diff, indent=2, sort_keys=True), encoding="utf-8")
-                (dst / "actual.json").write_text(json.dumps(actual, indent=2, sort_keys=True), encoding="utf-8")
-                (dst / "expected.json").write_text(json.dumps(missing_expected, indent=2, sort_keys=True), encoding="utf-8")
-
-        invariance_failures = 0
-        invariance_mismatches: List[Dict[str, Any]] = []
-        invariance_cfg = pack.global_config.get("invariance")
-        do_invariance = False
-        transforms = ("translate_large", "rotate_z_90", "unit_mm")
-        scalar_abs_tol = 1e-4
-        scalar_rel_tol = 1e-5
-        array_thr: Dict[str, float] = {"max_abs": 1e-3, "rmse": 1e-4, "p95_abs": 1e-3}
-        if isinstance(invariance_cfg, bool):
-            do_invariance = invariance_cfg
-        elif isinstance(invariance_cfg, Mapping):
-            do_invariance = bool(invariance_cfg.get("enabled", True))
-            trs = invariance_cfg.get("transforms")
-            if isinstance(trs, list) and trs:
-                transforms = tuple(str(x) for x in trs if str(x).strip())
-            if invariance_cfg.get("scalar_abs_tol") is not None:
-                scalar_abs_tol = float(invariance_cfg.get("scalar_abs_tol"))
-            if invariance_cfg.get("scalar_rel_tol") is not None:
-                scalar_rel_tol = float(invariance_cfg.get("scalar_rel_tol"))
-            ath = invariance_cfg.get("array_thresholds")
-            if isinstance(ath, Mapping):
-                for k, v in ath.items():
-                    try:
-                        array_thr[str(k)] = float(v)
-                    except Exception:
-                        pass
-
-        if do_invariance:
-            inv_out = out / "invariance" / pack.id / scene.id
-            inv_out.mkdir(parents=True, exist_ok=True)
-            scene_job_ids = list(pack.engines)
-            inv = run_invariance_for_scene(
-                scene_path,
-                job_ids=scene_job_ids,
-                out_dir=inv_out,
-                transforms=transforms,
-                scalar_abs_tol=scalar_abs_tol,
-                scalar_rel_tol=scalar_rel_tol,
-                array_thresholds=array_thr,
-            )
-            invariance_failures = len(inv.mismatches)
-            invariance_mismatches = [
-                {
-                    "transform": m.transform,
-                    "metric": m.metric,
-                    "baseline": m.baseline,
-                    "variant": m.variant,
-                    "abs_error": m.abs_error,
-                    "rel_error": m.rel_error,
-                    "abs_tol": m.abs_tol,
-                    "rel_tol": m.rel_tol,
-                    "reason": m.reason,
-                }
-                for m in inv.mismatches
-            ]
-            (inv_out / "details.json").write_text(json.dumps(inv.details, indent=2, sort_keys=True), encoding="utf-8")
-            if invariance_failures > 0:
-                status = "FAIL"
-
-        rows.append(
+                ],
+            }
+            dst = out / "failures" / scene.id
+            dst.mkdir(parents=True, exist_ok=True)
+            (dst / "diff.json").write_text(json.dumps(diff, indent=2, sort_keys=True), encoding="utf-8")
+            (dst / "actual.json").write_text(json.dumps(actual, indent=2, sort_keys=True), encoding="utf-8")
+            (dst / "expected.json").write_text(json.dumps(missing_expected, indent=2, sort_keys=True), encoding="utf-8")
+
+    invariance_failures = 0
+    invariance_mismatches: List[Dict[str, Any]] = []
+    invariance_cfg = pack.global_config.get("invariance")
+    do_invariance = False
+    transforms = ("translate_large", "rotate_z_90", "unit_mm")
+    scalar_abs_tol = 1e-4
+    scalar_rel_tol = 1e-5
+    array_thr: Dict[str, float] = {"max_abs": 1e-3, "rmse": 1e-4, "p95_abs": 1e-3}
+    if isinstance(invariance_cfg, bool):
+        do_invariance = invariance_cfg
+    elif isinstance(invariance_cfg, Mapping):
+        do_invariance = bool(invariance_cfg.get("enabled", True))
+        trs = invariance_cfg.get("transforms")
+        if isinstance(trs, list) and trs:
+            transforms = tuple(str(x) for x in trs if str(x).strip())
+        if invariance_cfg.get("scalar_abs_tol") is not None:
+            scalar_abs_tol = float(invariance_cfg.get("scalar_abs_tol"))
+        if invariance_cfg.get("scalar_rel_tol") is not None:
+            scalar_rel_tol = float(invariance_cfg.get("scalar_rel_tol"))
+        ath = invariance_cfg.get("array_thresholds")
+        if isinstance(ath, Mapping):
+            for k, v in ath.items():
+                try:
+                    array_thr[str(k)] = float(v)
+                except Exception:
+                    pass
+
+    if do_invariance:
+        inv_out = out / "invariance" / pack.id / scene.id
+        inv_out.mkdir(parents=True, exist_ok=True)
+        scene_job_ids = list(pack.engines)
+        inv = run_invariance_for_scene(
+            scene_path,
+            job_ids=scene_job_ids,
+            out_dir=inv_out,
+            transforms=transforms,
+            scalar_abs_tol=scalar_abs_tol,
+            scalar_rel_tol=scalar_rel_tol,
+            array_thresholds=array_thr,
+        )
+        invariance_failures = len(inv.mismatches)
+        invariance_mismatches = [
             {
-                "scene_id": scene.id,
-                "pack_id": pack.id,
-                "baseline": baseline,
-                "expected_path": str(expected_path),
-                "status": status,
-                "checked_metrics": int(getattr(comparison, "checked_metrics", 0)),
-                "mismatches": len(getattr(comparison, "mismatches", [])),
-                "invariance_failures": invariance_failures,
-                "invariance_mismatches": invariance_mismatches,
+                "transform": m.transform,
+                "metric": m.metric,
+                "baseline": m.baseline,
+                "variant": m.variant,
+                "abs_error": m.abs_error,
+                "rel_error": m.rel_error,
+                "abs_tol": m.abs_tol,
+                "rel_tol": m.rel_tol,
+                "reason": m.reason,
             }
+            for m in inv.mismatches
+        ]
+        (inv_out / "details.json").write_text(json.dumps(inv.details, indent=2, sort_keys=True), encoding="utf-8")
+        if invariance_failures > 0:
+            status = "FAIL"
+
+    row = {
+        "scene_id": scene.id,
+        "pack_id": pack.id,
+        "baseline": baseline,
+        "expected_path": str(expected_path),
+        "status": status,
+        "checked_metrics": int(getattr(comparison, "checked_metrics", 0)),
+        "mismatches": len(getattr(comparison, "mismatches", [])),
+        "invariance_failures": invariance_failures,
+        "invariance_mismatches": invariance_mismatches,
+    }
+    return status == "PASS", {"row": row, "update": update}
+
+
+def _run_corpus_scene(
+    task: Tuple[Pack, PackScene],
+    *,
+    root: Path,
+    baseline: str,
+    out: Path,
+    update_goldens: bool,
+    run_scene: Callable[[Path], Mapping[str, Any]] | None,
+) -> Tuple[bool, Dict[str, Any]]:
+    """Run one scene; an exception fails that scene instead of aborting the suite."""
+    try:
+        return _evaluate_corpus_scene(
+            task, root=root, baseline=baseline, out=out, update_goldens=update_goldens, run_scene=run_scene
+        )
+    except Exception as exc:
+        pack, scene = task
+        dst = out / "failures" / scene.id
+        dst.mkdir(parents=True, exist_ok=True)
+        (dst / "error.txt").write_text(traceback.format_exc(), encoding="utf-8")
+        row = {
+            "scene_id": scene.id,
+            "pack_id": pack.id,
+            "baseline": baseline,
+            "expected_path": str(_scene_expected_path(root, pack, scene, baseline)),
+            "status": "FAIL",
+            "checked_metrics": 0,
+            "mismatches": 0,
+            "invariance_failures": 0,
+            "invariance_mismatches": [],
+            "error": f"{type(exc).__name__}: {exc}",
+        }
+        return False, {"row": row, "update": None}
+
+
+def run_corpus(
+    parity_root: Path,
+    selector: dict,
+    baseline: str,
+    out_dir: Path,
+    update_goldens: bool = False,
+    run_scene: Callable[[Path], Mapping[str, Any]] | None = None,
+    *,
+    jobs: int | None = 1,
+    incremental: bool = False,
+) -> dict:
+    """
+    Run the selected parity scenes and write ``summary.json``/``summary.md`` to ``out_dir``.
+
+    Scenes run in a pool of ``jobs`` processes (``None`` or 0: one per CPU). Every
+    passing scene is recorded in ``out_dir/suite_cache.json`` keyed by a hash of its
+    scene file, photometry, expected file, pack settings and the engine version;
+    with ``incremental`` set, unchanged scenes reuse that pass instead of re-running
+    and are flagged ``cached`` in the summary.
+    """
+    root = Path(parity_root).expanduser().resolve()
+    out = Path(out_dir).expanduser().resolve()
+    out.mkdir(parents=True, exist_ok=True)
+
+    selected = select_scenes(root, selector)
+    rows: List[Dict[str, Any]] = []
+    updates: List[Dict[str, Any]] = []
+
+    tasks = list(selected)
+    keys = [f"{pack.id}/{scene.id}" for pack, scene in tasks]
+    fingerprints = [
+        input_fingerprint(
+            [*scene_input_paths((pack.pack_dir / scene.path).resolve()), _scene_expected_path(root, pack, scene, baseline)],
+            {
+                "baseline": str(baseline),
+                "update_goldens": bool(update_goldens),
+                "engines": list(pack.engines),
+                "global": pack.global_config,
+                "tags": list(scene.tags),
+                "run_scene": callable_fingerprint(run_scene),
+            },
         )
+        for pack, scene in tasks
+    ]
+    outcomes = run_suite(
+        tasks,
+        functools.partial(
+            _run_corpus_scene,
+            root=root,
+            baseline=baseline,
+            out=out,
+            update_goldens=update_goldens,
+            run_scene=run_scene,
+        ),
+        keys=keys,
+        fingerprints=fingerprints,
+        cache_path=out / SUITE_CACHE_FILENAME,
+        incremental=incremental,
+        jobs=jobs,
+    )
+    for outcome in outcomes:
+        row = dict(outcome.payload["row"])
+        row["cached"] = outcome.cached
+        rows.append(row)
+        if outcome.payload.get("update") is not None and not outcome.cached:
+            updates.append(dict(outcome.payload["update"]))
 
     passed = sum(1 for r in rows if r["status"] == "PASS")
     failed = len(rows) - passed
@@ -392,6 +492,7 @@ def run_corpus(
         "selected_scenes": len(rows),
         "passed": passed,
         "failed": failed,
+        "cached": sum(1 for r in rows if r["cached"]),
         "baseline": baseline,
         "update_goldens": bool(update_goldens),
         "scenes": rows,
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from luxera.models.photometry import PhotometryHeader
 from luxera.models.angles import AngleGrid
 from luxera.models.candela import CandelaGrid
@@ -64,6 +66,8 @@ class IESMetadata:
 
 
 _NUM_RE = re.compile(r"^[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?$")
+# Anything outside this set (comments, words, nan/inf) sends a block to the per-token path.
+_BULK_REJECT_RE = re.compile(r"[^0-9eE+\-.\s]")
 SUPPORTS_ANGLE_NORMALIZATION = False
 
 
@@ -71,12 +75,61 @@ def _is_number(tok: str) -> bool:
     return bool(_NUM_RE.match(tok))
 
 
+def _bulk_numeric_block(lines: List[str], start_idx0: int, count: int) -> Optional[Tuple[np.ndarray, int, int, int]]:
+    """
+    Locate the lines holding `count` values and convert them in one NumPy call.
+    Returns None whenever the block needs the per-token reader (comments, bad tokens,
+    short block) so that errors are reported by `_tokenise_numeric_block_slow`.
+    """
+    chunks: List[str] = []
+    found = 0
+    start_line_no = end_line_no = 0
+    idx0 = start_idx0
+    n_lines = len(lines)
+    while idx0 < n_lines and found < count:
+        s = lines[idx0]
+        if s and not s.isspace():
+            chunks.append(s)
+            found += len(s.split())
+            if not start_line_no:
+                start_line_no = idx0 + 1
+            end_line_no = idx0 + 1
+        idx0 += 1
+    if found < count or not chunks:
+        return None
+    block = " ".join(chunks)
+    if _BULK_REJECT_RE.search(block):
+        return None
+    try:
+        values = np.array(block.split()[:count], dtype=float)
+    except ValueError:
+        return None
+    return values, start_line_no, end_line_no, idx0
+
+
+def _numeric_block_array(lines: List[str], start_idx0: int, count: int) -> Tuple[np.ndarray, int, int, int]:
+    bulk = _bulk_numeric_block(lines, start_idx0, count)
+    if bulk is not None:
+        return bulk
+    values, start_line_no, end_line_no, next_idx0 = _tokenise_numeric_block_slow(lines, start_idx0, count)
+    return np.asarray(values, dtype=float), start_line_no, end_line_no, next_idx0
+
+
 def _tokenise_numeric_block(lines: List[str], start_idx0: int, count: int) -> Tuple[List[float], int, int, int]:
     """
     Read `count` numeric values starting at lines[start_idx0], continuing across lines.
     Returns: (values, start_line_no, end_line_no, next_idx0)
     where line numbers are 1-indexed inclusive, and next_idx0 is the next unread line index.
     """
+    bulk = _bulk_numeric_block(lines, start_idx0, count)
+    if bulk is None:
+        return _tokenise_numeric_block_slow(lines, start_idx0, count)
+    values, start_line_no, end_line_no, next_idx0 = bulk
+    return values.tolist(), start_line_no, end_line_no, next_idx0
+
+
+def _tokenise_numeric_block_slow(lines: List[str], start_idx0: int, count: int) -> Tuple[List[float], int, int, int]:
+    """Per-token reader with precise error locations; see `_tokenise_numeric_block`."""
     values: List[float] = []
     start_line_no: Optional[int] = None
     end_line_no: Optional[int] = None
@@ -251,24 +304,19 @@ def _parse_candela_table(
     V = len(angles.vertical_deg)
     total = H * V
 
-    flat, start_ln, end_ln, next_idx0 = _tokenise_numeric_block(lines, start_idx0, total)
+    flat, start_ln, end_ln, next_idx0 = _numeric_block_array(lines, start_idx0, total)
 
     # reshape: first V entries -> row 0 (horizontal angle 0), next V -> row 1, etc.
-    values_cd: List[List[float]] = []
-    for i in range(H):
-        row = flat[i * V : (i + 1) * V]
-        values_cd.append(row)
-
-    # scaled
-    m = ph.candela_multiplier
-    values_cd_scaled: List[List[float]] = [[m * x for x in row] for row in values_cd]
+    table = flat.reshape(H, V)
+    scaled = table * ph.candela_multiplier
+    values_cd: List[List[float]] = table.tolist()
+    values_cd_scaled: List[List[float]] = scaled.tolist()
 
     # stats/flags
-    all_vals = [x for row in values_cd_scaled for x in row]
-    has_nan_or_inf = any((math.isnan(x) or math.isinf(x)) for x in all_vals)
-    has_negative = any(x < 0 for x in all_vals)
-    min_cd = min(all_vals) if all_vals else 0.0
-    max_cd = max(all_vals) if all_vals else 0.0
+    has_nan_or_inf = bool(not np.all(np.isfinite(scaled)))
+    has_negative = bool(np.any(scaled < 0))
+    min_cd = float(np.min(scaled)) if scaled.size else 0.0
+    max_cd = float(np.max(scaled)) if scaled.size else 0.0
 
     return CandelaGrid(
         values_cd=values_cd,
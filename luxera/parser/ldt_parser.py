@@ -45,6 +45,8 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Literal
 import math
 
+import numpy as np
+
 
 @dataclass
 class LDTParseError(Exception):
@@ -159,6 +161,63 @@ def _get_line(lines: List[str], idx: int) -> str:
     return lines[idx].strip()
 
 
+def _bulk_floats(tokens: List[str]) -> Optional[np.ndarray]:
+    """Convert tokens in one NumPy call; None means fall back to per-value parsing."""
+    try:
+        return np.array([t.replace(',', '.') for t in tokens], dtype=float)
+    except ValueError:
+        return None
+
+
+def _read_line_values(lines: List[str], idx: int, count: int, label: str, field: str) -> Tuple[List[float], int]:
+    """Read `count` single-value lines starting at `idx`."""
+    if 0 <= count and idx + count <= len(lines):
+        bulk = _bulk_floats([lines[i].strip() for i in range(idx, idx + count)])
+        if bulk is not None:
+            return bulk.tolist(), idx + count
+    values: List[float] = []
+    for i in range(count):
+        if idx >= len(lines):
+            raise LDTParseError(f"Unexpected end of file reading {label} {i + 1}")
+        values.append(_safe_float(_get_line(lines, idx), idx + 1, f"{field}_{i}"))
+        idx += 1
+    return values, idx
+
+
+def _read_candela_values(lines: List[str], idx: int, total_values: int) -> Tuple[np.ndarray, int]:
+    """Read `total_values` whitespace/comma separated values spanning any number of lines."""
+    start = idx
+    tokens: List[str] = []
+    while len(tokens) < total_values and idx < len(lines):
+        line = lines[idx].strip()
+        if line:
+            tokens.extend(line.replace(',', ' ').split())
+        idx += 1
+    if 0 <= total_values <= len(tokens):
+        bulk = _bulk_floats(tokens[:total_values])
+        if bulk is not None:
+            return bulk, idx
+
+    idx = start
+    flat_values: List[float] = []
+    while len(flat_values) < total_values and idx < len(lines):
+        line = _get_line(lines, idx)
+        if line:
+            # Handle space or comma separated values on same line
+            parts = line.replace(',', ' ').split()
+            for p in parts:
+                if len(flat_values) >= total_values:
+                    break
+                flat_values.append(_safe_float(p, idx + 1, "candela"))
+        idx += 1
+
+    if len(flat_values) != total_values:
+        raise LDTParseError(
+            f"Expected {total_values} candela values, got {len(flat_values)}"
+        )
+    return np.asarray(flat_values, dtype=float), idx
+
+
 def parse_ldt_text(text: str) -> ParsedLDT:
     """
     Parse EULUMDAT (.ldt) text content.
@@ -267,57 +326,26 @@ def parse_ldt_text(text: str) -> ParsedLDT:
         idx += 1
     
     # C-plane angles (num_c_planes values)
-    c_planes: List[float] = []
-    for i in range(num_c_planes):
-        if idx >= len(lines):
-            raise LDTParseError(f"Unexpected end of file reading C-plane angle {i + 1}")
-        c_planes.append(_safe_float(_get_line(lines, idx), idx + 1, f"c_plane_{i}"))
-        idx += 1
+    c_planes, idx = _read_line_values(lines, idx, num_c_planes, "C-plane angle", "c_plane")
     
     # G angles (num_g_angles values)
-    g_angles: List[float] = []
-    for i in range(num_g_angles):
-        if idx >= len(lines):
-            raise LDTParseError(f"Unexpected end of file reading G angle {i + 1}")
-        g_angles.append(_safe_float(_get_line(lines, idx), idx + 1, f"g_angle_{i}"))
-        idx += 1
+    g_angles, idx = _read_line_values(lines, idx, num_g_angles, "G angle", "g_angle")
     
     angles = LDTAngles(c_planes_deg=c_planes, g_angles_deg=g_angles)
     
     # Candela values: num_c_planes × num_g_angles values
     # Stored as num_c_planes blocks of num_g_angles values each
     total_values = num_c_planes * num_g_angles
-    flat_values: List[float] = []
-    
-    while len(flat_values) < total_values and idx < len(lines):
-        line = _get_line(lines, idx)
-        if line:
-            # Handle space or comma separated values on same line
-            parts = line.replace(',', ' ').split()
-            for p in parts:
-                if len(flat_values) >= total_values:
-                    break
-                flat_values.append(_safe_float(p, idx + 1, "candela"))
-        idx += 1
-    
-    if len(flat_values) != total_values:
-        raise LDTParseError(
-            f"Expected {total_values} candela values, got {len(flat_values)}"
-        )
-    
-    # Reshape into [C][G] matrix
-    values_cd: List[List[float]] = []
-    for c in range(num_c_planes):
-        row = flat_values[c * num_g_angles : (c + 1) * num_g_angles]
-        values_cd.append(row)
+    flat, idx = _read_candela_values(lines, idx, total_values)
     
-    # Apply conversion factor
-    cf = conversion_factor
-    values_cd_scaled = [[cf * v for v in row] for row in values_cd]
+    # Reshape into [C][G] matrix and apply conversion factor
+    table = flat.reshape(num_c_planes, num_g_angles)
+    scaled = table * conversion_factor
+    values_cd: List[List[float]] = table.tolist()
+    values_cd_scaled: List[List[float]] = scaled.tolist()
     
-    all_scaled = [v for row in values_cd_scaled for v in row]
-    min_cd = min(all_scaled) if all_scaled else 0.0
-    max_cd = max(all_scaled) if all_scaled else 0.0
+    min_cd = float(np.min(scaled)) if scaled.size else 0.0
+    max_cd = float(np.max(scaled)) if scaled.size else 0.0
     
     candela = LDTCandela(
         values_cd=values_cd,
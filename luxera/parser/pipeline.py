@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
+from luxera.cache.parse_cache import parse_photometry_text_cached
+
 from luxera.derived.metrics import compute_derived_metrics
 from luxera.models.derived import DerivedMetrics
 from luxera.models.validation import ValidationReport
-from luxera.parser.ies_parser import ParsedIES, parse_ies_text
+from luxera.parser.ies_parser import ParsedIES
 from luxera.validation.defaults import default_validator
 
 
@@ -17,8 +20,8 @@ class LuxeraViewResult:
     report: Optional[ValidationReport]
 
 
-def parse_and_analyse_ies(text: str) -> LuxeraViewResult:
-    doc = parse_ies_text(text)
+def parse_and_analyse_ies(text: str, cache_dir: Optional[str | Path] = None) -> LuxeraViewResult:
+    doc = parse_photometry_text_cached(text, "IES", cache_dir=cache_dir)
 
     derived = None
     report = None
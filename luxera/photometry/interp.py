@@ -136,3 +136,89 @@ def sample_lut_intensity_cd(lut: PhotometryLUT, direction_luminaire_frame: Vecto
     v0 = c00 * (1.0 - g_t) + c01 * g_t
     v1 = c10 * (1.0 - g_t) + c11 * g_t
     return float(v0 * (1.0 - c_t) + v1 * c_t)
+
+
+def _symmetry_array(c: np.ndarray, c_angles: np.ndarray, symmetry: str) -> np.ndarray:
+    if len(c_angles) == 0:
+        return c
+    c = np.mod(c, 360.0)
+    sym = str(symmetry or "UNKNOWN").upper()
+    if sym == "FULL":
+        return np.zeros_like(c)
+    if sym not in {"QUADRANT", "BILATERAL"}:
+        if len(c_angles) == 1:
+            return np.zeros_like(c)
+        span = float(c_angles[-1] - c_angles[0])
+        if span <= 90.0 + 1e-9:
+            sym = "QUADRANT"
+        elif span <= 180.0 + 1e-9:
+            sym = "BILATERAL"
+        else:
+            return c
+    if sym == "QUADRANT":
+        return np.where(c <= 90.0, c, np.where(c <= 180.0, 180.0 - c, np.where(c <= 270.0, c - 180.0, 360.0 - c)))
+    return np.where(c <= 180.0, c, 360.0 - c)
+
+
+def _bracket_array(x: np.ndarray, arr: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorised ``_find_bracket`` for values already clamped to ``[arr[0], arr[-1]]``."""
+    n = len(arr)
+    if n < 2:
+        zeros = np.zeros(x.shape, dtype=np.int64)
+        return zeros, zeros, np.zeros(x.shape, dtype=float)
+    lo = np.clip(np.searchsorted(arr, x, side="left") - 1, 0, n - 2)
+    hi = lo + 1
+    d = arr[hi] - arr[lo]
+    t = np.divide(x - arr[lo], d, out=np.zeros(x.shape, dtype=float), where=d != 0)
+    at_lo = x <= arr[0]
+    at_hi = x >= arr[-1]
+    lo = np.where(at_hi, n - 1, lo)
+    hi = np.where(at_lo, 0, np.where(at_hi, n - 1, hi))
+    t = np.where(at_lo | at_hi, 0.0, t)
+    return lo, hi, t
+
+
+def sample_lut_intensity_cd_array(lut: PhotometryLUT, directions_luminaire_frame: np.ndarray) -> np.ndarray:
+    """
+    ``sample_lut_intensity_cd`` over ``(K, 3)`` luminaire-frame directions.
+
+    Type C tables are interpolated with array operations; other systems fall back
+    to the scalar sampler per direction.
+    """
+    dirs = np.asarray(directions_luminaire_frame, dtype=float).reshape(-1, 3)
+    if lut.system != "C":
+        return np.array([sample_lut_intensity_cd(lut, Vector3.from_array(d)) for d in dirs], dtype=float)
+    c = np.asarray(lut.angles_h_deg, dtype=float)
+    g = np.asarray(lut.angles_v_deg, dtype=float)
+    length = np.sqrt(np.sum(dirs * dirs, axis=1))
+    unit = np.divide(dirs, length[:, None], out=np.zeros_like(dirs), where=length[:, None] > 0.0)
+    gamma = np.degrees(np.arccos(np.clip(-unit[:, 2], -1.0, 1.0)))
+    c_deg = np.mod(np.degrees(np.arctan2(unit[:, 1], unit[:, 0])) + 360.0, 360.0)
+    c_deg = _symmetry_array(c_deg, c, str(getattr(lut, "symmetry", "UNKNOWN")))
+
+    can_use_cyclic = (
+        c.size >= 2
+        and float(c[0]) >= -1e-9
+        and float(c[-1]) <= 360.0 + 1e-9
+        and (float(c[-1]) - float(c[0])) < 360.0 - 1e-9
+    )
+    if can_use_cyclic:
+        lo0 = float(c[0])
+        x = np.mod(c_deg - lo0, 360.0) + lo0
+        c_lo, c_hi, c_t = _bracket_array(np.minimum(x, float(c[-1])), c)
+        seam = x > float(c[-1])
+        denom = (lo0 + 360.0) - float(c[-1])
+        seam_t = (x - float(c[-1])) / denom if denom != 0.0 else np.zeros_like(x)
+        c_lo = np.where(seam, c.size - 1, c_lo)
+        c_hi = np.where(seam, 0, c_hi)
+        c_t = np.where(seam, seam_t, c_t)
+    else:
+        if c.size >= 2 and c[0] < 0 < c[-1]:
+            c_deg = np.where(c_deg > 180.0, c_deg - 360.0, c_deg)
+        c_lo, c_hi, c_t = _bracket_array(np.clip(c_deg, float(c[0]), float(c[-1])), c)
+
+    g_lo, g_hi, g_t = _bracket_array(np.clip(gamma, float(g[0]), float(g[-1])), g)
+    table = np.asarray(lut.intensity_cd, dtype=float)
+    v0 = table[c_lo, g_lo] * (1.0 - g_t) + table[c_lo, g_hi] * g_t
+    v1 = table[c_hi, g_lo] * (1.0 - g_t) + table[c_hi, g_hi] * g_t
+    return v0 * (1.0 - c_t) + v1 * c_t
@@ -6,9 +6,8 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+from luxera.cache.parse_cache import parse_photometry_text_cached
 from luxera.core.hashing import sha256_file
-from luxera.parser.ies_parser import parse_ies_text
-from luxera.parser.ldt_parser import parse_ldt_text
 from luxera.photometry.model import photometry_from_parsed_ies, photometry_from_parsed_ldt
 
 
@@ -95,14 +94,14 @@ def _build_result(
     )
 
 
-def verify_photometry_file(path: str, fmt: Optional[str] = None) -> PhotometryVerifyResult:
+def verify_photometry_file(path: str, fmt: Optional[str] = None, cache_dir: Optional[str | Path] = None) -> PhotometryVerifyResult:
     p = Path(path).expanduser().resolve()
     if not p.exists() or not p.is_file():
         raise FileNotFoundError(f"Photometry file not found: {p}")
 
     format_inferred = (fmt or p.suffix.replace(".", "")).upper()
     if format_inferred == "IES":
-        doc = parse_ies_text(p.read_text(encoding="utf-8", errors="replace"), source_path=p)
+        doc = parse_photometry_text_cached(p.read_text(encoding="utf-8", errors="replace"), "IES", source_path=p, cache_dir=cache_dir)
         phot = photometry_from_parsed_ies(doc)
         tilt_source = str(doc.tilt_mode or "NONE")
         tilt_status = "ok"
@@ -127,7 +126,7 @@ def verify_photometry_file(path: str, fmt: Optional[str] = None) -> PhotometryVe
         )
 
     if format_inferred == "LDT":
-        doc = parse_ldt_text(p.read_text(encoding="utf-8", errors="replace"))
+        doc = parse_photometry_text_cached(p.read_text(encoding="utf-8", errors="replace"), "LDT", cache_dir=cache_dir)
         phot = photometry_from_parsed_ldt(doc)
         return _build_result(
             p,
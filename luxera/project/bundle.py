@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+import sqlite3
+import weakref
+import zlib
+from copy import deepcopy
+from dataclasses import asdict, fields, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from luxera.project.schema import Project
+
+
+BUNDLE_SUFFIX = ".luxb"
+BUNDLE_FORMAT_VERSION = 1
+_SQLITE_MAGIC = b"SQLite format 3\x00"
+
+# Top-level project keys stored in each section. Everything not listed here
+# lives in "core" (name, jobs, grids, profiles, ...), which is small and is
+# what most read-only commands need.
+SECTION_KEYS: Dict[str, Tuple[str, ...]] = {
+    "geometry": ("geometry", "param"),
+    "luminaires": ("photometry_assets", "luminaire_families", "luminaires"),
+    "history": ("agent_history", "assistant_undo_stack", "assistant_redo_stack"),
+    "results": ("results",),
+}
+SECTIONS: Tuple[str, ...] = ("core",) + tuple(SECTION_KEYS)
+
+_BLOB_REF = "embedded_blob"
+
+
+class ProjectBundleError(ValueError):
+    pass
+
+
+def is_project_bundle(path: Path) -> bool:
+    try:
+        with Path(path).open("rb") as fh:
+            return fh.read(len(_SQLITE_MAGIC)) == _SQLITE_MAGIC
+    except OSError:
+        return False
+
+
+def _section_fields(name: str) -> Tuple[str, ...]:
+    if name != "core":
+        return SECTION_KEYS[name]
+    claimed = {k for keys in SECTION_KEYS.values() for k in keys}
+    return tuple(f.name for f in fields(Project) if f.name not in claimed and f.name != "loaded_sections")
+
+
+def _plain(value: Any) -> Any:
+    """``asdict`` semantics for a single field value."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (list, tuple)):
+        return type(value)(_plain(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    return deepcopy(value)
+
+
+def _section_payload(project: Project, name: str) -> Dict[str, Any]:
+    """The slice of ``project.to_dict()`` stored in section ``name``."""
+    return {k: _plain(getattr(project, k)) for k in _section_fields(name)}
+
+
+# id(project) -> (weak reference, {(bundle path, section): (digest, field copies)})
+# for the sections last written or verified by save(). A section whose fields
+# still equal those copies is skipped without being serialised or hashed.
+_SavedSections = Dict[Tuple[str, str], Tuple[str, Tuple[Any, ...]]]
+_SAVED: Dict[int, Tuple["weakref.ref[Project]", _SavedSections]] = {}
+
+
+def _saved_sections(project: Project) -> _SavedSections:
+    key = id(project)
+    held = _SAVED.get(key)
+    if held is None or held[0]() is not project:
+        held = (weakref.ref(project, lambda _ref: _SAVED.pop(key, None)), {})
+        _SAVED[key] = held
+    return held[1]
+
+
+def _encode(payload: Dict[str, Any]) -> Tuple[bytes, str]:
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return zlib.compress(raw, 6), hashlib.sha256(raw).hexdigest()
+
+
+def _extract_blobs(section: Dict[str, Any]) -> Dict[str, bytes]:
+    """Move canonical ``embedded_b64`` payloads out of the luminaire section."""
+    blobs: Dict[str, bytes] = {}
+    for asset in section.get("photometry_assets", []):
+        text = asset.get("embedded_b64") if isinstance(asset, dict) else None
+        if not isinstance(text, str) or not text:
+            continue
+        try:
+            raw = base64.b64decode(text, validate=True)
+        except (binascii.Error, ValueError):
+            continue
+        # Only canonical encodings round-trip byte-for-byte; keep others inline.
+        if base64.b64encode(raw).decode("ascii") != text:
+            continue
+        digest = hashlib.sha256(raw).hexdigest()
+        blobs[digest] = raw
+        asset["embedded_b64"] = None
+        asset[_BLOB_REF] = digest
+    return blobs
+
+
+class ProjectBundle:
+    """
+    SQLite-backed project container with separately stored sections.
+
+    Sections are zlib-compressed compact JSON rows keyed by a content digest,
+    so saving rewrites only the sections whose content changed. Embedded
+    photometry is stored once per content hash in a ``blobs`` table instead of
+    as base64 text. Only the sections a caller asks for are read.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path).expanduser().resolve()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and self.path.stat().st_size > 0 and not is_project_bundle(self.path):
+            raise ProjectBundleError(f"Not a Luxera project bundle: {self.path}")
+        self._conn = sqlite3.connect(str(self.path))
+        self._init_db()
+        self.loaded_sections: set[str] = set()
+
+    def _init_db(self) -> None:
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS sections (
+                name TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                data BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS blobs (
+                digest TEXT PRIMARY KEY,
+                data BLOB NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ProjectBundle":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def schema_version(self) -> Optional[int]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        return int(row[0]) if row else None
+
+    def section_digests(self) -> Dict[str, str]:
+        return {str(name): str(digest) for name, digest in self._conn.execute("SELECT name, digest FROM sections")}
+
+    def read_section(self, name: str) -> Dict[str, Any]:
+        if name not in SECTIONS:
+            raise ProjectBundleError(f"Unknown bundle section: {name}")
+        row = self._conn.execute("SELECT data FROM sections WHERE name = ?", (name,)).fetchone()
+        payload = json.loads(zlib.decompress(row[0]).decode("utf-8")) if row else {}
+        if name == "luminaires":
+            self._inline_blobs(payload)
+        return payload
+
+    def read_blob(self, digest: str) -> bytes:
+        row = self._conn.execute("SELECT data FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        if row is None:
+            raise ProjectBundleError(f"Missing photometry blob {digest} in {self.path}")
+        return zlib.decompress(row[0])
+
+    def _inline_blobs(self, section: Dict[str, Any]) -> None:
+        for asset in section.get("photometry_assets", []):
+            digest = asset.pop(_BLOB_REF, None) if isinstance(asset, dict) else None
+            if digest:
+                asset["embedded_b64"] = base64.b64encode(self.read_blob(str(digest))).decode("ascii")
+
+    def load_project(self, sections: Optional[Iterable[str]] = None) -> Project:
+        """
+        Build a ``Project`` from the requested sections (all by default).
+
+        Sections that are not requested keep their dataclass defaults and the
+        project records what it holds in ``loaded_sections``; saving it writes
+        back only those sections.
+        """
+        from luxera.project.io import _project_from_dict  # type: ignore[attr-defined]
+        from luxera.project.migrations import migrate_project
+
+        wanted = set(SECTIONS if sections is None else sections) | {"core"}
+        unknown = wanted - set(SECTIONS)
+        if unknown:
+            raise ProjectBundleError(f"Unknown bundle sections: {sorted(unknown)}")
+        stored = self.schema_version
+        if stored is not None and stored != Project.schema_version:
+            # Migrations operate on whole documents.
+            wanted = set(SECTIONS)
+        data: Dict[str, Any] = {}
+        for name in SECTIONS:
+            if name in wanted:
+                data.update(self.read_section(name))
+        if stored is not None and stored != Project.schema_version:
+            data = migrate_project(data)
+        project = _project_from_dict(data)
+        project.root_dir = str(self.path.parent)
+        self.loaded_sections = wanted
+        if wanted != set(SECTIONS):
+            project.loaded_sections = [name for name in SECTIONS if name in wanted]
+        return project
+
+    def save(self, project: Project, sections: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Write changed sections in one transaction and return their names.
+
+        Sections are serialised one at a time; a section whose fields equal
+        what the previous save of this project object wrote (and whose stored
+        digest is unchanged) is not serialised at all.
+
+        By default only the sections loaded through :meth:`load_project` are
+        written (all of them for a fresh bundle), so a partially loaded
+        project never clobbers sections it did not read. Writing a section a
+        partially loaded project does not hold, or saving such a project into
+        a bundle that lacks the other sections, raises ``ProjectBundleError``.
+        """
+        partial = project.loaded_sections
+        if sections is None:
+            sections = partial or self.loaded_sections or SECTIONS
+        targets = [name for name in SECTIONS if name in set(sections)]
+        existing = self.section_digests()
+        if partial is not None:
+            unloaded = [name for name in targets if name not in partial]
+            if unloaded:
+                raise ProjectBundleError(f"Cannot save sections {unloaded}: the project was loaded with {partial} only")
+            missing = [name for name in SECTIONS if name not in partial and name not in existing]
+            if missing:
+                raise ProjectBundleError(f"Cannot save a partially loaded project into {self.path}: sections {missing} would be lost")
+        saved = _saved_sections(project)
+        written: List[str] = []
+        with self._conn:
+            for name in targets:
+                key = (str(self.path), name)
+                values = tuple(getattr(project, k) for k in _section_fields(name))
+                prior = saved.get(key)
+                if prior is not None and prior[0] == existing.get(name) and prior[1] == values:
+                    continue
+                payload = _section_payload(project, name)
+                blobs = _extract_blobs(payload) if name == "luminaires" else {}
+                data, digest = _encode(payload)
+                saved[key] = (digest, deepcopy(values))
+                if existing.get(name) == digest:
+                    continue
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO blobs (digest, data) VALUES (?, ?)",
+                    [(d, zlib.compress(raw, 6)) for d, raw in blobs.items()],
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sections (name, digest, data) VALUES (?, ?, ?)",
+                    (name, digest, data),
+                )
+                written.append(name)
+            if "luminaires" in written:
+                self._drop_unreferenced_blobs()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("format_version", str(BUNDLE_FORMAT_VERSION)),
+                    ("schema_version", str(int(project.schema_version))),
+                ],
+            )
+        self.loaded_sections = set(SECTIONS) if partial is None else set(partial)
+        return written
+
+    def _drop_unreferenced_blobs(self) -> None:
+        row = self._conn.execute("SELECT data FROM sections WHERE name = 'luminaires'").fetchone()
+        payload = json.loads(zlib.decompress(row[0]).decode("utf-8")) if row else {}
+        keep = {
+            str(a[_BLOB_REF])
+            for a in payload.get("photometry_assets", [])
+            if isinstance(a, dict) and a.get(_BLOB_REF)
+        }
+        stale = [d for (d,) in self._conn.execute("SELECT digest FROM blobs") if d not in keep]
+        self._conn.executemany("DELETE FROM blobs WHERE digest = ?", [(d,) for d in stale])
+
+
+def save_project_bundle(project: Project, path: Path) -> List[str]:
+    """Save every section, or only the loaded ones for a partially loaded project."""
+    with ProjectBundle(path) as bundle:
+        return bundle.save(project, sections=project.loaded_sections or SECTIONS)
+
+
+def load_project_bundle(path: Path, sections: Optional[Iterable[str]] = None) -> Project:
+    path = Path(path).expanduser().resolve()
+    if not is_project_bundle(path):
+        raise ProjectBundleError(f"Not a Luxera project bundle: {path}")
+    with ProjectBundle(path) as bundle:
+        return bundle.load_project(sections=sections)
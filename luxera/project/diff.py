@@ -1,23 +1,38 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional
 
 from luxera.project.schema import Project
 
 
 DiffOpKind = Literal[
+    "project_meta",
     "geometry_meta",
     "room",
+    "zone",
+    "no_go_zone",
     "surface",
     "opening",
     "obstruction",
     "level",
+    "coordinate_system",
     "escape_route",
     "luminaire",
     "grid",
+    "workplane",
+    "vertical_plane",
+    "arbitrary_plane",
+    "point_set",
+    "line_grid",
+    "glare_view",
+    "roadway",
+    "roadway_grid",
+    "compliance_profile",
     "job",
+    "result",
     "material",
+    "material_library",
     "asset",
     "family",
     "variant",
@@ -34,6 +49,8 @@ class DiffOp:
     kind: DiffOpKind
     id: str
     payload: Dict[str, Any] = field(default_factory=dict)
+    # Position for "add"; None appends.
+    index: Optional[int] = None
 
 
 @dataclass
@@ -47,8 +64,8 @@ class ProjectDiff:
 
 
 def _apply_op(project: Project, op: DiffOp) -> None:
-    if op.kind == "geometry_meta":
-        current = project.geometry
+    if op.kind in ("project_meta", "geometry_meta"):
+        current = project if op.kind == "project_meta" else project.geometry
         if op.op != "update":
             return
         for k, v in op.payload.items():
@@ -56,7 +73,10 @@ def _apply_op(project: Project, op: DiffOp) -> None:
         return
     collection = _get_collection(project, op.kind)
     if op.op == "add":
-        collection.append(op.payload)
+        if op.index is None:
+            collection.append(op.payload)
+        else:
+            collection.insert(op.index, op.payload)
         return
     if op.op == "remove":
         idx = _find_index(collection, op.id)
@@ -81,6 +101,10 @@ def _get_collection(project: Project, kind: DiffOpKind):
         return [project.geometry]
     if kind == "room":
         return project.geometry.rooms
+    if kind == "zone":
+        return project.geometry.zones
+    if kind == "no_go_zone":
+        return project.geometry.no_go_zones
     if kind == "surface":
         return project.geometry.surfaces
     if kind == "opening":
@@ -89,16 +113,40 @@ def _get_collection(project: Project, kind: DiffOpKind):
         return project.geometry.obstructions
     if kind == "level":
         return project.geometry.levels
+    if kind == "coordinate_system":
+        return project.geometry.coordinate_systems
     if kind == "escape_route":
         return project.escape_routes
     if kind == "luminaire":
         return project.luminaires
     if kind == "grid":
         return project.grids
+    if kind == "workplane":
+        return project.workplanes
+    if kind == "vertical_plane":
+        return project.vertical_planes
+    if kind == "arbitrary_plane":
+        return project.arbitrary_planes
+    if kind == "point_set":
+        return project.point_sets
+    if kind == "line_grid":
+        return project.line_grids
+    if kind == "glare_view":
+        return project.glare_views
+    if kind == "roadway":
+        return project.roadways
+    if kind == "roadway_grid":
+        return project.roadway_grids
+    if kind == "compliance_profile":
+        return project.compliance_profiles
     if kind == "job":
         return project.jobs
+    if kind == "result":
+        return project.results
     if kind == "material":
         return project.materials
+    if kind == "material_library":
+        return project.material_library
     if kind == "asset":
         return project.photometry_assets
     if kind == "family":
@@ -122,4 +170,7 @@ def _find_index(collection, item_id: str):
             return i
         if isinstance(item, dict) and item.get("id") == item_id:
             return i
+        # Job results are keyed by job id.
+        if not hasattr(item, "id") and getattr(item, "job_id", None) == item_id:
+            return i
     return None
@@ -1,60 +1,429 @@
 from __future__ import annotations
 
+import weakref
 from copy import deepcopy
-from dataclasses import asdict
-from typing import Any, Dict
+from dataclasses import asdict, fields, is_dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from luxera.project.schema import Project
+from luxera.project.diff import DiffOp, ProjectDiff, _find_index  # type: ignore[attr-defined]
+from luxera.project.schema import Geometry, Project
 
 
-def push_snapshot(project: Project, label: str = "assistant_change") -> None:
-    snap = asdict(project)
+# Undo entries come in two formats:
+#   * diff entries  {"label", "format": "diff", "changes": [...]}, holding the
+#     before/after state of only the entities a change touched;
+#   * legacy snapshots {"label", **asdict(project)}, written by older versions
+#     and by push_snapshot for the change that is still in progress.
+# At most one snapshot is live at a time: it is compacted into a diff entry as
+# soon as the state after the change is known (next push, undo or compaction).
+DEFAULT_HISTORY_DEPTH = 100
+
+# Diff kind -> (owner, attribute) for id-keyed collections tracked by history.
+_COLLECTIONS: Dict[str, Tuple[str, str]] = {
+    "room": ("geometry", "rooms"),
+    "zone": ("geometry", "zones"),
+    "no_go_zone": ("geometry", "no_go_zones"),
+    "surface": ("geometry", "surfaces"),
+    "opening": ("geometry", "openings"),
+    "obstruction": ("geometry", "obstructions"),
+    "level": ("geometry", "levels"),
+    "coordinate_system": ("geometry", "coordinate_systems"),
+    "material": ("project", "materials"),
+    "material_library": ("project", "material_library"),
+    "asset": ("project", "photometry_assets"),
+    "family": ("project", "luminaire_families"),
+    "luminaire": ("project", "luminaires"),
+    "grid": ("project", "grids"),
+    "workplane": ("project", "workplanes"),
+    "vertical_plane": ("project", "vertical_planes"),
+    "arbitrary_plane": ("project", "arbitrary_planes"),
+    "point_set": ("project", "point_sets"),
+    "line_grid": ("project", "line_grids"),
+    "glare_view": ("project", "glare_views"),
+    "escape_route": ("project", "escape_routes"),
+    "roadway": ("project", "roadways"),
+    "roadway_grid": ("project", "roadway_grids"),
+    "compliance_profile": ("project", "compliance_profiles"),
+    "symbol_2d": ("project", "symbols_2d"),
+    "block_instance": ("project", "block_instances"),
+    "selection_set": ("project", "selection_sets"),
+    "layer": ("project", "layers"),
+    "variant": ("project", "variants"),
+    "job": ("project", "jobs"),
+    "result": ("project", "results"),
+}
+_GEOMETRY_FIELDS = ("length_unit", "scale_to_meters", "source_length_unit", "axis_transform_applied")
+_PROJECT_FIELDS = ("name", "active_variant_id", "asset_bundle_path", "control_groups", "light_scenes", "param")
+# Never part of an undo state.
+_UNTRACKED = ("agent_history", "assistant_undo_stack", "assistant_redo_stack", "loaded_sections")
+
+
+def _is_diff_entry(entry: Dict[str, Any]) -> bool:
+    return entry.get("format") == "diff"
+
+
+def _key_of(kind: str, item: Dict[str, Any]) -> Any:
+    return item.get("job_id") if kind == "result" else item.get("id")
+
+
+def _wrap(owner: str, attr: str, value: Any) -> Dict[str, Any]:
+    return {"geometry": {attr: value}} if owner == "geometry" else {attr: value}
+
+
+def _hydrate_field(owner: str, attr: str, value: Any) -> Any:
+    """Rebuild schema objects for a serialised field through the project loader."""
+    from luxera.project.io import _project_from_dict  # type: ignore[attr-defined]
+
+    if owner == "geometry" and attr in _GEOMETRY_FIELDS:
+        return deepcopy(value)
+    if owner == "project" and attr in ("name", "active_variant_id", "asset_bundle_path"):
+        return value
+    restored = _project_from_dict(_wrap(owner, attr, deepcopy(value)))
+    return getattr(restored.geometry if owner == "geometry" else restored, attr)
+
+
+def _hydrate_item(kind: str, item: Dict[str, Any]) -> Any:
+    owner, attr = _COLLECTIONS[kind]
+    return _hydrate_field(owner, attr, [item])[0]
+
+
+def _field_state(state: Dict[str, Any], owner: str, attr: str) -> Any:
+    return (state.get("geometry", {}) if owner == "geometry" else state).get(attr)
+
+
+def _diff_states(before: Dict[str, Any], after: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Entity-level changes turning serialised state ``before`` into ``after``."""
+    changes: List[Dict[str, Any]] = []
+    for attr in _GEOMETRY_FIELDS:
+        b, a = _field_state(before, "geometry", attr), _field_state(after, "geometry", attr)
+        if b != a:
+            changes.append({"kind": "geometry_meta", "id": attr, "before": b, "after": a})
+    for attr in _PROJECT_FIELDS:
+        b, a = before.get(attr), after.get(attr)
+        if b != a:
+            changes.append({"kind": "project_meta", "id": attr, "before": b, "after": a})
+    for kind, (owner, attr) in _COLLECTIONS.items():
+        b_items = list(_field_state(before, owner, attr) or [])
+        a_items = list(_field_state(after, owner, attr) or [])
+        if b_items != a_items:
+            changes.extend(_diff_collection(kind, owner, attr, b_items, a_items))
+    return changes
+
+
+def _diff_collection(
+    kind: str,
+    owner: str,
+    attr: str,
+    before: List[Dict[str, Any]],
+    after: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    b_keys = [_key_of(kind, x) for x in before]
+    a_keys = [_key_of(kind, x) for x in after]
+    b_set, a_set = set(b_keys), set(a_keys)
+    common_b = [k for k in b_keys if k in a_set]
+    common_a = [k for k in a_keys if k in b_set]
+    if len(b_set) != len(b_keys) or len(a_set) != len(a_keys) or None in b_set or None in a_set or common_b != common_a:
+        # Duplicate/missing ids or a reorder: record the whole field.
+        meta = "geometry_meta" if owner == "geometry" else "project_meta"
+        return [{"kind": meta, "id": attr, "before": before, "after": after}]
+    b_map = dict(zip(b_keys, before))
+    out: List[Dict[str, Any]] = []
+    for i, key in enumerate(b_keys):
+        if key not in a_set:
+            out.append({"kind": kind, "id": key, "index": i, "before": before[i], "after": None})
+    for i, key in enumerate(a_keys):
+        if key not in b_set:
+            out.append({"kind": kind, "id": key, "index": i, "before": None, "after": after[i]})
+        elif b_map[key] != after[i]:
+            out.append({"kind": kind, "id": key, "index": i, "before": b_map[key], "after": after[i]})
+    return out
+
+
+def _changes_to_diff(changes: Iterable[Dict[str, Any]], inverse: bool = False) -> ProjectDiff:
+    """
+    Build the ProjectDiff replaying ``changes`` forwards (or backwards).
+
+    Removals run first, then insertions in ascending target index, then
+    updates; untouched items never move, so this reproduces list order.
+    """
+    removes: List[DiffOp] = []
+    adds: List[Tuple[int, DiffOp]] = []
+    updates: List[DiffOp] = []
+    for ch in changes:
+        kind = str(ch["kind"])
+        src, dst = (ch["after"], ch["before"]) if inverse else (ch["before"], ch["after"])
+        if kind in ("geometry_meta", "project_meta"):
+            owner = "geometry" if kind == "geometry_meta" else "project"
+            field_name = str(ch["id"])
+            updates.append(DiffOp(op="update", kind=kind, id=field_name, payload={field_name: _hydrate_field(owner, field_name, dst)}))  # type: ignore[arg-type]
+            continue
+        if dst is None:
+            removes.append(DiffOp(op="remove", kind=kind, id=str(ch["id"])))  # type: ignore[arg-type]
+        elif src is None:
+            index = int(ch["index"])
+            adds.append((index, DiffOp(op="add", kind=kind, id=str(ch["id"]), payload=_hydrate_item(kind, dst), index=index)))  # type: ignore[arg-type]
+        else:
+            item = _hydrate_item(kind, dst)
+            payload = {k: getattr(item, k) for k, v in dst.items() if src.get(k) != v and hasattr(item, k)}
+            updates.append(DiffOp(op="update", kind=kind, id=str(ch["id"]), payload=payload))  # type: ignore[arg-type]
+    adds.sort(key=lambda x: x[0])
+    return ProjectDiff(ops=removes + [op for _, op in adds] + updates)
+
+
+def _serialise(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, list):
+        return [_serialise(v) for v in value]
+    return deepcopy(value)
+
+
+class _StateCache:
+    """
+    Serialised entities from a project's previous state.
+
+    Keyed by ``id`` of the live object; an entry is reused while the object is
+    the same instance and still equals the copy taken when it was serialised.
+    Dataclass equality is far cheaper than ``asdict``, so taking a state after
+    a small edit only serialises the entities that changed.
+    """
+
+    def __init__(self) -> None:
+        self.items: Dict[int, Tuple[Any, Any, Dict[str, Any]]] = {}
+
+    def serialise(self, value: Any, seen: Dict[int, Tuple[Any, Any, Dict[str, Any]]]) -> Any:
+        if isinstance(value, Geometry):
+            return {f.name: self.serialise(getattr(value, f.name), seen) for f in fields(value)}
+        if isinstance(value, list):
+            return [self.serialise(v, seen) for v in value]
+        if not (is_dataclass(value) and not isinstance(value, type)):
+            return deepcopy(value)
+        entry = self.items.get(id(value))
+        if entry is None or entry[0] is not value or entry[1] != value:
+            entry = (value, deepcopy(value), asdict(value))
+        seen[id(value)] = entry
+        return entry[2]
+
+
+# id(project) -> (weak reference, cache); entries go when the project does.
+_STATE_CACHES: Dict[int, Tuple["weakref.ref[Project]", _StateCache]] = {}
+
+
+def _state_cache(project: Project) -> _StateCache:
+    key = id(project)
+    held = _STATE_CACHES.get(key)
+    if held is None or held[0]() is not project:
+        held = (weakref.ref(project, lambda _ref: _STATE_CACHES.pop(key, None)), _StateCache())
+        _STATE_CACHES[key] = held
+    return held[1]
+
+
+def _state(project: Project) -> Dict[str, Any]:
+    """
+    Serialised undo state of ``project``.
+
+    Entities unchanged since the previous call share their serialised form
+    with it; callers must treat the result as read-only.
+    """
+    cache = _state_cache(project)
+    seen: Dict[int, Tuple[Any, Any, Dict[str, Any]]] = {}
+    out = {f.name: cache.serialise(getattr(project, f.name), seen) for f in fields(project) if f.name not in _UNTRACKED}
+    cache.items = seen
+    return out
+
+
+def _snapshot_to_entry(snap: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    return {"label": snap.get("label", "assistant_change"), "format": "diff", "changes": _diff_states(snap, current)}
+
+
+def _trim(stack: List[Dict[str, Any]], max_depth: int) -> None:
+    if max_depth > 0 and len(stack) > max_depth:
+        del stack[: len(stack) - max_depth]
+
+
+def _compact_top(project: Project, current: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Turn a pending top snapshot into a diff entry; returns the state used."""
+    stack = project.assistant_undo_stack
+    if stack and not _is_diff_entry(stack[-1]):
+        current = _state(project) if current is None else current
+        stack[-1] = _snapshot_to_entry(stack[-1], current)
+    return current
+
+
+def push_snapshot(project: Project, label: str = "assistant_change", max_depth: int = DEFAULT_HISTORY_DEPTH) -> None:
+    """
+    Mark the current state as the undo point for a change about to be made.
+
+    The state is held as a snapshot only until the next history operation,
+    which compacts it into a diff entry of the entities that changed.
+    """
+    snap = dict(_compact_top(project) or _state(project))
     snap["label"] = label
     project.assistant_undo_stack.append(snap)
     project.assistant_redo_stack = []
+    _trim(project.assistant_undo_stack, max_depth)
 
 
-def _restore(project: Project, snap: Dict[str, Any]) -> None:
-    from luxera.project.io import _project_from_dict  # type: ignore[attr-defined]
+def _capture(project: Project, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Any]:
+    """
+    Serialise the state a diff can touch: meta fields by name, collection
+    items by id as ``(index, item)``. A collection whose ids are not unique
+    is captured whole under the key ``(kind, "*")``.
+    """
+    out: Dict[Tuple[str, str], Any] = {}
+    for kind, item_id in keys:
+        if kind in ("geometry_meta", "project_meta"):
+            owner = project.geometry if kind == "geometry_meta" else project
+            out[(kind, item_id)] = _serialise(getattr(owner, item_id, None))
+            continue
+        owner_name, attr = _COLLECTIONS[kind]
+        coll = getattr(project.geometry if owner_name == "geometry" else project, attr)
+        if item_id == "*":
+            out[(kind, item_id)] = [asdict(x) for x in coll]
+            continue
+        idx = _find_index(coll, item_id)
+        out[(kind, item_id)] = None if idx is None else (idx, asdict(coll[idx]))
+    return out
+
+
+def _needs_whole_capture(project: Project, kind: str, ops: List[DiffOp]) -> bool:
+    """True when ids cannot address items uniquely before or after ``ops``."""
+    owner_name, attr = _COLLECTIONS[kind]
+    coll = getattr(project.geometry if owner_name == "geometry" else project, attr)
+    keys = [getattr(x, "job_id" if kind == "result" else "id", None) for x in coll]
+    existing = set(keys)
+    if len(existing) != len(keys) or None in existing:
+        return True
+    added = [str(op.id) for op in ops if op.kind == kind and op.op == "add"]
+    return len(set(added)) != len(added) or any(k in existing for k in added)
 
-    restored = _project_from_dict({k: deepcopy(v) for k, v in snap.items() if k != "label"})
-    project.geometry = restored.geometry
-    project.materials = restored.materials
-    project.material_library = restored.material_library
-    project.photometry_assets = restored.photometry_assets
-    project.luminaire_families = restored.luminaire_families
-    project.luminaires = restored.luminaires
-    project.grids = restored.grids
-    project.workplanes = restored.workplanes
-    project.vertical_planes = restored.vertical_planes
-    project.point_sets = restored.point_sets
-    project.glare_views = restored.glare_views
-    project.roadways = restored.roadways
-    project.roadway_grids = restored.roadway_grids
-    project.compliance_profiles = restored.compliance_profiles
-    project.variants = restored.variants
-    project.active_variant_id = restored.active_variant_id
-    project.jobs = restored.jobs
-    project.results = restored.results
+
+def record_diff(
+    project: Project,
+    diff: ProjectDiff,
+    label: str = "assistant_change",
+    max_depth: int = DEFAULT_HISTORY_DEPTH,
+) -> ProjectDiff:
+    """
+    Apply ``diff`` to ``project`` and push an undo entry for it.
+
+    Only the items and fields the diff touches are serialised, so the cost is
+    proportional to the edit rather than to the project.
+    """
+    _compact_top(project)
+    kinds = {op.kind for op in diff.ops if op.kind in _COLLECTIONS}
+    whole = {kind for kind in kinds if _needs_whole_capture(project, kind, diff.ops)}
+    keys: List[Tuple[str, str]] = []
+    for op in diff.ops:
+        if op.kind in ("geometry_meta", "project_meta"):
+            keys.extend((op.kind, str(k)) for k in op.payload)
+        elif op.kind in _COLLECTIONS:
+            keys.append((op.kind, "*" if op.kind in whole else str(op.id)))
+    keys = list(dict.fromkeys(keys))
+    before = _capture(project, keys)
+    diff.apply(project)
+    after = _capture(project, keys)
+
+    changes: List[Dict[str, Any]] = []
+    for kind, item_id in keys:
+        b, a = before[(kind, item_id)], after[(kind, item_id)]
+        if b == a:
+            continue
+        if kind in ("geometry_meta", "project_meta"):
+            changes.append({"kind": kind, "id": item_id, "before": b, "after": a})
+        elif item_id == "*":
+            owner, attr = _COLLECTIONS[kind]
+            changes.extend(_diff_collection(kind, owner, attr, b, a))
+        else:
+            index = (a if a is not None else b)[0]
+            changes.append(
+                {
+                    "kind": kind,
+                    "id": item_id,
+                    "index": index,
+                    "before": None if b is None else b[1],
+                    "after": None if a is None else a[1],
+                }
+            )
+    project.assistant_undo_stack.append({"label": label, "format": "diff", "changes": changes})
+    project.assistant_redo_stack = []
+    _trim(project.assistant_undo_stack, max_depth)
+    return diff
 
 
 def undo(project: Project) -> bool:
     if not project.assistant_undo_stack:
         return False
-    current = asdict(project)
-    current["label"] = "redo_snapshot"
-    snap = project.assistant_undo_stack.pop()
-    project.assistant_redo_stack.append(current)
-    _restore(project, snap)
+    _compact_top(project)
+    entry = project.assistant_undo_stack.pop()
+    _changes_to_diff(entry.get("changes", []), inverse=True).apply(project)
+    project.assistant_redo_stack.append(entry)
     return True
 
 
 def redo(project: Project) -> bool:
     if not project.assistant_redo_stack:
         return False
-    current = asdict(project)
-    current["label"] = "undo_snapshot"
-    snap = project.assistant_redo_stack.pop()
-    project.assistant_undo_stack.append(current)
-    _restore(project, snap)
+    entry = project.assistant_redo_stack.pop()
+    if not _is_diff_entry(entry):
+        # Redo snapshot persisted by an older version: the state to return to.
+        entry = _snapshot_to_entry(_state(project), entry)
+        entry["label"] = "undo_snapshot"
+    _changes_to_diff(entry.get("changes", []), inverse=False).apply(project)
+    project.assistant_undo_stack.append(entry)
     return True
+
+
+def compact_history(project: Project, max_depth: int = DEFAULT_HISTORY_DEPTH) -> int:
+    """
+    Trim both stacks to ``max_depth`` and convert snapshots to diff entries.
+
+    Needed once for projects saved by older versions, whose stacks hold a full
+    project copy per change. Walks each stack from the top on a scratch copy,
+    replaying as it goes so each snapshot is diffed against its neighbour
+    state. Returns the number of entries converted.
+    """
+    stack = project.assistant_undo_stack
+    _trim(stack, max_depth)
+    _trim(project.assistant_redo_stack, max_depth)
+    pending = [i for i, e in enumerate(stack) if not _is_diff_entry(e)]
+    if not pending:
+        converted = 0
+    elif pending == [len(stack) - 1]:
+        _compact_top(project)
+        converted = 1
+    else:
+        converted = _compact_undo_stack(project)
+    return converted + _compact_redo_stack(project)
+
+
+def _compact_undo_stack(project: Project) -> int:
+    from luxera.project.io import _project_from_dict  # type: ignore[attr-defined]
+
+    stack = project.assistant_undo_stack
+    scratch = _project_from_dict(_state(project))
+    converted = 0
+    for i in range(len(stack) - 1, -1, -1):
+        if not _is_diff_entry(stack[i]):
+            stack[i] = _snapshot_to_entry(stack[i], _state(scratch))
+            converted += 1
+        _changes_to_diff(stack[i].get("changes", []), inverse=True).apply(scratch)
+    return converted
+
+
+def _compact_redo_stack(project: Project) -> int:
+    from luxera.project.io import _project_from_dict  # type: ignore[attr-defined]
+
+    stack = project.assistant_redo_stack
+    if all(_is_diff_entry(e) for e in stack):
+        return 0
+    scratch = _project_from_dict(_state(project))
+    converted = 0
+    for i in range(len(stack) - 1, -1, -1):
+        if not _is_diff_entry(stack[i]):
+            entry = _snapshot_to_entry(_state(scratch), stack[i])
+            entry["label"] = "undo_snapshot"
+            stack[i] = entry
+            converted += 1
+        _changes_to_diff(stack[i].get("changes", []), inverse=False).apply(scratch)
+    return converted
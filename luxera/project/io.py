@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional
 
 from luxera.project.schema import (
     Project,
@@ -60,6 +60,13 @@ from luxera.geometry.param.model import (
     WallParam,
     ZoneParam,
 )
+from luxera.project.bundle import (
+    BUNDLE_SUFFIX,
+    ProjectBundleError,
+    is_project_bundle,
+    load_project_bundle,
+    save_project_bundle,
+)
 from luxera.project.migrations import migrate_project
 
 
@@ -429,11 +436,27 @@ def _project_from_dict(d: Dict[str, Any]) -> Project:
 def save_project_schema(project: Project, path: Path) -> None:
     path = path.expanduser().resolve()
     path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == BUNDLE_SUFFIX:
+        save_project_bundle(project, path)
+        return
+    if project.loaded_sections is not None:
+        raise ProjectBundleError(
+            f"Cannot save a project loaded with bundle sections {project.loaded_sections} as JSON; load it in full first"
+        )
     path.write_text(json.dumps(project.to_dict(), indent=2, sort_keys=True), encoding="utf-8")
 
 
-def load_project_schema(path: Path) -> Project:
+def load_project_schema(path: Path, sections: Optional[Iterable[str]] = None) -> Project:
+    """
+    Load a project file.
+
+    ``sections`` names the bundle sections to read (``core`` is always read);
+    read-only callers pass only what they use. JSON projects are always
+    loaded in full.
+    """
     path = path.expanduser().resolve()
+    if is_project_bundle(path):
+        return load_project_bundle(path, sections=sections)
     data = json.loads(path.read_text(encoding="utf-8"))
     data = migrate_project(data)
     project = _project_from_dict(data)
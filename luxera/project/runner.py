@@ -7,14 +7,16 @@ import math
 import shutil
 import subprocess
 from dataclasses import asdict
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import numpy as np
 
 from luxera.core.hashing import hash_job_spec, sha256_bytes, sha256_file
 from luxera.core.errors import CalculationError
 from luxera.core.diagnostics import ProjectDiagnostics
+from luxera.core.trace import current_tracer, span, trace_enabled_from_env, tracing
 from luxera.project.schema import Project, JobSpec, JobResultRef, PhotometryAsset, CalcGrid
 from luxera.project.io import load_project_schema, save_project_schema
 from luxera.project.validator import validate_project_for_job, ProjectValidationError
@@ -31,7 +33,7 @@ from luxera.results.store import (
     write_manifest,
 )
 from luxera.results.heatmaps import write_surface_heatmaps
-from luxera.results.grid_viz import write_grid_heatmap_and_isolux
+from luxera.results.grid_viz import grid_extent, write_grid_rasters
 from luxera.results.surface_grids import compute_surface_grids
 from luxera.results.writers import write_tables_csv, write_tables_json
 from luxera.results.writers_daylight import (
@@ -71,13 +73,14 @@ from luxera.engine.daylight_df import run_daylight_df
 from luxera.engine.daylight_annual_radiance import run_daylight_annual_radiance
 from luxera.engine.daylight_radiance import run_daylight_radiance
 from luxera.engine.emergency_escape_route import run_escape_routes
+from luxera.engine.emergency_failure import analyse_target_failures, rank_lux, summarize_failures
 from luxera.engine.emergency_open_area import run_open_area
 from luxera.compliance import ActivityType, check_compliance_from_grid
 from luxera.compliance.emergency_standards import get_standard_profile
 from luxera.standards.roadway import evaluate_roadway_profile, get_profile
 from luxera.photometry.verify import verify_photometry_file
 from luxera.metrics.core import compute_basic_metrics
-from luxera.viz.falsecolor import render_falsecolor_plane
+from luxera.viz.raster import run_render_jobs, write_falsecolor_png
 from luxera.agent.audit import append_audit_event
 from luxera.backends.radiance import build_radiance_run_manifest, get_radiance_version, run_radiance_direct
 from luxera.backends.radiance_roadway import run_radiance_roadway
@@ -117,7 +120,7 @@ def _scale_grid_spec(grid: CalcGrid, s: float) -> CalcGrid:
     )
 
 
-def run_job(project_path: str | Path, job_id: str) -> JobResultRef:
+def run_job(project_path: str | Path, job_id: str, *, trace: Optional[bool] = None) -> JobResultRef:
     """
     Path-based runner contract:
     load project -> execute -> persist updated project -> return result ref.
@@ -126,7 +129,7 @@ def run_job(project_path: str | Path, job_id: str) -> JobResultRef:
     project = load_project_schema(ppath)
     # Canonicalize runtime root to project file location for portable relative paths.
     project.root_dir = str(ppath.parent)
-    ref = run_job_in_memory(project, job_id)
+    ref = run_job_in_memory(project, job_id, trace=trace)
     save_project_schema(project, ppath)
     return ref
 
@@ -271,6 +274,8 @@ def _effective_job_settings(job: JobSpec) -> Dict[str, object]:
             "battery_end_factor": 0.5,
             "battery_curve": "linear",
             "battery_steps": 7,
+            "failure_k": 1,
+            "failure_max_combinations": 20000,
         }
     else:  # daylight
         defaults = {
@@ -295,9 +300,22 @@ def _effective_job_settings(job: JobSpec) -> Dict[str, object]:
     return merged
 
 
-def run_job_in_memory(project: Project, job_id: str) -> JobResultRef:
+def run_job_in_memory(project: Project, job_id: str, *, trace: Optional[bool] = None) -> JobResultRef:
+    """
+    Execute a job and persist its result artifacts.
+
+    With ``trace`` (default: the ``LUXERA_TRACE`` environment variable) every runner
+    stage and calc object is timed; the spans are stored under ``trace`` in
+    ``result.json`` and exported as a Chrome trace to ``trace.json``.
+    """
+    with tracing(trace_enabled_from_env() if trace is None else bool(trace)):
+        return _execute_job(project, job_id)
+
+
+def _execute_job(project: Project, job_id: str) -> JobResultRef:
     job = _get_job(project, job_id)
-    diagnostics = ProjectDiagnostics().check(project)
+    with span("diagnostics"):
+        diagnostics = ProjectDiagnostics().check(project)
     diag_errors = [d for d in diagnostics if str(d.severity).lower() == "error"]
     diag_warnings = [d for d in diagnostics if str(d.severity).lower() == "warning"]
     if diag_warnings:
@@ -316,10 +334,12 @@ def run_job_in_memory(project: Project, job_id: str) -> JobResultRef:
             )
         )
     try:
-        validate_project_for_job(project, job)
+        with span("validation"):
+            validate_project_for_job(project, job)
     except ProjectValidationError as e:
         raise RunnerError(str(e)) from e
-    job_hash = hash_job_spec(project, asdict(job))
+    with span("hashing"):
+        job_hash = hash_job_spec(project, asdict(job))
 
     project_root = _resolve_project_root(project)
     out_dir = ensure_result_dir(project_root, job_hash)
@@ -348,7 +368,8 @@ def run_job_in_memory(project: Project, job_id: str) -> JobResultRef:
         else:
             raise RunnerError("Radiance backend currently supports direct, roadway, and daylight jobs only")
         try:
-            rr = _run_daylight(project, job) if job.type == "daylight" else run_fn(project, job, out_dir)
+            with span("solve", job_type=job.type, backend=job.backend):
+                rr = _run_daylight(project, job) if job.type == "daylight" else run_fn(project, job, out_dir)
         except RuntimeError as e:
             raise RunnerError(str(e)) from e
         if isinstance(rr, dict):
@@ -363,18 +384,18 @@ def run_job_in_memory(project: Project, job_id: str) -> JobResultRef:
             if rr.result_data:
                 result.update(dict(rr.result_data))
     else:
-        if job.type == "direct":
-            result = _run_direct(project, job)
-        elif job.type == "radiosity":
-            result = _run_radiosity(project, job)
-        elif job.type == "roadway":
-            result = _run_roadway(project, job)
-        elif job.type == "emergency":
-            result = _run_emergency(project, job)
-        elif job.type == "daylight":
-            result = _run_daylight(project, job)
-        else:
+        solvers = {
+            "direct": _run_direct,
+            "radiosity": _run_radiosity,
+            "roadway": _run_roadway,
+            "emergency": _run_emergency,
+            "daylight": _run_daylight,
+        }
+        solve = solvers.get(job.type)
+        if solve is None:
             raise RunnerError(f"Unsupported job type: {job.type}")
+        with span("solve", job_type=job.type, backend=job.backend):
+            result = solve(project, job)
 
     result_meta = {
         "contract_version": "solver_result_v1",
@@ -423,32 +444,126 @@ def run_job_in_memory(project: Project, job_id: str) -> JobResultRef:
     if "backend_artifacts" in result:
         result_meta["backend_artifacts"] = result["backend_artifacts"]
 
-    verification = _build_photometry_verification(project, result.get("assets", {}))
-    result_meta["photometry_verification"] = verification
-    photometry_warnings: List[Dict[str, object]] = []
-    root = _resolve_project_root(project)
-    for asset in project.photometry_assets:
-        if str(getattr(asset, "format", "")).upper() != "IES" or not asset.path:
-            continue
-        p = Path(asset.path).expanduser()
-        if not p.is_absolute():
-            p = (root / p).resolve()
-        if not p.exists():
-            continue
-        try:
-            doc = parse_ies_text(p.read_text(encoding="utf-8", errors="replace"), source_path=p)
-            for note in getattr(doc, "warnings", []):
-                photometry_warnings.append({"asset_id": asset.id, "code": getattr(note, "code", ""), "message": getattr(note, "message", "")})
-        except Exception:
-            continue
+    with span("photometry_verification"):
+        verification = _build_photometry_verification(project, result.get("assets", {}))
+        result_meta["photometry_verification"] = verification
+        photometry_warnings: List[Dict[str, object]] = []
+        root = _resolve_project_root(project)
+        for asset in project.photometry_assets:
+            if str(getattr(asset, "format", "")).upper() != "IES" or not asset.path:
+                continue
+            p = Path(asset.path).expanduser()
+            if not p.is_absolute():
+                p = (root / p).resolve()
+            if not p.exists():
+                continue
+            try:
+                doc = parse_ies_text(p.read_text(encoding="utf-8", errors="replace"), source_path=p)
+                for note in getattr(doc, "warnings", []):
+                    photometry_warnings.append({"asset_id": asset.id, "code": getattr(note, "code", ""), "message": getattr(note, "message", "")})
+            except Exception:
+                continue
     if photometry_warnings:
         result_meta["photometry_warnings"] = photometry_warnings
     if job.backend == "radiance":
         result_meta["backend_manifest"] = build_radiance_run_manifest(project, job)
         result_meta["solver"]["radiance"] = get_radiance_version()
 
-    write_result_json(out_dir, result_meta)
-    write_named_json(out_dir, "photometry_verify.json", verification)
+    with span("write_result_json"):
+        write_result_json(out_dir, result_meta)
+    with span("write_artifacts"):
+        _write_job_artifacts(out_dir, job, result, result_meta)
+    manifest_metadata = {
+        "job_id": job.id,
+        "job_hash": job_hash,
+        "seed": job.seed,
+        "solver": result_meta.get("solver", {}),
+        "solver_version": str(result_meta.get("solver", {}).get("package_version", "unknown")),
+        "backend": result_meta.get("backend", {}),
+        "assets": result_meta.get("assets", {}),
+        "photometry_hashes": result_meta.get("assets", {}),
+        "settings": result_meta.get("settings_dump", {}),
+        "coordinate_convention": result_meta.get("coordinate_convention"),
+        "units": result_meta.get("units", {}),
+        "photometry_assets": result_meta.get("photometry_assets", {}),
+    }
+    if job.type == "roadway" and isinstance(result_meta.get("summary"), dict):
+        rs = result_meta["summary"]
+        manifest_metadata["road_parameters"] = {
+            "lane_width_m": rs.get("lane_width_m"),
+            "num_lanes": rs.get("num_lanes"),
+            "road_length_m": rs.get("road_length_m"),
+            "mounting_height_m": rs.get("mounting_height_m"),
+            "setback_m": rs.get("setback_m"),
+            "pole_spacing_m": rs.get("pole_spacing_m"),
+        }
+    if job.type == "daylight" and isinstance(result_meta.get("summary"), dict):
+        rs = result_meta["summary"]
+        manifest_metadata["daylight"] = {
+            "mode": rs.get("mode"),
+            "sky": rs.get("sky"),
+            "external_horizontal_illuminance_lux": rs.get("external_horizontal_illuminance_lux"),
+            "glass_visible_transmittance_default": rs.get("glass_visible_transmittance_default"),
+            "radiance_quality": rs.get("radiance_quality"),
+            "random_seed": rs.get("random_seed"),
+            "metric": rs.get("metric", "daylight_factor_percent"),
+            "weather_file": rs.get("weather_file"),
+            "thresholds": rs.get("thresholds", {}),
+        }
+    if job.type == "emergency" and isinstance(result_meta.get("summary"), dict):
+        rs = result_meta["summary"]
+        manifest_metadata["emergency"] = {
+            "mode": rs.get("mode"),
+            "standard": rs.get("standard"),
+            "emergency_factor": rs.get("emergency_factor"),
+            "luminaire_count": rs.get("luminaire_count"),
+            "compliance": rs.get("compliance"),
+        }
+    tracer = current_tracer()
+    if tracer is not None:
+        result_meta["trace"] = tracer.to_dict()
+        write_result_json(out_dir, result_meta)
+        tracer.write_chrome_trace(out_dir / "trace.json")
+    else:
+        (out_dir / "trace.json").unlink(missing_ok=True)
+    write_manifest(out_dir, metadata=manifest_metadata)
+    append_audit_event(
+        project,
+        action="runner.run_job",
+        plan="Execute job and persist immutable result artifacts.",
+        job_hashes=[job_hash],
+        artifacts=[str(out_dir)],
+        metadata={"job_id": job.id, "job_type": job.type},
+    )
+
+    ref = JobResultRef(job_id=job.id, job_hash=job_hash, result_dir=str(out_dir), summary=result_meta["summary"])
+    _upsert_result_ref(project, ref)
+    return ref
+
+
+# Summary key suffix -> unit label of the values it describes.
+_UNIT_SUFFIXES = (("_percent", "%"), ("_cd_m2", "cd/m2"), ("_lux", "lux"))
+
+
+def _calc_object_unit(obj: Dict[str, object], default: str) -> str:
+    """Unit of a calc object's values: its summary ``unit``, else its ``metric`` or ``mean_*`` key."""
+    summary = obj.get("summary")
+    if not isinstance(summary, dict):
+        return default
+    unit = summary.get("unit")
+    if isinstance(unit, str) and unit:
+        return unit
+    names = [str(summary["metric"])] if isinstance(summary.get("metric"), str) else []
+    names += [str(k) for k in summary if str(k).startswith("mean_")]
+    for name in names:
+        for suffix, label in _UNIT_SUFFIXES:
+            if name.endswith(suffix):
+                return label
+    return default
+
+
+def _write_job_artifacts(out_dir: Path, job: JobSpec, result: Dict[str, object], result_meta: Dict[str, object]) -> None:
+    write_named_json(out_dir, "photometry_verify.json", result_meta["photometry_verification"])
     gh_counts = {}
     gh_hash = "sha256:0"
     if isinstance(result_meta.get("summary"), dict):
@@ -466,9 +581,14 @@ def run_job_in_memory(project: Project, job_id: str) -> JobResultRef:
     calc_objects = result.get("calc_objects")
     if isinstance(calc_objects, list) and calc_objects:
         first_grid_written = False
+        # Per-object images are independent; render them concurrently once
+        # every CSV has been written.
+        render_jobs: List[Callable[[], object]] = []
+        default_unit = "%" if job.type == "daylight" else "lux"
         for obj in calc_objects:
             if not isinstance(obj, dict):
                 continue
+            unit = _calc_object_unit(obj, default_unit)
             obj_type = str(obj.get("type", "grid"))
             obj_id = str(obj.get("id", "unknown"))
             points = obj.get("points")
@@ -488,35 +608,37 @@ def run_job_in_memory(project: Project, job_id: str) -> JobResultRef:
                 nx = int(obj.get("nx", 0))
                 ny = int(obj.get("ny", 0))
                 if nx > 0 and ny > 0:
-                    viz = write_grid_heatmap_and_isolux(out_dir, points, values, nx=nx, ny=ny)
-                    heatmap = viz.get("heatmap")
-                    isolux = viz.get("isolux")
-                    if heatmap is not None:
-                        shutil.copyfile(heatmap, out_dir / heatmap_name)
-                        heatmap.unlink(missing_ok=True)
-                    if isolux is not None and isolux_name is not None:
-                        shutil.copyfile(isolux, out_dir / isolux_name)
-                        isolux.unlink(missing_ok=True)
-                    elif isolux is not None:
-                        isolux.unlink(missing_ok=True)
-                    render_falsecolor_plane(
-                        values=values.reshape(-1),
-                        nx=nx,
-                        ny=ny,
-                        out_path=out_dir / f"{obj_type}_{obj_id}_falsecolor.png",
-                        title=f"{obj_type}:{obj_id}",
-                        with_contours=True,
+                    flat = values.reshape(-1)
+                    render_jobs.append(
+                        partial(
+                            write_grid_rasters,
+                            out_dir,
+                            flat,
+                            nx=nx,
+                            ny=ny,
+                            heatmap_name=heatmap_name,
+                            isolux_name=isolux_name,
+                            points=points,
+                            unit=unit,
+                        )
+                    )
+                    extent, axis_labels = grid_extent(points, nx, ny)
+                    render_jobs.append(
+                        partial(
+                            write_falsecolor_png,
+                            out_dir / f"{obj_type}_{obj_id}_falsecolor.png",
+                            flat,
+                            nx,
+                            ny,
+                            unit=unit,
+                            extent=extent,
+                            axis_labels=axis_labels,
+                        )
                     )
                 if not first_grid_written:
                     write_grid_csv(out_dir, points, values)
-                    if int(obj.get("nx", 0)) > 0 and int(obj.get("ny", 0)) > 0:
-                        write_grid_heatmap_and_isolux(
-                            out_dir,
-                            points,
-                            values,
-                            nx=int(obj["nx"]),
-                            ny=int(obj["ny"]),
-                        )
+                    if nx > 0 and ny > 0:
+                        render_jobs.append(partial(write_grid_rasters, out_dir, values.reshape(-1), nx=nx, ny=ny, points=points, unit=unit))
                     first_grid_written = True
                 if job.type == "daylight":
                     write_daylight_target_artifacts(out_dir, obj_id, obj_type, points, values, nx=nx, ny=ny)
@@ -530,6 +652,7 @@ def run_job_in_memory(project: Project, job_id: str) -> JobResultRef:
                 write_points_csv(out_dir, f"line_{obj_id}.csv", points, values)
             elif obj_type == "escape_route":
                 write_points_csv(out_dir, f"escape_route_{obj_id}.csv", points, values)
+        run_render_jobs(render_jobs)
         write_named_json(out_dir, "summary.json", result["summary"])
         if job.type == "daylight":
             write_daylight_summary(out_dir, result["summary"])
@@ -594,7 +717,7 @@ def run_job_in_memory(project: Project, job_id: str) -> JobResultRef:
         nx = int(result.get("grid_nx", 0))
         ny = int(result.get("grid_ny", 0))
         if nx > 0 and ny > 0:
-            write_grid_heatmap_and_isolux(out_dir, result["grid_points"], result["grid_values"], nx=nx, ny=ny)
+            write_grid_rasters(out_dir, result["grid_values"], nx=nx, ny=ny, points=result["grid_points"])
         if job.type == "roadway":
             shutil.copyfile(out_dir / "grid.csv", out_dir / "road_grid.csv")
             write_named_json(out_dir, "road_summary.json", result["summary"])
@@ -684,65 +807,6 @@ def run_job_in_memory(project: Project, job_id: str) -> JobResultRef:
         grids = compute_surface_grids(result["room"].get_surfaces(), result["luminaires"], resolution=10)
         for sid, grid in grids.items():
             write_surface_grid_csv(out_dir, sid, grid.points, grid.values)
-    manifest_metadata = {
-        "job_id": job.id,
-        "job_hash": job_hash,
-        "seed": job.seed,
-        "solver": result_meta.get("solver", {}),
-        "solver_version": str(result_meta.get("solver", {}).get("package_version", "unknown")),
-        "backend": result_meta.get("backend", {}),
-        "assets": result_meta.get("assets", {}),
-        "photometry_hashes": result_meta.get("assets", {}),
-        "settings": result_meta.get("settings_dump", {}),
-        "coordinate_convention": result_meta.get("coordinate_convention"),
-        "units": result_meta.get("units", {}),
-        "photometry_assets": result_meta.get("photometry_assets", {}),
-    }
-    if job.type == "roadway" and isinstance(result_meta.get("summary"), dict):
-        rs = result_meta["summary"]
-        manifest_metadata["road_parameters"] = {
-            "lane_width_m": rs.get("lane_width_m"),
-            "num_lanes": rs.get("num_lanes"),
-            "road_length_m": rs.get("road_length_m"),
-            "mounting_height_m": rs.get("mounting_height_m"),
-            "setback_m": rs.get("setback_m"),
-            "pole_spacing_m": rs.get("pole_spacing_m"),
-        }
-    if job.type == "daylight" and isinstance(result_meta.get("summary"), dict):
-        rs = result_meta["summary"]
-        manifest_metadata["daylight"] = {
-            "mode": rs.get("mode"),
-            "sky": rs.get("sky"),
-            "external_horizontal_illuminance_lux": rs.get("external_horizontal_illuminance_lux"),
-            "glass_visible_transmittance_default": rs.get("glass_visible_transmittance_default"),
-            "radiance_quality": rs.get("radiance_quality"),
-            "random_seed": rs.get("random_seed"),
-            "metric": rs.get("metric", "daylight_factor_percent"),
-            "weather_file": rs.get("weather_file"),
-            "thresholds": rs.get("thresholds", {}),
-        }
-    if job.type == "emergency" and isinstance(result_meta.get("summary"), dict):
-        rs = result_meta["summary"]
-        manifest_metadata["emergency"] = {
-            "mode": rs.get("mode"),
-            "standard": rs.get("standard"),
-            "emergency_factor": rs.get("emergency_factor"),
-            "luminaire_count": rs.get("luminaire_count"),
-            "compliance": rs.get("compliance"),
-        }
-    write_manifest(out_dir, metadata=manifest_metadata)
-    append_audit_event(
-        project,
-        action="runner.run_job",
-        plan="Execute job and persist immutable result artifacts.",
-        job_hashes=[job_hash],
-        artifacts=[str(out_dir)],
-        metadata={"job_id": job.id, "job_type": job.type},
-    )
-
-    ref = JobResultRef(job_id=job.id, job_hash=job_hash, result_dir=str(out_dir), summary=result_meta["summary"])
-    _upsert_result_ref(project, ref)
-    return ref
 
 
 def _build_photometry_verification(project: Project, asset_hashes: Dict[str, str]) -> Dict[str, object]:
@@ -772,6 +836,24 @@ def _build_photometry_verification(project: Project, asset_hashes: Dict[str, str
     return out
 
 
+def _with_culling(summary: Dict[str, object], res: object) -> Dict[str, object]:
+    """Add a calc object's ``influence_culling`` pair counts to its summary, if it was culled."""
+    culling = getattr(res, "influence_culling", None)
+    if culling:
+        summary["influence_culling"] = dict(culling)
+    return summary
+
+
+def _influence_threshold(effective: Dict[str, object]) -> Optional[float]:
+    raw = effective.get("influence_threshold_lux")
+    if raw is None:
+        return None
+    value = float(raw)
+    if not value > 0.0:
+        raise RunnerError("influence_threshold_lux must be > 0")
+    return value
+
+
 def _run_direct(project: Project, job: JobSpec) -> Dict[str, object]:
     if not (project.grids or project.vertical_planes or project.arbitrary_planes or project.point_sets or project.line_grids):
         raise RunnerError("Project has no calculation objects")
@@ -789,230 +871,254 @@ def _run_direct(project: Project, job: JobSpec) -> Dict[str, object]:
         include_room_shell=bool(effective.get("occlusion_include_room_shell", False)),
         occlusion_epsilon=occlusion_epsilon,
     )
+    grid_mode = str(effective.get("grid_mode", "uniform")).strip().lower()
+    if grid_mode not in {"uniform", "adaptive"}:
+        raise RunnerError(f"Unsupported grid_mode: {grid_mode}")
+    adaptive_tolerance = float(effective.get("adaptive_tolerance", 0.02)) if grid_mode == "adaptive" else None
+    adaptive_max_level = int(effective.get("adaptive_max_level", 4))
+    influence_threshold_lux = _influence_threshold(effective)
 
     calc_objects: List[Dict[str, object]] = []
     aggregate_values: List[np.ndarray] = []
     primary_grid = None
 
     for grid_spec in project.grids:
-        sg = _scale_grid_spec(grid_spec, length_scale)
-        metric = str(getattr(sg, "illuminance_metric", "horizontal")).strip().lower()
-        if metric in {"cylindrical", "semicylindrical"}:
-            grid_res = CylindricalIlluminanceEngine().compute_grid(
-                project=project,
-                grid_spec=sg,
-                luminaires=luminaires,
-                metric=metric,
-                facing_direction=getattr(sg, "semicylindrical_facing", None),
-                occlusion_ctx=(occlusion if use_occlusion else None),
-            )
-        else:
-            grid_res = run_direct_grid(
-                sg,
-                luminaires,
-                occlusion=occlusion,
-                use_occlusion=use_occlusion,
-                occlusion_epsilon=occlusion_epsilon,
+        with span("calc_object", type="grid", id=grid_spec.id):
+            sg = _scale_grid_spec(grid_spec, length_scale)
+            metric = str(getattr(sg, "illuminance_metric", "horizontal")).strip().lower()
+            if metric in {"cylindrical", "semicylindrical"}:
+                grid_res = CylindricalIlluminanceEngine().compute_grid(
+                    project=project,
+                    grid_spec=sg,
+                    luminaires=luminaires,
+                    metric=metric,
+                    facing_direction=getattr(sg, "semicylindrical_facing", None),
+                    occlusion_ctx=(occlusion if use_occlusion else None),
+                )
+            else:
+                grid_res = run_direct_grid(
+                    sg,
+                    luminaires,
+                    occlusion=occlusion,
+                    use_occlusion=use_occlusion,
+                    occlusion_epsilon=occlusion_epsilon,
+                    adaptive_tolerance=adaptive_tolerance,
+                    adaptive_max_level=adaptive_max_level,
+                    influence_threshold_lux=influence_threshold_lux,
+                )
+            aggregate_values.append(grid_res.values.reshape(-1))
+            summary_contract = ContractGridResult(
+                values=np.asarray(grid_res.values, dtype=float),
+                points_xyz=np.asarray(grid_res.points, dtype=float),
+                normal=tuple(float(x) for x in sg.normal),
+                metadata={"id": grid_spec.id, "name": grid_spec.name, "nx": grid_res.nx, "ny": grid_res.ny},
+                units="lux",
+            ).to_summary()
+            grid_summary = _compute_grid_stats(grid_res.values.reshape(-1)) | summary_contract.to_dict()
+            if grid_res.computed_mask is not None:
+                grid_summary["grid_mode"] = "adaptive"
+                grid_summary["computed_points"] = int(np.count_nonzero(grid_res.computed_mask))
+            _with_culling(grid_summary, grid_res)
+            calc_objects.append(
+                {
+                    "type": "grid",
+                    "id": grid_spec.id,
+                    "name": grid_spec.name,
+                    "points": grid_res.points,
+                    "values": grid_res.values,
+                    "nx": grid_res.nx,
+                    "ny": grid_res.ny,
+                    "summary": grid_summary,
+                }
             )
-        aggregate_values.append(grid_res.values.reshape(-1))
-        summary_contract = ContractGridResult(
-            values=np.asarray(grid_res.values, dtype=float),
-            points_xyz=np.asarray(grid_res.points, dtype=float),
-            normal=tuple(float(x) for x in sg.normal),
-            metadata={"id": grid_spec.id, "name": grid_spec.name, "nx": grid_res.nx, "ny": grid_res.ny},
-            units="lux",
-        ).to_summary()
-        calc_objects.append(
-            {
-                "type": "grid",
-                "id": grid_spec.id,
-                "name": grid_spec.name,
-                "points": grid_res.points,
-                "values": grid_res.values,
-                "nx": grid_res.nx,
-                "ny": grid_res.ny,
-                "summary": _compute_grid_stats(grid_res.values.reshape(-1)) | summary_contract.to_dict(),
-            }
-        )
-        if primary_grid is None:
-            primary_grid = grid_res
+            if primary_grid is None:
+                primary_grid = grid_res
 
     for plane in project.vertical_planes:
-        if getattr(plane, "host_surface_id", None):
-            host = next((s for s in project.geometry.surfaces if s.id == plane.host_surface_id), None)
-            if host is None:
-                raise RunnerError(f"Vertical plane host surface not found: {plane.host_surface_id}")
-            geo = build_vertical_grid_on_wall(
-                host,
-                rows=plane.ny,
-                cols=plane.nx,
-                openings=(project.geometry.openings if bool(getattr(plane, "mask_openings", True)) else ()),
-                subrect_u0=getattr(plane, "subrect_u0", None),
-                subrect_u1=getattr(plane, "subrect_u1", None),
-                subrect_v0=getattr(plane, "subrect_v0", None),
-                subrect_v1=getattr(plane, "subrect_v1", None),
+        with span("calc_object", type="vertical_plane", id=plane.id):
+            if getattr(plane, "host_surface_id", None):
+                host = next((s for s in project.geometry.surfaces if s.id == plane.host_surface_id), None)
+                if host is None:
+                    raise RunnerError(f"Vertical plane host surface not found: {plane.host_surface_id}")
+                geo = build_vertical_grid_on_wall(
+                    host,
+                    rows=plane.ny,
+                    cols=plane.nx,
+                    openings=(project.geometry.openings if bool(getattr(plane, "mask_openings", True)) else ()),
+                    subrect_u0=getattr(plane, "subrect_u0", None),
+                    subrect_u1=getattr(plane, "subrect_u1", None),
+                    subrect_v0=getattr(plane, "subrect_v0", None),
+                    subrect_v1=getattr(plane, "subrect_v1", None),
+                )
+                pts_in = np.asarray([p for p, keep in zip(geo.points_xyz, geo.mask) if keep], dtype=float)
+                normal = Vector3(*geo.normal).normalize()
+                out = run_direct_points(
+                    points=pts_in,
+                    surface_normal=normal,
+                    luminaires=luminaires,
+                    occlusion=occlusion,
+                    use_occlusion=use_occlusion,
+                    occlusion_epsilon=occlusion_epsilon,
+                    influence_threshold_lux=influence_threshold_lux,
+                )
+                vals = np.full((geo.rows * geo.cols,), np.nan, dtype=float)
+                src = 0
+                for i, keep in enumerate(geo.mask):
+                    if keep:
+                        vals[i] = float(out.values[src])
+                        src += 1
+                points_all = np.asarray(geo.points_xyz, dtype=float)
+                aggregate_values.append(vals.reshape(-1))
+                calc_objects.append(
+                    {
+                        "type": "vertical_plane",
+                        "id": plane.id,
+                        "name": plane.name,
+                        "points": points_all,
+                        "values": vals,
+                        "nx": geo.cols,
+                        "ny": geo.rows,
+                        "summary": _with_culling(_compute_grid_stats(vals.reshape(-1)), out),
+                    }
+                )
+            else:
+                from luxera.project.schema import VerticalPlaneSpec
+
+                sp = VerticalPlaneSpec(
+                    id=plane.id,
+                    name=plane.name,
+                    origin=tuple(float(x) * length_scale for x in plane.origin),
+                    width=float(plane.width) * length_scale,
+                    height=float(plane.height) * length_scale,
+                    nx=plane.nx,
+                    ny=plane.ny,
+                    azimuth_deg=plane.azimuth_deg,
+                    room_id=plane.room_id,
+                    zone_id=plane.zone_id,
+                )
+                plane_res = run_direct_vertical_plane(
+                    sp,
+                    luminaires,
+                    occlusion=occlusion,
+                    use_occlusion=use_occlusion,
+                    occlusion_epsilon=occlusion_epsilon,
+                    influence_threshold_lux=influence_threshold_lux,
+                )
+                aggregate_values.append(plane_res.values.reshape(-1))
+                calc_objects.append(
+                    {
+                        "type": "vertical_plane",
+                        "id": plane.id,
+                        "name": plane.name,
+                        "points": plane_res.points,
+                        "values": plane_res.values,
+                        "nx": plane_res.nx,
+                        "ny": plane_res.ny,
+                        "summary": _with_culling(_compute_grid_stats(plane_res.values.reshape(-1)), plane_res),
+                    }
+                )
+
+    for point_set in project.point_sets:
+        with span("calc_object", type="point_set", id=point_set.id):
+            from luxera.project.schema import PointSetSpec
+            sps = PointSetSpec(
+                id=point_set.id,
+                name=point_set.name,
+                points=[tuple(float(x) * length_scale for x in p) for p in point_set.points],
+                room_id=point_set.room_id,
+                zone_id=point_set.zone_id,
             )
-            pts_in = np.asarray([p for p, keep in zip(geo.points_xyz, geo.mask) if keep], dtype=float)
-            normal = Vector3(*geo.normal).normalize()
-            out = run_direct_points(
-                points=pts_in,
-                surface_normal=normal,
-                luminaires=luminaires,
+            ps_res = run_direct_point_set(
+                sps,
+                luminaires,
                 occlusion=occlusion,
                 use_occlusion=use_occlusion,
                 occlusion_epsilon=occlusion_epsilon,
+                influence_threshold_lux=influence_threshold_lux,
             )
-            vals = np.full((geo.rows * geo.cols,), np.nan, dtype=float)
-            src = 0
-            for i, keep in enumerate(geo.mask):
-                if keep:
-                    vals[i] = float(out.values[src])
-                    src += 1
-            points_all = np.asarray(geo.points_xyz, dtype=float)
-            aggregate_values.append(vals.reshape(-1))
+            aggregate_values.append(ps_res.values.reshape(-1))
             calc_objects.append(
                 {
-                    "type": "vertical_plane",
-                    "id": plane.id,
-                    "name": plane.name,
-                    "points": points_all,
-                    "values": vals,
-                    "nx": geo.cols,
-                    "ny": geo.rows,
-                    "summary": _compute_grid_stats(vals.reshape(-1)),
+                    "type": "point_set",
+                    "id": point_set.id,
+                    "name": point_set.name,
+                    "points": ps_res.points,
+                    "values": ps_res.values,
+                    "summary": _with_culling(_compute_grid_stats(ps_res.values.reshape(-1)), ps_res),
                 }
             )
-        else:
-            from luxera.project.schema import VerticalPlaneSpec
 
-            sp = VerticalPlaneSpec(
+    for plane in project.arbitrary_planes:
+        with span("calc_object", type="arbitrary_plane", id=plane.id):
+            from luxera.project.schema import ArbitraryPlaneSpec
+            ap = ArbitraryPlaneSpec(
                 id=plane.id,
                 name=plane.name,
                 origin=tuple(float(x) * length_scale for x in plane.origin),
+                axis_u=plane.axis_u,
+                axis_v=plane.axis_v,
                 width=float(plane.width) * length_scale,
                 height=float(plane.height) * length_scale,
                 nx=plane.nx,
                 ny=plane.ny,
-                azimuth_deg=plane.azimuth_deg,
                 room_id=plane.room_id,
                 zone_id=plane.zone_id,
+                evaluation_height_offset=float(getattr(plane, "evaluation_height_offset", 0.0)) * length_scale,
+                metric_set=list(getattr(plane, "metric_set", [])),
             )
-            plane_res = run_direct_vertical_plane(
-                sp,
+            plane_res = run_direct_arbitrary_plane(
+                ap,
                 luminaires,
                 occlusion=occlusion,
                 use_occlusion=use_occlusion,
                 occlusion_epsilon=occlusion_epsilon,
+                influence_threshold_lux=influence_threshold_lux,
             )
             aggregate_values.append(plane_res.values.reshape(-1))
             calc_objects.append(
                 {
-                    "type": "vertical_plane",
+                    "type": "arbitrary_plane",
                     "id": plane.id,
                     "name": plane.name,
                     "points": plane_res.points,
                     "values": plane_res.values,
                     "nx": plane_res.nx,
                     "ny": plane_res.ny,
-                    "summary": _compute_grid_stats(plane_res.values.reshape(-1)),
+                    "summary": _with_culling(_compute_grid_stats(plane_res.values.reshape(-1)), plane_res),
                 }
             )
 
-    for point_set in project.point_sets:
-        from luxera.project.schema import PointSetSpec
-        sps = PointSetSpec(
-            id=point_set.id,
-            name=point_set.name,
-            points=[tuple(float(x) * length_scale for x in p) for p in point_set.points],
-            room_id=point_set.room_id,
-            zone_id=point_set.zone_id,
-        )
-        ps_res = run_direct_point_set(
-            sps,
-            luminaires,
-            occlusion=occlusion,
-            use_occlusion=use_occlusion,
-            occlusion_epsilon=occlusion_epsilon,
-        )
-        aggregate_values.append(ps_res.values.reshape(-1))
-        calc_objects.append(
-            {
-                "type": "point_set",
-                "id": point_set.id,
-                "name": point_set.name,
-                "points": ps_res.points,
-                "values": ps_res.values,
-                "summary": _compute_grid_stats(ps_res.values.reshape(-1)),
-            }
-        )
-
-    for plane in project.arbitrary_planes:
-        from luxera.project.schema import ArbitraryPlaneSpec
-        ap = ArbitraryPlaneSpec(
-            id=plane.id,
-            name=plane.name,
-            origin=tuple(float(x) * length_scale for x in plane.origin),
-            axis_u=plane.axis_u,
-            axis_v=plane.axis_v,
-            width=float(plane.width) * length_scale,
-            height=float(plane.height) * length_scale,
-            nx=plane.nx,
-            ny=plane.ny,
-            room_id=plane.room_id,
-            zone_id=plane.zone_id,
-            evaluation_height_offset=float(getattr(plane, "evaluation_height_offset", 0.0)) * length_scale,
-            metric_set=list(getattr(plane, "metric_set", [])),
-        )
-        plane_res = run_direct_arbitrary_plane(
-            ap,
-            luminaires,
-            occlusion=occlusion,
-            use_occlusion=use_occlusion,
-            occlusion_epsilon=occlusion_epsilon,
-        )
-        aggregate_values.append(plane_res.values.reshape(-1))
-        calc_objects.append(
-            {
-                "type": "arbitrary_plane",
-                "id": plane.id,
-                "name": plane.name,
-                "points": plane_res.points,
-                "values": plane_res.values,
-                "nx": plane_res.nx,
-                "ny": plane_res.ny,
-                "summary": _compute_grid_stats(plane_res.values.reshape(-1)),
-            }
-        )
-
     for line in project.line_grids:
-        from luxera.project.schema import LineGridSpec
-        lg = LineGridSpec(
-            id=line.id,
-            name=line.name,
-            polyline=[tuple(float(x) * length_scale for x in p) for p in line.polyline],
-            spacing=float(line.spacing) * length_scale,
-            room_id=line.room_id,
-            zone_id=line.zone_id,
-            metric_set=list(getattr(line, "metric_set", [])),
-        )
-        line_res = run_direct_line_grid(
-            lg,
-            luminaires,
-            occlusion=occlusion,
-            use_occlusion=use_occlusion,
-            occlusion_epsilon=occlusion_epsilon,
-        )
-        aggregate_values.append(line_res.values.reshape(-1))
-        calc_objects.append(
-            {
-                "type": "line_grid",
-                "id": line.id,
-                "name": line.name,
-                "points": line_res.points,
-                "values": line_res.values,
-                "summary": _compute_grid_stats(line_res.values.reshape(-1)),
-            }
-        )
+        with span("calc_object", type="line_grid", id=line.id):
+            from luxera.project.schema import LineGridSpec
+            lg = LineGridSpec(
+                id=line.id,
+                name=line.name,
+                polyline=[tuple(float(x) * length_scale for x in p) for p in line.polyline],
+                spacing=float(line.spacing) * length_scale,
+                room_id=line.room_id,
+                zone_id=line.zone_id,
+                metric_set=list(getattr(line, "metric_set", [])),
+            )
+            line_res = run_direct_line_grid(
+                lg,
+                luminaires,
+                occlusion=occlusion,
+                use_occlusion=use_occlusion,
+                occlusion_epsilon=occlusion_epsilon,
+                influence_threshold_lux=influence_threshold_lux,
+            )
+            aggregate_values.append(line_res.values.reshape(-1))
+            calc_objects.append(
+                {
+                    "type": "line_grid",
+                    "id": line.id,
+                    "name": line.name,
+                    "points": line_res.points,
+                    "values": line_res.values,
+                    "summary": _with_culling(_compute_grid_stats(line_res.values.reshape(-1)), line_res),
+                }
+            )
 
     if not aggregate_values:
         raise RunnerError("Direct job has no calculation objects to evaluate")
@@ -1055,25 +1161,36 @@ def _run_direct(project: Project, job: JobSpec) -> Dict[str, object]:
         "occlusion_enabled": use_occlusion,
         "occluder_count": len(occlusion.triangles),
     }
+    if influence_threshold_lux is not None:
+        culling = [o["summary"]["influence_culling"] for o in calc_objects if "influence_culling" in o.get("summary", {})]
+        evaluated = sum(int(c["evaluated_pairs"]) for c in culling)
+        total = sum(int(c["total_pairs"]) for c in culling)
+        summary["influence_culling"] = {
+            "threshold_lux": influence_threshold_lux,
+            "evaluated_pairs": evaluated,
+            "total_pairs": total,
+            "culled_fraction": (1.0 - evaluated / total) if total else 0.0,
+        }
 
-    compliance = None
-    if project.geometry.rooms:
-        room_spec = project.geometry.rooms[0]
-        if room_spec.activity_type:
-            try:
-                activity = ActivityType[room_spec.activity_type]
-                compliance = check_compliance_from_grid(
-                    room_name=room_spec.name,
-                    activity_type=activity,
-                    grid_values_lux=all_values.reshape(-1).tolist(),
-                    maintenance_factor=1.0,
-                )
-            except KeyError:
-                compliance = {"error": f"Unknown activity_type: {room_spec.activity_type}"}
-    summary["compliance"] = compliance.summary() if hasattr(compliance, "summary") else compliance
-    profile = _resolve_compliance_profile(project, "indoor", (job.settings or {}).get("compliance_profile_id"))
-    if profile is not None:
-        summary["compliance_profile"] = _evaluate_profile_thresholds(summary, profile)
+    with span("compliance"):
+        compliance = None
+        if project.geometry.rooms:
+            room_spec = project.geometry.rooms[0]
+            if room_spec.activity_type:
+                try:
+                    activity = ActivityType[room_spec.activity_type]
+                    compliance = check_compliance_from_grid(
+                        room_name=room_spec.name,
+                        activity_type=activity,
+                        grid_values_lux=all_values.reshape(-1).tolist(),
+                        maintenance_factor=1.0,
+                    )
+                except KeyError:
+                    compliance = {"error": f"Unknown activity_type: {room_spec.activity_type}"}
+        summary["compliance"] = compliance.summary() if hasattr(compliance, "summary") else compliance
+        profile = _resolve_compliance_profile(project, "indoor", (job.settings or {}).get("compliance_profile_id"))
+        if profile is not None:
+            summary["compliance_profile"] = _evaluate_profile_thresholds(summary, profile)
 
     # Backward-compatible indoor planes/zones aggregates used by golden packs.
     work_obj = next((o for o in calc_objects if str(o.get("type")) == "grid"), None)
@@ -1239,19 +1356,20 @@ def _run_radiosity(project: Project, job: JobSpec) -> Dict[str, object]:
                 for r in view_analysis.results
             ]
 
-    if room_spec.activity_type:
-        try:
-            activity = ActivityType[room_spec.activity_type]
-            if result.floor_values:
-                compliance = check_compliance_from_grid(
-                    room_name=room_spec.name,
-                    activity_type=activity,
-                    grid_values_lux=result.floor_values,
-                    maintenance_factor=1.0,
-                    ugr=ugr_value,
-                )
-        except KeyError:
-            compliance = {"error": f"Unknown activity_type: {room_spec.activity_type}"}
+    with span("compliance"):
+        if room_spec.activity_type:
+            try:
+                activity = ActivityType[room_spec.activity_type]
+                if result.floor_values:
+                    compliance = check_compliance_from_grid(
+                        room_name=room_spec.name,
+                        activity_type=activity,
+                        grid_values_lux=result.floor_values,
+                        maintenance_factor=1.0,
+                        ugr=ugr_value,
+                    )
+            except KeyError:
+                compliance = {"error": f"Unknown activity_type: {room_spec.activity_type}"}
 
     summary = {
         "avg_illuminance": result.avg_illuminance,
@@ -1384,7 +1502,8 @@ def _resolve_compliance_profile(project: Project, domain: str, profile_id: Optio
 def _load_luminaires_and_hashes(project: Project):
     try:
         root = _resolve_project_root(project)
-        return load_luminaires(project, lambda asset: _hash_photometry_asset(asset, root))
+        with span("photometry_load", luminaires=len(project.luminaires)):
+            return load_luminaires(project, lambda asset: _hash_photometry_asset(asset, root))
     except ValueError as e:
         raise RunnerError(str(e)) from e
 
@@ -1450,7 +1569,7 @@ def _run_roadway(project: Project, job: JobSpec) -> Dict[str, object]:
                 "uo_ok": summary["uniformity_ratio"] >= uo_min,
                 "ul_ok": summary["ul_longitudinal"] >= ul_min,
                 "luminance_ok": summary["road_luminance_mean_cd_m2"] >= lmin,
-                "ti_ok": summary["threshold_increment_ti_proxy_percent"] <= ti_max,
+                "ti_ok": summary["threshold_increment_ti_percent"] <= ti_max,
                 "surround_ratio_ok": summary["surround_ratio_proxy"] >= sr_min,
                 "thresholds": {
                     "avg_min_lux": avg_min,
@@ -1474,10 +1593,13 @@ def _run_roadway(project: Project, job: JobSpec) -> Dict[str, object]:
                 "lane_number": float(getattr(obs, "lane_number", i + 1)),
             }
         )
-    observer_sets = {
-        "luminance": observer_rows,
-        "ti_stub": build_ti_stub(observer_rows),
-    }
+    observer_sets: Dict[str, object] = {"luminance": observer_rows}
+    ti_sweep = summary.get("ti_moving_observer")
+    ti_lanes = ti_sweep.get("lanes", []) if isinstance(ti_sweep, dict) else []
+    if ti_lanes:
+        observer_sets["ti"] = list(ti_lanes)
+    else:
+        observer_sets["ti_stub"] = build_ti_stub(observer_rows)
 
     roadway_payload = summary.get("roadway")
     if not isinstance(roadway_payload, dict):
@@ -1574,6 +1696,7 @@ def _run_emergency(project: Project, job: JobSpec) -> Dict[str, object]:
             use_occlusion=use_occlusion,
             occlusion_epsilon=occlusion_epsilon,
             length_scale=length_scale,
+            keep_contributions=True,
         )
 
         grid_ids = set(job.open_area_targets or [])
@@ -1586,6 +1709,7 @@ def _run_emergency(project: Project, job: JobSpec) -> Dict[str, object]:
             occlusion=occlusion,
             use_occlusion=use_occlusion,
             occlusion_epsilon=occlusion_epsilon,
+            keep_contributions=True,
         )
 
         spec = job.emergency
@@ -1651,20 +1775,49 @@ def _run_emergency(project: Project, job: JobSpec) -> Dict[str, object]:
                 op_counts["none"] += 1
         summary["luminaire_operation_counts"] = op_counts
 
-        if route_stats and selected_specs:
-            route_id = str(route_stats[0].get("route_id", ""))
-            route = route_map.get(route_id)
-            if route is not None and route.polyline:
-                px, py, pz = route.polyline[0]
-                failures: List[Dict[str, object]] = []
-                for lum in selected_specs:
-                    lx, ly, lz = lum.transform.position
-                    d = math.sqrt((float(px) - float(lx)) ** 2 + (float(py) - float(ly)) ** 2 + (float(pz) - float(lz)) ** 2)
-                    drop = 1.0 / max(d, 1e-6)
-                    failures.append({"route_id": route_id, "luminaire_id": lum.id, "drop_lux": float(drop)})
-                failures.sort(key=lambda r: (-float(r["drop_lux"]), str(r["luminaire_id"])))
-                summary["route_failure_analysis"] = failures
-                summary["worst_single_failure"] = failures[0]
+        failure_k = max(1, int(effective.get("failure_k", 1)))
+        max_combinations = max(1, int(effective.get("failure_max_combinations", 20000)))
+        lum_ids = [lum.id for lum in selected_specs]
+        failure_routes: List[Dict[str, object]] = []
+        failures: List[Dict[str, object]] = []
+        for rr in route_results:
+            if rr.contributions is None:
+                continue
+            analysis = analyse_target_failures(rr.route_id, rr.contributions, k=failure_k, max_combinations=max_combinations)
+            row = summarize_failures(analysis, lum_ids, min_lux=route_min_lux, u0_min=route_u0_min)
+            row["route_id"] = rr.route_id
+            failure_routes.append(row)
+            for case in analysis.cases:
+                if len(case.failed) != 1:
+                    continue
+                failures.append(
+                    {
+                        "route_id": rr.route_id,
+                        "luminaire_id": lum_ids[case.failed[0]],
+                        "drop_lux": float(analysis.baseline_min_lux - case.min_lux),
+                        "min_lux": case.min_lux,
+                        "u0": case.u0,
+                    }
+                )
+        failure_areas: List[Dict[str, object]] = []
+        for orr in open_results:
+            if orr.contributions is None:
+                continue
+            analysis = analyse_target_failures(orr.target_id, orr.contributions, k=failure_k, max_combinations=max_combinations)
+            row = summarize_failures(analysis, lum_ids, min_lux=open_min_lux, u0_min=open_u0_min)
+            row["grid_id"] = orr.target_id
+            failure_areas.append(row)
+        summary["failure_analysis"] = {
+            "k": failure_k,
+            "max_combinations": max_combinations,
+            "route_results": failure_routes,
+            "open_area_results": failure_areas,
+            "pass": all(bool(r["pass"]) for r in failure_routes + failure_areas),
+        }
+        if failures:
+            failures.sort(key=lambda r: (-rank_lux(float(r["drop_lux"])), str(r["route_id"]), str(r["luminaire_id"])))
+            summary["route_failure_analysis"] = failures
+            summary["worst_single_failure"] = failures[0]
 
         calc_objects: List[Dict[str, object]] = []
         for rr in route_results:
@@ -618,9 +618,13 @@ class Project:
     assistant_undo_stack: List[Dict[str, Any]] = field(default_factory=list)
     assistant_redo_stack: List[Dict[str, Any]] = field(default_factory=list)
     param: ParamModel = field(default_factory=ParamModel)
+    # Bundle sections this instance was loaded from; None for a complete project. Not serialised.
+    loaded_sections: Optional[List[str]] = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        data = asdict(self)
+        data.pop("loaded_sections", None)
+        return data
 
 
 def matrix_to_array(m: List[List[float]]):
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt  # noqa: E402
 
+from luxera.viz.raster import write_heatmap_png, write_isolux_png  # noqa: E402
+
 
 def write_grid_heatmap_and_isolux(
     out_dir: Path,
@@ -83,3 +85,53 @@ def write_grid_heatmap_and_isolux(
         out["isolux"] = contour_path
 
     return out
+
+
+def grid_extent(points: Optional[np.ndarray], nx: int, ny: int) -> Tuple[Optional[Tuple[float, float, float, float]], Tuple[str, str]]:
+    """
+    Plot extent and axis names for row-major grid points.
+
+    Horizontal grids use their plan X/Y range; tilted or vertical grids use
+    in-plane U/V distances from the first point.
+    """
+    labels = ("X (m)", "Y (m)")
+    if points is None:
+        return None, labels
+    pts = np.asarray(points, dtype=float).reshape(-1, 3)
+    if pts.shape[0] != nx * ny or pts.shape[0] == 0:
+        return None, labels
+    if float(np.ptp(pts[:, 2])) <= 1e-9:
+        return (float(np.min(pts[:, 0])), float(np.max(pts[:, 0])), float(np.min(pts[:, 1])), float(np.max(pts[:, 1]))), labels
+    u = float(np.linalg.norm(pts[nx - 1] - pts[0]))
+    v = float(np.linalg.norm(pts[(ny - 1) * nx] - pts[0]))
+    return (0.0, u, 0.0, v), ("U (m)", "V (m)")
+
+
+def write_grid_rasters(
+    out_dir: Path,
+    values: np.ndarray,
+    nx: int,
+    ny: int,
+    *,
+    heatmap_name: str = "grid_heatmap.png",
+    isolux_name: Optional[str] = "grid_isolux.png",
+    points: Optional[np.ndarray] = None,
+    unit: str = "lux",
+) -> Dict[str, Path]:
+    """
+    Matplotlib-free variant of :func:`write_grid_heatmap_and_isolux`.
+
+    Writes a false-colour heatmap and, for grids of at least 2x2, a filled
+    isolux band image with contour lines, directly under the given names.
+    Both carry a colour bar in ``unit``; with ``points`` they also show the
+    grid's extent in metres.
+    """
+    out: Dict[str, Path] = {}
+    if nx <= 0 or ny <= 0 or np.asarray(values).size != nx * ny:
+        return out
+    extent, axis_labels = grid_extent(points, nx, ny)
+    kw = {"unit": unit, "extent": extent, "axis_labels": axis_labels}
+    out["heatmap"] = write_heatmap_png(out_dir / heatmap_name, values, nx, ny, **kw)
+    if isolux_name is not None and nx >= 2 and ny >= 2:
+        out["isolux"] = write_isolux_png(out_dir / isolux_name, values, nx, ny, **kw)
+    return out
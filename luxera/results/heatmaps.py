@@ -1,25 +1,28 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
-import numpy as np
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt  # noqa: E402
+from luxera.viz.raster import run_render_jobs, write_swatch_png
 
 
-def write_surface_heatmaps(out_dir: Path, surface_illuminance: Dict[str, float]) -> Dict[str, Path]:
-    out: Dict[str, Path] = {}
-    for surface_id, value in surface_illuminance.items():
-        fig, ax = plt.subplots(figsize=(4, 3))
-        ax.imshow([[value]], cmap="inferno")
-        ax.set_title(surface_id)
-        ax.set_xticks([])
-        ax.set_yticks([])
-        out_path = out_dir / f"{surface_id}_heatmap.png"
-        fig.tight_layout()
-        fig.savefig(out_path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        out[surface_id] = out_path
-    return out
+def write_surface_heatmaps(
+    out_dir: Path,
+    surface_illuminance: Dict[str, float],
+    max_workers: Optional[int] = None,
+) -> Dict[str, Path]:
+    """Write one false-colour swatch per surface, scaled across all surfaces."""
+    if not surface_illuminance:
+        return {}
+    values = [float(v) for v in surface_illuminance.values()]
+    vmin = min(values)
+    vmax = max(values)
+    ids = list(surface_illuminance.keys())
+    paths = run_render_jobs(
+        [
+            (lambda sid=sid, value=value: write_swatch_png(out_dir / f"{sid}_heatmap.png", value, vmin=vmin, vmax=vmax))
+            for sid, value in zip(ids, values)
+        ],
+        max_workers=max_workers,
+    )
+    return dict(zip(ids, paths))
@@ -5,7 +5,7 @@ from typing import Dict
 
 import numpy as np
 
-from luxera.results.grid_viz import write_grid_heatmap_and_isolux
+from luxera.results.grid_viz import write_grid_rasters
 from luxera.results.store import write_grid_csv_named, write_named_json, write_points_csv
 
 
@@ -26,16 +26,11 @@ def write_daylight_target_artifacts(
         p = write_grid_csv_named(out_dir, csv_name, points, values)
     artifacts["csv"] = str(p)
     if target_type in {"grid", "vertical_plane"} and nx > 0 and ny > 0:
-        viz = write_grid_heatmap_and_isolux(out_dir, points, values, nx=nx, ny=ny)
-        heatmap = viz.get("heatmap")
-        if heatmap is not None:
-            out = out_dir / f"daylight_{target_id}_heatmap.png"
-            out.write_bytes(Path(heatmap).read_bytes())
-            Path(heatmap).unlink(missing_ok=True)
-            artifacts["heatmap"] = str(out)
-        isolux = viz.get("isolux")
-        if isolux is not None:
-            Path(isolux).unlink(missing_ok=True)
+        viz = write_grid_rasters(
+            out_dir, values, nx=nx, ny=ny, heatmap_name=f"daylight_{target_id}_heatmap.png", isolux_name=None, points=points, unit="%"
+        )
+        if "heatmap" in viz:
+            artifacts["heatmap"] = str(viz["heatmap"])
     return artifacts
 
 
@@ -66,14 +61,9 @@ def write_daylight_annual_target_artifacts(
             ("ase", ase_point_percent),
             ("udi", udi_point_percent),
         ):
-            viz = write_grid_heatmap_and_isolux(out_dir, points, values, nx=nx, ny=ny)
-            heatmap = viz.get("heatmap")
-            if heatmap is not None:
-                out = out_dir / f"{metric_name}_{target_id}.png"
-                out.write_bytes(Path(heatmap).read_bytes())
-                Path(heatmap).unlink(missing_ok=True)
-                artifacts[f"{metric_name}_heatmap"] = str(out)
-            isolux = viz.get("isolux")
-            if isolux is not None:
-                Path(isolux).unlink(missing_ok=True)
+            viz = write_grid_rasters(
+                out_dir, values, nx=nx, ny=ny, heatmap_name=f"{metric_name}_{target_id}.png", isolux_name=None, points=points, unit="%"
+            )
+            if "heatmap" in viz:
+                artifacts[f"{metric_name}_heatmap"] = str(viz["heatmap"])
     return artifacts
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 import warnings
 
 from luxera.project.runner import RunnerError, run_job as run_job_path, run_job_in_memory as _run_job_in_memory
 
 
-def run_job(project_path: Union[str, Path], job_id: str):
-    return run_job_path(project_path, job_id)
+def run_job(project_path: Union[str, Path], job_id: str, *, trace: Optional[bool] = None):
+    return run_job_path(project_path, job_id, trace=trace)
 
 
 def run_job_in_memory(project, job_id: str):
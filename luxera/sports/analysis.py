@@ -7,8 +7,12 @@ import numpy as np
 
 from luxera.calculation.illuminance import Luminaire
 from luxera.core.transform import from_aim_up, from_euler_zyx
-from luxera.engine.direct_illuminance import run_direct_grid, run_direct_points
+from luxera.engine.direct_illuminance import run_direct_grid
+from luxera.engine.glare_rating import compute_glare_rating
+from luxera.engine.multi_metric import MetricRequest, compute_point_metrics
 from luxera.geometry.core import Vector3
+from luxera.photometry.canonical import canonical_from_photometry
+from luxera.photometry.interp import build_interpolation_lut
 from luxera.photometry.model import Photometry
 from luxera.project.schema import CalcGrid, Project
 from luxera.sports.en12193 import SportStandard
@@ -26,6 +30,7 @@ class SportsResult:
     E_v_avg: Optional[Dict[str, float]]
     compliance: Dict[str, bool]
     overall_compliant: bool
+    GR_max: Optional[float] = None
 
 
 def _synthetic_floodlight_photometry() -> Photometry:
@@ -43,6 +48,8 @@ def _synthetic_floodlight_photometry() -> Photometry:
 
 def _build_luminaires_from_poles(poles: List[LightingPole]) -> List[Luminaire]:
     phot = _synthetic_floodlight_photometry()
+    # One shared LUT keeps intensity lookups vectorised across every floodlight.
+    lut = build_interpolation_lut(canonical_from_photometry(phot))
     out: List[Luminaire] = []
     for pole in poles:
         p = Vector3(*pole.position)
@@ -56,7 +63,7 @@ def _build_luminaires_from_poles(poles: List[LightingPole]) -> List[Luminaire]:
                     pitch_deg=-float(lum.tilt_deg),
                     roll_deg=0.0,
                 )
-            out.append(Luminaire(photometry=phot, transform=tf, flux_multiplier=1.0, tilt_deg=0.0))
+            out.append(Luminaire(photometry=phot, transform=tf, flux_multiplier=1.0, tilt_deg=0.0, lut=lut))
     return out
 
 
@@ -65,12 +72,8 @@ def _grid_points(field: PlayingField, spacing: float, z: float) -> np.ndarray:
     ny = max(2, int(round(field.width / spacing)) + 1)
     xs = np.linspace(-field.length / 2.0, field.length / 2.0, nx, dtype=float)
     ys = np.linspace(-field.width / 2.0, field.width / 2.0, ny, dtype=float)
-    pts = np.zeros((nx * ny, 3), dtype=float)
-    k = 0
-    for y in ys:
-        for x in xs:
-            pts[k] = [x, y, z]
-            k += 1
+    xx, yy = np.meshgrid(xs, ys)
+    pts = np.stack((xx.ravel(), yy.ravel(), np.full(nx * ny, float(z))), axis=1)
     return pts
 
 
@@ -83,6 +86,7 @@ class SportsLightingAnalysis:
         poles: List[LightingPole],
         standard: SportStandard,
         grid_spacing: float = 5.0,
+        surface_reflectance: float = 0.2,
     ) -> SportsResult:
         """
         Build horizontal and optional vertical evaluation objects and evaluate against standard.
@@ -117,16 +121,17 @@ class SportsLightingAnalysis:
             E_v_avg = {}
             points = _grid_points(field, grid_spacing, z=1.5)
             normals = {
-                "N": Vector3(0.0, -1.0, 0.0),
-                "S": Vector3(0.0, 1.0, 0.0),
-                "E": Vector3(-1.0, 0.0, 0.0),
-                "W": Vector3(1.0, 0.0, 0.0),
+                "N": (0.0, -1.0, 0.0),
+                "S": (0.0, 1.0, 0.0),
+                "E": (-1.0, 0.0, 0.0),
+                "W": (1.0, 0.0, 0.0),
             }
+            # One fused pass shares distances and intensities across the four orientations.
+            vres = compute_point_metrics(points, luminaires, MetricRequest(horizontal=False, vertical=normals))
             all_uniform_ok = True
             all_mean_ok = True
-            for key, nrm in normals.items():
-                pres = run_direct_points(points=points, surface_normal=nrm, luminaires=luminaires, use_occlusion=False)
-                pvals = np.asarray(pres.values, dtype=float)
+            for key in normals:
+                pvals = np.asarray(vres.E_v(key), dtype=float)
                 pav = float(np.mean(pvals))
                 pmin = float(np.min(pvals))
                 E_v_avg[key] = pav
@@ -146,8 +151,13 @@ class SportsLightingAnalysis:
             compliance["E_v_maintained"] = Ev_mean_ok
         if standard.E_v_uniformity is not None:
             compliance["E_v_uniformity"] = Ev_uniformity_ok
+        GR_max: Optional[float] = None
         if standard.GR_max is not None:
-            compliance["GR_max"] = True  # Placeholder until explicit GR computation is bound for sports workflow.
+            # Observers at eye height on the field grid, eight view directions each.
+            observers = _grid_points(field, grid_spacing, z=1.5)
+            gres = compute_glare_rating(observers, luminaires, e_h_avg=E_h_avg, reflectance=surface_reflectance)
+            GR_max = gres.gr_max
+            compliance["GR_max"] = GR_max <= float(standard.GR_max)
 
         overall = all(bool(v) for v in compliance.values())
         return SportsResult(
@@ -159,4 +169,5 @@ class SportsLightingAnalysis:
             E_v_avg=E_v_avg,
             compliance=compliance,
             overall_compliant=overall,
+            GR_max=GR_max,
         )
@@ -170,7 +170,7 @@ def evaluate_roadway_profile(profile: RoadwayProfile, summary: Dict[str, object]
         "uo_ok": bool(by_metric.get("uniformity_ratio", {}).get("pass", False)),
         "ul_ok": bool(by_metric.get("ul_longitudinal", {}).get("pass", False)),
         "luminance_ok": bool(by_metric.get("road_luminance_mean_cd_m2", {}).get("pass", False)),
-        "ti_ok": bool(by_metric.get("threshold_increment_ti_proxy_percent", {}).get("pass", False)),
+        "ti_ok": bool(by_metric.get("threshold_increment_ti_percent", {}).get("pass", False)),
         "surround_ratio_ok": bool(by_metric.get("surround_ratio_proxy", {}).get("pass", False)),
     }
 
@@ -190,6 +190,7 @@ def evaluate_roadway_profile(profile: RoadwayProfile, summary: Dict[str, object]
             "uniformity_ratio": float(summary.get("uniformity_ratio", 0.0) or 0.0),
             "ul_longitudinal": float(summary.get("ul_longitudinal", 0.0) or 0.0),
             "road_luminance_mean_cd_m2": float(summary.get("road_luminance_mean_cd_m2", 0.0) or 0.0),
+            "threshold_increment_ti_percent": float(summary.get("threshold_increment_ti_percent", 0.0) or 0.0),
             "threshold_increment_ti_proxy_percent": float(summary.get("threshold_increment_ti_proxy_percent", 0.0) or 0.0),
         },
     }
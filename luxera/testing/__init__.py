@@ -1,5 +1,6 @@
 from luxera.testing.golden import GoldenCase, discover_golden_cases, load_golden_case, run_golden_case
-from luxera.testing.compare import GoldenCompareResult, compare_golden_case
+from luxera.testing.compare import GoldenCompareResult, compare_golden_case, compare_golden_cases
+from luxera.testing.suite import SuiteCache, SuiteOutcome, input_fingerprint, run_parallel, run_suite
 
 __all__ = [
     "GoldenCase",
@@ -8,4 +9,10 @@ __all__ = [
     "load_golden_case",
     "run_golden_case",
     "compare_golden_case",
+    "compare_golden_cases",
+    "SuiteCache",
+    "SuiteOutcome",
+    "input_fingerprint",
+    "run_parallel",
+    "run_suite",
 ]
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt  # noqa: E402
 import numpy as np  # noqa: E402
 
-from luxera.testing.golden import GoldenCase
+from luxera.testing.golden import GoldenCase, run_golden_case
+from luxera.testing.suite import SUITE_CACHE_FILENAME, input_fingerprint, run_suite, scene_input_paths
 
 
 @dataclass(frozen=True)
@@ -158,3 +160,63 @@ def compare_golden_case(case: GoldenCase, produced_dir: Path) -> GoldenCompareRe
         passed=bool(passed),
         metrics=report_payload,
     )
+
+
+def _compare_task(case: GoldenCase, *, run_root: Optional[Path]) -> Tuple[bool, Dict[str, Any]]:
+    result = compare_golden_case(case, run_golden_case(case, run_root=run_root))
+    return result.passed, {
+        "case_id": result.case_id,
+        "produced_dir": str(result.produced_dir),
+        "expected_dir": str(result.expected_dir),
+        "report_path": str(result.report_path),
+        "heatmap_paths": [str(p) for p in result.heatmap_paths],
+        "passed": result.passed,
+        "metrics": result.metrics,
+    }
+
+
+def compare_golden_cases(
+    cases: Sequence[GoldenCase],
+    run_root: Optional[Path] = None,
+    *,
+    jobs: Optional[int] = 1,
+    incremental: bool = False,
+) -> List[GoldenCompareResult]:
+    """
+    Run and compare golden cases in a pool of ``jobs`` processes (``None`` or 0: one per CPU).
+
+    Passing cases are recorded in ``<run_root>/suite_cache.json`` keyed by a hash of
+    the project, scene, expected outputs, photometry and engine version; with
+    ``incremental`` set, unchanged cases reuse that pass instead of re-running.
+    """
+    if not cases:
+        return []
+    root = run_root.expanduser().resolve() if run_root is not None else cases[0].expected_dir.parent.parent / "runs"
+    fingerprints = [
+        input_fingerprint(
+            [*scene_input_paths(c.project_path), c.scene_path, c.expected_dir],
+            {"run_settings": c.run_settings, "tolerances": c.tolerances},
+        )
+        for c in cases
+    ]
+    outcomes = run_suite(
+        list(cases),
+        functools.partial(_compare_task, run_root=root),
+        keys=[c.case_id for c in cases],
+        fingerprints=fingerprints,
+        cache_path=root / SUITE_CACHE_FILENAME,
+        incremental=incremental,
+        jobs=jobs,
+    )
+    return [
+        GoldenCompareResult(
+            case_id=str(o.payload["case_id"]),
+            produced_dir=Path(str(o.payload["produced_dir"])),
+            expected_dir=Path(str(o.payload["expected_dir"])),
+            report_path=Path(str(o.payload["report_path"])),
+            heatmap_paths=[Path(str(p)) for p in o.payload.get("heatmap_paths", [])],
+            passed=bool(o.payload["passed"]),
+            metrics=dict(o.payload.get("metrics", {})),
+        )
+        for o in outcomes
+    ]
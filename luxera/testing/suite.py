@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+"""Parallel, incremental execution shared by the parity, validation and golden suites."""
+
+import functools
+import json
+import marshal
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+import luxera
+from luxera.core.hashing import sha256_bytes, sha256_file, stable_json_dumps
+from luxera.core.processes import process_context
+
+
+SUITE_CACHE_SCHEMA_VERSION = "suite_cache_v1"
+SUITE_CACHE_FILENAME = "suite_cache.json"
+
+# Project keys rewritten by the runner itself; they must not invalidate a recorded pass.
+_VOLATILE_PROJECT_KEYS = ("results", "agent_history", "root_dir")
+
+# Packages whose code determines computed illuminance; only their sources feed
+# ``engine_version``. Reporting, GUI, API or CLI changes do not invalidate passes.
+ENGINE_PACKAGES = ("engine", "calculation", "photometry", "parser", "geometry", "calcs")
+# Overrides the source digest with an explicit engine version string.
+ENGINE_VERSION_ENV = "LUXERA_ENGINE_VERSION"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class SuiteOutcome:
+    """Result of one suite entry; ``cached`` entries were reused from the last recorded pass."""
+
+    key: str
+    passed: bool
+    payload: Dict[str, Any]
+    cached: bool = False
+
+
+@dataclass
+class SuiteCache:
+    """
+    Fingerprints of the last passing run of every suite entry, stored as JSON.
+
+    Only passes are kept: a failing or errored entry is always re-run.
+    """
+
+    path: Path
+    entries: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "SuiteCache":
+        p = Path(path).expanduser().resolve()
+        entries: Dict[str, Dict[str, Any]] = {}
+        if p.exists():
+            try:
+                payload = json.loads(p.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            if isinstance(payload, Mapping) and payload.get("schema_version") == SUITE_CACHE_SCHEMA_VERSION:
+                raw = payload.get("entries")
+                if isinstance(raw, Mapping):
+                    entries = {str(k): dict(v) for k, v in raw.items() if isinstance(v, Mapping)}
+        return cls(path=p, entries=entries)
+
+    def lookup(self, key: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get(key)
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return None
+        payload = entry.get("payload")
+        return dict(payload) if isinstance(payload, Mapping) else None
+
+    def record(self, key: str, fingerprint: str, passed: bool, payload: Mapping[str, Any]) -> None:
+        if passed:
+            self.entries[key] = {"fingerprint": fingerprint, "payload": dict(payload)}
+        else:
+            self.entries.pop(key, None)
+
+    def save(self) -> Path:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"schema_version": SUITE_CACHE_SCHEMA_VERSION, "entries": dict(sorted(self.entries.items()))}
+        self.path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        return self.path
+
+
+@functools.lru_cache(maxsize=1)
+def engine_version() -> str:
+    """
+    Package version plus a digest of the solver sources in ``ENGINE_PACKAGES``.
+
+    Setting ``LUXERA_ENGINE_VERSION`` replaces the digest with that value, for
+    pinning recorded passes across changes known not to affect results.
+    """
+    override = os.environ.get(ENGINE_VERSION_ENV, "").strip()
+    if override:
+        return override
+    pkg_root = Path(luxera.__file__).resolve().parent
+    digests = [
+        f"{p.relative_to(pkg_root).as_posix()}:{sha256_file(str(p))}"
+        for name in ENGINE_PACKAGES
+        for p in sorted((pkg_root / name).rglob("*.py"))
+        if "__pycache__" not in p.parts
+    ]
+    return f"{getattr(luxera, '__version__', 'unknown')}+{sha256_bytes(chr(10).join(digests).encode('utf-8'))[:16]}"
+
+
+def callable_fingerprint(fn: Optional[Callable[..., Any]]) -> Optional[str]:
+    """
+    Identify a callback by module, qualified name and a hash of its code object.
+
+    ``functools.partial`` objects are unwrapped to their function plus bound
+    arguments; editing the body of a callback changes its fingerprint.
+    """
+    if fn is None:
+        return None
+    if isinstance(fn, functools.partial):
+        inner = callable_fingerprint(fn.func)
+        return f"{inner}({fn.args!r}, {sorted(fn.keywords.items())!r})"
+    target = fn if hasattr(fn, "__code__") else getattr(type(fn), "__call__", fn)
+    code = getattr(target, "__code__", None)
+    digest = sha256_bytes(marshal.dumps(code))[:16] if code is not None else "nocode"
+    name = getattr(fn, "__qualname__", None) or type(fn).__qualname__
+    return f"{getattr(fn, '__module__', None) or type(fn).__module__}:{name}:{digest}"
+
+
+def _file_digest(path: Path) -> str:
+    if not path.exists():
+        return "missing"
+    if path.is_dir():
+        return input_fingerprint(sorted(p for p in path.rglob("*") if p.is_file()), include_engine=False)
+    if path.suffix.lower() == ".json":
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            if isinstance(payload, dict):
+                stripped = {k: v for k, v in payload.items() if k not in _VOLATILE_PROJECT_KEYS}
+                return sha256_bytes(stable_json_dumps(stripped).encode("utf-8"))
+        except (OSError, ValueError):
+            pass
+    return sha256_file(str(path))
+
+
+def scene_input_paths(scene_path: Path) -> List[Path]:
+    """The scene file plus every photometry file it references by path (relative to the scene)."""
+    scene = Path(scene_path).expanduser().resolve()
+    out = [scene]
+    try:
+        payload = json.loads(scene.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return out
+    assets = payload.get("photometry_assets") if isinstance(payload, Mapping) else None
+    for asset in assets if isinstance(assets, list) else []:
+        if not isinstance(asset, Mapping) or not asset.get("path"):
+            continue
+        p = Path(str(asset["path"])).expanduser()
+        out.append(p if p.is_absolute() else (scene.parent / p).resolve())
+    return out
+
+
+def input_fingerprint(
+    paths: Iterable[Path],
+    extra: Optional[Mapping[str, Any]] = None,
+    *,
+    include_engine: bool = True,
+) -> str:
+    """
+    Hash of input files, JSON-serialisable ``extra`` settings and (by default) the engine version.
+
+    Runner-written project keys (``results``, ``agent_history``) are ignored so that
+    running a scene does not change its own fingerprint.
+    """
+    files = sorted({Path(p).expanduser().resolve() for p in paths})
+    payload = {
+        "engine_version": engine_version() if include_engine else None,
+        "files": [[p.as_posix(), _file_digest(p)] for p in files],
+        "extra": dict(extra or {}),
+    }
+    return sha256_bytes(stable_json_dumps(payload).encode("utf-8"))
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """Worker count; ``None`` or values below 1 mean one worker per CPU."""
+    if jobs is None or int(jobs) < 1:
+        return max(1, os.cpu_count() or 1)
+    return int(jobs)
+
+
+def _picklable(*objs: Any) -> bool:
+    try:
+        pickle.dumps(objs)
+    except Exception:
+        return False
+    return True
+
+
+def run_parallel(fn: Callable[[T], R], tasks: Sequence[T], *, jobs: Optional[int] = 1) -> List[R]:
+    """
+    Apply ``fn`` to every task, in a process pool when more than one worker is requested.
+
+    Results keep task order. Work that cannot be pickled (for example a locally
+    defined callback) runs serially in the calling process.
+    """
+    items = list(tasks)
+    workers = min(resolve_jobs(jobs), len(items))
+    if workers <= 1 or not _picklable(fn, items):
+        return [fn(t) for t in items]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=process_context()) as pool:
+        return list(pool.map(fn, items))
+
+
+def run_suite(
+    tasks: Sequence[T],
+    fn: Callable[[T], Tuple[bool, Dict[str, Any]]],
+    *,
+    keys: Sequence[str],
+    fingerprints: Sequence[str],
+    cache_path: Optional[Path] = None,
+    incremental: bool = False,
+    jobs: Optional[int] = 1,
+) -> List[SuiteOutcome]:
+    """
+    Run suite entries in parallel, reusing the last recorded pass of unchanged entries.
+
+    ``fn`` returns ``(passed, payload)`` with a JSON-serialisable payload. With
+    ``incremental`` set, entries whose fingerprint matches a recorded pass in
+    ``cache_path`` are not run and their stored payload is returned with
+    ``cached=True``. New passes are recorded whenever ``cache_path`` is given.
+    """
+    items = list(tasks)
+    if not (len(items) == len(keys) == len(fingerprints)):
+        raise ValueError("tasks, keys and fingerprints must have the same length")
+    cache = SuiteCache.load(cache_path) if cache_path is not None else None
+    outcomes: List[Optional[SuiteOutcome]] = [None] * len(items)
+    pending: List[int] = []
+    for i, (key, fp) in enumerate(zip(keys, fingerprints)):
+        hit = cache.lookup(key, fp) if (cache is not None and incremental) else None
+        if hit is not None:
+            outcomes[i] = SuiteOutcome(key=key, passed=True, payload=hit, cached=True)
+        else:
+            pending.append(i)
+
+    for i, (passed, payload) in zip(pending, run_parallel(fn, [items[i] for i in pending], jobs=jobs)):
+        outcomes[i] = SuiteOutcome(key=keys[i], passed=bool(passed), payload=dict(payload))
+        if cache is not None:
+            cache.record(keys[i], fingerprints[i], bool(passed), payload)
+    if cache is not None:
+        cache.save()
+    return [o for o in outcomes if o is not None]
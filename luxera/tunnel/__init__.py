@@ -1,7 +1,19 @@
 from .cie88 import TunnelGeometry, TunnelLightingDesign, TunnelZone
+from .luminance import (
+    TunnelLuminaireRow,
+    TunnelLuminanceProfile,
+    TunnelLuminanceResult,
+    compute_tunnel_luminance,
+    flicker_analysis,
+)
 
 __all__ = [
     "TunnelGeometry",
     "TunnelLightingDesign",
     "TunnelZone",
+    "TunnelLuminaireRow",
+    "TunnelLuminanceProfile",
+    "TunnelLuminanceResult",
+    "compute_tunnel_luminance",
+    "flicker_analysis",
 ]
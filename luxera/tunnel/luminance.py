@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from luxera.calculation.illuminance import Luminaire
+from luxera.engine.multi_metric import luminaire_intensity_array
+from luxera.engine.road_reflection import lookup_reflection_coefficients
+from luxera.geometry.core import Transform, Vector3
+from luxera.photometry.canonical import canonical_from_photometry
+from luxera.photometry.interp import build_interpolation_lut
+from luxera.photometry.model import Photometry
+from luxera.tunnel.cie88 import TunnelGeometry, TunnelLightingDesign, TunnelZone
+
+
+# CIE 88 flicker band: discomfort between 4 and 11 Hz when it lasts longer than 20 s.
+FLICKER_BAND_HZ: Tuple[float, float] = (4.0, 11.0)
+FLICKER_MAX_DURATION_S = 20.0
+
+
+@dataclass(frozen=True)
+class TunnelLuminaireRow:
+    """
+    Evenly spaced luminaires along the tunnel axis.
+
+    Tunnel coordinates: ``x`` runs from the entrance portal (0) into the tunnel, ``y``
+    across it with 0 on the centre line, ``z`` up from the road surface.
+    """
+
+    photometry: Photometry
+    start_m: float
+    spacing_m: float
+    count: int
+    lateral_m: float
+    mounting_height_m: float
+    yaw_deg: float = 0.0
+    pitch_deg: float = 0.0
+    roll_deg: float = 0.0
+    flux_multiplier: float = 1.0
+
+    def index_window(self, x0: float, x1: float) -> Tuple[int, int]:
+        """Half-open index range of luminaires with ``x0 <= x <= x1``."""
+        if self.count <= 0:
+            return 0, 0
+        if self.spacing_m <= 0.0:
+            return (0, self.count) if x0 <= self.start_m <= x1 else (0, 0)
+        lo = max(0, int(math.ceil((x0 - self.start_m) / self.spacing_m)))
+        hi = min(self.count, int(math.floor((x1 - self.start_m) / self.spacing_m)) + 1)
+        return lo, max(lo, hi)
+
+    def positions(self, lo: int = 0, hi: Optional[int] = None) -> np.ndarray:
+        stop = self.count if hi is None else hi
+        x = self.start_m + self.spacing_m * np.arange(lo, stop, dtype=float)
+        return np.column_stack((x, np.full(x.size, self.lateral_m), np.full(x.size, self.mounting_height_m)))
+
+
+@dataclass(frozen=True)
+class TunnelLuminanceProfile:
+    """Per-station luminance along the tunnel (cd/m2)."""
+
+    stations_m: np.ndarray
+    road_avg: np.ndarray
+    road_min: np.ndarray
+    road_centre: np.ndarray
+    wall_avg: np.ndarray
+
+
+@dataclass(frozen=True)
+class TunnelLuminanceResult:
+    profile: TunnelLuminanceProfile
+    zones: List[Dict[str, object]]
+    compliance: Dict[str, bool]
+    flicker: List[Dict[str, object]]
+    segments: int
+    max_luminaires_per_segment: int
+
+
+def _row_templates(rows: Sequence[TunnelLuminaireRow]) -> List[Luminaire]:
+    """One luminaire per row carrying its rotation and a shared LUT; position is unused."""
+    luts: Dict[int, object] = {}
+    out: List[Luminaire] = []
+    for row in rows:
+        key = id(row.photometry)
+        if key not in luts:
+            luts[key] = build_interpolation_lut(canonical_from_photometry(row.photometry))
+        tf = Transform.from_euler_zyx(Vector3(0.0, 0.0, 0.0), yaw_deg=row.yaw_deg, pitch_deg=row.pitch_deg, roll_deg=row.roll_deg)
+        out.append(Luminaire(photometry=row.photometry, transform=tf, flux_multiplier=row.flux_multiplier, lut=luts[key]))
+    return out
+
+
+def _iter_segments(stations: np.ndarray, segment_length_m: float) -> Iterator[Tuple[int, int]]:
+    if stations.size == 0:
+        return
+    edges = np.searchsorted(stations, np.arange(float(stations[0]), float(stations[-1]) + segment_length_m, segment_length_m), side="left")
+    edges = np.unique(np.concatenate((edges, [stations.size])))
+    for a, b in zip(edges[:-1], edges[1:]):
+        if b > a:
+            yield int(a), int(b)
+
+
+def _illuminance(points: np.ndarray, normal: np.ndarray, lum_pos: np.ndarray, template: Luminaire) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-(point, luminaire) illuminance on ``normal`` planes and the point-to-luminaire vectors."""
+    to_lum = lum_pos[None, :, :] - points[:, None, :]
+    d2 = np.sum(to_lum * to_lum, axis=2)
+    ok = d2 > 1e-6
+    dist = np.sqrt(np.where(ok, d2, 1.0))
+    unit = to_lum / dist[:, :, None]
+    cos_inc = unit @ normal
+    intensity = luminaire_intensity_array(template, -unit.reshape(-1, 3)).reshape(d2.shape)
+    e = np.where(ok & (cos_inc > 0.0), intensity * cos_inc / np.where(ok, d2, 1.0), 0.0)
+    return e, to_lum
+
+
+def flicker_analysis(rows: Sequence[TunnelLuminaireRow], speed_kmh: float) -> List[Dict[str, object]]:
+    """Passing frequency ``v / spacing`` per luminaire row and whether it is in the CIE 88 critical band."""
+    v = max(float(speed_kmh), 0.0) / 3.6
+    out: List[Dict[str, object]] = []
+    for i, row in enumerate(rows):
+        spacing = float(row.spacing_m)
+        freq = v / spacing if spacing > 0.0 and v > 0.0 else 0.0
+        length = spacing * max(int(row.count) - 1, 0)
+        duration = length / v if v > 0.0 else 0.0
+        in_band = FLICKER_BAND_HZ[0] <= freq <= FLICKER_BAND_HZ[1]
+        out.append(
+            {
+                "row_index": i,
+                "spacing_m": spacing,
+                "frequency_hz": freq,
+                "duration_s": duration,
+                "in_critical_band": bool(in_band),
+                "critical": bool(in_band and duration > FLICKER_MAX_DURATION_S),
+            }
+        )
+    return out
+
+
+def compute_tunnel_luminance(
+    tunnel: TunnelGeometry,
+    rows: Sequence[TunnelLuminaireRow],
+    *,
+    zones: Optional[Sequence[TunnelZone]] = None,
+    station_step_m: float = 1.0,
+    road_points_across: int = 3,
+    wall_sample_heights_m: Sequence[float] = (0.5, 1.0, 1.5, 2.0),
+    wall_reflectance: float = 0.5,
+    surface_class: str = "R3",
+    observer_distance_m: float = 60.0,
+    observer_height_m: float = 1.5,
+    segment_length_m: float = 100.0,
+    influence_m: Optional[float] = None,
+    design_speed_kmh: Optional[float] = None,
+) -> TunnelLuminanceResult:
+    """
+    Road and wall luminance along the full tunnel, evaluated in streamed segments.
+
+    Stations are spaced ``station_step_m`` along the axis with ``road_points_across``
+    road points and wall points at ``wall_sample_heights_m`` on both walls. Each
+    segment of ``segment_length_m`` only considers luminaires within ``influence_m``
+    of it (default 12 x the highest mounting height), so memory does not grow with
+    tunnel length. Road luminance is ``E_h * q(beta, tan(gamma))`` from the road
+    reflection table, seen by an observer ``observer_distance_m`` back in the same
+    line; walls are Lambertian with ``wall_reflectance``. Zones, if given, are checked
+    for average luminance, U0, Ul and a wall/road ratio of at least 0.6.
+    """
+    length = float(tunnel.length_m)
+    width = float(tunnel.width_m)
+    step = max(float(station_step_m), 1e-3)
+    stations = np.arange(0.5 * step, length, step, dtype=float) if length > 0.0 else np.zeros((0,), dtype=float)
+    n_across = max(1, int(road_points_across))
+    road_y = -0.5 * width + (np.arange(n_across, dtype=float) + 0.5) * width / n_across
+    centre = n_across // 2
+    heights = np.asarray(list(wall_sample_heights_m), dtype=float)
+    max_h = max((float(r.mounting_height_m) for r in rows), default=0.0)
+    reach = float(influence_m) if influence_m is not None else max(12.0 * max_h, 30.0)
+    templates = _row_templates(rows)
+    rho_wall = max(float(wall_reflectance), 0.0)
+    up = np.array([0.0, 0.0, 1.0])
+    walls = ((-0.5 * width, np.array([0.0, 1.0, 0.0])), (0.5 * width, np.array([0.0, -1.0, 0.0])))
+    # Observer straight back along the lane: fixed horizontal view direction and tan(gamma).
+    view_h = np.array([-1.0, 0.0])
+    tan_g = float(observer_height_m) / max(float(observer_distance_m), 1e-12)
+
+    road_avg = np.zeros(stations.shape, dtype=float)
+    road_min = np.zeros(stations.shape, dtype=float)
+    road_centre = np.zeros(stations.shape, dtype=float)
+    wall_avg = np.zeros(stations.shape, dtype=float)
+    segments = 0
+    max_lums = 0
+    for a, b in _iter_segments(stations, max(float(segment_length_m), step)):
+        segments += 1
+        xs = stations[a:b]
+        n = xs.size
+        road = np.column_stack((np.repeat(xs, n_across), np.tile(road_y, n), np.zeros(n * n_across)))
+        road_l = np.zeros((road.shape[0],), dtype=float)
+        wall_e = [np.zeros((n * heights.size,), dtype=float) for _ in walls]
+        wall_pts = [
+            np.column_stack((np.repeat(xs, heights.size), np.full(n * heights.size, wy), np.tile(heights, n)))
+            for wy, _ in walls
+        ]
+        seg_lums = 0
+        for row, template in zip(rows, templates):
+            lo, hi = row.index_window(float(xs[0]) - reach, float(xs[-1]) + reach)
+            if hi <= lo:
+                continue
+            seg_lums += hi - lo
+            lum_pos = row.positions(lo, hi)
+            e_h, to_lum = _illuminance(road, up, lum_pos, template)
+            # beta: horizontal angle between the light and view directions, folded to [0, 90].
+            lh = to_lum[:, :, :2]
+            lh_n = np.linalg.norm(lh, axis=2)
+            cos_b = np.where(lh_n > 1e-12, (lh @ view_h) / np.maximum(lh_n, 1e-12), 1.0)
+            beta = np.degrees(np.arccos(np.clip(cos_b, -1.0, 1.0)))
+            beta = np.minimum(beta, 180.0 - beta)
+            q = lookup_reflection_coefficients(surface_class, beta, np.full(beta.shape, tan_g))
+            road_l += np.sum(e_h * q, axis=1)
+            for k, (_, normal) in enumerate(walls):
+                e_w, _ = _illuminance(wall_pts[k], normal, lum_pos, template)
+                wall_e[k] += np.sum(e_w, axis=1)
+        max_lums = max(max_lums, seg_lums)
+        grid = road_l.reshape(n, n_across)
+        road_avg[a:b] = np.mean(grid, axis=1)
+        road_min[a:b] = np.min(grid, axis=1)
+        road_centre[a:b] = grid[:, centre]
+        wall_l = sum(rho_wall * e.reshape(n, heights.size) / math.pi for e in wall_e)
+        wall_avg[a:b] = np.mean(wall_l, axis=1) / len(walls)
+
+    profile = TunnelLuminanceProfile(
+        stations_m=stations,
+        road_avg=road_avg,
+        road_min=road_min,
+        road_centre=road_centre,
+        wall_avg=wall_avg,
+    )
+    zone_rows: List[Dict[str, object]] = []
+    measured: Dict[str, float] = {}
+    for zone in zones or ():
+        sel = (stations >= float(zone.start_m)) & (stations < float(zone.end_m))
+        if not np.any(sel):
+            continue
+        l_avg = float(np.mean(road_avg[sel]))
+        l_min = float(np.min(road_min[sel]))
+        c = road_centre[sel]
+        u0 = l_min / l_avg if l_avg > 1e-12 else 0.0
+        ul = float(np.min(c) / np.max(c)) if float(np.max(c)) > 1e-12 else 0.0
+        w_avg = float(np.mean(wall_avg[sel]))
+        wall_ratio = w_avg / l_avg if l_avg > 1e-12 else 0.0
+        measured[zone.name] = l_avg
+        zone_rows.append(
+            {
+                "name": zone.name,
+                "start_m": float(zone.start_m),
+                "end_m": float(zone.end_m),
+                "L_avg_cd_m2": l_avg,
+                "L_min_cd_m2": l_min,
+                "U0": u0,
+                "Ul": ul,
+                "wall_avg_cd_m2": w_avg,
+                "wall_road_ratio": wall_ratio,
+                "required_luminance_cd_m2": float(zone.required_luminance_cd_m2),
+                "luminance_ok": l_avg >= float(zone.required_luminance_cd_m2),
+                "U0_ok": u0 >= float(zone.required_uniformity_U0),
+                "Ul_ok": ul >= float(zone.required_uniformity_Ul),
+                "wall_ratio_ok": wall_ratio >= 0.6,
+            }
+        )
+    compliance: Dict[str, bool] = {}
+    if zone_rows:
+        compliance = TunnelLightingDesign().check_compliance([z for z in zones or () if z.name in measured], measured)
+        for row in zone_rows:
+            name = str(row["name"])
+            compliance[name] = all(bool(row[k]) for k in ("luminance_ok", "U0_ok", "Ul_ok", "wall_ratio_ok"))
+        compliance["overall"] = all(v for k, v in compliance.items() if k != "overall")
+    speed = float(design_speed_kmh) if design_speed_kmh is not None else float(tunnel.speed_limit_kmh)
+    return TunnelLuminanceResult(
+        profile=profile,
+        zones=zone_rows,
+        compliance=compliance,
+        flicker=flicker_analysis(rows, speed),
+        segments=segments,
+        max_luminaires_per_segment=max_lums,
+    )
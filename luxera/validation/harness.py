@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+import functools
 import json
 import math
 import shutil
@@ -12,6 +13,7 @@ import numpy as np
 
 from luxera.project.io import load_project_schema
 from luxera.runner import run_job
+from luxera.testing.suite import SUITE_CACHE_FILENAME, input_fingerprint, run_suite, scene_input_paths
 
 
 CASE_SCHEMA_VERSION = "validation_case_v1"
@@ -494,8 +496,73 @@ def run_case(case: ValidationCaseRef, out_root: Path) -> CaseRunResult:
     )
 
 
-def run_cases(cases: Sequence[ValidationCaseRef], out_root: Path) -> List[CaseRunResult]:
-    return [run_case(case, out_root) for case in sorted(cases, key=lambda c: (c.suite, c.case_id))]
+def _metric_payload(m: MetricResult) -> Dict[str, Any]:
+    return {"kind": m.kind, "id": m.metric_id, "passed": m.passed, "skipped": m.skipped, "details": m.details}
+
+
+def _run_case_task(case: ValidationCaseRef, *, out_root: Path) -> Tuple[bool, Dict[str, Any]]:
+    result = run_case(case, out_root)
+    return result.passed, {
+        "suite": result.suite,
+        "case_id": result.case_id,
+        "passed": result.passed,
+        "metrics": [_metric_payload(m) for m in result.metrics],
+        "output_dir": str(result.output_dir),
+        "comparison_path": str(result.comparison_path),
+    }
+
+
+def _case_result_from_payload(payload: Mapping[str, Any]) -> CaseRunResult:
+    return CaseRunResult(
+        suite=str(payload["suite"]),
+        case_id=str(payload["case_id"]),
+        passed=bool(payload["passed"]),
+        metrics=[
+            MetricResult(
+                kind=str(m["kind"]),
+                metric_id=str(m["id"]),
+                passed=bool(m["passed"]),
+                skipped=bool(m["skipped"]),
+                details=dict(m.get("details", {})),
+            )
+            for m in payload.get("metrics", [])
+        ],
+        output_dir=Path(str(payload["output_dir"])),
+        comparison_path=Path(str(payload["comparison_path"])),
+    )
+
+
+def run_cases(
+    cases: Sequence[ValidationCaseRef],
+    out_root: Path,
+    *,
+    jobs: int | None = 1,
+    incremental: bool = False,
+) -> List[CaseRunResult]:
+    """
+    Run cases in a pool of ``jobs`` processes (``None`` or 0: one per CPU).
+
+    Passing cases are recorded in ``out_root/suite_cache.json`` keyed by a hash of
+    the case directory, referenced photometry and the engine version; with
+    ``incremental`` set, unchanged cases reuse that pass (and the artifacts it left
+    under ``out_root``) instead of re-running.
+    """
+    out_root = Path(out_root).expanduser().resolve()
+    ordered = sorted(cases, key=lambda c: (c.suite, c.case_id))
+    fingerprints = [
+        input_fingerprint([case.case_dir, *scene_input_paths(case.case_dir / "scene.lux.json")])
+        for case in ordered
+    ]
+    outcomes = run_suite(
+        ordered,
+        functools.partial(_run_case_task, out_root=out_root),
+        keys=[f"{c.suite}/{c.case_id}" for c in ordered],
+        fingerprints=fingerprints,
+        cache_path=out_root / SUITE_CACHE_FILENAME,
+        incremental=incremental,
+        jobs=jobs,
+    )
+    return [_case_result_from_payload(o.payload) for o in outcomes]
 
 
 def _fmt(v: float) -> str:
@@ -564,16 +631,7 @@ def write_suite_report(suite: str, case_results: Sequence[CaseRunResult], out_ro
             {
                 "case_id": c.case_id,
                 "passed": c.passed,
-                "metrics": [
-                    {
-                        "kind": m.kind,
-                        "id": m.metric_id,
-                        "passed": m.passed,
-                        "skipped": m.skipped,
-                        "details": m.details,
-                    }
-                    for m in c.metrics
-                ],
+                "metrics": [_metric_payload(m) for m in c.metrics],
             }
             for c in sorted(case_results, key=lambda x: x.case_id)
         ],
@@ -16,7 +16,14 @@ from luxera.viewer.mesh import (
     mesh_from_trimesh,
 )
 from luxera.viewer.renderer import Renderer, SceneObject
-from luxera.viewer.streaming import StoreyChunk, build_storey_chunks, filter_chunks_for_storeys
+from luxera.viewer.streaming import (
+    ChunkStore,
+    StoreyChunk,
+    build_storey_chunks,
+    filter_chunks_for_storeys,
+    iter_chunk_stream,
+    surface_content_hash,
+)
 
 __all__ = [
     "Camera",
@@ -30,9 +37,12 @@ __all__ = [
     "mesh_from_trimesh",
     "Renderer",
     "SceneObject",
+    "ChunkStore",
     "StoreyChunk",
     "build_storey_chunks",
     "filter_chunks_for_storeys",
+    "iter_chunk_stream",
+    "surface_content_hash",
 ]
 
 try:
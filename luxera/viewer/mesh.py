@@ -251,17 +251,13 @@ def mesh_from_trimesh(
         indices = np.zeros((0, 3), dtype=np.uint32)
 
     normals = np.zeros_like(vertices, dtype=np.float32)
-    for a, b, c in indices.tolist():
-        va = vertices[a]
-        vb = vertices[b]
-        vc = vertices[c]
-        n = np.cross(vb - va, vc - va)
-        ln = float(np.linalg.norm(n))
-        if ln > 0.0:
-            n = n / ln
-        normals[a] += n
-        normals[b] += n
-        normals[c] += n
+    if indices.shape[0]:
+        va = vertices[indices[:, 0]]
+        fn = np.cross(vertices[indices[:, 1]] - va, vertices[indices[:, 2]] - va)
+        ln = np.linalg.norm(fn, axis=1, keepdims=True)
+        fn = np.divide(fn, ln, out=fn, where=ln > 0.0)
+        for k in range(3):
+            np.add.at(normals, indices[:, k], fn)
     nl = np.linalg.norm(normals, axis=1, keepdims=True)
     nl[nl == 0.0] = 1.0
     normals = normals / nl
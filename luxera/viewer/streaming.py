@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 
-from luxera.geometry.lod import build_lod
+from luxera.geometry.lod import simplify_mesh_levels
 from luxera.geometry.mesh import TriMesh
 from luxera.geometry.triangulate import triangulate_polygon_vertices
 from luxera.project.schema import Project, SurfaceSpec
 from luxera.viewer.mesh import Mesh, mesh_from_trimesh
 
 
+# Extra LOD levels (fractions of the full face count) built below the viewport level.
+DEFAULT_LOD_RATIOS: Tuple[float, ...] = (0.1,)
+
+
 @dataclass(frozen=True)
 class StoreyChunk:
     chunk_id: str
@@ -17,6 +23,43 @@ class StoreyChunk:
     surface_ids: Tuple[str, ...]
     calc_mesh: TriMesh
     viewport_mesh: Mesh
+    # Viewer LODs ordered coarsest first; the viewport mesh is one of them.
+    lod_meshes: Tuple[Mesh, ...] = ()
+    content_hash: str = ""
+
+
+class ChunkStore:
+    """
+    In-memory cache of storey chunks keyed by the hash of their surfaces.
+
+    Pass the same store to successive ``build_storey_chunks`` calls so that only
+    storeys whose surfaces (or LOD settings) changed are re-meshed.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: Dict[str, StoreyChunk] = {}
+        self.last_rebuilt: Tuple[str, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def get(self, storey_id: str, content_hash: str) -> Optional[StoreyChunk]:
+        chunk = self._chunks.get(storey_id)
+        if chunk is None or chunk.content_hash != content_hash:
+            return None
+        return chunk
+
+    def put(self, chunk: StoreyChunk) -> None:
+        self._chunks[chunk.storey_id] = chunk
+
+    def retain(self, storey_ids: Iterable[str]) -> None:
+        keep = set(storey_ids)
+        for sid in [s for s in self._chunks if s not in keep]:
+            del self._chunks[sid]
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self.last_rebuilt = ()
 
 
 def _surface_to_trimesh(surface: SurfaceSpec) -> Optional[TriMesh]:
@@ -66,12 +109,64 @@ def _infer_storey_id(surface: SurfaceSpec, room_level_by_id: Mapping[str, str])
     return f"storey_{idx}"
 
 
+def surface_content_hash(surface: SurfaceSpec) -> str:
+    """Hash of the surface fields that affect its chunk mesh."""
+    payload = {
+        "id": surface.id,
+        "kind": surface.kind,
+        "vertices": [[float(f"{c:.12g}") for c in v] for v in surface.vertices],
+    }
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _storey_hash(surfaces: Sequence[SurfaceSpec], ratios: Sequence[float]) -> str:
+    h = hashlib.sha256()
+    h.update(json.dumps([float(r) for r in ratios]).encode("utf-8"))
+    for s in surfaces:
+        h.update(surface_content_hash(s).encode("ascii"))
+    return h.hexdigest()
+
+
+def _build_chunk(
+    storey_id: str,
+    surfaces: Sequence[SurfaceSpec],
+    ratios: Sequence[float],
+    viewport_ratio: float,
+    content_hash: str,
+) -> Optional[StoreyChunk]:
+    meshes = [m for m in (_surface_to_trimesh(s) for s in surfaces) if m is not None]
+    merged = _combine_meshes(meshes)
+    if merged is None:
+        return None
+    levels = [mesh_from_trimesh(m, use_lod=False) for m in simplify_mesh_levels(merged, ratios)]
+    viewport = levels[list(ratios).index(viewport_ratio)]
+    return StoreyChunk(
+        chunk_id=f"chunk:{storey_id}",
+        storey_id=storey_id,
+        surface_ids=tuple(s.id for s in surfaces),
+        calc_mesh=merged,
+        viewport_mesh=viewport,
+        lod_meshes=tuple(reversed(levels)),
+        content_hash=content_hash,
+    )
+
+
 def build_storey_chunks(
     project: Project,
     *,
     viewport_ratio: float = 0.4,
     include_kinds: Optional[Iterable[str]] = None,
+    lod_ratios: Sequence[float] = DEFAULT_LOD_RATIOS,
+    store: Optional[ChunkStore] = None,
 ) -> List[StoreyChunk]:
+    """
+    Merge surfaces per storey and build viewport LODs.
+
+    ``lod_ratios`` adds coarser levels below ``viewport_ratio`` for progressive
+    streaming. With a ``store``, storeys whose surface hashes are unchanged reuse
+    their cached chunk; ``store.last_rebuilt`` lists the storeys that were re-meshed.
+    """
     kinds = set(include_kinds) if include_kinds is not None else {"wall", "floor", "ceiling", "custom"}
     room_level_by_id: Dict[str, str] = {r.id: r.level_id for r in project.geometry.rooms if r.level_id}
 
@@ -82,26 +177,49 @@ def build_storey_chunks(
         sid = _infer_storey_id(s, room_level_by_id)
         surfaces_by_storey.setdefault(sid, []).append(s)
 
+    vp = max(0.05, min(1.0, float(viewport_ratio)))
+    ratios = sorted({vp, *(max(0.05, min(1.0, float(r))) for r in lod_ratios if float(r) < vp)}, reverse=True)
     chunks: List[StoreyChunk] = []
+    rebuilt: List[str] = []
     for storey_id in sorted(surfaces_by_storey):
-        meshes = [m for m in (_surface_to_trimesh(s) for s in surfaces_by_storey[storey_id]) if m is not None]
-        merged = _combine_meshes(meshes)
-        if merged is None:
-            continue
-        lod = build_lod(merged, viewport_ratio=viewport_ratio)
-        viewport = mesh_from_trimesh(lod.simplified, use_lod=False)
-        chunks.append(
-            StoreyChunk(
-                chunk_id=f"chunk:{storey_id}",
-                storey_id=storey_id,
-                surface_ids=tuple(s.id for s in surfaces_by_storey[storey_id]),
-                calc_mesh=lod.full,
-                viewport_mesh=viewport,
-            )
-        )
+        surfaces = surfaces_by_storey[storey_id]
+        content_hash = _storey_hash(surfaces, ratios)
+        chunk = store.get(storey_id, content_hash) if store is not None else None
+        if chunk is None:
+            chunk = _build_chunk(storey_id, surfaces, ratios, vp, content_hash)
+            if chunk is None:
+                continue
+            rebuilt.append(storey_id)
+            if store is not None:
+                store.put(chunk)
+        chunks.append(chunk)
+    if store is not None:
+        store.retain(c.storey_id for c in chunks)
+        store.last_rebuilt = tuple(rebuilt)
     return chunks
 
 
+def iter_chunk_stream(
+    chunks: Sequence[StoreyChunk], visible_storeys: Optional[Set[str]] = None
+) -> Iterator[Tuple[StoreyChunk, int, Mesh]]:
+    """
+    Yield ``(chunk, level, mesh)`` coarsest level first across all chunks.
+
+    Every visible storey gets its coarsest mesh before any storey gets a finer one, so
+    a large building is on screen after the first pass. Chunks without LODs yield
+    their viewport mesh.
+    """
+    visible = filter_chunks_for_storeys(chunks, visible_storeys)
+    depth = max((len(c.lod_meshes) for c in visible), default=0)
+    for chunk in visible:
+        if not chunk.lod_meshes:
+            yield chunk, 0, chunk.viewport_mesh
+    for level in range(depth):
+        for chunk in visible:
+            if level < len(chunk.lod_meshes):
+                yield chunk, level, chunk.lod_meshes[level]
+
+
 def filter_chunks_for_storeys(chunks: Sequence[StoreyChunk], visible_storeys: Optional[Set[str]]) -> List[StoreyChunk]:
     if not visible_storeys:
         return list(chunks)
@@ -1,4 +1,14 @@
 from luxera.viz.contours import compute_contour_levels
 from luxera.viz.falsecolor import FalseColourRenderer, render_falsecolor_plane
+from luxera.viz.raster import annotate_image, colorize, encode_png, render_grid_image, write_png
 
-__all__ = ["compute_contour_levels", "render_falsecolor_plane", "FalseColourRenderer"]
+__all__ = [
+    "compute_contour_levels",
+    "render_falsecolor_plane",
+    "FalseColourRenderer",
+    "annotate_image",
+    "colorize",
+    "encode_png",
+    "render_grid_image",
+    "write_png",
+]
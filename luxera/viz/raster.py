@@ -0,0 +1,549 @@
+"""
+Matplotlib-free false-colour rasters.
+
+Result directories get one heatmap, isolux and false-colour image per calc
+object. Building a matplotlib figure for each of those dominates the artifact
+stage of a run, so they are produced here with NumPy colour lookup tables and
+a small PNG encoder instead. Reports embed these images, so each one carries
+a colour bar with tick values and units, plus axis extents when the grid
+geometry is known, drawn with a built-in 5x7 bitmap font. Free-form report
+figures (titles, arbitrary text) still go through matplotlib.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+
+# Colour stops sampled at 17 evenly spaced positions from the matplotlib maps
+# of the same name; "luxera" mirrors FalseColourRenderer._custom_luxera_cmap.
+_COLORMAP_STOPS: Dict[str, Tuple[Tuple[float, str], ...]] = {
+    "inferno": tuple(
+        zip(
+            np.linspace(0.0, 1.0, 17).tolist(),
+            (
+                "#000004", "#0B0724", "#210C4A", "#3D0965", "#57106E", "#71196E", "#8A226A", "#A32C61", "#BC3754",
+                "#D24644", "#E45A31", "#F1731D", "#F98E09", "#FCAC11", "#F9CB35", "#F2EA69", "#FCFFA4",
+            ),
+        )
+    ),
+    "viridis": tuple(
+        zip(
+            np.linspace(0.0, 1.0, 17).tolist(),
+            (
+                "#440154", "#48186A", "#472D7B", "#424086", "#3B528B", "#33638D", "#2C728E", "#26828E", "#21918C",
+                "#1FA088", "#28AE80", "#3FBC73", "#5EC962", "#84D44B", "#ADDC30", "#D8E219", "#FDE725",
+            ),
+        )
+    ),
+    "plasma": tuple(
+        zip(
+            np.linspace(0.0, 1.0, 17).tolist(),
+            (
+                "#0D0887", "#310597", "#4C02A1", "#6600A7", "#7E03A8", "#9511A1", "#AA2395", "#BC3587", "#CC4778",
+                "#DA5A6A", "#E66C5C", "#F0804E", "#F89540", "#FDAC33", "#FDC527", "#F8DF25", "#F0F921",
+            ),
+        )
+    ),
+    "luxera": (
+        (0.0, "#000033"),
+        (0.15, "#0000CC"),
+        (0.30, "#0099FF"),
+        (0.45, "#00CC66"),
+        (0.60, "#FFFF00"),
+        (0.80, "#FF6600"),
+        (1.0, "#CC0000"),
+    ),
+}
+
+DEFAULT_MAX_SIDE_PX = 480
+_NAN_RGB = np.array([128, 128, 128], dtype=np.uint8)
+_LINE_RGB = np.array([0, 0, 0], dtype=np.uint8)
+_PAPER_RGB = np.array([255, 255, 255], dtype=np.uint8)
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# 5x7 glyphs for tick values, units and axis labels. Spaces render blank and
+# any other character as _MISSING_GLYPH, so unsupported text stays visible.
+_GLYPHS: Dict[str, Tuple[str, ...]] = {
+    "0": ("01110", "10001", "10011", "10101", "11001", "10001", "01110"),
+    "1": ("00100", "01100", "00100", "00100", "00100", "00100", "01110"),
+    "2": ("01110", "10001", "00001", "00010", "00100", "01000", "11111"),
+    "3": ("11110", "00001", "00001", "01110", "00001", "00001", "11110"),
+    "4": ("00010", "00110", "01010", "10010", "11111", "00010", "00010"),
+    "5": ("11111", "10000", "11110", "00001", "00001", "10001", "01110"),
+    "6": ("00110", "01000", "10000", "11110", "10001", "10001", "01110"),
+    "7": ("11111", "00001", "00010", "00100", "01000", "01000", "01000"),
+    "8": ("01110", "10001", "10001", "01110", "10001", "10001", "01110"),
+    "9": ("01110", "10001", "10001", "01111", "00001", "00010", "01100"),
+    ".": ("00000", "00000", "00000", "00000", "00000", "01100", "01100"),
+    "-": ("00000", "00000", "00000", "11111", "00000", "00000", "00000"),
+    "(": ("00010", "00100", "01000", "01000", "01000", "00100", "00010"),
+    ")": ("01000", "00100", "00010", "00010", "00010", "00100", "01000"),
+    "%": ("11000", "11001", "00010", "00100", "01000", "10011", "00011"),
+    "/": ("00000", "00001", "00010", "00100", "01000", "10000", "00000"),
+    "c": ("00000", "00000", "01110", "10000", "10000", "10001", "01110"),
+    "d": ("00001", "00001", "01101", "10011", "10001", "10001", "01111"),
+    "l": ("01100", "00100", "00100", "00100", "00100", "00100", "01110"),
+    "u": ("00000", "00000", "10001", "10001", "10001", "10011", "01101"),
+    "x": ("00000", "00000", "10001", "01010", "00100", "01010", "10001"),
+    "m": ("00000", "00000", "11010", "10101", "10101", "10001", "10001"),
+    "U": ("10001", "10001", "10001", "10001", "10001", "10001", "01110"),
+    "V": ("10001", "10001", "10001", "10001", "10001", "01010", "00100"),
+    "X": ("10001", "10001", "01010", "00100", "01010", "10001", "10001"),
+    "Y": ("10001", "10001", "01010", "00100", "00100", "00100", "00100"),
+    "Z": ("11111", "00001", "00010", "00100", "01000", "10000", "11111"),
+}
+_MISSING_GLYPH = ("11111", "10001", "10001", "10001", "10001", "10001", "11111")
+_FONT_SCALE = 2
+_TEXT_H = 7 * _FONT_SCALE
+_ADVANCE = 6 * _FONT_SCALE
+_PAD = 8
+_BAR_W = 18
+_MIN_BAR_H = 120
+
+# (xmin, xmax, ymin, ymax) of the plotted area in metres.
+Extent = Tuple[float, float, float, float]
+
+T = TypeVar("T")
+
+
+def _hex_to_rgb(code: str) -> Tuple[int, int, int]:
+    code = code.lstrip("#")
+    return int(code[0:2], 16), int(code[2:4], 16), int(code[4:6], 16)
+
+
+def _limits(finite: np.ndarray, vmin: Optional[float], vmax: Optional[float]) -> Tuple[float, float]:
+    lo = float(vmin) if vmin is not None else (float(np.min(finite)) if finite.size else 0.0)
+    hi = float(vmax) if vmax is not None else (float(np.max(finite)) if finite.size else 1.0)
+    return lo, hi
+
+
+@lru_cache(maxsize=None)
+def colormap_lut(name: str, n: int = 256) -> np.ndarray:
+    """Return an ``(n, 3)`` uint8 lookup table for a named colormap."""
+    stops = _COLORMAP_STOPS.get(name)
+    if stops is None:
+        raise ValueError(f"Unknown colormap: {name}. Available: {sorted(_COLORMAP_STOPS)}")
+    pos = np.array([p for p, _ in stops], dtype=float)
+    rgb = np.array([_hex_to_rgb(c) for _, c in stops], dtype=float)
+    t = np.linspace(0.0, 1.0, int(n))
+    lut = np.stack([np.interp(t, pos, rgb[:, k]) for k in range(3)], axis=1)
+    out = np.rint(lut).astype(np.uint8)
+    out.flags.writeable = False
+    return out
+
+
+def colorize(
+    values: np.ndarray,
+    *,
+    vmin: Optional[float] = None,
+    vmax: Optional[float] = None,
+    cmap: str = "inferno",
+) -> np.ndarray:
+    """Map a 2D scalar field to an ``(h, w, 3)`` uint8 image. NaNs render grey."""
+    arr = np.asarray(values, dtype=float)
+    finite = np.isfinite(arr)
+    lo, hi = _limits(arr[finite], vmin, vmax)
+    lut = colormap_lut(cmap)
+    span = hi - lo
+    if span <= 1e-12:
+        idx = np.zeros(arr.shape, dtype=np.intp)
+    else:
+        scaled = (np.where(finite, arr, lo) - lo) * ((lut.shape[0] - 1) / span)
+        idx = np.clip(scaled, 0, lut.shape[0] - 1).astype(np.intp)
+    img = lut[idx]
+    if not finite.all():
+        img[~finite] = _NAN_RGB
+    return img
+
+
+def canvas_shape(ny: int, nx: int, max_side: int = DEFAULT_MAX_SIDE_PX) -> Tuple[int, int]:
+    """Pixel ``(height, width)`` keeping the grid aspect with the longest side at ``max_side``."""
+    scale = float(max_side) / float(max(int(nx), int(ny), 1))
+    return max(1, int(round(ny * scale))), max(1, int(round(nx * scale)))
+
+
+def _sample_coords(n_src: int, n_dst: int) -> np.ndarray:
+    return np.clip((np.arange(n_dst) + 0.5) * (n_src / float(n_dst)) - 0.5, 0.0, max(n_src - 1, 0))
+
+
+def resample(grid: np.ndarray, height: int, width: int, *, smooth: bool = True) -> np.ndarray:
+    """
+    Resample a cell-centred grid to ``(height, width)`` pixels.
+
+    ``smooth`` uses separable bilinear interpolation; otherwise each cell is
+    replicated as a flat block, like ``imshow`` without interpolation.
+    """
+    src = np.asarray(grid, dtype=float)
+    ny, nx = src.shape
+    ys = _sample_coords(ny, height)
+    xs = _sample_coords(nx, width)
+    if not smooth:
+        return src[np.rint(ys).astype(np.intp)][:, np.rint(xs).astype(np.intp)]
+    y0 = np.floor(ys).astype(np.intp)
+    x0 = np.floor(xs).astype(np.intp)
+    y1 = np.minimum(y0 + 1, ny - 1)
+    x1 = np.minimum(x0 + 1, nx - 1)
+    fy = (ys - y0)[:, None]
+    fx = (xs - x0)[None, :]
+    rows0 = src[y0]
+    rows1 = src[y1]
+    top = rows0[:, x0] * (1.0 - fx) + rows0[:, x1] * fx
+    bottom = rows1[:, x0] * (1.0 - fx) + rows1[:, x1] * fx
+    return top * (1.0 - fy) + bottom * fy
+
+
+def contour_bands(field: np.ndarray, levels: Sequence[float]) -> np.ndarray:
+    """Band index of each pixel: the number of ``levels`` at or below its value."""
+    lv = np.sort(np.asarray(list(levels), dtype=float))
+    return np.searchsorted(lv, np.asarray(field, dtype=float), side="right")
+
+
+def contour_mask(bands: np.ndarray) -> np.ndarray:
+    """Boolean mask of pixels on a band boundary (one pixel wide)."""
+    mask = np.zeros(bands.shape, dtype=bool)
+    mask[:, :-1] |= bands[:, 1:] != bands[:, :-1]
+    mask[:-1, :] |= bands[1:, :] != bands[:-1, :]
+    return mask
+
+
+def encode_png(image: np.ndarray, *, compress_level: int = 6) -> bytes:
+    """Encode an ``(h, w, 3)`` RGB or ``(h, w, 4)`` RGBA uint8 image as PNG."""
+    arr = np.ascontiguousarray(image, dtype=np.uint8)
+    if arr.ndim != 3 or arr.shape[2] not in (3, 4) or arr.shape[0] == 0 or arr.shape[1] == 0:
+        raise ValueError(f"Expected a non-empty (h, w, 3|4) image, got shape {arr.shape}")
+    h, w, c = arr.shape
+    rows = arr.reshape(h, w * c)
+    # "Sub" filter (type 1): flat colour runs become zeros and compress well.
+    filtered = rows.copy()
+    filtered[:, c:] = rows[:, c:] - rows[:, :-c]
+    raw = np.empty((h, w * c + 1), dtype=np.uint8)
+    raw[:, 0] = 1
+    raw[:, 1:] = filtered
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", w, h, 8, 2 if c == 3 else 6, 0, 0, 0)
+    return b"".join(
+        (
+            _PNG_SIGNATURE,
+            chunk(b"IHDR", header),
+            chunk(b"IDAT", zlib.compress(raw.tobytes(), int(compress_level))),
+            chunk(b"IEND", b""),
+        )
+    )
+
+
+def write_png(path: Path, image: np.ndarray) -> Path:
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(encode_png(image))
+    return out
+
+
+def _as_grid(values: np.ndarray, nx: int, ny: int) -> np.ndarray:
+    arr = np.asarray(values, dtype=float).reshape(-1)
+    if arr.size != int(nx) * int(ny):
+        raise ValueError(f"values size {arr.size} does not match nx*ny={int(nx) * int(ny)}")
+    return arr.reshape(int(ny), int(nx))
+
+
+def render_grid_image(
+    values: np.ndarray,
+    nx: int,
+    ny: int,
+    *,
+    cmap: str = "inferno",
+    vmin: Optional[float] = None,
+    vmax: Optional[float] = None,
+    contour_levels: Optional[Sequence[float]] = None,
+    banded: bool = False,
+    smooth: bool = False,
+    max_side: int = DEFAULT_MAX_SIDE_PX,
+) -> np.ndarray:
+    """
+    Render row-major grid values (``ny`` rows of ``nx``) to an RGB image.
+
+    The image has y increasing upwards. With ``banded`` each contour band is
+    filled with the colour of its midpoint; ``contour_levels`` also draws the
+    band boundaries.
+    """
+    grid = _as_grid(values, nx, ny)
+    lo, hi = _limits(grid[np.isfinite(grid)], vmin, vmax)
+    height, width = canvas_shape(grid.shape[0], grid.shape[1], max_side)
+    field = resample(grid, height, width, smooth=smooth or banded)[::-1]
+    if contour_levels is None or len(contour_levels) == 0:
+        return colorize(field, vmin=lo, vmax=hi, cmap=cmap)
+    levels = np.sort(np.asarray(list(contour_levels), dtype=float))
+    bands = contour_bands(field, levels)
+    if banded:
+        edges = np.concatenate(([lo], levels, [hi]))
+        mids = 0.5 * (edges[:-1] + edges[1:])
+        img = colorize(mids[None, :], vmin=lo, vmax=hi, cmap=cmap)[0][bands]
+        img[~np.isfinite(field)] = _NAN_RGB
+    else:
+        img = colorize(field, vmin=lo, vmax=hi, cmap=cmap)
+    img[contour_mask(bands)] = _LINE_RGB
+    return img
+
+
+@lru_cache(maxsize=None)
+def _glyph(char: str) -> np.ndarray:
+    if char == " ":
+        return np.zeros((_TEXT_H, 5 * _FONT_SCALE), dtype=bool)
+    rows = _GLYPHS.get(char, _MISSING_GLYPH)
+    bits = np.array([[c == "1" for c in row] for row in rows], dtype=bool)
+    return np.repeat(np.repeat(bits, _FONT_SCALE, axis=0), _FONT_SCALE, axis=1)
+
+
+def text_width(text: str) -> int:
+    return max(len(text) * _ADVANCE - _FONT_SCALE, 0)
+
+
+def draw_text(canvas: np.ndarray, text: str, x: int, y: int, *, align: str = "left", rgb: np.ndarray = _LINE_RGB) -> None:
+    """Draw ``text`` with its top edge at row ``y``; ``align`` anchors column ``x`` left, right or center."""
+    width = text_width(text)
+    if align == "right":
+        x -= width
+    elif align == "center":
+        x -= width // 2
+    h, w = canvas.shape[:2]
+    for i, char in enumerate(text):
+        mask = _glyph(char)
+        x0, y0 = x + i * _ADVANCE, y
+        r0, c0 = max(y0, 0), max(x0, 0)
+        r1, c1 = min(y0 + mask.shape[0], h), min(x0 + mask.shape[1], w)
+        if r1 > r0 and c1 > c0:
+            canvas[r0:r1, c0:c1][mask[r0 - y0 : r1 - y0, c0 - x0 : c1 - x0]] = rgb
+
+
+def format_ticks(values: Sequence[float]) -> List[str]:
+    """Format tick values with the fewest decimals (max 3) that keep neighbours apart."""
+    vals = np.asarray(list(values), dtype=float)
+    steps = np.diff(np.unique(vals))
+    step = float(np.min(steps)) if steps.size else max(abs(float(vals[0])) if vals.size else 1.0, 1.0)
+    decimals = 0
+    if step < 1.0:
+        decimals = min(3, int(np.ceil(-np.log10(step))))
+        while decimals < 3 and abs(round(step, decimals) - step) > 1e-9:
+            decimals += 1
+    out = []
+    for v in vals:
+        text = f"{v:.{decimals}f}"
+        out.append(text[1:] if text.startswith("-") and float(text) == 0.0 else text)
+    return out
+
+
+def _frame(canvas: np.ndarray, top: int, left: int, height: int, width: int) -> None:
+    canvas[max(top - 1, 0), max(left - 1, 0) : left + width + 1] = _LINE_RGB
+    canvas[top + height, max(left - 1, 0) : left + width + 1] = _LINE_RGB
+    canvas[max(top - 1, 0) : top + height + 1, max(left - 1, 0)] = _LINE_RGB
+    canvas[max(top - 1, 0) : top + height + 1, left + width] = _LINE_RGB
+
+
+def annotate_image(
+    plot: np.ndarray,
+    *,
+    vmin: float,
+    vmax: float,
+    cmap: str,
+    unit: str,
+    ticks: Sequence[float],
+    band_levels: Optional[Sequence[float]] = None,
+    extent: Optional[Extent] = None,
+    axis_labels: Tuple[str, str] = ("X (m)", "Y (m)"),
+) -> np.ndarray:
+    """
+    Place a rendered grid on a white canvas with a colour bar and labels.
+
+    The colour bar spans ``vmin`` (bottom) to ``vmax`` (top), is labelled with
+    ``ticks`` and headed by ``unit``. With ``band_levels`` it is drawn in the
+    same flat bands as a banded isolux image, with a line at each level, so
+    contour lines in the plot can be read against it. ``extent`` adds the
+    coordinate range along the plot edges and the axis names.
+    """
+    ph, pw = plot.shape[:2]
+    bar_h = max(ph, _MIN_BAR_H)
+    span = float(vmax) - float(vmin)
+
+    # Keep ticks at least one text line apart, preferring the extremes.
+    rows: List[Tuple[int, float]] = []
+    for v in sorted({float(t) for t in ticks}, key=lambda t: (t not in (min(ticks), max(ticks)), t)):
+        row = (bar_h - 1) // 2 if span <= 1e-12 else int(round((float(vmax) - v) / span * (bar_h - 1)))
+        if 0 <= row < bar_h and all(abs(row - r) > _TEXT_H + 2 for r, _ in rows):
+            rows.append((row, v))
+    rows.sort()
+    labels = format_ticks([v for _, v in rows]) if rows else []
+
+    ext_labels: List[str] = []
+    if extent is not None:
+        ext_labels = [f"{float(v):.2f}" for v in extent]
+    y_label_w = max((text_width(t) for t in ext_labels[2:]), default=0)
+    left = _PAD + (y_label_w + 6 if extent is not None else 0)
+    top = _PAD + _TEXT_H + 8
+    bottom = _PAD + (2 * (_TEXT_H + 6) if extent is not None else 0)
+    tick_w = max((text_width(t) for t in labels), default=0)
+    bar_x = left + pw + 16
+    right = 16 + _BAR_W + 4 + 5 + tick_w + _PAD
+    height = top + max(ph, bar_h) + bottom
+    width = left + pw + max(right, text_width(unit) + 16 + _PAD)
+
+    canvas = np.empty((height, width, 3), dtype=np.uint8)
+    canvas[:] = _PAPER_RGB
+    canvas[top : top + ph, left : left + pw] = plot
+    _frame(canvas, top, left, ph, pw)
+
+    bar_vals = np.linspace(float(vmax), float(vmin), bar_h)
+    if band_levels is not None and len(band_levels) and span > 1e-12:
+        levels = np.sort(np.asarray(list(band_levels), dtype=float))
+        edges = np.concatenate(([float(vmin)], levels, [float(vmax)]))
+        mids = 0.5 * (edges[:-1] + edges[1:])
+        bar_vals = mids[contour_bands(bar_vals, levels)]
+    bar = colorize(np.repeat(bar_vals[:, None], _BAR_W, axis=1), vmin=vmin, vmax=vmax, cmap=cmap)
+    canvas[top : top + bar_h, bar_x : bar_x + _BAR_W] = bar
+    if band_levels is not None:
+        for v in band_levels:
+            if span > 1e-12:
+                canvas[top + int(round((float(vmax) - float(v)) / span * (bar_h - 1))), bar_x : bar_x + _BAR_W] = _LINE_RGB
+    _frame(canvas, top, bar_x, bar_h, _BAR_W)
+    draw_text(canvas, unit, bar_x, _PAD)
+    for (row, _), label in zip(rows, labels):
+        y = top + row
+        canvas[y, bar_x + _BAR_W : bar_x + _BAR_W + 5] = _LINE_RGB
+        draw_text(canvas, label, bar_x + _BAR_W + 9, min(max(y - _TEXT_H // 2, 0), height - _TEXT_H))
+
+    if extent is not None:
+        x_lo, x_hi, y_lo, y_hi = ext_labels
+        draw_text(canvas, x_lo, left, top + ph + 6)
+        draw_text(canvas, x_hi, left + pw, top + ph + 6, align="right")
+        draw_text(canvas, axis_labels[0], left + pw // 2, top + ph + 6 + _TEXT_H + 6, align="center")
+        draw_text(canvas, y_lo, left - 6, top + ph - _TEXT_H, align="right")
+        draw_text(canvas, y_hi, left - 6, top, align="right")
+        draw_text(canvas, axis_labels[1], left, _PAD)
+    return canvas
+
+
+def isolux_levels(values: np.ndarray, n_levels: int = 10) -> List[float]:
+    arr = np.asarray(values, dtype=float)
+    arr = arr[np.isfinite(arr)]
+    if arr.size == 0:
+        return []
+    vmin = float(np.min(arr))
+    vmax = float(np.max(arr))
+    if abs(vmax - vmin) < 1e-9:
+        return [vmin]
+    return [float(x) for x in np.linspace(vmin, vmax, int(n_levels))]
+
+
+def _grid_limits(values: np.ndarray) -> Tuple[float, float]:
+    arr = np.asarray(values, dtype=float)
+    return _limits(arr[np.isfinite(arr)], None, None)
+
+
+def write_heatmap_png(
+    path: Path,
+    values: np.ndarray,
+    nx: int,
+    ny: int,
+    *,
+    cmap: str = "inferno",
+    unit: str = "lux",
+    extent: Optional[Extent] = None,
+    axis_labels: Tuple[str, str] = ("X (m)", "Y (m)"),
+    annotate: bool = True,
+) -> Path:
+    img = render_grid_image(values, nx, ny, cmap=cmap)
+    if annotate:
+        lo, hi = _grid_limits(values)
+        img = annotate_image(
+            img, vmin=lo, vmax=hi, cmap=cmap, unit=unit, ticks=np.linspace(lo, hi, 5).tolist(), extent=extent, axis_labels=axis_labels
+        )
+    return write_png(path, img)
+
+
+def write_isolux_png(
+    path: Path,
+    values: np.ndarray,
+    nx: int,
+    ny: int,
+    *,
+    cmap: str = "inferno",
+    n_levels: int = 10,
+    unit: str = "lux",
+    extent: Optional[Extent] = None,
+    axis_labels: Tuple[str, str] = ("X (m)", "Y (m)"),
+    annotate: bool = True,
+) -> Path:
+    """Banded isolux image; the colour bar ticks label each contour level."""
+    levels = isolux_levels(values, n_levels)
+    img = render_grid_image(values, nx, ny, cmap=cmap, contour_levels=levels, banded=True)
+    if annotate:
+        lo, hi = _grid_limits(values)
+        img = annotate_image(
+            img, vmin=lo, vmax=hi, cmap=cmap, unit=unit, ticks=levels, band_levels=levels, extent=extent, axis_labels=axis_labels
+        )
+    return write_png(path, img)
+
+
+def write_falsecolor_png(
+    path: Path,
+    values: np.ndarray,
+    nx: int,
+    ny: int,
+    *,
+    with_contours: bool = True,
+    unit: str = "lux",
+    extent: Optional[Extent] = None,
+    axis_labels: Tuple[str, str] = ("X (m)", "Y (m)"),
+    annotate: bool = True,
+) -> Path:
+    """Raster counterpart of ``render_falsecolor_plane`` (luxera scale, 8 contour lines)."""
+    levels = isolux_levels(values, 8) if with_contours else None
+    img = render_grid_image(values, nx, ny, cmap="luxera", contour_levels=levels, smooth=True)
+    if annotate:
+        lo, hi = _grid_limits(values)
+        ticks = levels if levels else np.linspace(lo, hi, 5).tolist()
+        img = annotate_image(img, vmin=lo, vmax=hi, cmap="luxera", unit=unit, ticks=ticks, extent=extent, axis_labels=axis_labels)
+    return write_png(path, img)
+
+
+def write_swatch_png(
+    path: Path,
+    value: float,
+    *,
+    vmin: float,
+    vmax: float,
+    cmap: str = "inferno",
+    size: int = 64,
+    unit: str = "lux",
+    annotate: bool = True,
+) -> Path:
+    """Single-value swatch; annotated swatches carry the shared colour bar with the value marked."""
+    img = colorize(np.full((int(size), int(size)), float(value)), vmin=vmin, vmax=vmax, cmap=cmap)
+    if annotate:
+        ticks = [float(vmin), float(value), float(vmax)]
+        img = annotate_image(img, vmin=vmin, vmax=vmax, cmap=cmap, unit=unit, ticks=ticks)
+    return write_png(path, img)
+
+
+def run_render_jobs(jobs: Sequence[Callable[[], T]], max_workers: Optional[int] = None) -> List[T]:
+    """
+    Run independent render callables concurrently and return results in order.
+
+    Colour lookup and zlib compression release the GIL, so threads scale
+    without pickling grids into worker processes.
+    """
+    jobs = list(jobs)
+    if len(jobs) <= 1 or (max_workers is not None and int(max_workers) <= 1):
+        return [job() for job in jobs]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(job) for job in jobs]
+        return [f.result() for f in futures]
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from luxera.api.daemon import LuxeraDaemon
+from luxera.project.io import load_project_schema, save_project_schema
+from luxera.project.schema import Project
+
+
+def _project(tmp_path: Path) -> Path:
+    path = tmp_path / "p.json"
+    save_project_schema(Project(name="daemon", root_dir=str(tmp_path)), path)
+    return path
+
+
+def _rpc(daemon: LuxeraDaemon, method: str, params: dict | None = None, req_id: int = 1) -> dict:
+    line = daemon.handle_line(json.dumps({"jsonrpc": "2.0", "id": req_id, "method": method, "params": params or {}}))
+    assert line is not None
+    return json.loads(line)
+
+
+def test_daemon_keeps_project_live_across_tool_calls(tmp_path: Path) -> None:
+    path = _project(tmp_path)
+    daemon = LuxeraDaemon()
+    loads: list[Path] = []
+    loader = daemon.sessions._loader
+    daemon.sessions._loader = lambda p: loads.append(p) or loader(p)
+
+    opened = _rpc(daemon, "project.open", {"project_path": str(path)})["result"]
+    assert opened["name"] == "daemon" and opened["rooms"] == 0
+
+    created = _rpc(
+        daemon,
+        "create_room",
+        {"project_path": str(path), "room_id": "r1", "name": "Office", "width": 6, "length": 4, "height": 3, "approved": True},
+        req_id=2,
+    )
+    assert created["result"]["ok"] is True
+    grid = _rpc(
+        daemon,
+        "project.grid.add",
+        {"project_path": str(path), "name": "G", "width": 6, "height": 4, "elevation": 0.8, "nx": 4, "ny": 3},
+        req_id=3,
+    )
+    assert grid["result"]["ok"] is True
+
+    assert len(loads) == 1
+    on_disk = load_project_schema(path)
+    assert [r.id for r in on_disk.geometry.rooms] == ["r1"]
+    assert len(on_disk.grids) == 1
+
+
+def test_daemon_protocol_errors(tmp_path: Path) -> None:
+    daemon = LuxeraDaemon()
+    assert json.loads(daemon.handle_line("{nope"))["error"]["code"] == -32700
+    assert _rpc(daemon, "no.such.method")["error"]["code"] == -32601
+    missing = _rpc(daemon, "create_room", {"project_path": str(_project(tmp_path)), "room_id": "r1"})
+    assert missing["error"]["code"] == -32602
+    assert daemon.handle_line(json.dumps({"jsonrpc": "2.0", "method": "daemon.ping"})) is None
+    assert "job.run" in _rpc(daemon, "daemon.methods")["result"]["tools"]
+
+
+def test_daemon_stdio_and_cli_run(tmp_path: Path) -> None:
+    path = _project(tmp_path)
+    requests = [
+        {"jsonrpc": "2.0", "id": 1, "method": "cli.run", "params": {"argv": ["add-room", str(path), "--id", "r9", "--name", "Hall", "--width", "5", "--length", "5", "--height", "3"]}},
+        {"jsonrpc": "2.0", "id": 2, "method": "project.open", "params": {"project_path": str(path)}},
+        {"jsonrpc": "2.0", "id": 3, "method": "daemon.shutdown"},
+        {"jsonrpc": "2.0", "id": 4, "method": "daemon.ping"},
+    ]
+    stdin = io.StringIO("".join(json.dumps(r) + "\n" for r in requests))
+    stdout = io.StringIO()
+    LuxeraDaemon().serve_stdio(stdin, stdout)
+    replies = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert [r["id"] for r in replies] == [1, 2, 3]
+    assert replies[0]["result"]["exit_code"] == 0, replies[0]
+    assert replies[1]["result"]["rooms"] == 1
+
+
+def test_daemon_cli_run_syncs_only_named_sessions(tmp_path: Path) -> None:
+    path = _project(tmp_path)
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    other = _project(other_dir)
+    daemon = LuxeraDaemon(flush_delay_s=3600.0)
+    room = {"name": "Office", "width": 4, "length": 4, "height": 3, "approved": True}
+    assert _rpc(daemon, "create_room", {"project_path": str(path), "room_id": "r1", **room})["result"]["ok"] is True
+    assert _rpc(daemon, "create_room", {"project_path": str(other), "room_id": "o1", **room})["result"]["ok"] is True
+
+    ran = _rpc(daemon, "cli.run", {"argv": ["add-room", str(path), "--id", "r2", "--name", "Hall", "--width", "5", "--length", "5", "--height", "3"]})
+    assert ran["result"]["exit_code"] == 0 and "r2" in ran["result"]["stdout"]
+    # The named session was flushed before the command and reloaded after it.
+    assert [r.id for r in load_project_schema(path).geometry.rooms] == ["r1", "r2"]
+    assert _rpc(daemon, "project.open", {"project_path": str(path)})["result"]["rooms"] == 2
+    # Other sessions stay open and unsaved.
+    assert daemon.sessions.dirty_paths() == [other.resolve()]
+    assert load_project_schema(other).geometry.rooms == []
+
+    bad = _rpc(daemon, "cli.run", {"argv": ["add-room", str(path)]})["result"]
+    assert bad["exit_code"] == 2 and "usage:" in bad["stderr"] and bad["stdout"] == ""
+    daemon.sessions.close()
+
+
+def test_daemon_saves_pending_edits_before_file_tools(tmp_path: Path) -> None:
+    path = _project(tmp_path)
+    daemon = LuxeraDaemon(flush_delay_s=3600.0)
+    room = {"name": "Office", "width": 4, "length": 4, "height": 3, "approved": True}
+    assert _rpc(daemon, "create_room", {"project_path": str(path), "room_id": "r1", **room})["result"]["ok"] is True
+    assert load_project_schema(path).geometry.rooms == []
+
+    # results.summarize reads the project file; it must see the live edit.
+    _rpc(daemon, "results.summarize", {"project_path": str(path), "job_id": "missing"})
+    assert [r.id for r in load_project_schema(path).geometry.rooms] == ["r1"]
+    assert daemon.sessions.dirty_paths() == []
+    daemon.sessions.close()
+
+
+def test_daemon_cli_run_captures_output_of_other_modules(monkeypatch: pytest.MonkeyPatch) -> None:
+    import luxera.cli
+
+    def fake_demo(args: argparse.Namespace) -> int:
+        # Stands in for runner/export code that writes to sys.stdout directly.
+        sys.stdout.write("from elsewhere\n")
+        print("warned", file=sys.stderr)
+        return 0
+
+    monkeypatch.setattr(luxera.cli, "_cmd_demo", fake_demo)
+    ran = _rpc(LuxeraDaemon(), "cli.run", {"argv": ["demo"]})["result"]
+    assert ran == {"exit_code": 0, "stdout": "from elsewhere\n", "stderr": "warned\n"}
+
+
+def test_daemon_direct_preview_reuses_unchanged_pairs(tmp_path: Path) -> None:
+    from luxera.project.schema import CalcGrid, LuminaireInstance, PhotometryAsset, RotationSpec, TransformSpec
+
+    ies = tmp_path / "lum.ies"
+    ies.write_text("IESNA:LM-63-2019\nTILT=NONE\n1 3000 1 3 1 1 2 0.6 0.6 0.1\n0 45 90\n0\n1200 800 0\n", encoding="utf-8")
+    project = Project(name="preview", root_dir=str(tmp_path))
+    project.photometry_assets.append(PhotometryAsset(id="a", format="IES", path=str(ies)))
+    rot = RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0))
+    for i in range(2):
+        project.luminaires.append(
+            LuminaireInstance(id=f"l{i}", name=f"L{i}", photometry_asset_id="a", transform=TransformSpec(position=(1.0 + 2.0 * i, 1.0, 2.8), rotation=rot))
+        )
+    project.grids.append(CalcGrid(id="g", name="g", origin=(0.0, 0.0, 0.0), width=4.0, height=2.0, elevation=0.8, nx=5, ny=3))
+    path = tmp_path / "p.json"
+    save_project_schema(project, path)
+
+    daemon = LuxeraDaemon()
+    first = _rpc(daemon, "project.direct.preview", {"project_path": str(path)})["result"]
+    assert first["stats"]["evaluated_pairs"] == first["stats"]["total_pairs"] == 2 * 15
+    assert first["objects"]["grid:g"]["mean_lux"] > 0.0
+
+    with daemon.sessions.checkout(path, write=True) as live:
+        live.luminaires[1].transform.position = (3.5, 1.0, 2.8)
+    second = _rpc(daemon, "project.direct.preview", {"project_path": str(path)}, req_id=2)["result"]
+    assert second["stats"]["dirty_luminaires"] == ["l1"]
+    assert second["stats"]["evaluated_pairs"] == 15
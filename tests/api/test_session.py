@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from luxera.api.session import ProjectConflictError, ProjectSessionCache
+from luxera.project.io import load_project_schema, save_project_schema
+from luxera.project.schema import LuminaireInstance, Project, RotationSpec, TransformSpec
+
+
+class _CountingSaver:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, project: Project, path: Path) -> None:
+        self.calls += 1
+        save_project_schema(project, path)
+
+
+def _lum(i: int) -> LuminaireInstance:
+    return LuminaireInstance(
+        id=f"l{i}",
+        name=f"L{i}",
+        photometry_asset_id="a",
+        transform=TransformSpec(position=(float(i), 0.0, 3.0), rotation=RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0))),
+    )
+
+
+def _make_project(tmp_path: Path) -> Path:
+    path = tmp_path / "p.luxera"
+    save_project_schema(Project(name="session", root_dir=str(tmp_path)), path)
+    return path
+
+
+def test_session_cache_returns_live_project_without_reload(tmp_path: Path) -> None:
+    path = _make_project(tmp_path)
+    loads = []
+
+    def loader(p: Path) -> Project:
+        loads.append(p)
+        return load_project_schema(p)
+
+    cache = ProjectSessionCache(flush_delay_s=60.0, loader=loader, saver=_CountingSaver())
+    with cache.checkout(path, write=True) as project:
+        project.luminaires.append(_lum(1))
+    with cache.checkout(path) as project:
+        assert [l.id for l in project.luminaires] == ["l1"]
+    assert len(loads) == 1
+    assert cache.dirty_paths() == [path.resolve()]
+    cache.close()
+
+
+def test_session_cache_batches_writes_until_flush(tmp_path: Path) -> None:
+    path = _make_project(tmp_path)
+    saver = _CountingSaver()
+    cache = ProjectSessionCache(flush_delay_s=60.0, saver=saver)
+    for i in range(20):
+        with cache.checkout(path, write=True) as project:
+            project.luminaires.append(_lum(i))
+    assert saver.calls == 0
+    assert load_project_schema(path).luminaires == []
+
+    assert cache.flush(path) is True
+    assert cache.flush(path) is False
+    assert saver.calls == 1
+    assert len(load_project_schema(path).luminaires) == 20
+    cache.close()
+
+
+def test_session_cache_debounced_write_behind(tmp_path: Path) -> None:
+    path = _make_project(tmp_path)
+    saver = _CountingSaver()
+    cache = ProjectSessionCache(flush_delay_s=0.05, saver=saver)
+    for i in range(5):
+        with cache.checkout(path, write=True) as project:
+            project.luminaires.append(_lum(i))
+    deadline = time.monotonic() + 5.0
+    while cache.dirty_paths() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert not cache.dirty_paths()
+    assert saver.calls == 1
+    assert len(load_project_schema(path).luminaires) == 5
+    cache.close()
+
+
+def test_session_cache_failed_write_rolls_back(tmp_path: Path) -> None:
+    path = _make_project(tmp_path)
+    cache = ProjectSessionCache(flush_delay_s=60.0)
+    with cache.checkout(path, write=True) as project:
+        project.luminaires.append(_lum(0))
+    with pytest.raises(ValueError):
+        with cache.checkout(path, write=True) as project:
+            project.luminaires.append(_lum(1))
+            project.luminaires[0].name = "half-applied"
+            raise ValueError("boom")
+    with cache.checkout(path) as project:
+        assert [(l.id, l.name) for l in project.luminaires] == [("l0", "L0")]
+    assert cache.flush(path) is True
+    assert [(l.id, l.name) for l in load_project_schema(path).luminaires] == [("l0", "L0")]
+
+    with pytest.raises(ValueError):
+        with cache.checkout(path, write=True) as project:
+            project.luminaires.clear()
+            raise ValueError("boom")
+    assert cache.dirty_paths() == []
+    with cache.checkout(path, write=True) as project:
+        project.name = "renamed"
+    cache.close()
+    saved = load_project_schema(path)
+    assert saved.name == "renamed" and [l.id for l in saved.luminaires] == ["l0"]
+
+
+def test_session_cache_external_flushes_and_reloads(tmp_path: Path) -> None:
+    path = _make_project(tmp_path)
+    cache = ProjectSessionCache(flush_delay_s=60.0)
+    with cache.checkout(path, write=True) as project:
+        project.luminaires.append(_lum(1))
+    with cache.external(path) as file_path:
+        on_disk = load_project_schema(file_path)
+        assert [l.id for l in on_disk.luminaires] == ["l1"]
+        on_disk.luminaires.append(_lum(2))
+        save_project_schema(on_disk, file_path)
+    with cache.checkout(path) as project:
+        assert [l.id for l in project.luminaires] == ["l1", "l2"]
+    cache.close()
+
+
+def _external_edit(path: Path, name: str) -> None:
+    project = load_project_schema(path)
+    project.name = name
+    save_project_schema(project, path)
+    # Make the change visible on filesystems with coarse mtimes.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_session_cache_reloads_clean_session_changed_on_disk(tmp_path: Path) -> None:
+    path = _make_project(tmp_path)
+    cache = ProjectSessionCache(flush_delay_s=60.0)
+    with cache.checkout(path) as project:
+        assert project.name == "session"
+    _external_edit(path, "edited elsewhere")
+    with cache.checkout(path) as project:
+        assert project.name == "edited elsewhere"
+    cache.close()
+
+
+def test_session_cache_refuses_to_overwrite_external_edit(tmp_path: Path) -> None:
+    path = _make_project(tmp_path)
+    cache = ProjectSessionCache(flush_delay_s=60.0)
+    with cache.checkout(path, write=True) as project:
+        project.luminaires.append(_lum(1))
+    _external_edit(path, "edited elsewhere")
+    with pytest.raises(ProjectConflictError):
+        with cache.checkout(path):
+            pass
+    with pytest.raises(ProjectConflictError):
+        cache.flush(path)
+    assert load_project_schema(path).name == "edited elsewhere"
+
+    cache.evict(path, flush=False)
+    with cache.checkout(path) as project:
+        assert project.name == "edited elsewhere" and project.luminaires == []
+    cache.close()
+
+
+def test_session_cache_evicts_idle_clean_sessions(tmp_path: Path) -> None:
+    for i in range(3):
+        (tmp_path / f"p{i}").mkdir()
+    paths = [_make_project(tmp_path / f"p{i}") for i in range(3)]
+    cache = ProjectSessionCache(flush_delay_s=60.0, max_idle_s=0.0)
+    with cache.checkout(paths[0], write=True) as project:
+        project.name = "dirty"
+    cache.open(paths[1])
+    cache.open(paths[2])
+    assert paths[0] in cache and paths[1] not in cache and paths[2] in cache
+    cache.close()
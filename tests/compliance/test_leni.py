@@ -1,6 +1,20 @@
 from __future__ import annotations
 
-from luxera.compliance.energy import LENIInputs, LENI_PROFILES, compute_leni
+import numpy as np
+import pytest
+
+from luxera.compliance.energy import (
+    ControlStrategy,
+    EnergyZone,
+    LENIInputs,
+    LENI_PROFILES,
+    compute_leni,
+    daylight_hourly_from_summary,
+    occupancy_schedule,
+    simulate_annual_energy,
+    zones_from_project,
+)
+from luxera.project.schema import LuminaireInstance, PhotometryAsset, Project, RoomSpec, RotationSpec, TransformSpec
 
 
 def test_leni_simple_office():
@@ -132,3 +146,100 @@ def test_power_density():
     assert abs(result.power_density_W_per_m2 - 12.0) < 1e-9
     assert abs(result.normalised_power_pn - 12.0) < 1e-9
 
+
+def _office_day(hours: int = 8760) -> tuple[np.ndarray, np.ndarray]:
+    hod = np.arange(hours) % 24
+    daylight = np.clip(np.sin(np.pi * (hod - 6.0) / 12.0), 0.0, None) * 800.0
+    occupancy = ((hod >= 8) & (hod < 18)).astype(float) * 0.8
+    return daylight, occupancy
+
+
+def test_annual_simulation_strategies_and_dimming_curve():
+    daylight, occupancy = _office_day()
+    zones = [
+        EnergyZone(id="window", installed_power_W=1200.0, area_m2=100.0, daylight_lux=daylight, occupancy=occupancy, parasitic_power_W=5.0),
+        EnergyZone(id="core", installed_power_W=800.0, area_m2=60.0, daylight_lux=0.3 * daylight, occupancy=occupancy),
+    ]
+    strategies = [
+        ControlStrategy(name="manual"),
+        ControlStrategy(name="dim", daylight="dim", min_light_output=0.2, min_power_fraction=0.25),
+        ControlStrategy(name="dim_occ", daylight="dim", occupancy_sensing=True, min_light_output=0.2, min_power_fraction=0.25),
+    ]
+    res = simulate_annual_energy(zones, strategies)
+
+    manual = res["manual"]
+    operating = 10 * 365
+    assert manual.power_W.shape == (2, 8760)
+    assert manual.energy_lighting_kWh == pytest.approx(2000.0 * operating / 1000.0)
+    assert manual.energy_parasitic_kWh == pytest.approx(5.0 * (8760 - operating) / 1000.0)
+    assert manual.leni_kWh_per_m2_year == pytest.approx(manual.total_energy_kWh / 160.0)
+    assert manual.peak_demand_W == pytest.approx(2000.0)
+    assert manual.savings_percent == 0.0
+
+    # 12:00: window zone has 800 lux daylight (off), core has 240 lux -> needs 52 % output.
+    noon = 12
+    assert res["dim"].power_W[0, noon] == pytest.approx(5.0)
+    expected_core = 800.0 * (0.25 + 0.75 * (0.52 - 0.2) / 0.8)
+    assert res["dim"].power_W[1, noon] == pytest.approx(expected_core)
+    assert res["dim_occ"].power_W[1, noon] == pytest.approx(0.8 * expected_core)
+    assert 0.0 < res["dim"].savings_percent < res["dim_occ"].savings_percent < 100.0
+    assert res["dim"].peak_demand_W < manual.peak_demand_W
+
+
+def test_zones_from_project_use_control_groups_and_daylight_summary():
+    p = Project(name="energy")
+    p.geometry.rooms.append(RoomSpec(id="r1", name="R", width=10.0, length=8.0, height=3.0))
+    p.photometry_assets.append(PhotometryAsset(id="a1", format="IES", path="unused.ies", metadata={"watts": 40.0}))
+    for i in range(4):
+        p.luminaires.append(LuminaireInstance(id=f"l{i}", name=f"L{i}", photometry_asset_id="a1", transform=TransformSpec(position=(1.0 + 2.0 * i, 4.0, 2.8), rotation=RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0)))))
+    p.control_groups = [
+        {"id": "front", "luminaire_ids": ["l0", "l1"], "daylight_target_id": "g_front"},
+        {"id": "back", "luminaire_ids": ["l2", "l3", "missing"]},
+    ]
+    summary = {
+        "annual_metrics": [
+            {"target_id": "g_front", "illuminance_hourly_mean_lux": [0.0, 600.0]},
+            {"target_id": "g_back", "illuminance_hourly_mean_lux": [0.0, 200.0]},
+        ]
+    }
+    zones = zones_from_project(p, daylight_hourly_from_summary(summary), occupancy=np.ones(4), target_lux=500.0)
+    assert [z.id for z in zones] == ["front", "back"]
+    assert [z.installed_power_W for z in zones] == [80.0, 80.0]
+    assert [z.area_m2 for z in zones] == [40.0, 40.0]
+    assert zones[0].daylight_lux.tolist() == [0.0, 600.0]
+    assert zones[1].daylight_lux.tolist() == [0.0, 400.0]
+    res = simulate_annual_energy(zones, [ControlStrategy(name="switch", daylight="switch")], hours=4)
+    assert res["switch"].power_W.tolist() == [[80.0, 0.0, 80.0, 0.0], [80.0, 80.0, 80.0, 80.0]]
+
+
+def test_zones_without_schedule_use_leni_profile_operating_hours():
+    profile = LENI_PROFILES["classroom"]
+    occ = occupancy_schedule("classroom")
+    assert occ.shape == (8760,)
+    assert np.count_nonzero(occ) == round(profile.annual_operating_hours)
+    assert set(np.unique(occ)) == {0.0, profile.occupancy_factor}
+    assert occ[12] == profile.occupancy_factor and occ[0] == 0.0
+
+    zone = EnergyZone(id="z", installed_power_W=1000.0, area_m2=50.0, daylight_lux=np.zeros(1), profile="classroom")
+    res = simulate_annual_energy([zone], [ControlStrategy(name="manual"), ControlStrategy(name="occ", occupancy_sensing=True)])
+    assert res["manual"].energy_lighting_kWh == pytest.approx(profile.annual_operating_hours)
+    assert res["occ"].energy_lighting_kWh == pytest.approx(profile.annual_operating_hours * profile.occupancy_factor)
+
+
+def test_annual_simulation_rejects_series_of_the_wrong_length():
+    zone = EnergyZone(id="z", installed_power_W=100.0, area_m2=10.0, daylight_lux=np.zeros(100), occupancy=np.ones(24))
+    with pytest.raises(ValueError, match="daylight_lux has 100 values"):
+        simulate_annual_energy([zone])
+    daily = EnergyZone(id="z", installed_power_W=100.0, area_m2=10.0, daylight_lux=np.zeros(24), occupancy=np.r_[np.zeros(12), np.ones(12)])
+    res = simulate_annual_energy([daily], [ControlStrategy(name="manual")], hours=48)
+    assert res["manual"].energy_lighting_kWh == pytest.approx(100.0 * 24 / 1000.0)
+
+
+def test_annual_simulation_counts_emergency_charging_as_parasitic():
+    occ = np.r_[np.zeros(12), np.ones(12)]
+    zone = EnergyZone(
+        id="z", installed_power_W=100.0, area_m2=10.0, daylight_lux=np.zeros(1), occupancy=occ, parasitic_power_W=2.0, emergency_power_W=3.0
+    )
+    res = simulate_annual_energy([zone], [ControlStrategy(name="manual")], hours=24)["manual"]
+    assert res.energy_parasitic_kWh == pytest.approx((2.0 * 12 + 3.0 * 24) / 1000.0)
+    assert res.power_W[0].tolist() == [5.0] * 12 + [103.0] * 12
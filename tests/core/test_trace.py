@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from luxera.core.trace import current_tracer, span, traced, tracing
+from luxera.project.runner import run_job_in_memory
+from luxera.project.schema import (
+    CalcGrid,
+    JobSpec,
+    LuminaireInstance,
+    PhotometryAsset,
+    Project,
+    RotationSpec,
+    TransformSpec,
+)
+
+
+def test_spans_nest_and_are_noop_when_disabled() -> None:
+    @traced("inner_engine")
+    def work() -> int:
+        return sum(range(1000))
+
+    assert current_tracer() is None
+    with span("ignored"):
+        assert work() == 499500
+
+    with tracing() as tracer:
+        assert tracer is not None
+        with span("outer", category="stage", object_id="g1"):
+            work()
+            with span("leaf"):
+                pass
+    assert current_tracer() is None
+
+    by_name = {s.name: s for s in tracer.spans}
+    assert set(by_name) == {"outer", "inner_engine", "leaf"}
+    assert by_name["outer"].depth == 0 and by_name["inner_engine"].depth == 1 and by_name["leaf"].depth == 1
+    assert by_name["outer"].wall_s >= by_name["inner_engine"].wall_s
+    assert by_name["inner_engine"].category == "engine"
+
+    payload = tracer.to_dict()
+    assert payload["schema_version"] == "luxera_trace_v1"
+    assert [s["name"] for s in payload["spans"]] == ["outer", "inner_engine", "leaf"]
+    chrome = tracer.to_chrome_trace()
+    events = [e for e in chrome["traceEvents"] if e["ph"] == "X"]
+    assert {e["name"] for e in events} == {"outer", "inner_engine", "leaf"}
+    assert next(e for e in events if e["name"] == "outer")["args"]["object_id"] == "g1"
+
+    with tracing(enabled=False) as off:
+        assert off is None and current_tracer() is None
+
+
+def _project(tmp_path: Path) -> Project:
+    ies_path = tmp_path / "fixture.ies"
+    ies_path.write_text(
+        "IESNA:LM-63-2019\nTILT=NONE\n1 1000 1 3 1 1 2 0.5 0.5 0.2\n0 45 90\n0\n1000 600 200\n",
+        encoding="utf-8",
+    )
+    project = Project(name="traced", root_dir=str(tmp_path))
+    project.photometry_assets.append(PhotometryAsset(id="a1", format="IES", path=str(ies_path)))
+    project.luminaires.append(
+        LuminaireInstance(
+            id="l1",
+            name="L1",
+            photometry_asset_id="a1",
+            transform=TransformSpec(position=(1.0, 1.0, 3.0), rotation=RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0))),
+        )
+    )
+    project.grids.append(CalcGrid(id="g1", name="g1", origin=(0.0, 0.0, 0.0), width=2.0, height=2.0, elevation=0.8, nx=3, ny=3))
+    project.grids.append(CalcGrid(id="g2", name="g2", origin=(0.0, 0.0, 0.0), width=1.0, height=1.0, elevation=0.0, nx=2, ny=2))
+    project.jobs.append(JobSpec(id="j1", type="direct"))
+    return project
+
+
+def test_runner_trace_is_written_to_result_json_and_chrome_trace(tmp_path: Path) -> None:
+    project = _project(tmp_path)
+    ref = run_job_in_memory(project, "j1", trace=True)
+    out_dir = Path(ref.result_dir)
+    trace = json.loads((out_dir / "result.json").read_text(encoding="utf-8"))["trace"]
+    stages = trace["stages"]
+    for name in ("diagnostics", "validation", "hashing", "solve", "photometry_load", "occlusion_build", "compliance", "write_artifacts"):
+        assert name in stages, name
+    assert stages["calc_object"]["count"] == 2
+    objects = [s["attrs"]["id"] for s in trace["spans"] if s["name"] == "calc_object"]
+    assert objects == ["g1", "g2"]
+    assert all(s["wall_s"] >= 0.0 and s["cpu_s"] >= 0.0 for s in trace["spans"])
+    chrome = json.loads((out_dir / "trace.json").read_text(encoding="utf-8"))
+    assert any(e.get("name") == "solve" and e.get("ph") == "X" for e in chrome["traceEvents"])
+    assert "trace.json" in json.loads((out_dir / "manifest.json").read_text(encoding="utf-8"))["entries"]
+
+    untraced = run_job_in_memory(project, "j1")
+    assert "trace" not in json.loads((Path(untraced.result_dir) / "result.json").read_text(encoding="utf-8"))
+    assert not (Path(untraced.result_dir) / "trace.json").exists()
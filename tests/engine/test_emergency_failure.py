@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from luxera.engine.direct_illuminance import load_luminaires
+from luxera.engine.emergency_escape_route import run_escape_routes
+from luxera.engine.emergency_failure import analyse_target_failures, failure_candidates
+from luxera.project.schema import EscapeRouteSpec, LuminaireInstance, PhotometryAsset, Project, RotationSpec, TransformSpec
+
+
+def _project(tmp_path: Path) -> Project:
+    ies = tmp_path / "f.ies"
+    ies.write_text(
+        "IESNA:LM-63-2019\nTILT=NONE\n1 1000 1 3 1 1 2 0.5 0.5 0.2\n0 45 90\n0\n1000 700 300\n",
+        encoding="utf-8",
+    )
+    p = Project(name="failure", root_dir=str(tmp_path))
+    p.photometry_assets.append(PhotometryAsset(id="a1", format="IES", path=str(ies)))
+    rot = RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0))
+    for i, x in enumerate((0.5, 3.0, 6.5, 9.0)):
+        p.luminaires.append(
+            LuminaireInstance(id=f"l{i}", name=f"L{i}", photometry_asset_id="a1", transform=TransformSpec(position=(x, 1.0, 2.8), rotation=rot))
+        )
+    return p
+
+
+def test_single_failures_match_full_reruns(tmp_path: Path) -> None:
+    project = _project(tmp_path)
+    lums, _ = load_luminaires(project, lambda a: str(a.path))
+    route = EscapeRouteSpec(id="r1", polyline=[(0.0, 1.0, 0.0), (10.0, 1.0, 0.0)], width_m=1.0, spacing_m=0.5)
+    (res,) = run_escape_routes([route], lums, emergency_factor=0.5, keep_contributions=True)
+    assert res.contributions is not None and res.contributions.shape == (4, res.points.shape[0])
+    assert np.allclose(res.contributions.sum(axis=0), res.values)
+
+    analysis = analyse_target_failures("r1", res.contributions, k=2)
+    assert len(analysis.cases) == 4 + 6
+    for case in analysis.cases:
+        kept = [lum for i, lum in enumerate(lums) if i not in case.failed]
+        (rerun,) = run_escape_routes([route], kept, emergency_factor=0.5)
+        assert np.isclose(case.min_lux, rerun.summary["min_lux"])
+        assert np.isclose(case.u0, rerun.summary["u0"])
+    assert len(analysis.worst.failed) == 2
+
+
+def test_combination_cap_keeps_most_critical_luminaires() -> None:
+    # Point 0 depends on luminaires 0 and 1; the rest are spread evenly.
+    C = np.full((6, 3), 100.0)
+    C[:, 0] = 10.0
+    C[0, 0] = 50.0
+    C[1, 0] = 40.0
+    assert failure_candidates(C, 2, max_combinations=15) == list(range(6))
+    picked = failure_candidates(C, 2, max_combinations=3)
+    assert len(picked) == 3 and {0, 1} <= set(picked)
+
+    masked = np.vstack([C, np.zeros((1, 3))])
+    masked[:, 2] = np.nan
+    analysis = analyse_target_failures("g", masked, k=1)
+    assert analysis.worst.failed == (0,)
+    assert np.isfinite(analysis.baseline_min_lux)
+
+
+def test_chunked_source_matches_dense_analysis(tmp_path: Path, monkeypatch) -> None:
+    from luxera.engine import emergency_failure
+    from luxera.engine.emergency_open_area import run_open_area
+    from luxera.project.schema import CalcGrid
+
+    project = _project(tmp_path)
+    lums, _ = load_luminaires(project, lambda a: str(a.path))
+    grid = CalcGrid(id="g", name="g", origin=(0.0, 0.0, 0.0), width=10.0, height=2.0, elevation=0.0, nx=21, ny=5)
+    (dense,) = run_open_area([grid], lums, keep_contributions=True)
+    assert isinstance(dense.contributions, np.ndarray)
+    assert np.allclose(dense.contributions.sum(axis=0), dense.values)
+
+    # Above the dense limit the matrix is never built; failures accumulate over point blocks.
+    monkeypatch.setattr(emergency_failure, "_DENSE_CELLS", 40)
+    monkeypatch.setattr(emergency_failure, "_BATCH_CELLS", 40)
+    (chunked,) = run_open_area([grid], lums, keep_contributions=True)
+    assert isinstance(chunked.contributions, emergency_failure.ContributionSource)
+    assert chunked.contributions.shape == dense.contributions.shape
+
+    expected = analyse_target_failures("g", dense.contributions, k=2)
+    got = analyse_target_failures("g", chunked.contributions, k=2)
+    assert np.isclose(got.baseline_min_lux, expected.baseline_min_lux)
+    assert [c.failed for c in got.cases] == [c.failed for c in expected.cases]
+    assert np.allclose([c.min_lux for c in got.cases], [c.min_lux for c in expected.cases])
+    assert np.allclose([c.u0 for c in got.cases], [c.u0 for c in expected.cases])
+
+
+def test_chunked_source_is_swept_once_per_analysis(monkeypatch) -> None:
+    from luxera.engine import emergency_failure
+
+    monkeypatch.setattr(emergency_failure, "_BATCH_CELLS", 8)
+    C = np.arange(1.0, 41.0).reshape(4, 10)
+    calls: list[tuple[int, int]] = []
+
+    def evaluate(start: int, stop: int) -> np.ndarray:
+        calls.append((start, stop))
+        return C[:, start:stop]
+
+    source = emergency_failure.ContributionSource(n_luminaires=4, n_points=10, evaluate=evaluate)
+    assert np.array_equal(emergency_failure.column_totals(source), C.sum(axis=0))
+    blocks = len(calls)
+
+    calls.clear()
+    got = analyse_target_failures("g", source, k=3)
+    expected = analyse_target_failures("g", C, k=3)
+    assert len(calls) == blocks
+    assert [(c.failed, c.min_lux) for c in got.cases] == [(c.failed, c.min_lux) for c in expected.cases]
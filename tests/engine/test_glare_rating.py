@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from luxera.calculation.illuminance import Luminaire
+from luxera.core.transform import from_aim_up
+from luxera.engine.glare_rating import compute_glare_rating, glare_view_directions
+from luxera.geometry.core import Vector3
+from luxera.photometry.model import Photometry
+from luxera.photometry.sample import sample_intensity_cd_world
+
+
+def _flood() -> Photometry:
+    gamma = np.array([0.0, 15.0, 30.0, 45.0, 60.0, 75.0, 90.0], dtype=float)
+    cd = np.array([90000.0, 80000.0, 50000.0, 20000.0, 6000.0, 1500.0, 0.0], dtype=float)
+    return Photometry(system="C", c_angles_deg=np.array([0.0]), gamma_angles_deg=gamma, candela=cd.reshape(1, -1), luminous_flux_lm=40000.0, symmetry="FULL")
+
+
+def _reference_gr(obs: np.ndarray, view: np.ndarray, lums: list[Luminaire], l_ve: float) -> float:
+    lvl = 0.0
+    for lum in lums:
+        to_lum = lum.transform.position.to_array() - obs
+        d = float(np.linalg.norm(to_lum))
+        cos_t = float(np.dot(to_lum / d, view))
+        theta = math.degrees(math.acos(max(-1.0, min(1.0, cos_t))))
+        if theta > 60.0:
+            continue
+        i_cd = float(sample_intensity_cd_world(lum.photometry, lum.transform, Vector3(*(-to_lum / d))))
+        lvl += 10.0 * (i_cd * cos_t / (d * d)) / max(theta, 1.5) ** 2
+    return 27.0 + 24.0 * math.log10(lvl / l_ve**0.9) if lvl > 0.0 else 0.0
+
+
+def test_batched_gr_matches_per_pair_formula() -> None:
+    phot = _flood()
+    # Corner floodlights aimed toward the middle of the field.
+    lums = [
+        Luminaire(photometry=phot, transform=from_aim_up(Vector3(x, y, 20.0), Vector3(-0.7 * x, -0.7 * y, -20.0), Vector3.up()))
+        for x, y in ((-40.0, -30.0), (40.0, -30.0), (40.0, 30.0), (-40.0, 30.0))
+    ]
+    obs = np.random.default_rng(3).uniform([-45.0, -30.0, 1.5], [45.0, 30.0, 1.5], size=(25, 3))
+    views = glare_view_directions(8)
+    res = compute_glare_rating(obs, lums, e_h_avg=200.0, reflectance=0.2, view_dirs=views)
+    assert res.gr.shape == (25, 8)
+    l_ve = 0.035 * 0.2 * 200.0 / math.pi
+    assert math.isclose(res.environment_luminance, l_ve)
+    for i in range(obs.shape[0]):
+        for j in range(views.shape[0]):
+            assert math.isclose(res.gr[i, j], _reference_gr(obs[i], views[j], lums, l_ve), rel_tol=1e-9, abs_tol=1e-9)
+    worst = res.worst()
+    assert worst["gr"] == res.gr_max > 0.0
+    # Looking straight away from every floodlight sees nothing.
+    away = compute_glare_rating(np.array([[0.0, 0.0, 1.5]]), lums, e_h_avg=200.0, view_dirs=np.array([[0.0, 0.0, -1.0]]))
+    assert away.gr_max == 0.0
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from luxera.engine.direct_illuminance import build_direct_occlusion_context, load_luminaires, run_direct_grid
+from luxera.engine.incremental import IncrementalDirectSession, segments_cross_boxes
+from luxera.geometry.param.model import FootprintParam, RoomParam, SharedWallParam, WallParam
+from luxera.geometry.param.rebuild import rebuild_surfaces_for_room
+from luxera.project.schema import CalcGrid, LuminaireInstance, PhotometryAsset, Project, RotationSpec, TransformSpec
+
+
+def _floor(tmp_path: Path, rooms: int = 4) -> Project:
+    """A row of 4 m x 4 m rooms separated by shared walls, one luminaire and one grid per room."""
+    ies = tmp_path / "lum.ies"
+    ies.write_text(
+        "IESNA:LM-63-2019\nTILT=NONE\n1 3000 1 5 1 1 2 0.6 0.6 0.1\n0 30 60 80 90\n0\n1200 1000 600 200 0\n",
+        encoding="utf-8",
+    )
+    p = Project(name="floor", root_dir=str(tmp_path))
+    p.photometry_assets.append(PhotometryAsset(id="a", format="IES", path=str(ies)))
+    for i in range(rooms):
+        x0 = 4.0 * i
+        p.param.footprints.append(FootprintParam(id=f"f{i}", polygon2d=[(x0, 0.0), (x0 + 4.0, 0.0), (x0 + 4.0, 4.0), (x0, 4.0)]))
+        p.param.rooms.append(RoomParam(id=f"r{i}", footprint_id=f"f{i}", height=3.0))
+        p.param.walls.append(WallParam(id=f"r{i}_s", room_id=f"r{i}", edge_ref=(0, 1)))
+        p.param.walls.append(WallParam(id=f"r{i}_n", room_id=f"r{i}", edge_ref=(2, 3)))
+        if i == 0:
+            p.param.walls.append(WallParam(id="r0_w", room_id="r0", edge_ref=(3, 0)))
+        if i == rooms - 1:
+            p.param.walls.append(WallParam(id=f"r{i}_e", room_id=f"r{i}", edge_ref=(1, 2)))
+        if i > 0:
+            p.param.shared_walls.append(
+                SharedWallParam(id=f"sw{i}", edge_geom=((x0, 0.0), (x0, 4.0)), room_a=f"r{i - 1}", room_b=f"r{i}")
+            )
+        p.luminaires.append(
+            LuminaireInstance(
+                id=f"l{i}",
+                name=f"L{i}",
+                photometry_asset_id="a",
+                transform=TransformSpec(position=(x0 + 2.0, 2.0, 2.8), rotation=RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0))),
+            )
+        )
+        p.grids.append(
+            CalcGrid(id=f"g{i}", name=f"g{i}", origin=(x0 + 0.25, 0.25, 0.0), width=3.5, height=3.5, elevation=0.8, nx=5, ny=5, room_id=f"r{i}")
+        )
+    for i in range(rooms):
+        rebuild_surfaces_for_room(f"r{i}", p)
+    return p
+
+
+def _full(project: Project, use_occlusion: bool = True) -> dict:
+    luminaires, _ = load_luminaires(project, lambda asset: "")
+    occlusion = build_direct_occlusion_context(project, force_rebuild=True)
+    return {
+        f"grid:{g.id}": run_direct_grid(g, luminaires, occlusion=occlusion, use_occlusion=use_occlusion).values
+        for g in project.grids
+    }
+
+
+def _assert_matches_full(result, project: Project, use_occlusion: bool = True) -> None:
+    for key, expected in _full(project, use_occlusion).items():
+        assert np.allclose(result.values(key), expected, rtol=1e-12, atol=1e-9), key
+
+
+def test_partition_wall_edit_recomputes_only_adjacent_rooms(tmp_path: Path) -> None:
+    project = _floor(tmp_path)
+    session = IncrementalDirectSession(use_occlusion=True)
+    first = session.update(project)
+    assert first.stats["evaluated_pairs"] == first.stats["total_pairs"] == 4 * 25 * 4
+    _assert_matches_full(first, project)
+    blas_builds = session.occlusion.scene.blas_rebuild_count
+
+    # Lower the partition between rooms 1 and 2 so light spills over it.
+    project.param.shared_walls[1].height = 1.0
+    edited = session.apply_edit(project, ["shared_wall:sw2"])
+    assert edited.stats["dirty_surfaces"] and all(s.startswith("sw2:") for s in edited.stats["dirty_surfaces"])
+    assert edited.stats["rebuilt_partitions"] == ["r1"]
+    assert session.occlusion.scene.blas_rebuild_count == blas_builds + 1
+    assert edited.stats["recomputed_objects"] == ["grid:g1", "grid:g2"]
+    assert 0 < edited.stats["evaluated_pairs"] < 2 * 25 * 4
+    assert np.max(edited.values("grid:g2") - first.values("grid:g2")) > 1.0
+    assert np.array_equal(edited.values("grid:g0"), first.values("grid:g0"))
+    _assert_matches_full(edited, project)
+
+    assert session.update(project).stats["evaluated_pairs"] == 0
+
+
+def test_luminaire_and_grid_edits_reuse_unchanged_pairs(tmp_path: Path) -> None:
+    project = _floor(tmp_path, rooms=3)
+    session = IncrementalDirectSession(use_occlusion=True)
+    session.update(project)
+
+    project.luminaires[2].transform.position = (9.0, 2.5, 2.8)
+    moved = session.update(project)
+    assert moved.stats["dirty_luminaires"] == ["l2"]
+    assert moved.stats["dirty_surfaces"] == []
+    assert moved.stats["evaluated_pairs"] == 3 * 25
+    _assert_matches_full(moved, project)
+
+    # Halving the spacing keeps the old points; only the new ones are evaluated.
+    project.grids[0].nx = 9
+    project.grids[0].ny = 9
+    refined = session.update(project)
+    assert refined.stats["recomputed_objects"] == ["grid:g0"]
+    assert refined.stats["evaluated_pairs"] == (81 - 25) * 3
+    _assert_matches_full(refined, project)
+
+    project.luminaires.pop(0)
+    removed = session.update(project)
+    assert removed.stats["dirty_luminaires"] == ["l0"] and removed.stats["evaluated_pairs"] == 0
+    _assert_matches_full(removed, project)
+
+
+def test_unoccluded_session_ignores_geometry_edits(tmp_path: Path) -> None:
+    project = _floor(tmp_path, rooms=2)
+    session = IncrementalDirectSession()
+    session.update(project)
+    project.param.shared_walls[0].height = 1.0
+    edited = session.apply_edit(project, ["shared_wall:sw1"])
+    assert edited.stats["evaluated_pairs"] == 0
+    _assert_matches_full(edited, project, use_occlusion=False)
+
+
+def test_segments_cross_boxes_matches_sampling() -> None:
+    rng = np.random.default_rng(7)
+    origin = np.array([0.5, 0.5, 3.0])
+    points = rng.uniform(-4.0, 4.0, size=(400, 3))
+    points[:50, 0] = origin[0]
+    boxes = np.array([[[1.0, -1.0, 0.0], [1.2, 2.0, 3.0]]])
+    hit = segments_cross_boxes(origin, points, boxes)
+    t = np.linspace(0.0, 1.0, 2001)
+    samples = origin[None, None, :] + t[None, :, None] * (points - origin)[:, None, :]
+    inside = np.all((samples >= boxes[0, 0]) & (samples <= boxes[0, 1]), axis=2).any(axis=1)
+    assert np.all(hit[inside])
+    assert np.count_nonzero(hit & ~inside) <= 2
+    with pytest.raises(ValueError):
+        IncrementalDirectSession(influence_threshold_lux=0.0)
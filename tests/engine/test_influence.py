@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from luxera.calculation.illuminance import Luminaire
+from luxera.engine.direct_illuminance import run_direct_grid
+from luxera.engine.influence import (
+    InfluenceCullingError,
+    PointGridIndex,
+    build_neighbourhoods,
+    influence_radius,
+)
+from luxera.exterior.area_lighting import ExteriorAreaEngine, ExteriorAreaSpec, PoleSpec
+from luxera.geometry.core import Transform, Vector3
+from luxera.photometry.model import Photometry
+from luxera.project.schema import CalcGrid, PhotometryAsset, Project
+
+
+def _photometry(cd: float = 8000.0) -> Photometry:
+    c = np.array([0.0, 90.0, 180.0, 270.0], dtype=float)
+    g = np.arange(0.0, 181.0, 5.0)
+    profile = np.where(g < 90.0, cd * np.cos(np.radians(np.minimum(g, 90.0))) ** 3, 0.0)
+    return Photometry(
+        system="C",
+        c_angles_deg=c,
+        gamma_angles_deg=g,
+        candela=np.tile(profile, (c.size, 1)),
+        luminous_flux_lm=20000.0,
+        symmetry="NONE",
+    )
+
+
+def _site_luminaires(nx: int, ny: int, spacing: float, height: float) -> list[Luminaire]:
+    phot = _photometry()
+    return [
+        Luminaire(photometry=phot, transform=Transform(position=Vector3(i * spacing, j * spacing, height)))
+        for i in range(nx)
+        for j in range(ny)
+    ]
+
+
+def test_grid_index_sphere_query_matches_brute_force() -> None:
+    rng = np.random.default_rng(3)
+    pts = np.column_stack([rng.uniform(0.0, 200.0, 2000), rng.uniform(0.0, 80.0, 2000), rng.uniform(0.0, 2.0, 2000)])
+    index = PointGridIndex(pts, cell_size=7.5)
+    for center, radius in [((50.0, 40.0, 8.0), 20.0), ((-10.0, -10.0, 0.0), 15.0), ((199.0, 1.0, 1.0), 3.0), ((0.0, 0.0, 50.0), 10.0)]:
+        expected = np.flatnonzero(np.linalg.norm(pts - np.asarray(center)[None, :], axis=1) <= radius)
+        assert np.array_equal(index.query_sphere(center, radius), expected)
+
+
+def test_influence_radius_bounds_contribution() -> None:
+    lum = Luminaire(photometry=_photometry(), transform=Transform(position=Vector3(0.0, 0.0, 10.0)), flux_multiplier=0.5)
+    r = influence_radius(lum, 0.5)
+    assert r == pytest.approx(np.sqrt(8000.0 * 0.5 / 0.5))
+    with pytest.raises(InfluenceCullingError):
+        influence_radius(lum, 0.0)
+
+
+def test_direct_grid_culling_is_bounded_and_skips_distant_pairs() -> None:
+    luminaires = _site_luminaires(8, 4, spacing=30.0, height=10.0)
+    grid = CalcGrid(id="site", name="site", origin=(0.0, 0.0, 0.0), width=210.0, height=90.0, elevation=0.0, nx=43, ny=19)
+    full = run_direct_grid(grid, luminaires)
+    threshold = 0.2
+    culled = run_direct_grid(grid, luminaires, influence_threshold_lux=threshold)
+
+    stats = culled.influence_culling
+    assert stats is not None and stats["total_pairs"] == grid.nx * grid.ny * len(luminaires)
+    assert stats["culled_fraction"] > 0.8
+    diff = full.values - culled.values
+    assert np.all(diff >= -1e-9)
+    # Every skipped pair contributes less than the threshold.
+    assert float(np.max(diff)) < threshold * len(luminaires)
+    assert float(np.max(diff)) < 0.01 * float(np.mean(full.values))
+
+    exact = run_direct_grid(grid, luminaires, influence_threshold_lux=1e-9)
+    assert exact.influence_culling["culled_fraction"] == 0.0
+    assert np.allclose(exact.values, full.values)
+
+    hood = build_neighbourhoods(full.points, luminaires, threshold)
+    assert hood.evaluated_pairs == stats["evaluated_pairs"]
+
+
+def test_exterior_area_culling_matches_full_evaluation(monkeypatch) -> None:
+    engine = ExteriorAreaEngine()
+    project = Project(name="site", root_dir=".")
+    project.photometry_assets.append(PhotometryAsset(id="a", format="IES", path="unused.ies"))
+    monkeypatch.setattr(engine, "_photometry_from_asset", lambda _project, _asset_id: _photometry())
+    area = ExteriorAreaSpec(name="Lot", boundary_polygon=[(0.0, 0.0), (240.0, 0.0), (240.0, 60.0), (0.0, 60.0)], grid_spacing=6.0)
+    poles = [
+        PoleSpec(id=f"p{i}", position=(15.0 + 30.0 * i, 30.0, 10.0), luminaire_asset_id="a", arm_length_m=0.0, tilt_deg=0.0)
+        for i in range(8)
+    ]
+    full = engine.compute(area, poles, project)
+    culled = engine.compute(area, poles, project, influence_threshold_lux=0.1)
+    assert "influence_culling" not in full
+    assert culled["influence_culling"]["culled_fraction"] > 0.5
+    assert np.max(np.abs(full["values_flat"] - culled["values_flat"])) < 0.1 * len(poles)
+    assert culled["E_avg"] == pytest.approx(full["E_avg"], rel=0.01)
+
+
+def test_direct_job_reports_influence_culling(tmp_path) -> None:
+    from luxera.project.runner import run_job_in_memory
+    from luxera.project.schema import JobSpec, LuminaireInstance, RotationSpec, TransformSpec
+
+    ies = tmp_path / "pole.ies"
+    ies.write_text(
+        "IESNA:LM-63-2019\nTILT=NONE\n1 10000 1 4 1 1 2 0.5 0.5 0.2\n0 30 60 90\n0\n8000 5200 1000 0\n",
+        encoding="utf-8",
+    )
+    project = Project(name="site", root_dir=str(tmp_path))
+    project.photometry_assets.append(PhotometryAsset(id="a", format="IES", path=str(ies)))
+    for i in range(6):
+        project.luminaires.append(
+            LuminaireInstance(
+                id=f"l{i}",
+                name=f"L{i}",
+                photometry_asset_id="a",
+                transform=TransformSpec(position=(10.0 + 40.0 * i, 10.0, 8.0), rotation=RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0))),
+            )
+        )
+    project.grids.append(CalcGrid(id="g", name="g", origin=(0.0, 0.0, 0.0), width=240.0, height=20.0, elevation=0.0, nx=25, ny=3))
+    project.jobs.append(JobSpec(id="full", type="direct"))
+    project.jobs.append(JobSpec(id="culled", type="direct", settings={"influence_threshold_lux": 0.5}))
+    full = run_job_in_memory(project, "full").summary
+    culled = run_job_in_memory(project, "culled").summary
+    assert "influence_culling" not in full
+    assert culled["influence_culling"]["culled_fraction"] > 0.5
+    assert culled["calc_objects"][0]["summary"]["influence_culling"]["total_pairs"] == 25 * 3 * 6
+    assert culled["mean_lux"] == pytest.approx(full["mean_lux"], rel=0.02)
+
+
+def test_every_culled_calc_object_reports_influence_culling(tmp_path) -> None:
+    from luxera.project.runner import run_job_in_memory
+    from luxera.project.schema import (
+        ArbitraryPlaneSpec,
+        JobSpec,
+        LineGridSpec,
+        LuminaireInstance,
+        PointSetSpec,
+        RoomSpec,
+        RotationSpec,
+        TransformSpec,
+        VerticalPlaneSpec,
+    )
+
+    ies = tmp_path / "pole.ies"
+    ies.write_text(
+        "IESNA:LM-63-2019\nTILT=NONE\n1 10000 1 4 1 1 2 0.5 0.5 0.2\n0 30 60 90\n0\n8000 5200 1000 0\n",
+        encoding="utf-8",
+    )
+    project = Project(name="site", root_dir=str(tmp_path))
+    project.geometry.rooms.append(RoomSpec(id="r", name="r", width=160.0, length=20.0, height=10.0))
+    project.photometry_assets.append(PhotometryAsset(id="a", format="IES", path=str(ies)))
+    for i in range(4):
+        project.luminaires.append(
+            LuminaireInstance(
+                id=f"l{i}",
+                name=f"L{i}",
+                photometry_asset_id="a",
+                transform=TransformSpec(position=(10.0 + 40.0 * i, 10.0, 8.0), rotation=RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0))),
+            )
+        )
+    project.grids.append(CalcGrid(id="g", name="g", origin=(0.0, 0.0, 0.0), width=160.0, height=20.0, elevation=0.0, nx=17, ny=3, room_id="r"))
+    project.point_sets.append(PointSetSpec(id="ps", name="ps", points=[(10.0, 10.0, 0.0), (150.0, 10.0, 0.0)], room_id="r"))
+    project.line_grids.append(LineGridSpec(id="lg", name="lg", polyline=[(0.0, 5.0, 0.0), (160.0, 5.0, 0.0)], spacing=10.0, room_id="r"))
+    project.vertical_planes.append(VerticalPlaneSpec(id="vp", name="vp", origin=(0.0, 20.0, 0.0), width=160.0, height=4.0, nx=9, ny=2, room_id="r"))
+    project.arbitrary_planes.append(
+        ArbitraryPlaneSpec(id="ap", name="ap", origin=(0.0, 0.0, 1.0), axis_u=(1.0, 0.0, 0.0), axis_v=(0.0, 1.0, 0.0), width=160.0, height=20.0, nx=9, ny=2, room_id="r")
+    )
+    project.jobs.append(JobSpec(id="culled", type="direct", settings={"influence_threshold_lux": 0.5}))
+    summary = run_job_in_memory(project, "culled").summary
+    per_object = {o["id"]: o["summary"].get("influence_culling") for o in summary["calc_objects"]}
+    assert set(per_object) == {"g", "ps", "lg", "vp", "ap"}
+    assert all(c is not None and c["culled_fraction"] > 0.0 for c in per_object.values())
+    assert per_object["ps"]["total_pairs"] == 2 * 4
+    assert summary["influence_culling"]["evaluated_pairs"] == sum(c["evaluated_pairs"] for c in per_object.values())
+    assert summary["influence_culling"]["total_pairs"] == sum(c["total_pairs"] for c in per_object.values())
+
+
+def test_point_path_builds_neighbourhoods_once(monkeypatch) -> None:
+    import luxera.engine.direct_illuminance as direct
+
+    builds = []
+    real = direct.build_neighbourhoods
+    monkeypatch.setattr(direct, "build_neighbourhoods", lambda *a, **k: builds.append(1) or real(*a, **k))
+    luminaires = _site_luminaires(3, 2, 30.0, 10.0)
+    grid = CalcGrid(id="g", name="g", origin=(0.0, 0.0, 0.0), width=60.0, height=30.0, elevation=0.0, nx=13, ny=7)
+    vectorised = run_direct_grid(grid, luminaires, influence_threshold_lux=0.5)
+    assert len(builds) == 1
+    scalar = run_direct_grid(grid, luminaires, influence_threshold_lux=0.5, vectorised=False)
+    assert len(builds) == 2
+    assert scalar.influence_culling == vectorised.influence_culling
+    assert np.allclose(scalar.values, vectorised.values)
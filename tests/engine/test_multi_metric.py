@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import numpy as np
+
+from luxera.calculation.illuminance import Luminaire, calculate_direct_illuminance
+from luxera.core.transform import from_euler_zyx
+from luxera.engine.cylindrical_illuminance import compute_cylindrical_illuminance, compute_semicylindrical_illuminance
+from luxera.engine.multi_metric import MetricRequest, compute_point_metrics
+from luxera.geometry.core import Vector3
+from luxera.photometry.canonical import canonical_from_photometry
+from luxera.photometry.interp import build_interpolation_lut, sample_lut_intensity_cd, sample_lut_intensity_cd_array
+from luxera.photometry.model import Photometry
+
+
+def _photometry() -> Photometry:
+    gamma = np.array([0.0, 30.0, 60.0, 90.0, 180.0], dtype=float)
+    c = np.array([0.0, 90.0, 180.0, 270.0], dtype=float)
+    cd = np.array([[900.0, 800.0, 400.0, 50.0, 0.0]] * 4) * np.array([[1.0], [0.8], [0.6], [0.9]])
+    return Photometry(system="C", c_angles_deg=c, gamma_angles_deg=gamma, candela=cd, luminous_flux_lm=3000.0, symmetry="NONE")
+
+
+def test_fused_metrics_match_single_metric_formulas() -> None:
+    phot = _photometry()
+    lut = build_interpolation_lut(canonical_from_photometry(phot))
+    lums = [
+        Luminaire(photometry=phot, transform=from_euler_zyx(Vector3(1.0, 1.0, 3.0), 10.0, 5.0, 0.0), lut=lut),
+        Luminaire(photometry=phot, transform=from_euler_zyx(Vector3(4.0, 2.5, 3.2), -30.0, 0.0, 0.0), flux_multiplier=0.7),
+    ]
+    pts = np.random.default_rng(4).uniform([0.0, 0.0, 0.8], [5.0, 4.0, 1.6], size=(40, 3))
+    request = MetricRequest(vertical={"N": (0.0, -1.0, 0.0)}, cylindrical=True, semicylindrical={"E": (1.0, 0.0)})
+    res = compute_point_metrics(pts, lums, request)
+    assert set(res.values) == {"E_h", "E_v:N", "E_z", "E_sc:E"}
+
+    for i, p in enumerate(pts):
+        pv = Vector3(*p)
+        eh = sum(calculate_direct_illuminance(pv, Vector3(0.0, 0.0, 1.0), lum) for lum in lums)
+        ev = sum(calculate_direct_illuminance(pv, Vector3(0.0, -1.0, 0.0), lum) for lum in lums)
+        # The cylindrical helpers take the intensity the horizontal-facing point would see.
+        ez = esc = 0.0
+        for lum in lums:
+            lp = lum.transform.position.to_array()
+            up = calculate_direct_illuminance(pv, (lum.transform.position - pv).normalize(), lum)
+            intensity = up * float(np.sum((lp - p) ** 2))
+            ez += compute_cylindrical_illuminance(p, lp, intensity)
+            esc += compute_semicylindrical_illuminance(p, lp, intensity, np.array([1.0, 0.0]))
+        assert np.isclose(res.E_h[i], eh, rtol=1e-9, atol=1e-9)
+        assert np.isclose(res.E_v("N")[i], ev, rtol=1e-9, atol=1e-9)
+        assert np.isclose(res.E_z[i], ez, rtol=1e-9, atol=1e-9)
+        assert np.isclose(res.E_sc("E")[i], esc, rtol=1e-9, atol=1e-9)
+    stats = res.stats()
+    assert stats["E_h"]["min"] <= stats["E_h"]["avg"] <= stats["E_h"]["max"]
+
+
+def test_array_lut_sampling_matches_scalar() -> None:
+    lut = build_interpolation_lut(canonical_from_photometry(_photometry()))
+    dirs = np.random.default_rng(5).normal(size=(500, 3))
+    expected = [sample_lut_intensity_cd(lut, Vector3(*d)) for d in dirs]
+    assert np.allclose(sample_lut_intensity_cd_array(lut, dirs), expected, rtol=1e-12, atol=1e-9)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import luxera.parser.ies_parser as ies_parser
+from luxera.engine.direct_illuminance import clear_photometry_cache, load_luminaires
+from luxera.project.schema import LuminaireInstance, PhotometryAsset, Project, RotationSpec, TransformSpec
+
+
+def _project(tmp_path: Path, count: int) -> Project:
+    fixture = Path("tests/fixtures/photometry/synthetic_basic.ies").resolve()
+    p = Project(name="warehouse", root_dir=str(tmp_path))
+    p.photometry_assets.append(PhotometryAsset(id="a1", format="IES", path=str(fixture)))
+    for i in range(count):
+        p.luminaires.append(
+            LuminaireInstance(
+                id=f"l{i}",
+                name=f"L{i}",
+                photometry_asset_id="a1",
+                transform=TransformSpec(position=(float(i), 1.0, 6.0), rotation=RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0))),
+            )
+        )
+    return p
+
+
+def _count_parses(monkeypatch) -> list[int]:
+    calls = [0]
+    real = ies_parser.parse_ies_text
+
+    def counting(*args, **kwargs):
+        calls[0] += 1
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(ies_parser, "parse_ies_text", counting)
+    return calls
+
+
+def test_asset_parsed_once_and_shared_across_instances(tmp_path: Path, monkeypatch) -> None:
+    clear_photometry_cache()
+    calls = _count_parses(monkeypatch)
+    hashed: list[str] = []
+    lums, hashes = load_luminaires(_project(tmp_path, 40), lambda a: hashed.append(a.id) or "h")
+    assert len(lums) == 40
+    assert calls[0] == 1
+    assert hashed == ["a1"] and hashes == {"a1": "h"}
+    assert all(l.photometry is lums[0].photometry for l in lums)
+    assert lums[0].lut is not None and all(l.lut is lums[0].lut for l in lums)
+    assert lums[3].transform.position.x == 3.0
+
+
+def test_parsed_photometry_survives_across_jobs(tmp_path: Path, monkeypatch) -> None:
+    clear_photometry_cache()
+    calls = _count_parses(monkeypatch)
+    first, _ = load_luminaires(_project(tmp_path / "a", 2), lambda a: "h")
+    second, _ = load_luminaires(_project(tmp_path / "b", 3), lambda a: "h")
+    assert calls[0] == 1
+    # Photometry and LUT come from the in-process cache, not a re-decoded parse.
+    assert second[0].photometry is first[0].photometry
+    assert second[0].lut is first[0].lut
+    # An in-process hit still leaves each project with its own on-disk LUT.
+    for root in ("a", "b"):
+        assert list((tmp_path / root / ".luxera" / "cache" / "photometry").glob("*.npz"))
+
+    clear_photometry_cache()
+    load_luminaires(_project(tmp_path / "c", 1), lambda a: "h")
+    assert calls[0] == 2
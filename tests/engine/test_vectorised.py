@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import threading
 import time
 
 import numpy as np
 
+from luxera.core.processes import process_context
 from luxera.engine.vectorised import ParallelEngine, VectorisedDirectEngine
 
 
@@ -100,6 +102,23 @@ def test_parallel_matches_single() -> None:
     np.testing.assert_allclose(parallel, single, rtol=0.0, atol=1e-12)
 
 
+def test_parallel_avoids_fork_while_other_threads_are_alive() -> None:
+    pts, nrm, lpos, lint, lflux, lmf = _sample_data(600, 6, seed=5)
+    eng = VectorisedDirectEngine()
+    single = eng.compute_grid(pts, nrm, lpos, lint, lflux, lmf)
+    release = threading.Event()
+    worker = threading.Thread(target=release.wait, daemon=True)
+    worker.start()
+    try:
+        # Forking now could deadlock the child; workers start fresh instead.
+        assert process_context().get_start_method() != "fork"
+        parallel = ParallelEngine(n_workers=2).compute_parallel(eng, pts, nrm, lpos, lint, lflux, lmf)
+    finally:
+        release.set()
+        worker.join()
+    np.testing.assert_allclose(parallel, single, rtol=0.0, atol=1e-12)
+
+
 def test_chunking_large_grid() -> None:
     pts, nrm, lpos, lint, lflux, lmf = _sample_data(10000, 50, seed=99)
     eng_chunked = VectorisedDirectEngine(max_pairs_per_batch=100_000)
@@ -75,3 +75,62 @@ def test_luminaire_schedule_content(tmp_path: Path) -> None:
     assert b"Luminaire Schedule" in data
     assert b"LX-100" in data
     assert b"a1" in data
+
+
+def test_rebuild_reuses_cached_figures(tmp_path: Path) -> None:
+    from luxera.cache.figure_cache import clear_figure_memory_cache
+
+    project, results = _build_project(tmp_path)
+    clear_figure_memory_cache()
+    first = ProfessionalReportBuilder(project, results, n_workers=2)
+    first.build(tmp_path / "first.pdf")
+    assert first.figure_stats["rendered"] >= 5
+    assert first.figure_stats["cached"] == 0
+    assert len(list((tmp_path / ".luxera" / "cache" / "figures").glob("*.png"))) == first.figure_stats["rendered"]
+
+    # A text-only change reuses every figure, also from disk in a fresh process.
+    clear_figure_memory_cache()
+    project.name = "professional-report-v2"
+    second = ProfessionalReportBuilder(project, results)
+    second.build(tmp_path / "second.pdf")
+    assert second.figure_stats == {"rendered": 0, "cached": first.figure_stats["rendered"]}
+
+    # Moving a luminaire in plan redraws only the figures that depend on it.
+    project.luminaires[0].transform.position = (3.0, 2.0, 2.8)
+    third = ProfessionalReportBuilder(project, results)
+    specs = third._figure_specs()
+    third.build(tmp_path / "third.pdf")
+    assert 0 < third.figure_stats["rendered"] < len(specs)
+
+
+def test_figure_disk_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    import os
+
+    from luxera.cache.figure_cache import clear_figure_memory_cache, load_figure_from_cache, save_figure_to_cache
+
+    clear_figure_memory_cache()
+    for i, key in enumerate(("a", "b", "c")):
+        path = save_figure_to_cache(tmp_path, key, bytes(100), max_bytes=250)
+        os.utime(path, ns=(i * 10**9, i * 10**9))
+    clear_figure_memory_cache()
+    assert load_figure_from_cache(tmp_path, "b") is not None  # refreshes "b"
+    save_figure_to_cache(tmp_path, "d", bytes(100), max_bytes=250)
+    assert sorted(p.stem for p in tmp_path.glob("*.png")) == ["b", "d"]
+
+
+def test_cached_grid_csv_arrays_are_read_only(tmp_path: Path) -> None:
+    from luxera.export.professional_pdf import _load_grid_csv
+
+    csv = tmp_path / "grid.csv"
+    csv.write_text("x,y,z,lux\n0,0,0.8,10\n1,0,0.8,20\n0,1,0.8,30\n1,1,0.8,40\n", encoding="utf-8")
+    st = csv.stat()
+    x, y, z = _load_grid_csv(str(csv), st.st_mtime_ns, st.st_size)
+    assert z.tolist() == [[10.0, 20.0], [30.0, 40.0]]
+    assert not (x.flags.writeable or y.flags.writeable or z.flags.writeable)
+    assert _load_grid_csv(str(csv), st.st_mtime_ns, st.st_size)[2] is z
+
+
+def test_polar_spec_carries_asset_source_path(tmp_path: Path) -> None:
+    project, results = _build_project(tmp_path)
+    _, spec = ProfessionalReportBuilder(project, results)._figure_specs()["polar:a1"]
+    assert spec["source_path"] == str(Path("tests/fixtures/photometry/synthetic_basic.ies").resolve())
@@ -130,3 +130,48 @@ def test_import_without_ifcopenshell(tmp_path: Path, monkeypatch) -> None:
     with pytest.raises(ImportError) as e:
         EnhancedIFCImporter(f)
     assert "pip install ifcopenshell" in str(e.value)
+
+
+_STEP_IFC = """ISO-10303-21;
+HEADER;
+FILE_SCHEMA(('IFC4'));
+ENDSEC;
+DATA;
+#10=IFCBUILDINGSTOREY('L1',$,'Level 1',$,$,$,$,$,.ELEMENT.,3.5);
+#20=IFCCARTESIANPOINT((1.,2.,0.));
+#21=IFCAXIS2PLACEMENT3D(#20,$,$);
+#22=IFCLOCALPLACEMENT($,#21);
+#30=IFCSPACE('SP1',$,'Office','6x4x3',$,#22,$,'Open Office',.ELEMENT.,.INTERNAL.,$);
+#40=IFCWALLSTANDARDCASE('W1',$,'Wall 1',$,$,#22,$,$,$);
+#41=IFCMATERIAL('Concrete',$,$);
+#42=IFCRELASSOCIATESMATERIAL('R1',$,$,$,(#40),#41);
+#50=IFCWINDOW('WIN1',$,'Window 1',$,$,#22,$,$,1.2,1.5,$,$,$);
+#51=IFCOPENINGELEMENT('O1',$,$,$,$,$,$,$,$);
+#52=IFCRELVOIDSELEMENT('R2',$,$,$,#40,#51);
+#53=IFCRELFILLSELEMENT('R3',$,$,$,#51,#50);
+ENDSEC;
+END-ISO-10303-21;
+"""
+
+
+def test_step_backend_reads_attributes_without_ifcopenshell(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "ifcopenshell", None)
+    f = tmp_path / "step.ifc"
+    f.write_text(_STEP_IFC, encoding="utf-8")
+
+    imp = EnhancedIFCImporter(f, backend="auto")
+    try:
+        assert imp.backend == "step"
+        spaces = imp.import_spaces()
+        assert spaces[0]["id"] == "SP1"
+        assert (spaces[0]["width"], spaces[0]["length"], spaces[0]["height"]) == (6.0, 4.0, 3.0)
+        assert spaces[0]["origin"] == (1.0, 2.0, 0.0)
+        surfaces = imp.import_surfaces()
+        assert [s["material_name"] for s in surfaces] == ["Concrete"]
+        openings = imp.import_openings()
+        assert openings[0]["host_surface_id"] == "W1"
+        assert (openings[0]["width"], openings[0]["height"]) == (1.5, 1.2)
+        project = imp.to_project()
+        assert project.geometry.levels[0].elevation == pytest.approx(3.5)
+    finally:
+        imp.close()
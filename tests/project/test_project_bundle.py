@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import base64
+from pathlib import Path
+
+import pytest
+
+from luxera.project.bundle import BUNDLE_SUFFIX, ProjectBundle, ProjectBundleError, is_project_bundle, load_project_bundle
+from luxera.project.io import load_project_schema, save_project_schema
+from luxera.project.schema import (
+    CalcGrid,
+    JobSpec,
+    LuminaireInstance,
+    PhotometryAsset,
+    Project,
+    RoomSpec,
+    RotationSpec,
+    TransformSpec,
+)
+
+
+def _project() -> Project:
+    p = Project(name="bundle")
+    p.geometry.rooms.append(RoomSpec(id="r1", name="R1", width=6.0, length=8.0, height=3.0))
+    blob = base64.b64encode(b"IESNA:LM-63-2002\nTILT=NONE\n" * 200).decode("ascii")
+    p.photometry_assets.append(PhotometryAsset(id="a1", format="IES", embedded_b64=blob))
+    p.photometry_assets.append(PhotometryAsset(id="a2", format="IES", embedded_b64=blob))
+    p.luminaires.append(
+        LuminaireInstance(
+            id="l1",
+            name="L1",
+            photometry_asset_id="a1",
+            transform=TransformSpec(position=(1.0, 1.0, 2.8), rotation=RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0))),
+        )
+    )
+    p.grids.append(CalcGrid(id="g1", name="G1", origin=(0.0, 0.0, 0.0), width=6.0, height=8.0, elevation=0.8, nx=4, ny=4))
+    p.jobs.append(JobSpec(id="j1", type="direct"))
+    p.agent_history.append({"intent": "place lights"})
+    return p
+
+
+def test_bundle_roundtrip_matches_json(tmp_path: Path) -> None:
+    project = _project()
+    json_path = tmp_path / "p.json"
+    bundle_path = tmp_path / f"p{BUNDLE_SUFFIX}"
+    save_project_schema(project, json_path)
+    save_project_schema(project, bundle_path)
+
+    assert is_project_bundle(bundle_path)
+    assert not is_project_bundle(json_path)
+    a = load_project_schema(json_path).to_dict()
+    b = load_project_schema(bundle_path).to_dict()
+    assert a == b
+
+
+def test_bundle_deduplicates_embedded_photometry(tmp_path: Path) -> None:
+    path = tmp_path / f"p{BUNDLE_SUFFIX}"
+    save_project_schema(_project(), path)
+    with ProjectBundle(path) as bundle:
+        count = bundle._conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+    assert count == 1
+
+
+def test_bundle_partial_load_and_incremental_save(tmp_path: Path) -> None:
+    path = tmp_path / f"p{BUNDLE_SUFFIX}"
+    save_project_schema(_project(), path)
+
+    with ProjectBundle(path) as bundle:
+        before = bundle.section_digests()
+        project = bundle.load_project(sections=["core"])
+        assert [j.id for j in project.jobs] == ["j1"]
+        assert project.luminaires == []
+        assert project.geometry.rooms == []
+
+        project.jobs.append(JobSpec(id="j2", type="direct"))
+        written = bundle.save(project)
+        after = bundle.section_digests()
+
+    assert written == ["core"]
+    assert {k: v for k, v in after.items() if k != "core"} == {k: v for k, v in before.items() if k != "core"}
+
+    full = load_project_schema(path)
+    assert [j.id for j in full.jobs] == ["j1", "j2"]
+    assert [l.id for l in full.luminaires] == ["l1"]
+    assert [r.id for r in full.geometry.rooms] == ["r1"]
+    assert full.agent_history == [{"intent": "place lights"}]
+
+
+def test_bundle_unchanged_save_writes_nothing(tmp_path: Path) -> None:
+    path = tmp_path / f"p{BUNDLE_SUFFIX}"
+    project = _project()
+    save_project_schema(project, path)
+    with ProjectBundle(path) as bundle:
+        assert bundle.save(project) == []
+
+
+def test_partial_load_then_save_keeps_unloaded_sections(tmp_path: Path) -> None:
+    path = tmp_path / f"p{BUNDLE_SUFFIX}"
+    save_project_schema(_project(), path)
+
+    project = load_project_bundle(path, sections=["core", "history"])
+    assert project.loaded_sections == ["core", "history"]
+    project.name = "renamed"
+    project.agent_history.append({"intent": "rename"})
+    save_project_schema(project, path)
+
+    full = load_project_schema(path)
+    assert full.loaded_sections is None
+    assert full.name == "renamed"
+    assert full.agent_history == [{"intent": "place lights"}, {"intent": "rename"}]
+    assert [l.id for l in full.luminaires] == ["l1"] and len(full.photometry_assets) == 2
+    assert [r.id for r in full.geometry.rooms] == ["r1"]
+
+    with pytest.raises(ProjectBundleError):
+        save_project_schema(project, tmp_path / "p.json")
+    with pytest.raises(ProjectBundleError):
+        save_project_schema(project, tmp_path / f"other{BUNDLE_SUFFIX}")
+    with ProjectBundle(path) as bundle, pytest.raises(ProjectBundleError):
+        bundle.save(project, sections=["luminaires"])
+    assert "loaded_sections" not in project.to_dict()
+
+
+def test_load_project_schema_reads_only_requested_sections(tmp_path: Path) -> None:
+    bundle_path = tmp_path / f"p{BUNDLE_SUFFIX}"
+    json_path = tmp_path / "p.json"
+    save_project_schema(_project(), bundle_path)
+    save_project_schema(_project(), json_path)
+
+    partial = load_project_schema(bundle_path, sections=("geometry",))
+    assert partial.loaded_sections == ["core", "geometry"]
+    assert [r.id for r in partial.geometry.rooms] == ["r1"]
+    assert partial.luminaires == [] and partial.agent_history == []
+    # JSON projects have no sections and always load in full.
+    full = load_project_schema(json_path, sections=("geometry",))
+    assert full.loaded_sections is None and [l.id for l in full.luminaires] == ["l1"]
+
+
+def test_bundle_save_serialises_only_changed_sections(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import luxera.project.bundle as bundle_mod
+
+    path = tmp_path / f"p{BUNDLE_SUFFIX}"
+    project = _project()
+    save_project_schema(project, path)
+
+    serialised: list[str] = []
+    payload = bundle_mod._section_payload
+    monkeypatch.setattr(bundle_mod, "_section_payload", lambda p, name: serialised.append(name) or payload(p, name))
+    project.luminaires[0].transform.position = (2.0, 1.0, 2.8)
+    with ProjectBundle(path) as bundle:
+        assert bundle.save(project) == ["luminaires"]
+    assert serialised == ["luminaires"]
+
+    # Another writer changed a section on disk: it is re-serialised and restored.
+    other = load_project_bundle(path)
+    other.name = "other"
+    save_project_schema(other, path)
+    serialised.clear()
+    with ProjectBundle(path) as bundle:
+        assert bundle.save(project) == ["core"]
+    assert serialised == ["core"]
+    assert load_project_bundle(path).name == "bundle"
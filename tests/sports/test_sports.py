@@ -65,3 +65,6 @@ def test_compliance_check_fields():
     assert "E_h_uniformity_U1" in result.compliance
     assert "E_h_uniformity_U2" in result.compliance
 
+    assert "GR_max" in result.compliance
+    assert result.GR_max is not None and result.GR_max > 0.0
+    assert result.compliance["GR_max"] == (result.GR_max <= 50.0)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from luxera.calcs.adaptive_grid import adaptive_grid_values
+from luxera.engine.direct_illuminance import load_luminaires, run_direct_grid
+from luxera.project.schema import CalcGrid, LuminaireInstance, PhotometryAsset, Project, RotationSpec, TransformSpec
+
+
+def test_adaptive_grid_evaluates_each_point_once_and_tracks_metrics() -> None:
+    nx, ny = 97, 65
+    xs, ys = np.meshgrid(np.linspace(0.0, 48.0, nx), np.linspace(0.0, 32.0, ny))
+    field = 500.0 / (1.0 + ((xs - 12.0) ** 2 + (ys - 20.0) ** 2) / 30.0) + 20.0
+    seen: list[np.ndarray] = []
+
+    def _evaluate(flat: np.ndarray) -> np.ndarray:
+        seen.append(flat)
+        j, i = np.divmod(flat, nx)
+        return field[j, i]
+
+    res = adaptive_grid_values(_evaluate, nx, ny, tolerance=0.01, max_level=4)
+    asked = np.concatenate(seen)
+    assert asked.size == np.unique(asked).size == res.computed_count
+    assert res.computed_count < nx * ny // 2
+    assert np.array_equal(res.values[res.computed], field[res.computed])
+    assert np.isclose(res.metrics["E_avg"], field.mean(), rtol=0.01)
+    assert np.isclose(res.metrics["U0"], field.min() / field.mean(), rtol=0.02)
+
+
+def test_run_direct_grid_adaptive_matches_uniform(tmp_path: Path) -> None:
+    ies = tmp_path / "lum.ies"
+    ies.write_text("IESNA:LM-63-2019\nTILT=NONE\n1 1000 1 3 1 1 2 0.5 0.5 0.2\n0 45 90\n0\n1000 700 300\n", encoding="utf-8")
+    p = Project(name="adaptive", root_dir=str(tmp_path))
+    p.photometry_assets.append(PhotometryAsset(id="a1", format="IES", path=str(ies)))
+    rot = RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0))
+    for k, (x, y) in enumerate([(3.0, 3.0), (9.0, 3.0), (6.0, 7.0)]):
+        p.luminaires.append(
+            LuminaireInstance(id=f"l{k}", name="Lum", photometry_asset_id="a1", transform=TransformSpec(position=(x, y, 3.0), rotation=rot))
+        )
+    luminaires, _ = load_luminaires(p, lambda a: "hash")
+    grid = CalcGrid(id="g", name="g", origin=(0.0, 0.0, 0.0), width=12.0, height=10.0, elevation=0.0, nx=49, ny=41)
+
+    uniform = run_direct_grid(grid, luminaires)
+    adaptive = run_direct_grid(grid, luminaires, adaptive_tolerance=0.01)
+    assert uniform.computed_mask is None
+    mask = adaptive.computed_mask
+    assert mask is not None and 0 < np.count_nonzero(mask) < mask.size
+    assert np.allclose(adaptive.values[mask], uniform.values[mask])
+    assert np.isclose(adaptive.values.mean(), uniform.values.mean(), rtol=0.01)
+    assert np.isclose(adaptive.values.min() / adaptive.values.mean(), uniform.values.min() / uniform.values.mean(), rtol=0.02)
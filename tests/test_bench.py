@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from luxera.bench import (
+    bench_report,
+    compare_to_baseline,
+    get_scenario,
+    list_scenarios,
+    run_scenario,
+    select_scenarios,
+)
+from luxera.cli import main
+
+
+def test_registered_scenarios_cover_hot_paths() -> None:
+    names = {s.name for s in list_scenarios()}
+    assert {
+        "direct",
+        "direct_occlusion",
+        "radiosity_analytic",
+        "radiosity_monte_carlo",
+        "radiosity_hemicube",
+        "ugr",
+        "roadway",
+        "daylight",
+        "import_obj",
+        "report_pdf",
+    } <= names
+    assert all({"small", "medium", "large"} <= set(s.sizes) for s in list_scenarios())
+    assert [s.name for s in select_scenarios(["direct"])] == ["direct"]
+    assert {s.name for s in select_scenarios(["radiosity_"])} == {"radiosity_analytic", "radiosity_hemicube", "radiosity_monte_carlo"}
+
+
+def test_run_scenario_reports_timings_and_peak_memory() -> None:
+    result = run_scenario(get_scenario("import_obj"), "small", repeats=3, warmup=1)
+    assert len(result.times_s) == 3 and all(t > 0.0 for t in result.times_s)
+    stats = result.stats()
+    assert stats["min"] <= stats["median"] <= stats["max"]
+    assert result.peak_memory_bytes is not None and result.peak_memory_bytes > 0
+
+    report = bench_report([result])
+    assert compare_to_baseline(report, report).passed
+    slower = json.loads(json.dumps(report))
+    slower["results"][0]["stats"]["median"] = stats["median"] * 3.0 + 0.01
+    slower["results"][0]["peak_memory_bytes"] = result.peak_memory_bytes * 4 + (8 << 20)
+    cmp = compare_to_baseline(slower, report)
+    assert not cmp.passed
+    assert {r.metric for r in cmp.regressions} == {"time_median_s", "peak_memory_bytes"}
+    assert compare_to_baseline(report, slower).improvements == ["import_obj/small"]
+
+
+def test_cli_bench_run_gates_on_baseline(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    baseline = tmp_path / "baseline.json"
+    args = ["bench", "run", "--scenario", "daylight", "--sizes", "small", "--repeat", "2", "--no-memory", "--baseline", str(baseline)]
+    assert main(args + ["--update-baseline"]) == 0
+    assert main(args + ["--out", str(tmp_path / "run.json")]) == 0
+    payload = json.loads((tmp_path / "run.json").read_text(encoding="utf-8"))
+    assert payload["comparison"]["passed"] is True
+    assert payload["results"][0]["scenario"] == "daylight"
+
+    stored = json.loads(baseline.read_text(encoding="utf-8"))
+    stored["results"][0]["stats"]["median"] = 1e-9
+    baseline.write_text(json.dumps(stored), encoding="utf-8")
+    assert main(args + ["--min-time-delta", "0"]) == 1
+    assert "[REGRESSION] daylight/small" in capsys.readouterr().out
@@ -30,7 +30,7 @@ def test_evaluate_roadway_handles_uo_and_ti_checks() -> None:
                 "uo": 0.32,
                 "uo_min": 0.40,
                 "ti_ok": False,
-                "threshold_increment_ti_proxy_percent": 18.0,
+                "threshold_increment_ti_percent": 18.0,
                 "ti_max_percent": 15.0,
             }
         }
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from luxera.geometry.core import Vector3
+from luxera.io.dxf_import import DXFInsert, DXFLine, DXFParser, iter_dxf_entities, lines_to_polylines
+
+
+_DXF = "\n".join(
+    [
+        "0", "SECTION", "2", "BLOCKS",
+        "0", "BLOCK", "2", "LUM", "10", "0.5", "20", "0.5", "30", "0.0",
+        "0", "INSERT", "2", "INNER", "8", "0",
+        "0", "LINE", "8", "B", "10", "0.0", "20", "0.0", "11", "1.0", "21", "0.0",
+        "0", "ENDBLK",
+        "0", "ENDSEC",
+        "0", "SECTION", "2", "ENTITIES",
+        "0", "INSERT", "8", "LIGHTS", "2", "LUM", "10", "2.0", "20", "1.5",
+        "0", "LINE", "8", "AUX", "10", "0.0", "20", "0.0", "11", "1.0", "21", "1.0",
+        "0", "ENDSEC",
+        "0", "EOF",
+    ]
+) + "\n"
+
+
+def test_parser_keeps_block_and_trailing_entities(tmp_path: Path) -> None:
+    doc = DXFParser().parse_string(_DXF)
+    block = doc.blocks["LUM"]
+    assert block.base_point == Vector3(0.5, 0.5, 0.0)
+    assert [type(e) for e in block.entities] == [DXFInsert, DXFLine]
+    assert block.entities[0].block_name == "INNER"
+    assert [type(e) for e in doc.entities] == [DXFInsert, DXFLine]
+
+    path = tmp_path / "plan.dxf"
+    path.write_text(_DXF, encoding="utf-8")
+    assert list(iter_dxf_entities(path)) == doc.entities
+
+
+def test_lines_to_polylines_stitches_shuffled_squares() -> None:
+    lines = []
+    for ox in (0.0, 10.0):
+        corners = [(ox, 0.0), (ox + 4.0, 0.0), (ox + 4.0, 3.0), (ox, 3.0)]
+        for k in range(4):
+            (x0, y0), (x1, y1) = corners[k], corners[(k + 1) % 4]
+            # Reverse every other segment and jitter endpoints inside the tolerance.
+            a, b = Vector3(x0 + 0.002, y0, 0.0), Vector3(x1, y1 - 0.002, 0.0)
+            lines.append(DXFLine(start=b, end=a) if k % 2 else DXFLine(start=a, end=b))
+    lines = lines[::2] + lines[1::2]
+    polys = lines_to_polylines(lines, tolerance=0.01)
+    assert len(polys) == 2
+    assert all(p.is_closed and len(p.vertices) == 4 for p in polys)
+    assert len(lines_to_polylines(lines, tolerance=0.0)) == len(lines)
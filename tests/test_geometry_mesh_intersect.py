@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import numpy as np
+
+from luxera.geometry.cleaning import merge_vertices
+from luxera.geometry.doctor import scene_health_report
+from luxera.geometry.heal import heal_mesh
+from luxera.geometry.mesh_intersect import find_self_intersections, triangle_pair_candidates
+
+
+def _brute_force_candidates(verts: np.ndarray, tris: np.ndarray) -> list[tuple[int, int]]:
+    corners = verts[tris]
+    mins, maxs = corners.min(axis=1), corners.max(axis=1)
+    out = []
+    for i in range(len(tris)):
+        for j in range(i + 1, len(tris)):
+            if set(tris[i].tolist()) & set(tris[j].tolist()):
+                continue
+            if np.any(maxs[i] < mins[j]) or np.any(maxs[j] < mins[i]):
+                continue
+            out.append((i, j))
+    return out
+
+
+def test_grid_broad_phase_matches_all_pairs() -> None:
+    rng = np.random.default_rng(7)
+    verts = rng.uniform(0.0, 4.0, size=(90, 3))
+    tris = np.array([rng.choice(90, 3, replace=False) for _ in range(120)])
+    # A few long triangles exercise the oversized-triangle path.
+    tris[:3] = [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+    verts[[0, 3, 6]] = [[-20.0, 0.0, 0.0], [0.0, -20.0, 1.0], [0.0, 0.0, 25.0]]
+    got = [tuple(p) for p in triangle_pair_candidates(verts, tris).tolist()]
+    assert got == _brute_force_candidates(verts, tris)
+
+
+def test_crossing_triangle_is_reported_by_heal_and_doctor() -> None:
+    verts = [(0.0, 0.0, 0.0), (2.0, 0.0, 0.0), (0.0, 2.0, 0.0), (0.5, 0.5, -1.0), (0.7, 0.5, 1.0), (0.5, 0.7, 1.0)]
+    tris = [(0, 1, 2), (3, 4, 5)]
+    assert find_self_intersections(np.asarray(verts), tris) == [(0, 1)]
+    assert heal_mesh(verts, tris).report.counts["self_intersections_coarse"] == 1
+    report = scene_health_report(verts, tris)
+    assert report.counts["self_intersections_approx"] == 1
+    assert report.counts["disconnected_components"] == 2
+
+
+def test_merge_vertices_keeps_first_seen_order() -> None:
+    verts = [(1.0, 0.0, 0.0), (0.0, 0.0, 0.0), (1.0 + 1e-9, 0.0, 0.0), (0.0, 0.0, 1e-9), (2.0, 0.0, 0.0)]
+    merged, remap = merge_vertices(verts, eps=1e-6)
+    assert merged == [(1.0, 0.0, 0.0), (0.0, 0.0, 0.0), (2.0, 0.0, 0.0)]
+    assert remap == [0, 1, 0, 1, 2]
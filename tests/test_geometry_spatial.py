@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 from luxera.geometry.spatial import (
     PickResult,
     SnapOptions,
@@ -9,6 +11,8 @@ from luxera.geometry.spatial import (
     constrain_parallel_perpendicular,
     pick_nearest,
     point_in_polygon,
+    points_in_polygon,
+    points_in_polygons,
     polygon_intersection,
     polygon_union,
     snap_polyline_to_segments,
@@ -27,6 +31,23 @@ def test_point_clip_union_intersection() -> None:
     assert inter
 
 
+def test_vectorised_point_in_polygon_matches_scalar_with_holes() -> None:
+    tri = [(0.0, 0.0), (4.0, 0.0), (2.0, 2.0)]
+    assert point_in_polygon((1.0, 0.5), tri)
+    assert not point_in_polygon((3.9, 1.5), tri)
+    concave = [(0.0, 0.0), (6.0, 0.0), (6.0, 1.0), (2.0, 2.0), (6.0, 4.0), (0.0, 4.0)]
+    hole = [(0.5, 0.5), (1.5, 0.5), (1.0, 3.0)]
+    pts = np.random.default_rng(3).uniform(-1.0, 7.0, size=(2000, 2))
+    scalar_tri = [point_in_polygon(tuple(p), tri) for p in pts]
+    assert points_in_polygon(pts, tri).tolist() == scalar_tri
+    expected = [
+        (point_in_polygon(tuple(p), tri) or point_in_polygon(tuple(p), concave)) and not point_in_polygon(tuple(p), hole)
+        for p in pts
+    ]
+    assert points_in_polygons(pts, [tri, concave, [(0.0, 0.0)]], [hole]).tolist() == expected
+    assert points_in_polygons(np.zeros((0, 2)), [tri]).shape == (0,)
+
+
 def test_snap_constraints_and_pick() -> None:
     p = snap_point(
         (0.9, 0.1),
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+
+from luxera.project.diff import DiffOp, ProjectDiff
+from luxera.project.history import compact_history, push_snapshot, record_diff, redo, undo
+from luxera.project.schema import CalcGrid, LuminaireInstance, Project, RotationSpec, TransformSpec
+
+
+def _lum(i: int, x: float = 0.0) -> LuminaireInstance:
+    return LuminaireInstance(
+        id=f"l{i}",
+        name=f"L{i}",
+        photometry_asset_id="a",
+        transform=TransformSpec(position=(x, float(i), 3.0), rotation=RotationSpec(type="euler_zyx", euler_deg=(0.0, 0.0, 0.0))),
+    )
+
+
+def _grid(grid_id: str) -> CalcGrid:
+    return CalcGrid(id=grid_id, name=grid_id, origin=(0.0, 0.0, 0.0), width=2.0, height=2.0, elevation=0.8, nx=3, ny=3)
+
+
+def _big_project(n: int = 500) -> Project:
+    p = Project(name="big")
+    p.luminaires = [_lum(i) for i in range(n)]
+    return p
+
+
+def test_record_diff_entry_only_holds_touched_items() -> None:
+    p = _big_project()
+    diff = ProjectDiff(
+        ops=[
+            DiffOp(op="update", kind="luminaire", id="l7", payload={"transform": _lum(7, x=5.0).transform}),
+            DiffOp(op="remove", kind="luminaire", id="l3"),
+            DiffOp(op="add", kind="grid", id="g1", payload=_grid("g1")),
+        ]
+    )
+    record_diff(p, diff, label="edit")
+    entry = p.assistant_undo_stack[-1]
+    assert entry["format"] == "diff"
+    assert sorted((c["kind"], c["id"]) for c in entry["changes"]) == [("grid", "g1"), ("luminaire", "l3"), ("luminaire", "l7")]
+    assert len(json.dumps(entry, default=list)) < 5_000
+
+    before_ids = [l.id for l in p.luminaires]
+    assert "l3" not in before_ids
+    assert undo(p) is True
+    assert [l.id for l in p.luminaires] == [f"l{i}" for i in range(500)]
+    assert p.luminaires[7].transform.position == (0.0, 7.0, 3.0)
+    assert p.grids == []
+    assert redo(p) is True
+    assert [l.id for l in p.luminaires] == before_ids
+    assert p.luminaires[6].transform.position == (5.0, 7.0, 3.0)
+    assert [g.id for g in p.grids] == ["g1"]
+
+
+def test_push_snapshot_keeps_a_single_pending_snapshot() -> None:
+    p = _big_project(50)
+    for i in range(5):
+        push_snapshot(p, label=f"step{i}")
+        p.luminaires[i].name = f"renamed{i}"
+    assert [e.get("format") for e in p.assistant_undo_stack] == ["diff"] * 4 + [None]
+    assert all(len(e["changes"]) == 1 for e in p.assistant_undo_stack[:-1])
+
+    while undo(p):
+        pass
+    assert [l.name for l in p.luminaires[:5]] == [f"L{i}" for i in range(5)]
+    while redo(p):
+        pass
+    assert [l.name for l in p.luminaires[:5]] == [f"renamed{i}" for i in range(5)]
+
+
+def test_history_depth_is_bounded() -> None:
+    p = Project(name="depth")
+    for i in range(12):
+        record_diff(p, ProjectDiff(ops=[DiffOp(op="add", kind="grid", id=f"g{i}", payload=_grid(f"g{i}"))]), max_depth=10)
+    assert len(p.assistant_undo_stack) == 10
+
+
+def test_compact_history_converts_legacy_snapshots() -> None:
+    p = Project(name="legacy")
+    states = []
+    for i in range(3):
+        snap = asdict(p)
+        snap["label"] = f"before_g{i}"
+        states.append(snap)
+        p.assistant_undo_stack.append(snap)
+        p.grids.append(_grid(f"g{i}"))
+
+    assert compact_history(p) == 3
+    assert all(e["format"] == "diff" for e in p.assistant_undo_stack)
+    assert [len(e["changes"]) for e in p.assistant_undo_stack] == [1, 1, 1]
+    assert undo(p) and [g.id for g in p.grids] == ["g0", "g1"]
+    assert undo(p) and [g.id for g in p.grids] == ["g0"]
+    assert undo(p) and p.grids == []
+
+
+def test_agent_apply_diff_records_diff_entry_without_snapshot(tmp_path) -> None:
+    from luxera.agent.tools.api import AgentTools
+    from luxera.project.io import load_project_schema, save_project_schema
+
+    path = tmp_path / "p.json"
+    save_project_schema(_big_project(200), path)
+    tools = AgentTools()
+    project, _ = tools.open_project(str(path))
+    diff = ProjectDiff(ops=[DiffOp(op="update", kind="luminaire", id="l5", payload={"name": "moved"})])
+    res = tools.apply_diff(project, diff, approved=True)
+    assert res.ok
+
+    for stack in (project.assistant_undo_stack, load_project_schema(path).assistant_undo_stack):
+        assert len(stack) == 1
+        entry = stack[0]
+        assert entry["format"] == "diff" and entry["label"] == "assistant_apply_diff"
+        assert "luminaires" not in entry and [c["id"] for c in entry["changes"]] == ["l5"]
+    assert load_project_schema(path).luminaires[5].name == "moved"
+
+    assert tools.undo_assistant_change(project).ok
+    assert load_project_schema(path).luminaires[5].name == "L5"
+
+
+def test_push_snapshot_reserialises_only_edited_entities() -> None:
+    from copy import deepcopy
+
+    from luxera.project.history import _state
+    from luxera.project.schema import RoomSpec
+
+    p = _big_project(50)
+    p.geometry.rooms.append(RoomSpec(id="r1", name="Room", width=4.0, length=5.0, height=3.0))
+    before = _state(p)
+    p.luminaires[3].transform.position = (9.0, 3.0, 3.0)
+    p.geometry.rooms[0].height = 3.5
+    after = _state(p)
+    changed = [i for i, (b, a) in enumerate(zip(before["luminaires"], after["luminaires"])) if b is not a]
+    assert changed == [3]
+    assert after["luminaires"][3]["transform"]["position"] == (9.0, 3.0, 3.0)
+    assert after["geometry"]["rooms"][0]["height"] == 3.5
+    assert after == _state(deepcopy(p))
+
+    push_snapshot(p, label="a")
+    p.luminaires[3].transform.position = (0.0, 3.0, 3.0)
+    push_snapshot(p, label="b")
+    assert [(c["kind"], c["id"]) for c in p.assistant_undo_stack[0]["changes"]] == [("luminaire", "l3")]
@@ -128,3 +128,28 @@ TILT=NONE
 """
     with pytest.raises(ParseError):
         parse_ies_text(text)
+
+
+def test_bulk_numeric_block_matches_per_token_reader():
+    from luxera.parser.ies_parser import _tokenise_numeric_block, _tokenise_numeric_block_slow
+
+    lines = ["", "0 22.5", "45 +67.5e0", "", "90 .5 1.", "tail ignored"]
+    assert _tokenise_numeric_block(lines, 0, 6) == _tokenise_numeric_block_slow(lines, 0, 6)
+    assert _tokenise_numeric_block(lines, 0, 6)[1:] == (2, 5, 5)
+
+    commented = ["1 2 ; note", "3"]
+    assert _tokenise_numeric_block(commented, 0, 3)[0] == [1.0, 2.0, 3.0]
+
+
+def test_bulk_fallback_keeps_precise_error_location():
+    text = """IESNA:LM-63-2002
+TILT=NONE
+1 1000 1 3 1 1 2 0.5 0.5 0.2
+0 45 90
+0
+100 nan 60
+"""
+    with pytest.raises(ParseError) as exc:
+        parse_ies_text(text)
+    assert exc.value.line_no == 6
+    assert "got 'nan' (token 2 on line)" in exc.value.message
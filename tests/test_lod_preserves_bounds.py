@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import numpy as np
 
-from luxera.geometry.lod import build_lod, mesh_bounds
+from luxera.geometry.cleaning import mesh_edge_counts, triangle_areas
+from luxera.geometry.lod import build_lod, mesh_bounds, simplify_mesh_levels
 from luxera.geometry.mesh import TriMesh
 from luxera.viewer.mesh import mesh_from_trimesh
 
@@ -44,3 +45,23 @@ def test_viewer_hook_uses_lod_mesh() -> None:
     full = mesh_from_trimesh(mesh, use_lod=False)
     lod = mesh_from_trimesh(mesh, use_lod=True, lod_ratio=0.5)
     assert lod.indices.shape[0] <= full.indices.shape[0]
+
+
+def test_quadric_simplification_keeps_plane_area_and_manifold_edges() -> None:
+    n = 20
+    verts = [(float(i), float(j), 0.0) for j in range(n + 1) for i in range(n + 1)]
+    faces = []
+    for j in range(n):
+        for i in range(n):
+            a = j * (n + 1) + i
+            faces.extend([(a, a + 1, a + n + 2), (a, a + n + 2, a + n + 1)])
+    mesh = TriMesh(vertices=verts, faces=faces)
+    finest, coarse = simplify_mesh_levels(mesh, (0.1, 0.5))
+    for level in (coarse, finest):
+        v = np.asarray(level.vertices, dtype=float)
+        f = np.asarray(level.faces, dtype=int)
+        assert len(f) < len(faces)
+        assert np.isclose(triangle_areas(v, f).sum(), n * n)
+        _, counts = mesh_edge_counts(f)
+        assert counts.max() <= 2
+    assert len(coarse.faces) < len(finest.faces)
@@ -211,3 +211,102 @@ def test_run_corpus_fails_when_invariance_mismatch_detected(tmp_path: Path, monk
     assert summary["scenes"][0]["invariance_failures"] == 1
     md = (out / "summary.md").read_text(encoding="utf-8")
     assert "rotate_z_90" in md
+
+
+def test_run_corpus_incremental_skips_unchanged_passing_scenes(tmp_path: Path) -> None:
+    parity_root = tmp_path / "parity"
+    pack_dir = _write_pack(parity_root)
+    (pack_dir / "scenes" / "office_01.lux.json").write_text(json.dumps({"name": "office"}), encoding="utf-8")
+    exp_path = pack_dir / "expected" / "luxera" / "v1" / "office_01.expected.json"
+    exp_path.write_text(
+        json.dumps(
+            {
+                "schema_version": "parity_expected_v2",
+                "scene_id": "office_01",
+                "baseline": "luxera",
+                "baseline_version": "v1",
+                "results": {"mean_lux": 100.0},
+            }
+        ),
+        encoding="utf-8",
+    )
+    calls = []
+
+    def stub_run_scene(scene_path: Path):
+        calls.append(scene_path.name)
+        return {"results": {"mean_lux": 100.0}}
+
+    def run() -> dict:
+        return run_corpus(
+            parity_root=parity_root,
+            selector={"include_packs": ["indoor_basic"]},
+            baseline="luxera",
+            out_dir=tmp_path / "out",
+            run_scene=stub_run_scene,
+            jobs=2,
+            incremental=True,
+        )
+
+    first = run()
+    assert first["passed"] == 1 and first["cached"] == 0
+    second = run()
+    assert len(calls) == 1
+    assert second["passed"] == 1 and second["cached"] == 1
+    assert second["scenes"][0]["cached"] is True
+    assert json.loads((tmp_path / "out" / "summary.json").read_text(encoding="utf-8"))["cached"] == 1
+
+    # Runner-written results do not invalidate the pass; scene edits do.
+    (pack_dir / "scenes" / "office_01.lux.json").write_text(json.dumps({"name": "office", "results": [1]}), encoding="utf-8")
+    run()
+    assert len(calls) == 1
+    (pack_dir / "scenes" / "office_01.lux.json").write_text(json.dumps({"name": "office_v2"}), encoding="utf-8")
+    third = run()
+    assert len(calls) == 2 and third["cached"] == 0
+
+
+def test_run_corpus_records_scene_errors_as_failed_rows(tmp_path: Path) -> None:
+    parity_root = tmp_path / "parity"
+    _write_pack(parity_root)
+
+    def broken_run_scene(_scene_path: Path):
+        raise RuntimeError("solver exploded")
+
+    out = tmp_path / "out"
+    summary = run_corpus(
+        parity_root=parity_root,
+        selector={"include_packs": ["indoor_basic"]},
+        baseline="luxera",
+        out_dir=out,
+        run_scene=broken_run_scene,
+    )
+
+    assert summary["selected_scenes"] == 1 and summary["failed"] == 1
+    (row,) = summary["scenes"]
+    assert row["status"] == "FAIL" and row["error"] == "RuntimeError: solver exploded"
+    assert "solver exploded" in (out / "failures" / "office_01" / "error.txt").read_text(encoding="utf-8")
+    assert "## Scene Errors" in (out / "summary.md").read_text(encoding="utf-8")
+
+
+def test_suite_fingerprints_track_run_scene_code_and_engine_override(monkeypatch) -> None:
+    from luxera.testing import suite
+
+    def make(value: float):
+        if value > 0:
+            def run_scene(_scene_path: Path):
+                return {"results": {"mean_lux": 100.0}}
+        else:
+            def run_scene(_scene_path: Path):
+                return {"results": {"mean_lux": 0.0}}
+        return run_scene
+
+    a, b = make(1.0), make(-1.0)
+    assert a.__qualname__ == b.__qualname__
+    assert suite.callable_fingerprint(a) != suite.callable_fingerprint(b)
+    assert suite.callable_fingerprint(a) == suite.callable_fingerprint(make(2.0))
+
+    suite.engine_version.cache_clear()
+    monkeypatch.setenv(suite.ENGINE_VERSION_ENV, "pinned-1")
+    try:
+        assert suite.engine_version() == "pinned-1"
+    finally:
+        suite.engine_version.cache_clear()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from luxera.cache.parse_cache import clear_parse_memory_cache, parse_cache_key, parse_photometry_text_cached
+from luxera.database.library import PhotometryLibrary
+from luxera.photometry.verify import verify_photometry_file
+
+
+IES = """IESNA:LM-63-2002
+TILT=NONE
+1 1000 1 3 1 1 2 0.5 0.5 0.2
+0 45 90
+0
+100 80 60
+"""
+
+
+def test_parse_cache_reuses_disk_entry_and_returns_copies(tmp_path: Path, monkeypatch):
+    import luxera.parser.ies_parser as ies_parser
+
+    calls = []
+    real = ies_parser.parse_ies_text
+    monkeypatch.setattr(ies_parser, "parse_ies_text", lambda *a, **k: calls.append(1) or real(*a, **k))
+    cache_dir = tmp_path / "parsed"
+    clear_parse_memory_cache()
+
+    first = parse_photometry_text_cached(IES, "ies", cache_dir=cache_dir)
+    entry = cache_dir / f"{parse_cache_key('IES', IES)}.npz"
+    with np.load(entry, allow_pickle=False) as data:
+        assert "meta" in data.files and len(data.files) > 1
+    clear_parse_memory_cache()
+    second = parse_photometry_text_cached(IES, "IES", cache_dir=cache_dir)
+    third = parse_photometry_text_cached(IES, "IES", cache_dir=cache_dir)
+    assert len(calls) == 1
+    assert second.candela.values_cd_scaled == first.candela.values_cd_scaled
+    second.warnings.append("mutated")
+    assert "mutated" not in third.warnings
+
+    tilt_file = IES.replace("TILT=NONE", "TILT=FILE lamp.tlt")
+    parse_photometry_text_cached(tilt_file, "IES", cache_dir=cache_dir)
+    parse_photometry_text_cached(tilt_file, "IES", cache_dir=cache_dir)
+    assert len(calls) == 3
+
+
+def test_verify_and_library_share_parse_cache(tmp_path: Path):
+    clear_parse_memory_cache()
+    lib_dir = tmp_path / "lib"
+    lib_dir.mkdir()
+    ies = lib_dir / "a.ies"
+    ies.write_text(IES, encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    verify_photometry_file(str(ies), cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+    with PhotometryLibrary(tmp_path / "db.sqlite", parse_cache_dir=cache_dir) as lib:
+        assert lib.index_directory(lib_dir) == 1
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+
+
+def test_parse_cache_round_trips_ldt_and_ignores_bad_entries(tmp_path: Path):
+    from luxera.cache.parse_cache import load_parsed_from_cache
+    from luxera.parser.ldt_parser import parse_ldt_text
+
+    text = (Path(__file__).parent / "fixtures" / "photometry" / "synthetic_basic.ldt").read_text(encoding="utf-8")
+    cache_dir = tmp_path / "parsed"
+    clear_parse_memory_cache()
+    cached = parse_photometry_text_cached(text, "LDT", cache_dir=cache_dir)
+    clear_parse_memory_cache()
+    assert parse_photometry_text_cached(text, "LDT", cache_dir=cache_dir) == parse_ldt_text(text) == cached
+
+    key = parse_cache_key("LDT", text)
+    (cache_dir / f"{key}.npz").write_bytes(b"not an archive")
+    clear_parse_memory_cache()
+    assert load_parsed_from_cache(cache_dir, key) is None
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import json
+import math
 from pathlib import Path
 
+import numpy as np
 import pytest
 
+from luxera.calculation.illuminance import Luminaire
+from luxera.core.transform import from_euler_zyx
+from luxera.engine.road_glare import compute_moving_observer_ti, threshold_increment_percent
+from luxera.geometry.core import Vector3
+from luxera.photometry.model import Photometry
+from luxera.photometry.sample import sample_intensity_cd_world
 from luxera.project.runner import run_job_in_memory
 from luxera.project.schema import (
     JobSpec,
@@ -118,3 +126,68 @@ def test_roadway_glare_golden_scene(tmp_path: Path) -> None:
         assert float(rr.get("rp8_veiling_ratio", 0.0)) == pytest.approx(float(er["rp8_veiling_ratio"]), abs=tol)
         assert float(rr.get("ti_proxy_percent", 0.0)) == pytest.approx(float(er["ti_proxy_percent"]), abs=tol)
         assert float(rr.get("veiling_luminance_total_cd_m2", 0.0)) == pytest.approx(float(er["veiling_luminance_total_cd_m2"]), abs=tol)
+
+
+def test_moving_observer_sweep_matches_per_position_formula() -> None:
+    phot = Photometry(
+        system="C",
+        c_angles_deg=np.array([0.0]),
+        gamma_angles_deg=np.array([0.0, 45.0, 70.0, 90.0]),
+        candela=np.array([[600.0, 500.0, 300.0, 0.0]]),
+        luminous_flux_lm=5000.0,
+        symmetry="FULL",
+    )
+    lums = [Luminaire(photometry=phot, transform=from_euler_zyx(Vector3(x, 0.0, 10.0), 0.0, 0.0, 0.0)) for x in np.arange(0.0, 1200.0, 40.0)]
+    xs = np.linspace(0.0, 1000.0, 400)
+    paths = {1: np.column_stack((xs, np.full(xs.size, 1.75), np.zeros(xs.size))), 2: np.column_stack((xs, np.full(xs.size, 5.25), np.zeros(xs.size)))}
+    rows, worst = compute_moving_observer_ti(paths, lums, lavg_by_lane={1: 1.0, 2: 1.0}, back_offset_m=23.375)
+    assert [r["positions"] for r in rows] == [400.0, 400.0]
+    assert worst["ti_percent"] == max(r["ti_percent_worst"] for r in rows) > 0.0
+
+    # Per-position reference at the worst eye of lane 1.
+    row = rows[0]
+    eye = np.array([row["worst_x"], row["worst_y"], row["worst_z"]])
+    tilt = math.radians(1.0)
+    view = np.array([math.cos(tilt), 0.0, -math.sin(tilt)])
+    lv = 0.0
+    for lum in lums:
+        to_lum = lum.transform.position.to_array() - eye
+        d = float(np.linalg.norm(to_lum))
+        horizontal = math.hypot(to_lum[0], to_lum[1])
+        if to_lum[0] <= 0.0 or to_lum[0] > 500.0 or to_lum[2] > math.tan(math.radians(20.0)) * horizontal:
+            continue
+        cos_t = float(np.dot(to_lum / d, view))
+        theta = max(math.degrees(math.acos(cos_t)), 1.5)
+        i_cd = float(sample_intensity_cd_world(lum.photometry, lum.transform, Vector3(*(-to_lum / d))))
+        lv += 10.0 * i_cd * cos_t / (d * d) / (theta * theta)
+    assert row["veiling_luminance_worst_cd_m2"] == pytest.approx(lv, rel=1e-9)
+    assert row["ti_percent_worst"] == pytest.approx(float(threshold_increment_percent(np.array([lv]), 1.0)[0]), rel=1e-9)
+
+
+def test_moving_observer_ti_is_undefined_for_unlit_lane() -> None:
+    assert threshold_increment_percent(np.array([0.5]), 0.0) is None
+    phot = Photometry(
+        system="C",
+        c_angles_deg=np.array([0.0]),
+        gamma_angles_deg=np.array([0.0, 45.0, 70.0, 90.0]),
+        candela=np.array([[600.0, 500.0, 300.0, 0.0]]),
+        luminous_flux_lm=5000.0,
+        symmetry="FULL",
+    )
+    lums = [Luminaire(photometry=phot, transform=from_euler_zyx(Vector3(x, 0.0, 10.0), 0.0, 0.0, 0.0)) for x in (40.0, 80.0)]
+    xs = np.linspace(0.0, 100.0, 11)
+    paths = {1: np.column_stack((xs, np.full(xs.size, 1.75), np.zeros(xs.size))), 2: np.column_stack((xs, np.full(xs.size, 5.25), np.zeros(xs.size)))}
+    rows, worst = compute_moving_observer_ti(paths, lums, lavg_by_lane={1: 1.0, 2: 0.0}, back_offset_m=10.0)
+    assert [r["ti_defined"] for r in rows] == [True, False]
+    assert rows[1]["ti_percent_worst"] == 0.0 and rows[1]["veiling_luminance_worst_cd_m2"] > 0.0
+    assert worst["lane_number"] == 1.0 and worst["ti_percent"] == rows[0]["ti_percent_worst"] > 0.0
+
+
+def test_roadway_ti_compliance_uses_moving_observer_sweep(tmp_path: Path) -> None:
+    p = _seed_project(tmp_path, with_extra_glare_source=True)
+    p.roadways[0].profile = "en13201_m3_common"
+    summary = run_job_in_memory(p, "j1").summary
+    sweep_ti = summary["ti_moving_observer"]["ti_percent_worst"]
+    assert summary["threshold_increment_ti_percent"] == sweep_ti
+    assert summary["ti_percent_worst"] == sweep_ti
+    assert summary["compliance"]["ti_ok"] is (sweep_ti <= 15.0)
@@ -151,7 +151,9 @@ def test_roadway_results_json_is_deterministic(tmp_path: Path) -> None:
     assert "lane_grids" in results_a
     assert "metadata" in results_a
     assert "observer_sets" in results_a
-    assert results_a["observer_sets"]["ti_stub"]
+    ti_rows = results_a["observer_sets"]["ti"]
+    assert [r["lane_number"] for r in ti_rows] == [1.0, 2.0]
+    assert all(r["positions"] > 0 for r in ti_rows)
 
 
 def test_auto_observers_use_selected_observer_method() -> None:
@@ -34,6 +34,7 @@ def test_roadway_profile_evaluate_margins() -> None:
         "uniformity_ratio": 0.2,
         "ul_longitudinal": 0.3,
         "road_luminance_mean_cd_m2": 0.4,
+        "threshold_increment_ti_percent": 18.0,
         "threshold_increment_ti_proxy_percent": 12.0,
         "surround_ratio_proxy": 0.7,
     }
@@ -42,6 +43,7 @@ def test_roadway_profile_evaluate_margins() -> None:
     assert compliance["avg_ok"] is True
     assert compliance["uo_ok"] is False
     assert compliance["margins"]["uniformity_ratio"] < 0.0
+    assert compliance["ti_ok"] is False
     assert submission["status"] == "FAIL"
     assert isinstance(submission.get("checks"), list)
 
@@ -70,6 +70,7 @@ def test_run_roadway_job(tmp_path: Path):
     assert "observer_luminance_views" in ref.summary
     assert "observer_luminance_max_cd_m2" in ref.summary
     assert "threshold_increment_ti_proxy_percent" in ref.summary
+    assert ref.summary["threshold_increment_ti_percent"] == ref.summary["ti_moving_observer"]["ti_percent_worst"]
     assert "surround_ratio_proxy" in ref.summary
     assert len(ref.summary["observer_luminance_views"]) >= 1
     assert "compliance" in ref.summary
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from luxera.io.step_reader import STEP_DERIVED, StepIndex, StepRef, StepTyped, parse_step_arguments
+
+
+_IFC = """ISO-10303-21;
+HEADER;
+FILE_DESCRIPTION(('ViewDefinition [CoordinationView]'),'2;1');
+FILE_SCHEMA(('IFC2X3'));
+ENDSEC;
+DATA;
+#1=IFCSIUNIT(*,.LENGTHUNIT.,.MILLI.,.METRE.);
+#5 = IfcSpace('g1',$,'Room; ''A''',$,$,$,$,'Long\\X2\\00E9\\X0\\',.ELEMENT.,.INTERNAL.,$);
+#2=IFCWALL('w',$,'Wall',$,$,$,$,$);
+#3=IFCPROPERTYSINGLEVALUE('Area',$,IFCAREAMEASURE(12.5),$);
+#4=IFCRELSPACEBOUNDARY('b',$,$,$,#5,#2,$,.PHYSICAL.,.INTERNAL.);
+#6=IFCCARTESIANPOINT((0.,1.5E3,-2.));
+ENDSEC;
+END-ISO-10303-21;
+"""
+
+
+def test_index_types_and_lazy_args(tmp_path: Path):
+    path = tmp_path / "m.ifc"
+    path.write_text(_IFC, encoding="utf-8")
+    with StepIndex.open(path) as index:
+        assert index.schema == "IFC2X3"
+        assert len(index) == 6
+        assert index.ids_of_type("ifcspace") == [5]
+        assert index.type_counts()["IFCWALL"] == 1
+        assert index.raw_args(2) == "'w',$,'Wall',$,$,$,$,$"
+        space = index.entity(5)
+        assert space.args[2] == "Room; 'A'"
+        assert space.args[7] == "Longé"
+        assert space.args[8] == "ELEMENT"
+        rel = index.by_type("IFCRELSPACEBOUNDARY")[0]
+        assert rel[4] == StepRef(5)
+        assert rel.resolve(4).type == "IFCSPACE"
+        assert index.args(3)[2] == StepTyped("IFCAREAMEASURE", 12.5)
+        assert index.args(6) == ((0.0, 1500.0, -2.0),)
+        assert index.args(1)[0] is STEP_DERIVED
+        assert 99 not in index
+        with pytest.raises(KeyError):
+            index.raw_args(99)
+
+
+def test_parse_step_arguments_nested_and_empty():
+    assert parse_step_arguments("") == ()
+    assert parse_step_arguments("(#1,#2),(),$,.T.,'x'") == ((StepRef(1), StepRef(2)), (), None, "T", "x")
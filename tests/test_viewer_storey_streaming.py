@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from luxera.project.schema import LevelSpec, Project, RoomSpec, SurfaceSpec
-from luxera.viewer.streaming import build_storey_chunks, filter_chunks_for_storeys
+from luxera.viewer.streaming import ChunkStore, build_storey_chunks, filter_chunks_for_storeys, iter_chunk_stream
 
 
 def test_build_storey_chunks_and_filter_visibility() -> None:
@@ -36,3 +36,34 @@ def test_build_storey_chunks_and_filter_visibility() -> None:
     only_l1 = filter_chunks_for_storeys(chunks, {"L1"})
     assert len(only_l1) == 1
     assert only_l1[0].storey_id == "L1"
+
+
+def test_chunk_store_rebuilds_only_edited_storey_and_streams_coarse_first() -> None:
+    p = Project(name="stream-cache")
+    p.geometry.levels.extend([LevelSpec(id="L1", name="Level 1", elevation=0.0), LevelSpec(id="L2", name="Level 2", elevation=3.5)])
+    p.geometry.rooms.extend(
+        [
+            RoomSpec(id="r1", name="R1", width=4.0, length=3.0, height=3.0, origin=(0.0, 0.0, 0.0), level_id="L1"),
+            RoomSpec(id="r2", name="R2", width=4.0, length=3.0, height=3.0, origin=(0.0, 0.0, 3.5), level_id="L2"),
+        ]
+    )
+    p.geometry.surfaces.extend(
+        [
+            SurfaceSpec(id="s1", name="S1", kind="wall", room_id="r1", vertices=[(0.0, 0.0, 0.0), (4.0, 0.0, 0.0), (4.0, 0.0, 3.0), (0.0, 0.0, 3.0)]),
+            SurfaceSpec(id="s2", name="S2", kind="wall", room_id="r2", vertices=[(0.0, 0.0, 3.5), (4.0, 0.0, 3.5), (4.0, 0.0, 6.5), (0.0, 0.0, 6.5)]),
+        ]
+    )
+    store = ChunkStore()
+    first = build_storey_chunks(p, viewport_ratio=0.5, lod_ratios=(0.1,), store=store)
+    assert store.last_rebuilt == ("L1", "L2")
+    assert all(len(c.lod_meshes) == 2 for c in first)
+
+    p.geometry.surfaces[1].vertices = [(0.0, 0.0, 3.5), (5.0, 0.0, 3.5), (5.0, 0.0, 6.5), (0.0, 0.0, 6.5)]
+    second = build_storey_chunks(p, viewport_ratio=0.5, lod_ratios=(0.1,), store=store)
+    assert store.last_rebuilt == ("L2",)
+    assert second[0] is first[0]
+    assert second[1] is not first[1]
+
+    stream = [(c.storey_id, level) for c, level, _ in iter_chunk_stream(second)]
+    assert stream == [("L1", 0), ("L2", 0), ("L1", 1), ("L2", 1)]
+    assert [c.storey_id for c, _, _ in iter_chunk_stream(second, {"L2"})] == ["L2", "L2"]
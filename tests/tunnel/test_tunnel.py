@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import math
+
+import numpy as np
 import pytest
 
+from luxera.calculation.illuminance import Luminaire, calculate_direct_illuminance
+from luxera.engine.road_reflection import lookup_reflection_coefficient
+from luxera.geometry.core import Transform, Vector3
+from luxera.photometry.model import Photometry
 from luxera.tunnel.cie88 import TunnelGeometry, TunnelLightingDesign
+from luxera.tunnel.luminance import TunnelLuminaireRow, compute_tunnel_luminance
 
 
 def _sample_tunnel() -> TunnelGeometry:
@@ -70,3 +78,53 @@ def test_interior_luminance_range() -> None:
     zones = design.compute_zones(tunnel, L20=l20)
     interior = next(z for z in zones if z.name == "interior")
     assert 1.0 <= interior.required_luminance_cd_m2 <= 20.0
+
+
+def _tunnel_photometry() -> Photometry:
+    return Photometry(
+        system="C",
+        c_angles_deg=np.array([0.0]),
+        gamma_angles_deg=np.array([0.0, 30.0, 60.0, 80.0, 90.0]),
+        candela=np.array([[2000.0, 1800.0, 900.0, 200.0, 0.0]]),
+        luminous_flux_lm=8000.0,
+        symmetry="FULL",
+    )
+
+
+def test_streamed_tunnel_luminance_matches_point_reference() -> None:
+    tunnel = _sample_tunnel()
+    design = TunnelLightingDesign()
+    zones = design.compute_zones(tunnel, L20=design.compute_L20(tunnel, sky_luminance_cd_m2=5000.0))
+    phot = _tunnel_photometry()
+    rows = [
+        TunnelLuminaireRow(phot, start_m=2.0, spacing_m=4.0, count=200, lateral_m=-2.0, mounting_height_m=6.0, flux_multiplier=8.0),
+        TunnelLuminaireRow(phot, start_m=0.0, spacing_m=12.0, count=67, lateral_m=2.0, mounting_height_m=6.0),
+    ]
+    res = compute_tunnel_luminance(tunnel, rows, zones=zones, station_step_m=2.0)
+    assert res.segments == 8
+    assert res.max_luminaires_per_segment < 100
+    assert [z["name"] for z in res.zones] == [z.name for z in zones]
+    assert "overall" in res.compliance
+
+    # The influence window only drops far luminaires: a single all-seeing segment barely differs.
+    whole = compute_tunnel_luminance(tunnel, rows, zones=zones, station_step_m=2.0, segment_length_m=1000.0, influence_m=1000.0)
+    assert whole.max_luminaires_per_segment == 267
+    assert np.allclose(res.profile.road_avg, whole.profile.road_avg, rtol=1e-3)
+    assert np.allclose(res.profile.wall_avg, whole.profile.wall_avg, rtol=1e-3)
+
+    # Road centre luminance at one station from per-luminaire scalar formulas.
+    k = 200
+    x = float(whole.profile.stations_m[k])
+    p = Vector3(x, 0.0, 0.0)
+    expected = 0.0
+    for row in rows:
+        for pos in row.positions():
+            lum = Luminaire(photometry=phot, transform=Transform(position=Vector3(*pos)), flux_multiplier=row.flux_multiplier)
+            e = calculate_direct_illuminance(p, Vector3(0.0, 0.0, 1.0), lum)
+            beta = math.degrees(math.acos(max(-1.0, min(1.0, -(pos[0] - x) / math.hypot(pos[0] - x, pos[1])))))
+            expected += e * lookup_reflection_coefficient("R3", min(beta, 180.0 - beta), 1.5 / 60.0).value
+    assert whole.profile.road_centre[k] == pytest.approx(expected, rel=1e-6)
+
+    flicker = res.flicker
+    assert flicker[0]["frequency_hz"] == pytest.approx(60.0 / 3.6 / 4.0)
+    assert flicker[0]["critical"] and not flicker[1]["critical"]
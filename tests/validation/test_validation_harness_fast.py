@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 import pytest
@@ -52,3 +53,38 @@ def test_validation_harness_supports_skipped_metrics(tmp_path: Path) -> None:
     assert results[0].metrics
     assert all(m.skipped for m in results[0].metrics)
     assert all(bool(m.details.get("reason")) for m in results[0].metrics)
+
+
+@pytest.mark.validation_fast
+def test_validation_harness_parallel_incremental_rerun(tmp_path: Path) -> None:
+    toy_cases = parse_target("toy", discover_cases())
+    out = tmp_path / "validation_parallel"
+    serial = run_cases(toy_cases, out_root=tmp_path / "validation_serial")
+    parallel = run_cases(toy_cases, out_root=out, jobs=2, incremental=True)
+    assert [(r.case_id, r.passed) for r in parallel] == [(r.case_id, r.passed) for r in serial]
+    assert [[m.details.get("mean_abs", m.details.get("actual")) for m in r.metrics] for r in parallel] == [
+        [m.details.get("mean_abs", m.details.get("actual")) for m in r.metrics] for r in serial
+    ]
+
+    # The second incremental run reuses every recorded pass without re-running.
+    for r in parallel:
+        r.comparison_path.unlink()
+    cached = run_cases(toy_cases, out_root=out, jobs=2, incremental=True)
+    assert [(r.case_id, r.passed, r.metrics) for r in cached] == [(r.case_id, r.passed, r.metrics) for r in parallel]
+    assert not any(r.comparison_path.exists() for r in cached)
+
+
+@pytest.mark.validation_fast
+def test_validation_harness_parallel_run_with_live_threads(tmp_path: Path) -> None:
+    # Daemon and GUI callers always have other threads; the pool must not fork them.
+    toy_cases = parse_target("toy", discover_cases())
+    serial = run_cases(toy_cases, out_root=tmp_path / "serial")
+    release = threading.Event()
+    worker = threading.Thread(target=release.wait, daemon=True)
+    worker.start()
+    try:
+        parallel = run_cases(toy_cases, out_root=tmp_path / "parallel", jobs=2)
+    finally:
+        release.set()
+        worker.join()
+    assert [(r.case_id, r.passed) for r in parallel] == [(r.case_id, r.passed) for r in serial]
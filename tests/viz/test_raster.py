@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import struct
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+from luxera.results.grid_viz import grid_extent, write_grid_rasters
+from luxera.results.heatmaps import write_surface_heatmaps
+from luxera.viz.raster import (
+    annotate_image,
+    colormap_lut,
+    contour_bands,
+    contour_mask,
+    encode_png,
+    format_ticks,
+    render_grid_image,
+    run_render_jobs,
+    write_heatmap_png,
+)
+
+
+def _decode_png(data: bytes) -> np.ndarray:
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    pos = 8
+    idat = b""
+    width = height = channels = 0
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos : pos + 4])
+        tag = data[pos + 4 : pos + 8]
+        body = data[pos + 8 : pos + 8 + length]
+        (crc,) = struct.unpack(">I", data[pos + 8 + length : pos + 12 + length])
+        assert crc == zlib.crc32(tag + body) & 0xFFFFFFFF
+        if tag == b"IHDR":
+            width, height, depth, colour_type = struct.unpack(">IIBB", body[:10])
+            assert depth == 8
+            channels = {2: 3, 6: 4}[colour_type]
+        elif tag == b"IDAT":
+            idat += body
+        pos += 12 + length
+    raw = np.frombuffer(zlib.decompress(idat), dtype=np.uint8).reshape(height, width * channels + 1)
+    assert np.all(raw[:, 0] == 1)
+    rows = np.cumsum(raw[:, 1:].reshape(height, width, channels).astype(np.int64), axis=1) % 256
+    return rows.astype(np.uint8)
+
+
+def test_encode_png_roundtrips_pixels():
+    rng = np.random.default_rng(3)
+    img = rng.integers(0, 256, size=(7, 11, 3), dtype=np.uint8)
+    assert np.array_equal(_decode_png(encode_png(img)), img)
+
+
+def test_colormap_endpoints_match_stops():
+    lut = colormap_lut("inferno")
+    assert lut.shape == (256, 3)
+    assert tuple(lut[0]) == (0x00, 0x00, 0x04)
+    assert tuple(lut[-1]) == (0xFC, 0xFF, 0xA4)
+    assert tuple(colormap_lut("luxera")[0]) == (0x00, 0x00, 0x33)
+
+
+def test_grid_image_orientation_and_contours():
+    values = np.array([[0.0, 0.0], [100.0, 100.0]])  # row 0 is y=0
+    img = render_grid_image(values.reshape(-1), 2, 2, max_side=20)
+    assert img.shape == (20, 20, 3)
+    # y increases upwards: the bright row is at the top of the image.
+    assert int(img[0].sum()) > int(img[-1].sum())
+
+    bands = contour_bands(np.array([[0.0, 1.0, 2.0]]), [0.5, 1.5])
+    assert bands.tolist() == [[0, 1, 2]]
+    assert contour_mask(bands).tolist() == [[True, True, False]]
+
+
+def test_write_grid_rasters_and_surface_swatches(tmp_path: Path):
+    values = np.linspace(0.0, 500.0, 12)
+    out = write_grid_rasters(tmp_path, values, nx=4, ny=3, heatmap_name="a_heatmap.png", isolux_name="a_isolux.png")
+    assert set(out) == {"heatmap", "isolux"}
+    heat = _decode_png(out["heatmap"].read_bytes())
+    # 480x360 plot plus margins for the colour bar and labels.
+    assert heat.shape[1] > 480 and heat.shape[0] > 360
+    assert write_grid_rasters(tmp_path, values[:4], nx=4, ny=1).keys() == {"heatmap"}
+
+    swatches = write_surface_heatmaps(tmp_path, {"floor": 10.0, "ceiling": 90.0})
+    assert sorted(swatches) == ["ceiling", "floor"]
+    assert all(p.exists() for p in swatches.values())
+
+
+def test_run_render_jobs_preserves_order():
+    assert run_render_jobs([lambda i=i: i * i for i in range(6)], max_workers=3) == [0, 1, 4, 9, 16, 25]
+
+
+def test_annotated_images_carry_colour_bar_and_extent(tmp_path: Path):
+    plot = render_grid_image(np.linspace(0.0, 400.0, 12), 4, 3, max_side=120)
+    img = annotate_image(plot, vmin=0.0, vmax=400.0, cmap="inferno", unit="lux", ticks=[0.0, 100.0, 200.0, 300.0, 400.0], extent=(0.0, 6.0, 0.0, 4.5))
+    h, w = plot.shape[:2]
+    assert img.shape[0] > h and img.shape[1] > w
+    black = np.all(img == 0, axis=2)
+    white = np.all(img == 255, axis=2)
+    # Labels are drawn on white paper on every side of the plot.
+    assert black.sum() > 0 and white.sum() > img.shape[0] * img.shape[1] // 4
+    plot_cols = np.flatnonzero(np.any(np.all(img == plot[0, 0], axis=2), axis=0))
+    assert black[:, : plot_cols.min()].any() and black[:, plot_cols.max() + 30 :].any()
+
+    assert format_ticks([0.0, 250.0, 500.0]) == ["0", "250", "500"]
+    assert format_ticks([0.0, 0.25, 0.5]) == ["0.00", "0.25", "0.50"]
+    assert format_ticks([-0.0001, 1.0]) == ["0", "1"]
+
+    xs, ys = np.meshgrid(np.linspace(1.0, 5.0, 5), np.linspace(2.0, 4.0, 3))
+    flat = np.column_stack([xs.ravel(), ys.ravel(), np.zeros(15)])
+    assert grid_extent(flat, 5, 3) == ((1.0, 5.0, 2.0, 4.0), ("X (m)", "Y (m)"))
+    wall = np.column_stack([xs.ravel(), np.zeros(15), ys.ravel()])
+    assert grid_extent(wall, 5, 3) == ((0.0, 4.0, 0.0, 2.0), ("U (m)", "V (m)"))
+
+    plain = _decode_png(write_heatmap_png(tmp_path / "plain.png", np.arange(12.0), 4, 3, annotate=False).read_bytes())
+    assert plain.shape == (360, 480, 3)
+
+
+def test_unknown_characters_render_a_fallback_glyph():
+    from luxera.viz.raster import draw_text
+
+    blank = np.full((20, 40, 3), 255, dtype=np.uint8)
+    for text in ("cd/m2", "?", "é"):
+        canvas = blank.copy()
+        draw_text(canvas, text, 1, 1)
+        assert (canvas == 0).any(), text
+    canvas = blank.copy()
+    draw_text(canvas, "  ", 1, 1)
+    assert not (canvas == 0).any()
+
+
+def test_calc_object_unit_comes_from_its_summary():
+    from luxera.project.runner import _calc_object_unit
+
+    assert _calc_object_unit({"summary": {"mean_lux": 1.0}}, "%") == "lux"
+    assert _calc_object_unit({"summary": {"mean_df_percent": 2.0}}, "lux") == "%"
+    assert _calc_object_unit({"summary": {"metric": "luminance_cd_m2"}}, "lux") == "cd/m2"
+    assert _calc_object_unit({"summary": {"unit": "W/m2", "mean_lux": 1.0}}, "lux") == "W/m2"
+    assert _calc_object_unit({"summary": {}}, "lux") == "lux"